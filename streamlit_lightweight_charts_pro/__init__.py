@@ -58,6 +58,7 @@ License: MIT
 # Import core components
 from streamlit_lightweight_charts_pro.charts import (
     Chart,
+    Viewport,
 )
 from streamlit_lightweight_charts_pro.charts.options import ChartOptions
 from streamlit_lightweight_charts_pro.charts.options.layout_options import (
@@ -70,18 +71,18 @@ from streamlit_lightweight_charts_pro.charts.options.trade_visualization_options
 from streamlit_lightweight_charts_pro.charts.options.ui_options import LegendOptions
 from streamlit_lightweight_charts_pro.charts.series import (
     AreaSeries,
+    BandSeries,
     BarSeries,
     BaselineSeries,
     CandlestickSeries,
+    GradientBandSeries,
+    GradientRibbonSeries,
     HistogramSeries,
     LineSeries,
+    RibbonSeries,
     Series,
     SignalSeries,
-    GradientRibbonSeries,
     TrendFillSeries,
-    RibbonSeries,
-    GradientBandSeries,
-    BandSeries,
 )
 from streamlit_lightweight_charts_pro.data import (
     Annotation,
@@ -104,6 +105,7 @@ from streamlit_lightweight_charts_pro.data.annotation import (
     create_text_annotation,
 )
 from streamlit_lightweight_charts_pro.data.trade import (
+    TradeBatch,
     TradeData,
     TradeType,
 )
@@ -113,7 +115,10 @@ from streamlit_lightweight_charts_pro.logging_config import get_logger, setup_lo
 from streamlit_lightweight_charts_pro.type_definitions import ChartType, LineStyle, MarkerPosition
 from streamlit_lightweight_charts_pro.type_definitions.enums import (
     ColumnNames,
+    DataTransport,
+    DownsampleMethod,
     MarkerShape,
+    TimeAlignment,
     TradeVisualization,
 )
 
@@ -127,6 +132,7 @@ __all__ = [
     "setup_logging",
     # Core chart classes
     "Chart",
+    "Viewport",
     # Series classes
     "AreaSeries",
     "BarSeries",
@@ -165,6 +171,7 @@ __all__ = [
     "create_arrow_annotation",
     "create_shape_annotation",
     # Trade visualization
+    "TradeBatch",
     "TradeData",
     "TradeType",
     "TradeVisualizationOptions",
@@ -175,6 +182,9 @@ __all__ = [
     "MarkerShape",
     "MarkerPosition",
     "ColumnNames",
+    "DataTransport",
+    "DownsampleMethod",
+    "TimeAlignment",
     # Version
     "__version__",
 ]
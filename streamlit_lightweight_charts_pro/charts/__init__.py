@@ -65,6 +65,7 @@ from streamlit_lightweight_charts_pro.charts.series import (
     SignalSeries,
     BandSeries,
 )
+from streamlit_lightweight_charts_pro.charts.viewport import Viewport
 
 __all__ = [
     "AreaSeries",
@@ -80,4 +81,5 @@ __all__ = [
     "SignalSeries",
     "BandSeries",
     "Chart",
+    "Viewport",
 ]
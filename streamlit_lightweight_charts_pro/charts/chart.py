@@ -28,12 +28,14 @@ Example:
     ```
 """
 
-import time
-import uuid
+import hashlib
+import json
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import pandas as pd
 
+from streamlit_lightweight_charts_pro.charts.config_delta import ConfigDeltaTracker
+from streamlit_lightweight_charts_pro.charts.data_cache import DataCacheTracker
 from streamlit_lightweight_charts_pro.charts.options import ChartOptions
 from streamlit_lightweight_charts_pro.charts.options.price_scale_options import (
     PriceScaleMargins,
@@ -45,22 +47,110 @@ from streamlit_lightweight_charts_pro.charts.series import (
     LineSeries,
     Series,
 )
+from streamlit_lightweight_charts_pro.charts.series.histogram import ohlcv_series_data
+from streamlit_lightweight_charts_pro.charts.viewport import DEFAULT_VIEWPORT_DEBOUNCE_MS, Viewport
 from streamlit_lightweight_charts_pro.component import get_component_func
+from streamlit_lightweight_charts_pro.data.aggregation import OhlcvPyramid
 from streamlit_lightweight_charts_pro.data.annotation import Annotation, AnnotationManager
+from streamlit_lightweight_charts_pro.data.marker import MarkerBase
 from streamlit_lightweight_charts_pro.data.ohlcv_data import OhlcvData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.data.tooltip import TooltipConfig, TooltipManager
-from streamlit_lightweight_charts_pro.data.trade import TradeData
+from streamlit_lightweight_charts_pro.data.trade import TradeBatch, TradeData
 from streamlit_lightweight_charts_pro.logging_config import get_logger
 from streamlit_lightweight_charts_pro.type_definitions.enums import (
     ColumnNames,
+    DataTransport,
     PriceScaleMode,
+    TimeAlignment,
     TradeVisualization,
 )
+from streamlit_lightweight_charts_pro.utils.serialization import dumps, encode_payload
+from streamlit_lightweight_charts_pro.utils.time_index import TimeIndex
 
 # Initialize logger
 logger = get_logger(__name__)
 
 
+def _script_run_ctx() -> Any:
+    """
+    Get the context of the current Streamlit script run.
+
+    Returns:
+        Any: The script run context, or None outside of a script run.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import (  # pylint: disable=import-outside-toplevel
+            get_script_run_ctx,
+        )
+    except ImportError:
+        return None
+
+    try:
+        return get_script_run_ctx(suppress_warning=True)
+    except TypeError:
+        # Older Streamlit versions have no suppress_warning argument
+        return get_script_run_ctx()
+
+
+def _component_keys_this_run() -> Any:
+    """
+    Get the element keys already registered in the current Streamlit script run.
+
+    Returns:
+        Any: Container of keys supporting ``in``; empty outside of a script run
+            or when the running Streamlit version does not expose the keys.
+    """
+    ctx = _script_run_ctx()
+    if ctx is None:
+        return ()
+    # Newer Streamlit versions keep per-run state on ctx.shared
+    run_state = getattr(ctx, "shared", ctx)
+    return getattr(run_state, "widget_user_keys_this_run", ())
+
+
+def _session_state() -> Optional[Any]:
+    """
+    Get the Streamlit session state of the current script run.
+
+    Returns:
+        Optional[Any]: The session state, or None outside of a script run.
+    """
+    if _script_run_ctx() is None:
+        return None
+    import streamlit as st  # pylint: disable=import-outside-toplevel
+
+    return st.session_state
+
+
+def _aligned_markers(
+    markers: Union[List[MarkerBase], SeriesData],
+    index: TimeIndex,
+    policy: TimeAlignment,
+    encode_data: bool,
+) -> Any:
+    """
+    Serialize the markers of a series with their times aligned onto an index.
+
+    Args:
+        markers (Union[List[MarkerBase], SeriesData]): Markers of the series.
+        index (TimeIndex): Bar times of the series.
+        policy (TimeAlignment): How to align the times.
+        encode_data (bool): Whether to encode columnar markers as EncodedRows.
+
+    Returns:
+        Any: The kept markers, serialized like Series.asdict() does.
+    """
+    if not isinstance(markers, SeriesData):
+        return index.align_rows([marker.asdict() for marker in markers], policy)
+    times, kept = index.align(markers.columns["time"], policy)
+    columns = dict(markers.columns, time=times)
+    if not kept.all():
+        columns = {name: column[kept] for name, column in columns.items()}
+    aligned = SeriesData(markers.data_class, columns)
+    return aligned.encoded() if encode_data else aligned.asdicts()
+
+
 class Chart:
     """
     Single pane chart for displaying financial data.
@@ -166,6 +256,12 @@ class Chart:
         self._trades = []
         # Store tooltip manager
         self._tooltip_manager = None
+        # Debounce delay of viewport reports, None unless enabled by report_viewport()
+        self._viewport_debounce_ms = None
+        # Alignment of marker, trade and annotation times, None unless set by align_times()
+        self._time_alignment = None
+        # Whether render() sends versioned deltas, see incremental_updates()
+        self._incremental_updates = False
         # Add initial annotations if provided
         if annotations is not None:
             if not isinstance(annotations, list):
@@ -598,6 +694,7 @@ class Chart:
             volume_pane_id = price_pane_id
 
         # Price series (default price scale)
+        ohlcv = None
         if price_type == "candlestick":
             # Filter column mapping to only include OHLC fields for candlestick series
             price_column_mapping = {
@@ -605,8 +702,17 @@ class Chart:
                 for k, v in column_mapping.items()
                 if k in ["time", "open", "high", "low", "close"]
             }
+            # Parse the bars once: price and volume share their columns
+            ohlcv = ohlcv_series_data(data, column_mapping)
+            price_data = data
+            if ohlcv is not None:
+                columns = ohlcv.columns
+                price_data = SeriesData(
+                    CandlestickSeries.data_class,
+                    {name: columns[name] for name in ("time", "open", "high", "low", "close")},
+                )
             price_series = CandlestickSeries(
-                data=data,
+                data=price_data,
                 column_mapping=price_column_mapping,
                 pane_id=price_pane_id,
                 price_scale_id="right",
@@ -645,21 +751,62 @@ class Chart:
             column_mapping["value"] = column_mapping["volume"]
 
         # Create histogram series
-        volume_series = HistogramSeries.create_volume_series(
-            data=data,
-            column_mapping=column_mapping,
-            up_color=volume_up_color,
-            down_color=volume_down_color,
-            pane_id=volume_pane_id,
-            price_scale_id=ColumnNames.VOLUME,
-        )
+        if ohlcv is not None:
+            volume_series = HistogramSeries.from_ohlcv(
+                ohlcv,
+                up_color=volume_up_color,
+                down_color=volume_down_color,
+                pane_id=volume_pane_id,
+                price_scale_id=ColumnNames.VOLUME,
+            )
+        else:
+            volume_series = HistogramSeries.create_volume_series(
+                data=data,
+                column_mapping=column_mapping,
+                up_color=volume_up_color,
+                down_color=volume_down_color,
+                pane_id=volume_pane_id,
+                price_scale_id=ColumnNames.VOLUME,
+            )
 
         # Set volume-specific properties
         volume_series.base = volume_base
         volume_series.price_format = {"type": "volume", "precision": 0}
 
+        # Aggregate price and volume together so both show the same resolution
+        if price_series.timeframes is not None:
+            self._share_price_volume_pyramid(price_series, volume_series)
+
         return price_series, volume_series
 
+    @staticmethod
+    def _share_price_volume_pyramid(price_series: Series, volume_series: Series) -> None:
+        """
+        Give price and volume series one OhlcvPyramid of their combined bars.
+
+        The pyramid is built from the already parsed columns of both series, so
+        the data is not converted again, and its aggregated volume is colored
+        by the aggregated price movement.
+
+        Args:
+            price_series (Series): Price series with timeframes set.
+            volume_series (Series): Volume series of the same bars.
+        """
+        price = price_series.data
+        if not isinstance(price, SeriesData):
+            price = SeriesData.from_data(price_series.data_class, price)
+        volume = volume_series.data
+        if not isinstance(volume, SeriesData) or len(volume) != len(price):
+            return
+        columns = {name: price.columns[name] for name in ("time", "open", "high", "low", "close")}
+        columns["volume"] = volume.columns["value"]
+        pyramid = OhlcvPyramid(SeriesData(OhlcvData, columns), price_series.timeframes)
+
+        for series in (price_series, volume_series):
+            series.pyramid = pyramid
+            series.max_bars = price_series.max_bars
+            series.visible_range = price_series.visible_range
+
     def add_price_volume_series(
         self,
         data: Union[Sequence[OhlcvData], pd.DataFrame],
@@ -684,7 +831,9 @@ class Chart:
             price_type (str, optional): Type of price series ('candlestick' or 'line').
                 Defaults to "candlestick".
             price_kwargs (dict, optional): Additional arguments for price series
-                configuration. Defaults to None.
+                configuration. Defaults to None. With "timeframes" (candlestick
+                only), price and volume share one OhlcvPyramid and are sent at
+                the same resolution (see set_visible_range()).
             volume_kwargs (dict, optional): Additional arguments for volume series
                 configuration. Defaults to None.
             pane_id (int, optional): Pane ID for both price and volume series.
@@ -795,7 +944,190 @@ class Chart:
 
         return chart
 
-    def add_trades(self, trades: List[TradeData]) -> "Chart":
+    def set_visible_range(self, start: Any, end: Any) -> "Chart":
+        """
+        Set the time range the aggregated series are sent for.
+
+        Series with timeframes or a pyramid (see Series.pyramid) only send the
+        finest resolution that shows this range in at most max_bars bars, and
+        only the bars around it. Other series are not affected.
+
+        Args:
+            start (Any): First time of the range, in any format accepted by
+                to_utc_timestamp().
+            end (Any): Last time of the range.
+
+        Returns:
+            Chart: Self for method chaining.
+
+        Example:
+            ```python
+            chart = Chart.from_price_volume_dataframe(
+                minute_bars, column_mapping=mapping,
+                price_kwargs={"timeframes": ["5m", "1h", "1D"]},
+            )
+            chart.set_visible_range("2024-01-01", "2024-03-31")
+            ```
+        """
+        for series in self.series:
+            if series.pyramid is not None:
+                series.visible_range = (start, end)
+        return self
+
+    def report_viewport(self, debounce_ms: int = DEFAULT_VIEWPORT_DEBOUNCE_MS) -> "Chart":
+        """
+        Have the frontend report the range the user is looking at.
+
+        After the user pans or zooms, the frontend waits until the chart has
+        been still for debounce_ms and reports its viewport, which reruns the
+        script; render() then returns it as a Viewport (see charts.viewport).
+        Charts with a series that has a data provider or a pyramid report their
+        viewport without calling this method.
+
+        Args:
+            debounce_ms (int): Delay without further changes before a report,
+                in milliseconds. Defaults to DEFAULT_VIEWPORT_DEBOUNCE_MS.
+
+        Returns:
+            Chart: Self for method chaining.
+
+        Raises:
+            ValueError: If debounce_ms is negative.
+        """
+        if debounce_ms < 0:
+            raise ValueError(f"debounce_ms must not be negative, got {debounce_ms}")
+        self._viewport_debounce_ms = int(debounce_ms)
+        return self
+
+    def incremental_updates(self, enabled: bool = True) -> "Chart":
+        """
+        Have render() update the mounted chart in place on reruns.
+
+        With incremental updates, render() sends the config as JSON bytes and,
+        on reruns that render the same component again, only the changes since
+        the previous rerun (appended or updated bars, changed options, added or
+        removed series), which the frontend applies to the live chart instead
+        of rebuilding it (see config_delta). Series data the browser already
+        holds is left out and referenced by its content hash (see data_cache).
+        The frontend asks for a full config through its component value when
+        it cannot apply a delta.
+
+        Without them, render() sends the full config as a dict on every rerun.
+        The frontend still reconciles each full config with the live chart
+        (see reconcile.ts), updating only the series that changed, but the
+        whole config is encoded and sent each time. The data cache is part of
+        this opt-in because its references name the content hashes of data
+        encoded as JSON bytes, which the dict config does not carry.
+
+        Args:
+            enabled (bool): Whether to send incremental updates. Defaults to True.
+
+        Returns:
+            Chart: Self for method chaining.
+        """
+        self._incremental_updates = bool(enabled)
+        return self
+
+    def align_times(
+        self, policy: Optional[Union[TimeAlignment, str]] = TimeAlignment.NEAREST
+    ) -> "Chart":
+        """
+        Align the times of markers, trades and annotations onto bar times.
+
+        The frontend moves markers and trades onto the nearest bar itself.
+        With an alignment, to_frontend_config() does it instead, for all of
+        them at once with the bar times of the series (see
+        utils.time_index.TimeIndex), and the frontend draws the times it
+        receives. Trades and annotations are aligned with the primary series,
+        the first one, which draws the trades; markers with the series they
+        belong to. Items whose time the policy leaves out are not sent.
+
+        Args:
+            policy (Optional[Union[TimeAlignment, str]]): How to align the
+                times, or None to leave them to the frontend. Defaults to
+                TimeAlignment.NEAREST.
+
+        Returns:
+            Chart: Self for method chaining.
+
+        Raises:
+            ValueError: If policy is not a TimeAlignment.
+        """
+        self._time_alignment = None if policy is None else TimeAlignment(policy)
+        return self
+
+    def _align_config(
+        self, chart_obj: Dict[str, Any], encode_data: bool, include_text: bool
+    ) -> None:
+        """Replace the marker, trade and annotation times of a config by aligned ones."""
+        policy = self._time_alignment
+        series_configs = chart_obj["series"]
+        primary = TimeIndex.from_payload(series_configs[0].get("data"))
+        for position, (series, config) in enumerate(zip(self.series, series_configs)):
+            index = primary if position == 0 else TimeIndex.from_payload(config.get("data"))
+            if not len(index):
+                continue
+            config["timesAligned"] = True
+            if "markers" in config:
+                config["markers"] = _aligned_markers(series.markers, index, policy, encode_data)
+        if not len(primary):
+            return
+
+        if "trades" in chart_obj:
+            trades = self._trades
+            if not isinstance(trades, TradeBatch):
+                trades = TradeBatch.from_trades(trades)
+            trades = trades.aligned(primary, policy)
+            if len(trades):
+                chart_obj["trades"] = (
+                    trades.encoded(include_text) if encode_data else trades.asdicts(include_text)
+                )
+            else:
+                del chart_obj["trades"]
+                chart_obj.pop("tradeVisualizationOptions", None)
+
+        for layer in chart_obj["annotations"]["layers"].values():
+            layer["annotations"] = primary.align_rows(layer["annotations"], policy)
+
+    def _viewport_series(self) -> List[Series]:
+        """Return the series whose data depends on the viewport."""
+        return [
+            series
+            for series in self.series
+            if series.data_provider is not None or series.pyramid is not None
+        ]
+
+    def _reports_viewport(self) -> bool:
+        """Return whether the frontend reports the viewport of the chart."""
+        return self._viewport_debounce_ms is not None or bool(self._viewport_series())
+
+    def apply_viewport(self, viewport: Optional[Viewport]) -> "Chart":
+        """
+        Load and resample the series for a viewport reported by the frontend.
+
+        Series with a data provider load the bars around the viewport, and
+        series with a pyramid pick the resolution that fits the width of the
+        chart (see Series.set_viewport()). Without a viewport, series with a
+        data provider load their default window. render() calls this method
+        with the viewport reported on the previous rerun.
+
+        Args:
+            viewport (Optional[Viewport]): The viewport, or None before the
+                frontend reported one.
+
+        Returns:
+            Chart: Self for method chaining.
+        """
+        for series in self._viewport_series():
+            if viewport is not None:
+                series.set_viewport(
+                    viewport.start, viewport.end, viewport.bar_budget(series.max_bars)
+                )
+            elif series.data_provider is not None:
+                series.set_viewport(*(series.visible_range or (None, None)))
+        return self
+
+    def add_trades(self, trades: Union[List[TradeData], TradeBatch]) -> "Chart":
         """
         Add trade visualization to the chart.
 
@@ -805,8 +1137,12 @@ class Chart:
         configuration. The visualization can include markers, rectangles, arrows, or
         combinations depending on the style setting.
 
+        For many trades, pass a TradeBatch (e.g. TradeBatch.from_dataframe()):
+        its markers and frontend payload are computed for all trades at once.
+
         Args:
-            trades (List[TradeData]): List of TradeData objects to visualize on the chart.
+            trades (Union[List[TradeData], TradeBatch]): List of TradeData objects,
+                or a TradeBatch, to visualize on the chart.
 
         Returns:
             Chart: Self for method chaining.
@@ -837,13 +1173,16 @@ class Chart:
         """
         if trades is None:
             raise TypeError("trades cannot be None")
-        if not isinstance(trades, list):
-            raise TypeError(f"trades must be a list, got {type(trades)}")
+        if not isinstance(trades, (list, TradeBatch)):
+            raise TypeError(f"trades must be a list or a TradeBatch, got {type(trades)}")
 
         # Validate that all items are TradeData objects
-        for trade in trades:
-            if not isinstance(trade, TradeData):
-                raise TypeError(f"All items in trades must be TradeData objects, got {type(trade)}")
+        if isinstance(trades, list):
+            for trade in trades:
+                if not isinstance(trade, TradeData):
+                    raise TypeError(
+                        f"All items in trades must be TradeData objects, got {type(trade)}"
+                    )
 
         # Store trades for frontend processing
         self._trades = trades
@@ -860,6 +1199,14 @@ class Chart:
             ]
 
         if should_add_markers:
+            if isinstance(trades, TradeBatch):
+                # Markers of all trades at once as columns, in the order of the loop below
+                for series in self.series:
+                    if hasattr(series, "markers"):
+                        series.add_markers(trades.marker_data())
+                        break
+                return self
+
             for trade in trades:
                 # Convert trade to markers
                 markers = trade.to_markers()
@@ -911,7 +1258,115 @@ class Chart:
         self._tooltip_manager.add_config(name, config)
         return self
 
-    def to_frontend_config(self) -> Dict[str, Any]:
+    def structure_key(self, key: Optional[str] = None) -> str:
+        """
+        Get a deterministic identifier for the chart's structure.
+
+        The identifier is a hash of what makes up the chart rather than of the
+        Python object: the type, pane and price scale of every series in order
+        and the pane layout, plus an optional user key. Series data and chart
+        options are not part of it, so building the same chart with new data or
+        restyled options on a Streamlit rerun yields the same identifier and the
+        frontend updates its existing chart instance instead of creating a new one.
+
+        Args:
+            key (Optional[str]): Optional user key mixed into the identifier, to
+                tell apart charts that share the same structure.
+
+        Returns:
+            str: A 16 character hexadecimal identifier.
+
+        Example:
+            ```python
+            Chart(series=LineSeries(data)).structure_key()  # e.g. "3f2a9c0d81b6e4f7"
+            ```
+        """
+        structure = {
+            "series": [
+                [
+                    getattr(series.chart_type, "value", type(series).__name__),
+                    series.pane_id,
+                    series.price_scale_id,
+                ]
+                for series in self.series
+            ],
+            "panes": sorted({series.pane_id or 0 for series in self.series}),
+            "key": key,
+        }
+        encoded = json.dumps(structure, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    def _component_key(self, key: Optional[str]) -> str:
+        """
+        Get the Streamlit component key for render().
+
+        A valid user key is used as-is. Otherwise the key is derived from the
+        chart structure so that it is identical across reruns; when a chart with
+        the same structure was already rendered in this run, a counter suffix
+        keeps the keys unique (charts render in the same order on every rerun,
+        so the suffixes are stable too).
+
+        Args:
+            key (Optional[str]): Key passed to render().
+
+        Returns:
+            str: Component key.
+        """
+        if key is not None and isinstance(key, str) and key.strip():
+            return key
+
+        base_key = f"chart_{self.structure_key()}"
+        used_keys = _component_keys_this_run()
+        candidate = base_key
+        suffix = 1
+        while candidate in used_keys:
+            candidate = f"{base_key}_{suffix}"
+            suffix += 1
+        return candidate
+
+    def _sends_binary_columns(self) -> bool:
+        """Return whether a series sends its data as binary columns."""
+        return any(series.transport == DataTransport.COLUMNAR for series in self.series)
+
+    def _frontend_payload(self, config: Dict[str, Any], component_key: str) -> Dict[str, Any]:
+        """
+        Get the payload that brings the rendered component to the given config.
+
+        Inside a Streamlit script run, a ConfigDeltaTracker kept in the session
+        state per component key turns the config into a delta against the one
+        sent on the previous rerun (see config_delta), or into a full versioned
+        config when the frontend asked for a resync or the change cannot be
+        applied in place. Series data the browser already holds is then
+        replaced by a reference to its content hash (see data_cache). Outside
+        of a script run the config is sent as-is.
+
+        Args:
+            config (Dict[str, Any]): Config returned by to_frontend_config(), possibly
+                with pre-encoded series data.
+            component_key (str): Key of the Streamlit component.
+
+        Returns:
+            Dict[str, Any]: Payload to pass to the component as its config.
+        """
+        session_state = _session_state()
+        if session_state is None:
+            return config
+
+        state_key = f"_lwc_delta_{component_key}"
+        tracker = session_state.get(state_key)
+        if not isinstance(tracker, ConfigDeltaTracker):
+            tracker = ConfigDeltaTracker()
+            session_state[state_key] = tracker
+        cache_key = f"_lwc_data_{component_key}"
+        data_cache = session_state.get(cache_key)
+        if not isinstance(data_cache, DataCacheTracker):
+            data_cache = DataCacheTracker()
+            session_state[cache_key] = data_cache
+        # The component value holds what the frontend reported on the last rerun
+        frontend_value = session_state.get(component_key)
+        return data_cache.prepare(tracker.prepare(config, frontend_value), frontend_value)
+
+    def to_frontend_config(self, encode_data: bool = False) -> Dict[str, Any]:
         """
         Convert chart to frontend configuration dictionary.
 
@@ -920,6 +1375,13 @@ class Chart:
         handles the serialization of all chart elements including series data,
         chart options, price scales, and annotations.
 
+        Args:
+            encode_data (bool): Write columnar series data straight to JSON as
+                EncodedRows, or as ColumnarData for series with the COLUMNAR
+                transport (see Series.asdict_encoded()), instead of one dictionary
+                per data point. The configuration must then be encoded with
+                utils.serialization.dumps() or encode_payload(). Defaults to False.
+
         Returns:
             Dict[str, Any]: Complete chart configuration ready for frontend
                 rendering. The configuration includes:
@@ -937,10 +1399,10 @@ class Chart:
             options_config = chart_config['chart']
             ```
         """
-        series_configs = []
-        for series in self.series:
-            series_config = series.asdict()
-            series_configs.append(series_config)
+        if encode_data:
+            series_configs = [series.asdict_encoded() for series in self.series]
+        else:
+            series_configs = [series.asdict() for series in self.series]
 
         chart_config = (
             self.options.asdict() if self.options is not None else ChartOptions().asdict()
@@ -961,11 +1423,21 @@ class Chart:
 
         # Add trades to chart configuration if they exist
         trades_config = None
-        if hasattr(self, "_trades") and self._trades:
-            trades_config = [trade.asdict() for trade in self._trades]
+        # Custom trade texts are only sent when the visualization style shows them
+        trade_options = self.options.trade_visualization if self.options else None
+        include_text = trade_options is not None and trade_options.shows_trade_text
+        if hasattr(self, "_trades") and isinstance(self._trades, TradeBatch):
+            if len(self._trades):
+                trades_config = (
+                    self._trades.encoded(include_text)
+                    if encode_data
+                    else self._trades.asdicts(include_text)
+                )
+        elif hasattr(self, "_trades") and self._trades:
+            trades_config = [trade.asdict(include_text) for trade in self._trades]
 
         chart_obj = {
-            "chartId": f"chart-{id(self)}",
+            "chartId": f"chart-{self.structure_key()}",
             "chart": chart_config,
             "series": series_configs,
             "annotations": annotations_config,
@@ -986,6 +1458,17 @@ class Chart:
             if self.options and self.options.trade_visualization:
                 chart_obj["tradeVisualizationOptions"] = self.options.trade_visualization.asdict()
 
+        # Send times already aligned onto the bars, see align_times()
+        if self._time_alignment is not None and self.series:
+            self._align_config(chart_obj, encode_data, include_text)
+
+        # Ask the frontend to report its viewport when the data depends on it
+        if self._reports_viewport():
+            debounce_ms = self._viewport_debounce_ms
+            if debounce_ms is None:
+                debounce_ms = DEFAULT_VIEWPORT_DEBOUNCE_MS
+            chart_obj["viewport"] = {"debounceMs": debounce_ms}
+
         # Add tooltip configurations if they exist
         if self._tooltip_manager:
             tooltip_configs = {}
@@ -1005,6 +1488,25 @@ class Chart:
 
         return config
 
+    def to_frontend_json(self) -> bytes:
+        """
+        Convert chart to its frontend configuration, encoded as JSON.
+
+        Produces the JSON encoding of to_frontend_config(), but writes columnar
+        series data (SeriesData) straight from its arrays instead of building
+        one dictionary per data point. Uses orjson when it is installed.
+
+        Returns:
+            bytes: UTF-8 encoded JSON configuration.
+
+        Example:
+            ```python
+            payload = chart.to_frontend_json()
+            assert json.loads(payload) == chart.to_frontend_config()
+            ```
+        """
+        return dumps(self.to_frontend_config(encode_data=True))
+
     def render(self, key: Optional[str] = None) -> Any:
         """
         Render the chart in Streamlit.
@@ -1013,19 +1515,50 @@ class Chart:
         Streamlit component. This is the final step in the chart creation process
         that displays the interactive chart in the Streamlit application.
 
+        The full config is sent on every rerun, unless the chart opted into
+        incremental updates (see incremental_updates()): then only the changes
+        since the previous rerun are sent, as JSON bytes with columnar series
+        data written straight from its arrays (see to_frontend_json()). The
+        numeric fields of series with the COLUMNAR transport (see
+        Series.transport) are always sent as JSON bytes with a separate binary
+        buffer of float64 columns.
+
+        When the chart reports its viewport (see report_viewport()), the
+        viewport reported on the previous rerun is applied first (see
+        apply_viewport()), so that series with a data provider or a pyramid
+        only send the range on screen.
+
         Args:
             key (Optional[str]): Optional unique key for the Streamlit component.
                 This key is used to identify the component instance and is useful
-                for debugging and component state management.
+                for debugging and component state management. When omitted, a key
+                derived from the chart structure (see structure_key()) is used,
+                which stays the same across reruns that build the same chart.
 
         Returns:
-            Any: The rendered Streamlit component that displays the interactive chart.
+            Any: The value of the Streamlit component that displays the
+                interactive chart. For charts reporting their viewport (see
+                report_viewport()), an Optional[Viewport] instead: the viewport
+                the frontend reported on a previous rerun, or None before the
+                first report.
+
+        Note:
+            The return type depends on the chart: render() returns the raw
+            component value unless the chart reports its viewport, which
+            includes every chart with a data provider or a pyramid series. Such
+            charts get a parsed Viewport instead; the raw component value stays
+            available as st.session_state[key].
 
         Example:
             ```python
             # Basic rendering
             chart.render()
 
+            # Reading the range on screen
+            viewport = chart.report_viewport().render(key="my_chart")
+            if viewport is not None:
+                print(viewport.start, viewport.end)
+
             # Rendering with custom key
             chart.render(key="my_chart")
 
@@ -1033,7 +1566,6 @@ class Chart:
             chart.add_series(line_series).update_options(height=600).render(key="chart1")
             ```
         """
-        config = self.to_frontend_config()
         component_func = get_component_func()
 
         if component_func is None:
@@ -1049,7 +1581,7 @@ class Chart:
                     "Please check if the component is properly initialized."
                 )
 
-        kwargs = {"config": config}
+        kwargs = {}
 
         # Extract height and width from chart options and pass to frontend
         if self.options:
@@ -1058,13 +1590,36 @@ class Chart:
             if hasattr(self.options, "width") and self.options.width is not None:
                 kwargs["width"] = self.options.width
 
-        # Generate a unique key if none provided or if it's empty/invalid
-        if key is None or not isinstance(key, str) or not key.strip():
-
-            # Generate a unique key using timestamp and UUID
-            unique_id = str(uuid.uuid4())[:8]
-            key = f"chart_{int(time.time() * 1000)}_{unique_id}"
-
-        kwargs["key"] = key
+        # Use a key derived from the chart structure if none provided or if it's
+        # empty/invalid, so that reruns update the mounted component
+        kwargs["key"] = self._component_key(key)
+
+        # Load the range the frontend reported on the previous rerun before
+        # building the config, so that only that window is sent
+        reports_viewport = self._reports_viewport()
+        viewport = None
+        if reports_viewport:
+            session_state = _session_state()
+            if session_state is not None:
+                viewport = Viewport.from_component_value(
+                    session_state.get(kwargs["key"]), f"chart-{self.structure_key()}"
+                )
+            self.apply_viewport(viewport)
+        if self._incremental_updates or self._sends_binary_columns():
+            # Sent as JSON bytes so that Streamlit does not encode it again, and
+            # the columns of series with the COLUMNAR transport as a binary buffer.
+            # With incremental updates, reruns only send what changed.
+            config = self.to_frontend_config(encode_data=True)
+            if self._incremental_updates:
+                config = self._frontend_payload(config, kwargs["key"])
+            payload, buffers = encode_payload(config)
+            kwargs["config"] = payload
+            if buffers:
+                kwargs["buffers"] = buffers
+        else:
+            kwargs["config"] = self.to_frontend_config()
 
-        return component_func(**kwargs)
+        value = component_func(**kwargs)
+        if reports_viewport:
+            return viewport
+        return value
@@ -0,0 +1,321 @@
+"""
+Incremental config updates for streamlit-lightweight-charts.
+
+Every Streamlit rerun rebuilds the chart and sends its configuration to the
+frontend component. For live dashboards that append one bar per rerun, resending
+and re-rendering every data point is wasteful. This module implements a
+versioned delta protocol: the Python side remembers the last configuration sent
+to a component and only sends what changed, which the frontend applies to the
+live chart with series.update(), series.setData() and applyOptions().
+
+Payloads sent to the frontend are either a full configuration:
+
+    {"charts": [...], "syncConfig": {...}, "version": 3}
+
+or a delta against the previous version:
+
+    {
+        "version": 4,
+        "baseVersion": 3,
+        "delta": {
+            "charts": [
+                {
+                    "chartId": "chart-...",
+                    "options": {...},  # Only when the chart options changed
+                    "series": [
+                        {"op": "append", "index": 0, "data": [...], "trim": 1},
+                        {"op": "setData", "index": 1, "data": [...]},
+                        {"op": "options", "index": 1, "options": {...}},
+                        {"op": "replace", "index": 2, "series": {...}},
+                        {"op": "remove", "index": 4},
+                        {"op": "add", "index": 3, "series": {...}},
+                    ],
+                }
+            ]
+        },
+    }
+
+An "append" operation lists bars to pass to series.update() in order; its first
+bar may have the time of the current last bar, in which case it replaces it.
+Its optional "trim" count is the number of points dropped from the front of
+the data, for series with bounded history.
+
+The frontend applies a delta only when its current version equals baseVersion.
+Otherwise (for example after the component was remounted) it asks for a full
+resync by setting its component value to {"resyncRequest": <id>}, and the next
+payload is a full configuration.
+
+Chart.render() only uses the protocol for charts that opted in with
+Chart.incremental_updates(); other charts send the full configuration on every
+rerun.
+
+Example:
+    ```python
+    tracker = ConfigDeltaTracker()
+    payload = tracker.prepare(chart.to_frontend_config())  # Full config
+    chart.series[0].data.append(new_bar)
+    payload = tracker.prepare(chart.to_frontend_config())  # One "append" operation
+    ```
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from streamlit_lightweight_charts_pro.utils.serialization import ColumnarData, EncodedRows
+
+# Series data: point dictionaries, encoded points or columns
+SeriesPayload = Union[List[Dict[str, Any]], EncodedRows, ColumnarData]
+
+# Chart keys the frontend can update in place. A change to any other key
+# (annotations, trades, legends, tooltips) requires a full resync.
+_PATCHABLE_CHART_KEYS = frozenset({"chartId", "chart", "series"})
+
+# Series keys the frontend can update in place. A change to any other key
+# (type, pane, markers, price lines) recreates the series.
+_PATCHABLE_SERIES_KEYS = frozenset({"data", "options"})
+
+
+def _point_time(point: Dict[str, Any]) -> Any:
+    """Return the time of a data point payload."""
+    return point.get("time")
+
+
+def _time_at(data: SeriesPayload, index: int) -> Any:
+    """Return the time of the data point at index, for dictionaries, encoded points or columns."""
+    if isinstance(data, (EncodedRows, ColumnarData)):
+        return data.times[index]
+    return _point_time(data[index])
+
+
+def _payload_kind(data: SeriesPayload) -> type:
+    """Return the kind of series data, so that only data of the same kind is compared."""
+    return type(data) if isinstance(data, (EncodedRows, ColumnarData)) else list
+
+
+def _find_time(data: SeriesPayload, time: Any) -> int:
+    """Return the position of the first data point at or after time, by bisection."""
+    if isinstance(data, (EncodedRows, ColumnarData)):
+        return int(np.searchsorted(data.times, time))
+    low, high = 0, len(data)
+    while low < high:
+        middle = (low + high) // 2
+        if _point_time(data[middle]) < time:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def diff_series_data(old_data: SeriesPayload, new_data: SeriesPayload) -> Optional[Dict[str, Any]]:
+    """
+    Get the data operation that turns the old series data into the new one.
+
+    When the new data keeps every old point except possibly the last one, and
+    the last point keeps its time, the operation is an "append" listing the
+    changed last point and the new points. Old points dropped from the front,
+    as series with max_points do, are reported as a "trim" count on the append.
+    Any other change replaces the whole data with a "setData" operation.
+
+    The data may be lists of point dictionaries, EncodedRows (data written
+    straight to JSON) or ColumnarData (data sent as binary columns, see
+    utils.serialization); operations then carry data of the same kind.
+
+    Args:
+        old_data (SeriesPayload): Data points previously sent.
+        new_data (SeriesPayload): Data points to send.
+
+    Returns:
+        Optional[Dict[str, Any]]: The operation without its index, or None if the
+            data did not change.
+    """
+    old_length = len(old_data)
+    new_length = len(new_data)
+    if old_length == 0 or new_length == 0:
+        if old_data == new_data:
+            return None
+        return {"op": "setData", "data": new_data}
+
+    if _payload_kind(old_data) is not _payload_kind(new_data):
+        return {"op": "setData", "data": new_data}
+
+    # Points dropped from the front: find where the new data starts in the old one
+    trim = 0
+    first_time = _time_at(new_data, 0)
+    if first_time != _time_at(old_data, 0):
+        trim = _find_time(old_data, first_time)
+        if trim >= old_length or _time_at(old_data, trim) != first_time:
+            return {"op": "setData", "data": new_data}
+
+    kept = old_length - trim
+    last = kept - 1
+    if new_length < kept or _time_at(new_data, last) != _time_at(old_data, -1):
+        return {"op": "setData", "data": new_data}
+    if new_data[:last] != old_data[trim:-1]:
+        return {"op": "setData", "data": new_data}
+
+    start = last if new_data[last] != old_data[-1] else kept
+    if start == new_length and trim == 0:
+        return None
+    operation = {"op": "append", "data": new_data[start:]}
+    if trim:
+        operation["trim"] = trim
+    return operation
+
+
+def diff_series(old_series: Dict[str, Any], new_series: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Get the operations that turn one series configuration into another.
+
+    Args:
+        old_series (Dict[str, Any]): Series configuration previously sent.
+        new_series (Dict[str, Any]): Series configuration to send.
+
+    Returns:
+        List[Dict[str, Any]]: Operations without their index. Empty if the series
+            did not change.
+    """
+    keys = set(old_series) | set(new_series)
+    for key in keys - _PATCHABLE_SERIES_KEYS:
+        if old_series.get(key) != new_series.get(key):
+            return [{"op": "replace", "series": new_series}]
+
+    operations = []
+    data_operation = diff_series_data(old_series.get("data", []), new_series.get("data", []))
+    if data_operation is not None:
+        operations.append(data_operation)
+    if old_series.get("options") != new_series.get("options"):
+        operations.append({"op": "options", "options": new_series.get("options", {})})
+    return operations
+
+
+def diff_chart(old_chart: Dict[str, Any], new_chart: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the delta that turns one chart configuration into another.
+
+    Series are matched by position. Changed series are updated in place,
+    series beyond the end of the new list are removed and new series at the
+    end are added.
+
+    Args:
+        old_chart (Dict[str, Any]): Chart configuration previously sent.
+        new_chart (Dict[str, Any]): Chart configuration to send.
+
+    Returns:
+        Optional[Dict[str, Any]]: The chart delta, or None if the change cannot be
+            applied in place and requires a full configuration.
+    """
+    if old_chart.get("chartId") != new_chart.get("chartId"):
+        return None
+    keys = set(old_chart) | set(new_chart)
+    for key in keys - _PATCHABLE_CHART_KEYS:
+        if old_chart.get(key) != new_chart.get(key):
+            return None
+
+    chart_delta: Dict[str, Any] = {"chartId": new_chart.get("chartId"), "series": []}
+    if old_chart.get("chart") != new_chart.get("chart"):
+        chart_delta["options"] = new_chart.get("chart", {})
+
+    old_series_list = old_chart.get("series", [])
+    new_series_list = new_chart.get("series", [])
+    common = min(len(old_series_list), len(new_series_list))
+    operations = chart_delta["series"]
+    for index in range(common):
+        for operation in diff_series(old_series_list[index], new_series_list[index]):
+            operations.append({**operation, "index": index})
+    # Remove from the end first so that the remaining indexes stay valid
+    for index in range(len(old_series_list) - 1, common - 1, -1):
+        operations.append({"op": "remove", "index": index})
+    for index in range(common, len(new_series_list)):
+        operations.append({"op": "add", "index": index, "series": new_series_list[index]})
+    return chart_delta
+
+
+def diff_config(old_config: Dict[str, Any], new_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the delta that turns one frontend configuration into another.
+
+    Args:
+        old_config (Dict[str, Any]): Configuration previously sent, as returned
+            by Chart.to_frontend_config().
+        new_config (Dict[str, Any]): Configuration to send.
+
+    Returns:
+        Optional[Dict[str, Any]]: The delta ({"charts": [...]}), or None if the
+            change requires a full configuration.
+    """
+    old_charts = old_config.get("charts", [])
+    new_charts = new_config.get("charts", [])
+    if len(old_charts) != len(new_charts):
+        return None
+    keys = set(old_config) | set(new_config)
+    for key in keys - {"charts"}:
+        if old_config.get(key) != new_config.get(key):
+            return None
+
+    chart_deltas = []
+    for old_chart, new_chart in zip(old_charts, new_charts):
+        chart_delta = diff_chart(old_chart, new_chart)
+        if chart_delta is None:
+            return None
+        chart_deltas.append(chart_delta)
+    return {"charts": chart_deltas}
+
+
+class ConfigDeltaTracker:
+    """
+    Versioned sender state for one chart component.
+
+    The tracker remembers the last configuration sent to a component and turns
+    each new configuration into the payload to send: a delta when the frontend
+    can apply it in place, the full configuration otherwise. Chart.render()
+    keeps one tracker per component key in the Streamlit session state.
+
+    The remembered configuration shares its data lists with the payload that
+    was sent, so the tracker holds about one extra copy of the chart data.
+
+    Attributes:
+        version (int): Version of the last payload produced.
+    """
+
+    def __init__(self):
+        """Initialize a tracker that has not sent anything yet."""
+        self.version = 0
+        self._config: Optional[Dict[str, Any]] = None
+        self._resync_request: Any = None
+
+    def reset(self) -> None:
+        """Forget the last configuration so that the next payload is a full one."""
+        self._config = None
+
+    def prepare(
+        self, config: Dict[str, Any], frontend_value: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the payload that brings the frontend to the given configuration.
+
+        Args:
+            config (Dict[str, Any]): Configuration to show, as returned by
+                Chart.to_frontend_config(). It must not be modified afterwards.
+            frontend_value (Optional[Any]): Last value reported by the component.
+                A new "resyncRequest" in it forces a full configuration.
+
+        Returns:
+            Dict[str, Any]: The full configuration with a "version" key, or a
+                delta payload with "version", "baseVersion" and "delta" keys.
+        """
+        if isinstance(frontend_value, dict):
+            resync_request = frontend_value.get("resyncRequest")
+            if resync_request is not None and resync_request != self._resync_request:
+                self._resync_request = resync_request
+                self.reset()
+
+        delta = None
+        if self._config is not None:
+            delta = diff_config(self._config, config)
+        self._config = config
+        self.version += 1
+
+        if delta is None:
+            return {**config, "version": self.version}
+        return {"version": self.version, "baseVersion": self.version - 1, "delta": delta}
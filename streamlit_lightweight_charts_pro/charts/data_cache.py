@@ -0,0 +1,189 @@
+"""
+Content-addressed series data cache for streamlit-lightweight-charts.
+
+Most Streamlit reruns are triggered by widgets unrelated to a chart. The delta
+protocol (see config_delta) already sends nothing for data that did not
+change, but a full configuration (after a resync, or for changes the frontend
+cannot apply in place, such as new annotations) carries every data point
+again. This module lets such payloads leave out the data the browser already
+holds. Like the delta protocol, it is used for charts that opted in with
+Chart.incremental_updates().
+
+Series data written straight from columns (EncodedRows and ColumnarData, see
+utils.serialization) has a content hash. Wherever a payload carries such data
+in full (series of a full configuration, and "setData", "replace" and "add"
+operations), the hash is sent next to it as "dataHash", and the frontend keeps
+the decoded data in a least recently used cache of DATA_CACHE_SIZE entries
+keyed by that hash. When the hash of data to send is in the cache, the data is
+replaced by a reference:
+
+    {"type": "line", "data": {"$cached": "9f86d08..."}, "dataHash": "9f86d08...", ...}
+
+DataCacheTracker keeps a mirror of the frontend cache: both sides apply the
+same insertions and lookups, in the same order, to every payload. When the
+frontend misses a referenced hash (for example after its component was
+remounted), it asks for a resync and reports the hashes it holds in its
+component value, which resets the mirror:
+
+    {"resyncRequest": 1712345678901, "dataCache": ["3a7bd3e...", "9f86d08..."]}
+
+Example:
+    ```python
+    tracker = DataCacheTracker()
+    payload = tracker.prepare(delta_tracker.prepare(config))  # Data sent in full
+    payload = tracker.prepare({**config, "version": 2})  # Data sent as references
+    ```
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from streamlit_lightweight_charts_pro.utils.serialization import ColumnarData, EncodedRows
+
+# Number of data sets the frontend keeps; must match DATA_CACHE_SIZE in
+# frontend/src/utils/dataCache.ts
+DATA_CACHE_SIZE = 16
+
+# Key of the reference written in place of data held by the frontend
+CACHED_KEY = "$cached"
+
+
+def content_hash(data: Any) -> Optional[str]:
+    """
+    Get the content hash of series data.
+
+    Args:
+        data (Any): Series data of a payload.
+
+    Returns:
+        Optional[str]: The hash of EncodedRows or ColumnarData, None for other
+            data (such as lists of point dictionaries), which is not cached.
+    """
+    if isinstance(data, (EncodedRows, ColumnarData)) and len(data) > 0:
+        return data.content_hash
+    return None
+
+
+def _data_holders(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield the series configurations and operations of a payload that carry full data."""
+    if "delta" in payload:
+        for chart in payload["delta"].get("charts", []):
+            for operation in chart.get("series", []):
+                if operation.get("op") == "setData":
+                    yield operation
+                elif operation.get("op") in ("replace", "add"):
+                    yield operation["series"]
+    else:
+        for chart in payload.get("charts", []):
+            yield from chart.get("series", [])
+
+
+class DataCacheTracker:
+    """
+    Mirror of the series data held by one chart component in the browser.
+
+    Chart.render() keeps one tracker per component key in the Streamlit
+    session state, next to its ConfigDeltaTracker.
+    """
+
+    def __init__(self, size: int = DATA_CACHE_SIZE):
+        """
+        Initialize a tracker for an empty frontend cache.
+
+        Args:
+            size (int): Number of data sets the frontend keeps.
+        """
+        self.size = size
+        self._held: "OrderedDict[str, None]" = OrderedDict()
+        self._resync_request: Any = None
+
+    @property
+    def held(self) -> List[str]:
+        """Return the hashes the frontend holds, least recently used first."""
+        return list(self._held)
+
+    def reset(self, hashes: Any = ()) -> None:
+        """
+        Forget what the frontend holds, or replace it with the hashes it reported.
+
+        Args:
+            hashes (Any): Hashes reported by the frontend, least recently used first.
+        """
+        self._held = OrderedDict((value, None) for value in hashes if isinstance(value, str))
+        while len(self._held) > self.size:
+            self._held.popitem(last=False)
+
+    def prepare(
+        self, payload: Dict[str, Any], frontend_value: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Replace the data the frontend holds by references, and tag the rest.
+
+        The payload is not modified: series configurations and operations that
+        change are copied.
+
+        Args:
+            payload (Dict[str, Any]): Full configuration or delta payload, as
+                returned by ConfigDeltaTracker.prepare().
+            frontend_value (Optional[Any]): Last value reported by the component.
+                A new "resyncRequest" in it resets the tracker to the hashes
+                listed under "dataCache".
+
+        Returns:
+            Dict[str, Any]: The payload to send.
+        """
+        if isinstance(frontend_value, dict):
+            resync_request = frontend_value.get("resyncRequest")
+            if resync_request is not None and resync_request != self._resync_request:
+                self._resync_request = resync_request
+                held = frontend_value.get("dataCache")
+                self.reset(held if isinstance(held, list) else ())
+
+        replacements = {}
+        for holder in _data_holders(payload):
+            data_hash = content_hash(holder.get("data"))
+            if data_hash is None:
+                continue
+            if data_hash in self._held:
+                self._held.move_to_end(data_hash)
+                data = {CACHED_KEY: data_hash}
+            else:
+                self._held[data_hash] = None
+                if len(self._held) > self.size:
+                    self._held.popitem(last=False)
+                data = holder["data"]
+            replacements[id(holder)] = {**holder, "data": data, "dataHash": data_hash}
+
+        if not replacements:
+            return payload
+        return _replace_holders(payload, replacements)
+
+
+def _replace_holders(
+    payload: Dict[str, Any], replacements: Dict[int, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Copy a payload, swapping the series configurations and operations in replacements."""
+
+    def swap(holder: Dict[str, Any]) -> Dict[str, Any]:
+        return replacements.get(id(holder), holder)
+
+    if "delta" in payload:
+        charts = []
+        for chart in payload["delta"].get("charts", []):
+            operations = []
+            for operation in chart.get("series", []):
+                if operation.get("op") in ("replace", "add"):
+                    series = swap(operation["series"])
+                    if series is not operation["series"]:
+                        operation = {**operation, "series": series}
+                else:
+                    operation = swap(operation)
+                operations.append(operation)
+            charts.append({**chart, "series": operations})
+        return {**payload, "delta": {**payload["delta"], "charts": charts}}
+
+    charts = [
+        {**chart, "series": [swap(series) for series in chart.get("series", [])]}
+        for chart in payload.get("charts", [])
+    ]
+    return {**payload, "charts": charts}
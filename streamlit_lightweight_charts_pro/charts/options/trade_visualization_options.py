@@ -133,3 +133,11 @@ class TradeVisualizationOptions(Options):
         # Convert style to enum if it's a string
         if isinstance(self.style, str):
             self.style = TradeVisualization(self.style.lower())
+
+    @property
+    def shows_trade_text(self) -> bool:
+        """Return whether the frontend displays the tooltip text of trades."""
+        return self.show_pnl_in_markers and self.style in (
+            TradeVisualization.MARKERS,
+            TradeVisualization.BOTH,
+        )
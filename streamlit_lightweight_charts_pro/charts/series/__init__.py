@@ -63,7 +63,11 @@ License: MIT
 from streamlit_lightweight_charts_pro.charts.series.area import AreaSeries
 from streamlit_lightweight_charts_pro.charts.series.band import BandSeries
 from streamlit_lightweight_charts_pro.charts.series.bar_series import BarSeries
-from streamlit_lightweight_charts_pro.charts.series.base import Series
+from streamlit_lightweight_charts_pro.charts.series.base import (
+    ConversionCache,
+    Series,
+    conversion_cache,
+)
 from streamlit_lightweight_charts_pro.charts.series.baseline import BaselineSeries
 from streamlit_lightweight_charts_pro.charts.series.candlestick import CandlestickSeries
 from streamlit_lightweight_charts_pro.charts.series.gradient_band import GradientBandSeries
@@ -88,4 +92,6 @@ __all__ = [
     "GradientBandSeries",
     "TrendFillSeries",
     "SignalSeries",
+    "ConversionCache",
+    "conversion_cache",
 ]
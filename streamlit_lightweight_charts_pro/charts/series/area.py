@@ -37,10 +37,10 @@ import pandas as pd
 from streamlit_lightweight_charts_pro.charts.options.line_options import LineOptions
 from streamlit_lightweight_charts_pro.charts.series.base import Series
 from streamlit_lightweight_charts_pro.data.area_data import AreaData
-from streamlit_lightweight_charts_pro.type_definitions import (
-    ChartType,
-)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions import ChartType, DownsampleMethod
 from streamlit_lightweight_charts_pro.utils import chainable_property
+from streamlit_lightweight_charts_pro.utils.downsampling import DEFAULT_DOWNSAMPLE_POINTS
 
 
 @chainable_property("line_options", LineOptions, allow_none=True)
@@ -71,14 +71,17 @@ class AreaSeries(Series):
     """
 
     DATA_CLASS = AreaData
+    DOWNSAMPLE_FIELD = "value"
 
     def __init__(
         self,
-        data: Union[List[AreaData], pd.DataFrame, pd.Series],
+        data: Union[List[AreaData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "",
         pane_id: Optional[int] = 0,
+        downsample: Optional[Union[DownsampleMethod, str]] = None,
+        downsample_points: int = DEFAULT_DOWNSAMPLE_POINTS,
     ):
         """
         Initialize AreaSeries.
@@ -89,6 +92,9 @@ class AreaSeries(Series):
             visible: Whether the series is visible
             price_scale_id: ID of the price scale
             pane_id: The pane index this series belongs to
+            downsample: Downsampling method for large data ("lttb", "minmax" or "m4"),
+                or None to send every point
+            downsample_points: Maximum number of points sent when downsampling
 
             top_color: Color of the top part of the area
             bottom_color: Color of the bottom part of the area
@@ -102,6 +108,8 @@ class AreaSeries(Series):
             price_scale_id=price_scale_id,
             pane_id=pane_id,
         )
+        self.downsample = downsample
+        self.downsample_points = downsample_points
 
         # Initialize properties
         self._line_options = LineOptions()
@@ -33,6 +33,7 @@ import pandas as pd
 from streamlit_lightweight_charts_pro.charts.options.line_options import LineOptions
 from streamlit_lightweight_charts_pro.charts.series.base import Series
 from streamlit_lightweight_charts_pro.data.band import BandData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.type_definitions import (
     ChartType,
 )
@@ -74,7 +75,7 @@ class BandSeries(Series):
 
     def __init__(
         self,
-        data: Union[List[BandData], pd.DataFrame, pd.Series],
+        data: Union[List[BandData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "",
@@ -23,12 +23,14 @@ Example:
     series.base = 0
 """
 
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
 
 import pandas as pd
 
 from streamlit_lightweight_charts_pro.charts.series.base import Series
 from streamlit_lightweight_charts_pro.data import BarData
+from streamlit_lightweight_charts_pro.data.aggregation import DEFAULT_MAX_BARS
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.type_definitions import ChartType
 from streamlit_lightweight_charts_pro.utils import chainable_property
 
@@ -61,6 +63,7 @@ class BarSeries(Series):
     """
 
     DATA_CLASS = BarData
+    SUPPORTS_AGGREGATION = True
 
     @property
     def chart_type(self) -> ChartType:
@@ -69,11 +72,13 @@ class BarSeries(Series):
 
     def __init__(
         self,
-        data: Union[List[BarData], pd.DataFrame, pd.Series],
+        data: Union[List[BarData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "right",
         pane_id: Optional[int] = 0,
+        timeframes: Optional[Sequence[Union[str, int]]] = None,
+        max_bars: int = DEFAULT_MAX_BARS,
     ):
         super().__init__(
             data=data,
@@ -82,6 +87,8 @@ class BarSeries(Series):
             price_scale_id=price_scale_id,
             pane_id=pane_id,
         )
+        self.timeframes = timeframes
+        self.max_bars = max_bars
 
         # Initialize properties with default values
         self._up_color = "#26a69a"
@@ -20,29 +20,442 @@ Example:
     ```
 """
 
+import hashlib
+import threading
+import weakref
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type, Union, get_type_hints
+from collections import OrderedDict
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, get_type_hints
 
+import numpy as np
 import pandas as pd
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - depends on the environment
+    xxhash = None
+
 # Import options classes for dynamic creation
 from streamlit_lightweight_charts_pro.charts.options import (
     PriceLineOptions,
 )
+from streamlit_lightweight_charts_pro.charts.viewport import DataProvider
 from streamlit_lightweight_charts_pro.data import Data
+from streamlit_lightweight_charts_pro.data.aggregation import (
+    DEFAULT_MAX_BARS,
+    OhlcvPyramid,
+    parse_timeframe,
+)
 from streamlit_lightweight_charts_pro.data.data import classproperty
-from streamlit_lightweight_charts_pro.data.marker import MarkerBase
+from streamlit_lightweight_charts_pro.data.marker import BarMarker, MarkerBase
+from streamlit_lightweight_charts_pro.data.ohlc_data import OhlcData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.logging_config import get_logger
 from streamlit_lightweight_charts_pro.type_definitions.enums import (
+    DataTransport,
+    DownsampleMethod,
     LineStyle,
     PriceLineSource,
 )
 from streamlit_lightweight_charts_pro.utils import chainable_property
-from streamlit_lightweight_charts_pro.utils.data_utils import snake_to_camel
+from streamlit_lightweight_charts_pro.utils.chainable import serialization_plan
+from streamlit_lightweight_charts_pro.utils.data_utils import to_utc_timestamp
+from streamlit_lightweight_charts_pro.utils.disk_cache import disk_key, get_disk_cache
+from streamlit_lightweight_charts_pro.utils.downsampling import (
+    DEFAULT_DOWNSAMPLE_POINTS,
+    MIN_DOWNSAMPLE_POINTS,
+    downsample_indices,
+)
+from streamlit_lightweight_charts_pro.utils.payload_cache import shared_payload
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Bounds of the DataFrame conversion cache shared by all series
+DEFAULT_CONVERSION_CACHE_ENTRIES = 32
+DEFAULT_CONVERSION_CACHE_BYTES = 256 * 1024 * 1024
+
+# Rows hashed to fingerprint a DataFrame with sampled fingerprints
+_FINGERPRINT_SAMPLE_ROWS = 1024
+_FINGERPRINT_EDGE_ROWS = 64
+
+
+def _normalize_key(key: str) -> str:
+    """Convert a snake_case mapping key to camelCase for comparison."""
+    if "_" in key:
+        parts = key.split("_")
+        return parts[0] + "".join(part.capitalize() for part in parts[1:])
+    return key
+
+
+@lru_cache(maxsize=256)
+def _column_plan(
+    data_class: Type[Data], mapping_keys: Tuple[str, ...]
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve which column_mapping key feeds each field of a data class.
+
+    Mapping keys may be given in snake_case or camelCase. The resolution only
+    depends on the data class and the mapping keys, so it is computed once and
+    cached; the column names themselves are looked up per DataFrame because
+    prepare_index() may rename them when promoting index levels.
+
+    Args:
+        data_class (Type[Data]): Data class describing a single point.
+        mapping_keys (Tuple[str, ...]): Keys of the column mapping, in mapping order.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: (field name, mapping key) pairs for every
+            required or optional field present in the mapping.
+
+    Raises:
+        ValueError: If a required field has no mapping key.
+    """
+    required = data_class.required_columns
+    optional = data_class.optional_columns
+
+    mapping_by_normalized = {}
+    for mapping_key in mapping_keys:
+        # The first key wins when both spellings of a field are mapped
+        mapping_by_normalized.setdefault(_normalize_key(mapping_key), mapping_key)
+
+    missing_required = {key for key in required if _normalize_key(key) not in mapping_by_normalized}
+    if missing_required:
+        raise ValueError(f"DataFrame is missing required column mapping: {missing_required}")
+
+    plan = []
+    for key in sorted(required.union(optional)):
+        mapping_key = mapping_by_normalized.get(_normalize_key(key))
+        if mapping_key is not None:
+            plan.append((key, mapping_key))
+    return tuple(plan)
+
+
+def _buffer_address(column: pd.Series) -> int:
+    """Identify the memory holding a column: its address, or its array object."""
+    if isinstance(column.dtype, np.dtype):
+        return column.to_numpy().__array_interface__["data"][0]
+    return id(column.array)
+
+
+def _content_buffers(frame: pd.DataFrame, columns: List[Any]) -> List[np.ndarray]:
+    """Return the bytes of the index and of the given columns, hashing object values."""
+    buffers = []
+    for values in [frame.index, *(frame[column] for column in columns)]:
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+            array = values.to_numpy()
+        else:
+            array = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        buffers.append(np.ascontiguousarray(array).view(np.uint8))
+    return buffers
+
+
+def _frame_layout(frame: pd.DataFrame) -> Tuple[Any, ...]:
+    """Describe the shape, labels and dtypes of a DataFrame and of its index."""
+    index = frame.index
+    return (
+        frame.shape,
+        tuple(frame.columns),
+        tuple(str(dtype) for dtype in frame.dtypes),
+        type(index).__name__,
+        str(index.dtype),
+        tuple(index.names),
+    )
+
+
+def _mapped_columns(frame: pd.DataFrame, column_mapping: Dict[str, Any]) -> List[Any]:
+    """Return the columns of a DataFrame that a column mapping reads, in frame order."""
+    labels = set()
+    for label in column_mapping.values():
+        try:
+            labels.add(label)
+        except TypeError:
+            # Unhashable labels never name a column
+            continue
+    return [column for column in frame.columns if column in labels]
+
+
+def _content_digest(frame: pd.DataFrame, columns: List[Any]) -> bytes:
+    """Hash every value of the index and of the given columns, with xxhash when installed."""
+    digest = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    for buffer in _content_buffers(frame, columns):
+        digest.update(buffer)
+    return digest.digest()
+
+
+def _frame_fingerprint(
+    data: Union[pd.DataFrame, pd.Series], column_mapping: Dict[str, Any], sampled: bool = False
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Fingerprint a DataFrame or Series for the conversion cache.
+
+    Only the index and the columns read by the column mapping are looked at,
+    along with the layout of the whole frame. By default every value of the
+    index and of those columns is hashed (with xxhash when installed, and with
+    blake2b otherwise), so any in-place edit is noticed and equal data shares
+    its conversion even across objects (such as the copies returned by
+    st.cache_data).
+
+    With sampled set, the fingerprint is instead made of the identity of the
+    object, of its index and of the buffers of those columns, and a hash of
+    their first and last rows and of rows sampled in between, which costs the
+    same for any number of rows. This notices new or replaced columns,
+    appended rows and edits of the latest bars, but not in-place edits of
+    rows outside the sample.
+
+    Args:
+        data (Union[pd.DataFrame, pd.Series]): Data passed to a series.
+        column_mapping (Dict[str, Any]): Mapping of fields to column names.
+        sampled (bool): Whether to fingerprint by identity and sampled rows
+            instead of hashing every value. Defaults to False.
+
+    Returns:
+        Optional[Tuple[Any, ...]]: The fingerprint, starting with "contents" or
+            "identity", or None for data that cannot be hashed.
+    """
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    try:
+        layout = _frame_layout(frame)
+        columns = _mapped_columns(frame, column_mapping)
+        if not sampled:
+            return ("contents", layout, _content_digest(frame, columns))
+
+        mapped = frame[columns]
+        rows = len(mapped)
+        if rows > _FINGERPRINT_SAMPLE_ROWS + 2 * _FINGERPRINT_EDGE_ROWS:
+            positions = np.concatenate(
+                [
+                    np.arange(_FINGERPRINT_EDGE_ROWS),
+                    np.linspace(0, rows - 1, _FINGERPRINT_SAMPLE_ROWS, dtype=np.int64),
+                    np.arange(rows - _FINGERPRINT_EDGE_ROWS, rows),
+                ]
+            )
+            mapped = mapped.iloc[positions]
+        sample = pd.util.hash_pandas_object(mapped, index=True).to_numpy()
+        buffers = tuple(_buffer_address(frame[column]) for column in columns)
+        layout = hash(layout)
+    except TypeError:
+        # Unhashable labels or values, such as lists
+        return None
+    sample_digest = hashlib.blake2b(sample.tobytes(), digest_size=16).digest()
+    return ("identity", id(data), id(frame.index), buffers, layout, sample_digest)
+
+
+def _conversion_disk_key(
+    data: Union[pd.DataFrame, pd.Series],
+    data_class: type,
+    column_mapping: Dict[str, Any],
+    fingerprint: Optional[Tuple[Any, ...]] = None,
+) -> Optional[str]:
+    """
+    Key the conversion of data in the disk cache by a hash of every mapped value.
+
+    Unlike the sampled fingerprints of the conversion cache, the key holds
+    across processes. A content fingerprint already computed for the
+    conversion cache is reused rather than hashing the data again. Mappings
+    to labels other than strings are not stored, since their JSON form would
+    not resolve to the same columns.
+
+    Args:
+        data (Union[pd.DataFrame, pd.Series]): Data passed to a series.
+        data_class (type): Data class of the series.
+        column_mapping (Dict[str, Any]): Mapping of fields to column names.
+        fingerprint (Optional[Tuple[Any, ...]]): Fingerprint of the data for
+            the conversion cache, if computed.
+
+    Returns:
+        Optional[str]: The key, or None for data that cannot be stored.
+    """
+    if not all(isinstance(column, str) for column in column_mapping.values()):
+        return None
+    if fingerprint is None or fingerprint[0] != "contents":
+        fingerprint = _frame_fingerprint(data, column_mapping)
+        if fingerprint is None:
+            return None
+    _, layout, digest = fingerprint
+    data_class_name = f"{data_class.__module__}.{data_class.__qualname__}"
+    return disk_key(
+        "conversion", layout, digest.hex(), data_class_name, tuple(column_mapping.items())
+    )
+
+
+def _frozen_columns(data: SeriesData) -> Dict[str, np.ndarray]:
+    """Return read-only views of the columns of series data."""
+    columns = {}
+    for name, column in data.columns.items():
+        view = column.view()
+        view.flags.writeable = False
+        columns[name] = view
+    return columns
+
+
+class _Conversion:
+    """Columns converted from a DataFrame, with the column mapping resolved for it."""
+
+    __slots__ = ("columns", "column_mapping", "nbytes", "source")
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        column_mapping: Dict[str, Any],
+        source: Optional[weakref.ref],
+    ):
+        self.columns = columns
+        self.column_mapping = column_mapping
+        self.nbytes = sum(column.nbytes for column in columns.values())
+        # The converted object, for fingerprints based on identity
+        self.source = source
+
+
+class ConversionCache:
+    """
+    Least recently used cache of DataFrame conversions, shared by all series.
+
+    Series built from a DataFrame or pandas Series look up its fingerprint
+    (see _frame_fingerprint), their data class and the column mapping here
+    before converting it, so Streamlit reruns that rebuild a series from an
+    unchanged DataFrame skip the conversion. The cached columns are read-only
+    and shared by the series built from them; SeriesData copies a column
+    before changing it in place. Lookups are safe from concurrent script runs.
+
+    By default DataFrames are recognized by a hash of every value of their
+    index and mapped columns, so equal copies, such as the ones returned by
+    st.cache_data, share a conversion and edited data is always converted
+    again. Applications that rebuild series from very large DataFrames kept
+    alive between reruns (e.g. by st.cache_resource or in the session state)
+    can set sampled_fingerprints to skip the hashing, at the cost of missing
+    in-place edits of rows outside the sample.
+
+    Attributes:
+        max_entries (int): Maximum number of conversions kept; 0 disables the cache.
+        max_bytes (int): Maximum size of the cached columns, in bytes.
+        sampled_fingerprints (bool): Whether to fingerprint DataFrames by
+            identity and sampled rows rather than by hashing every value of
+            their index and mapped columns (see _frame_fingerprint). Sampled
+            fingerprints cost the same for any number of rows, but only match
+            the same object and may serve stale data after an in-place edit.
+            Defaults to False.
+        hits (int): Lookups that found a conversion.
+        misses (int): Lookups that did not.
+
+    Example:
+        ```python
+        from streamlit_lightweight_charts_pro.charts.series import conversion_cache
+
+        conversion_cache.max_bytes = 64 * 1024 * 1024
+        conversion_cache.sampled_fingerprints = True
+        conversion_cache.hits, conversion_cache.misses
+        conversion_cache.clear()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CONVERSION_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_CONVERSION_CACHE_BYTES,
+        sampled_fingerprints: bool = False,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of conversions kept.
+            max_bytes (int): Maximum size of the cached columns, in bytes.
+            sampled_fingerprints (bool): Whether to fingerprint DataFrames by
+                identity and sampled rows instead of hashing every mapped value.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sampled_fingerprints = sampled_fingerprints
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, _Conversion]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached conversions."""
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the cached columns, in bytes."""
+        return self._nbytes
+
+    def get(self, key: Any, source: Any) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+        """
+        Look up a conversion.
+
+        Args:
+            key (Any): Fingerprint, data class and column mapping of the data.
+            source (Any): The DataFrame or Series being converted.
+
+        Returns:
+            Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]: The read-only
+                columns and the resolved column mapping, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.source is not None and entry.source() is not source:
+                # The converted object is gone and another one reuses its address
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.columns, dict(entry.column_mapping)
+
+    def put(
+        self,
+        key: Any,
+        columns: Dict[str, np.ndarray],
+        column_mapping: Dict[str, Any],
+        source: Any = None,
+    ) -> None:
+        """
+        Store a conversion, evicting the least recently used ones beyond the bounds.
+
+        Args:
+            key (Any): Fingerprint, data class and column mapping of the data.
+            columns (Dict[str, np.ndarray]): Read-only converted columns.
+            column_mapping (Dict[str, Any]): Column mapping resolved by prepare_index().
+            source (Any): The converted object, for fingerprints based on identity.
+        """
+        entry = _Conversion(
+            columns, dict(column_mapping), weakref.ref(source) if source is not None else None
+        )
+        with self._lock:
+            self._discard(key)
+            if self.max_entries <= 0 or entry.nbytes > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._nbytes += entry.nbytes
+            while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop every conversion and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _discard(self, key: Any) -> None:
+        """Drop one conversion; the lock must be held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+
+
+# Conversion cache used by every series
+conversion_cache = ConversionCache()
+
 
 # pylint: disable=no-member, invalid-name
 @chainable_property("title", top_level=True)
@@ -84,7 +497,9 @@ class Series(ABC):
         - Method chaining support
 
     Attributes:
-        data (List[Data]): List of data points for this series.
+        data (Union[List[Data], SeriesData]): Data points for this series. Series
+            created from a DataFrame keep their data in a columnar SeriesData,
+            which supports the same edits as a list of data objects.
         visible (bool): Whether the series is currently visible.
         price_scale_id (str): ID of the price scale this series is attached to.
         price_format (PriceFormatOptions): Price formatting configuration.
@@ -95,11 +510,20 @@ class Series(ABC):
     Note:
         Subclasses must define a class-level DATA_CLASS attribute for from_dataframe to work.
         The data_class property will always pick the most-derived DATA_CLASS in the MRO.
+        Subclasses that can be downsampled set DOWNSAMPLE_FIELD to the data field
+        whose values decide which points are kept. Subclasses that can show an
+        OhlcvPyramid level set SUPPORTS_AGGREGATION.
     """
 
+    # Data field driving downsampling, None for series that cannot be downsampled
+    DOWNSAMPLE_FIELD: Optional[str] = None
+
+    # Whether the series can show levels of an OhlcvPyramid instead of its data
+    SUPPORTS_AGGREGATION: bool = False
+
     def __init__(
         self,
-        data: Union[List[Data], pd.DataFrame, pd.Series],
+        data: Union[List[Data], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "",
@@ -114,8 +538,9 @@ class Series(ABC):
         and conversion.
 
         Args:
-            data (Union[List[Data], pd.DataFrame, pd.Series]): Series data as a list
-                of data objects, pandas DataFrame, or pandas Series.
+            data (Union[List[Data], SeriesData, pd.DataFrame, pd.Series]): Series data as
+                a list of data objects, a columnar SeriesData, pandas DataFrame, or
+                pandas Series.
             column_mapping (Optional[dict]): Optional column mapping for DataFrame/Series
                 input. Required when providing DataFrame or Series data.
             visible (bool, optional): Whether the series is visible. Defaults to True.
@@ -156,27 +581,7 @@ class Series(ABC):
             ```
         """
         # Validate and process data
-        if data is None:
-            self.data = []
-        elif isinstance(data, (pd.DataFrame, pd.Series)):
-            if column_mapping is None:
-                raise ValueError(
-                    "column_mapping is required when providing DataFrame or Series data"
-                )
-            # Process DataFrame/Series using from_dataframe logic
-            self.data = self._process_dataframe_input(data, column_mapping)
-        elif isinstance(data, list):
-            # Validate that all items are Data instances
-            if data and not all(isinstance(item, Data) for item in data):
-                raise ValueError(
-                    "All items in data list must be instances of Data or its subclasses"
-                )
-            self.data = data
-        else:
-            raise ValueError(
-                "data must be a list of SingleValueData objects, DataFrame, or Series, "
-                f"got {type(data)}"
-            )
+        self.data = self._coerce_data(data, column_mapping)
 
         self._title = None
         self._visible = visible
@@ -195,6 +600,129 @@ class Series(ABC):
         self._price_line_style = LineStyle.DASHED
         self._tooltip = None
         self._z_index = 100
+        self._max_points = None
+        self._transport = DataTransport.JSON
+        self._downsample = None
+        self._downsample_points = DEFAULT_DOWNSAMPLE_POINTS
+        self._timeframes = None
+        self._max_bars = DEFAULT_MAX_BARS
+        self._visible_range = None
+        self._pyramid = None
+        # Data the pyramid was built from, or None for a pyramid assigned by the user
+        self._pyramid_source = None
+        self._data_provider = None
+        # Bars worth sending for the viewport reported by the frontend, if any
+        self._viewport_max_bars = None
+
+    def _coerce_data(
+        self,
+        data: Union[List[Data], SeriesData, pd.DataFrame, pd.Series, None],
+        column_mapping: Optional[dict],
+    ) -> Union[SeriesData, List[Data]]:
+        """
+        Validate series data input and convert DataFrames to columnar data.
+
+        Args:
+            data (Union[List[Data], SeriesData, pd.DataFrame, pd.Series, None]): Data
+                in any form the constructor accepts.
+            column_mapping (Optional[dict]): Column mapping for DataFrame/Series input.
+
+        Returns:
+            Union[SeriesData, List[Data]]: The series data.
+
+        Raises:
+            ValueError: If data has an invalid type or a DataFrame/Series is given
+                without column_mapping.
+        """
+        if data is None:
+            return []
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            if column_mapping is None:
+                raise ValueError(
+                    "column_mapping is required when providing DataFrame or Series data"
+                )
+            return self._convert_dataframe(data, column_mapping)
+        if isinstance(data, SeriesData):
+            return data
+        if isinstance(data, list):
+            # Validate that all items are Data instances
+            if data and not all(isinstance(item, Data) for item in data):
+                raise ValueError(
+                    "All items in data list must be instances of Data or its subclasses"
+                )
+            return data
+        raise ValueError(
+            "data must be a list of SingleValueData objects, DataFrame, or Series, "
+            f"got {type(data)}"
+        )
+
+    @classmethod
+    def _convert_dataframe(
+        cls,
+        data: Union[pd.DataFrame, pd.Series],
+        column_mapping: Dict[str, str],
+        data_class: Optional[Type[Data]] = None,
+    ) -> Union[SeriesData, List[Data]]:
+        """
+        Convert a DataFrame or Series through the conversion caches.
+
+        Like _process_dataframe_input(), resolves column_mapping in place, but
+        reuses the columns of an earlier conversion of the same data with the
+        same data class and mapping: from memory (see ConversionCache), then
+        from the disk cache when it is enabled (see utils.disk_cache).
+
+        Args:
+            data (Union[pd.DataFrame, pd.Series]): DataFrame or Series to convert.
+            column_mapping (Dict[str, str]): Mapping of fields to column names.
+            data_class (Optional[Type[Data]]): Data class to convert to, if not
+                the one of the series type.
+
+        Returns:
+            Union[SeriesData, List[Data]]: Columnar data for the series type.
+        """
+        data_class = data_class or cls.data_class
+        key = None
+        fingerprint = None
+        if conversion_cache.max_entries > 0:
+            fingerprint = _frame_fingerprint(
+                data, column_mapping, conversion_cache.sampled_fingerprints
+            )
+        if fingerprint is not None:
+            key = (fingerprint, data_class, tuple(column_mapping.items()))
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+        if key is not None:
+            cached = conversion_cache.get(key, data)
+            if cached is not None:
+                columns, resolved_mapping = cached
+                column_mapping.update(resolved_mapping)
+                return SeriesData(data_class, columns)
+        source = data if key is not None and fingerprint[0] == "identity" else None
+
+        disk = get_disk_cache()
+        entry_key = None
+        if disk is not None:
+            entry_key = _conversion_disk_key(data, data_class, column_mapping, fingerprint)
+        if entry_key is not None:
+            entry = disk.get(entry_key)
+            if entry is not None:
+                column_mapping.update(entry.meta["column_mapping"])
+                if key is not None:
+                    conversion_cache.put(key, entry.arrays, column_mapping, source)
+                return SeriesData(data_class, entry.arrays)
+
+        converted = cls._process_dataframe_input(data, column_mapping, data_class)
+        if not isinstance(converted, SeriesData):
+            return converted
+        if entry_key is not None:
+            disk.put(entry_key, {"column_mapping": column_mapping}, arrays=converted.columns)
+        if key is None:
+            return converted
+        columns = _frozen_columns(converted)
+        conversion_cache.put(key, columns, column_mapping, source)
+        return SeriesData(data_class, columns)
 
     @staticmethod
     def prepare_index(df: pd.DataFrame, column_mapping: Dict[str, str]) -> pd.DataFrame:
@@ -225,8 +753,10 @@ class Series(ABC):
                 # Handle single DatetimeIndex
                 if isinstance(df.index, pd.DatetimeIndex):
                     if df.index.name is None:
-                        # Set name and reset index to make it a regular column
-                        df.index.name = time_col
+                        # Name the index of a shallow copy, leaving the caller's
+                        # DataFrame untouched, and reset it to make it a regular column
+                        df = df.copy(deep=False)
+                        df.index = df.index.rename(time_col)
                         df = df.reset_index()
                     elif df.index.name == time_col:
                         # Index name already matches, just reset to make it a regular column
@@ -240,7 +770,8 @@ class Series(ABC):
                                 # Set name for this level and reset it
                                 new_names = list(df.index.names)
                                 new_names[i] = time_col
-                                df.index.names = new_names
+                                df = df.copy(deep=False)
+                                df.index = df.index.set_names(new_names)
                                 df = df.reset_index(level=time_col)
                                 break
                             elif df.index.names[i] == time_col:
@@ -341,23 +872,30 @@ class Series(ABC):
 
         return df
 
+    @classmethod
     def _process_dataframe_input(
-        self, data: Union[pd.DataFrame, pd.Series], column_mapping: Dict[str, str]
-    ) -> List[Data]:
+        cls,
+        data: Union[pd.DataFrame, pd.Series],
+        column_mapping: Dict[str, str],
+        data_class: Optional[Type[Data]] = None,
+    ) -> Union[SeriesData, List[Data]]:
         """
-        Process DataFrame or Series input into a list of Data objects.
+        Process DataFrame or Series input into series data.
 
-        This method duplicates the logic from from_dataframe to handle
-        DataFrame/Series input in the constructor. It validates the input
-        data structure and converts it to the appropriate Data objects
-        based on the series type.
+        This method handles DataFrame/Series input in the constructor. The
+        mapping of data class fields to columns (snake_case or camelCase keys)
+        is resolved once per data class and mapping and cached; the mapped
+        columns are then normalized and validated in one vectorized pass.
 
         Args:
             data (Union[pd.DataFrame, pd.Series]): DataFrame or Series to process.
             column_mapping (Dict[str, str]): Mapping of required fields to column names.
+            data_class (Optional[Type[Data]]): Data class to convert to, if not
+                the one of the series type.
 
         Returns:
-            List[Data]: List of processed data objects suitable for the series type.
+            Union[SeriesData, List[Data]]: Columnar data for the series type, or a
+                list of data objects for data classes without columnar support.
 
         Raises:
             ValueError: If required columns are missing from the DataFrame/Series.
@@ -368,35 +906,17 @@ class Series(ABC):
             This method uses the data_class property to determine the appropriate
             Data class for conversion.
         """
+        data_class = data_class or cls.data_class
+
         # Convert Series to DataFrame if needed (do this first)
         if isinstance(data, pd.Series):
             data = data.to_frame()
 
-        data_class = self.data_class
-        required = data_class.required_columns
-        optional = data_class.optional_columns
-
-        # Check if all required columns are mapped
-        # Normalize keys to handle both snake_case and camelCase
-        def normalize_key(key):
-            """Convert snake_case to camelCase for comparison."""
-            if "_" in key:
-                parts = key.split("_")
-                return parts[0] + "".join(part.capitalize() for part in parts[1:])
-            return key
-
-        # Create normalized versions of both sets for comparison
-        normalized_required = {normalize_key(key) for key in required}
-        normalized_mapping_keys = {normalize_key(key) for key in column_mapping.keys()}
-
-        missing_required = normalized_required - normalized_mapping_keys
-        if missing_required:
-            # Convert back to original format for error message
-            original_missing = {key for key in required if normalize_key(key) in missing_required}
-            raise ValueError(f"DataFrame is missing required column mapping: {original_missing}")
+        # Resolve field -> mapping key once per (data class, mapping keys)
+        plan = _column_plan(data_class, tuple(column_mapping))
 
         # Prepare index for all column mappings
-        df = self.prepare_index(data, column_mapping)
+        df = cls.prepare_index(data, column_mapping)
 
         # Check if all required columns are present in the DataFrame
         mapped_columns = set(column_mapping.values())
@@ -406,28 +926,9 @@ class Series(ABC):
         if missing_columns:
             raise ValueError(f"DataFrame is missing required column: {missing_columns}")
 
-        # Create data objects
-        result = []
-        for _, row in df.iterrows():
-            kwargs = {}
-            # Process both required and optional columns
-            for key in required.union(optional):
-                # Find the corresponding column mapping key (handle both snake_case and camelCase)
-                mapped_key = None
-                for mapping_key in column_mapping:
-                    if normalize_key(mapping_key) == normalize_key(key):
-                        mapped_key = mapping_key
-                        break
-
-                if mapped_key:
-                    col_name = column_mapping[mapped_key]
-                    if col_name in df.columns:
-                        value = row[col_name]
-                        kwargs[key] = value
-            data_obj = data_class(**kwargs)
-            result.append(data_obj)
-
-        return result
+        # Apply the plan to whole columns; Data objects are built lazily
+        columns = {key: df[column_mapping[mapping_key]] for key, mapping_key in plan}
+        return SeriesData.from_columns(data_class, columns)
 
     @property
     def data_dict(self) -> List[Dict[str, Any]]:
@@ -454,6 +955,9 @@ class Series(ABC):
                 pass
             ```
         """
+        if isinstance(self.data, SeriesData):
+            # Serialize straight from the columns without building Data objects
+            return self.data.asdicts()
         if isinstance(self.data, dict):
             return self.data
         if isinstance(self.data, list):
@@ -468,6 +972,624 @@ class Series(ABC):
         # Fallback: return as-is
         return self.data
 
+    @property
+    def max_points(self) -> Optional[int]:
+        """
+        Get the maximum number of points kept by the series.
+
+        Returns:
+            Optional[int]: The maximum number of points, or None when the history
+                is unbounded.
+        """
+        return self._max_points
+
+    @max_points.setter
+    def max_points(self, value: Optional[int]) -> None:
+        """
+        Bound the history of the series, e.g. for an always-on tick chart.
+
+        When the series holds more points, the oldest ones are dropped, now and
+        after every append().
+
+        Args:
+            value (Optional[int]): Maximum number of points, or None for no limit.
+
+        Raises:
+            ValueError: If value is not None or a positive integer.
+        """
+        data = self._streaming_data()
+        if isinstance(data, SeriesData):
+            data.max_points = value
+        else:
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value <= 0
+            ):
+                raise ValueError("max_points must be a positive integer or None")
+            if value is not None and len(data) > value:
+                del data[: len(data) - value]
+        self._max_points = value
+
+    @property
+    def transport(self) -> DataTransport:
+        """
+        Get how the data points of the series are sent to the frontend.
+
+        Returns:
+            DataTransport: The data transport, DataTransport.JSON by default.
+        """
+        return self._transport
+
+    @transport.setter
+    def transport(self, value: Union[DataTransport, str]) -> None:
+        """
+        Set how the data points of the series are sent to the frontend.
+
+        With DataTransport.COLUMNAR, Chart.render() sends the numeric fields of
+        the data as binary float64 columns, which the frontend reads as typed
+        arrays instead of parsing one JSON object per point. This makes the
+        payload of large series several times smaller and faster to decode.
+        Series whose data cannot be described by columns (e.g. data classes
+        with a custom asdict()) are still sent as JSON.
+
+        Args:
+            value (Union[DataTransport, str]): The data transport.
+
+        Raises:
+            ValueError: If value is not a valid DataTransport.
+        """
+        try:
+            self._transport = DataTransport(value)
+        except ValueError as exc:
+            valid = ", ".join(transport.value for transport in DataTransport)
+            raise ValueError(f"transport must be one of {valid}, got {value!r}") from exc
+
+    @property
+    def downsample(self) -> Optional[DownsampleMethod]:
+        """
+        Get the method used to downsample the data sent to the frontend.
+
+        Returns:
+            Optional[DownsampleMethod]: The downsampling method, or None when every
+                point is sent.
+        """
+        return self._downsample
+
+    @downsample.setter
+    def downsample(self, value: Optional[Union[DownsampleMethod, str]]) -> None:
+        """
+        Set the method used to downsample the data sent to the frontend.
+
+        When set, series holding more than downsample_points points only send
+        that many to the frontend, chosen with the given method (see
+        utils.downsampling). The first and last points and the lowest and
+        highest values are always sent. The series data itself is not changed.
+
+        Args:
+            value (Optional[Union[DownsampleMethod, str]]): The downsampling method,
+                or None to send every point.
+
+        Raises:
+            ValueError: If the series type cannot be downsampled or value is not a
+                valid DownsampleMethod.
+        """
+        if value is None:
+            self._downsample = None
+            return
+        if self.DOWNSAMPLE_FIELD is None:
+            raise ValueError(f"{type(self).__name__} does not support downsampling")
+        try:
+            self._downsample = DownsampleMethod(value)
+        except ValueError as exc:
+            valid = ", ".join(method.value for method in DownsampleMethod)
+            raise ValueError(f"downsample must be one of {valid} or None, got {value!r}") from exc
+
+    @property
+    def downsample_points(self) -> int:
+        """
+        Get the number of points sent to the frontend when downsampling.
+
+        Returns:
+            int: The maximum number of points sent.
+        """
+        return self._downsample_points
+
+    @downsample_points.setter
+    def downsample_points(self, value: int) -> None:
+        """
+        Set the number of points sent to the frontend when downsampling.
+
+        Args:
+            value (int): The maximum number of points sent, e.g. about twice the
+                width of the chart in pixels.
+
+        Raises:
+            ValueError: If value is not an integer of at least 4.
+        """
+        if isinstance(value, bool) or not isinstance(value, int) or value < MIN_DOWNSAMPLE_POINTS:
+            raise ValueError(
+                f"downsample_points must be an integer of at least {MIN_DOWNSAMPLE_POINTS}"
+            )
+        self._downsample_points = value
+
+    def _downsampled_data(
+        self, data: Union[SeriesData, List[Data]]
+    ) -> Union[SeriesData, List[Data]]:
+        """
+        Get the points to send to the frontend.
+
+        Args:
+            data (Union[SeriesData, List[Data]]): The series data.
+
+        Returns:
+            Union[SeriesData, List[Data]]: data itself, or a new container with the
+                points kept by downsampling.
+        """
+        if self._downsample is None or len(data) <= self._downsample_points:
+            return data
+        field = self.DOWNSAMPLE_FIELD
+        if isinstance(data, SeriesData):
+            values = data.columns.get(field)
+            if values is None or values.dtype.kind not in "biuf":
+                return data
+        else:
+            values = np.array([getattr(point, field, None) for point in data], dtype=np.float64)
+        indices = downsample_indices(values, self._downsample, self._downsample_points)
+        if indices is None:
+            return data
+        if isinstance(data, SeriesData):
+            return data.take(indices)
+        return [data[index] for index in indices.tolist()]
+
+    @property
+    def timeframes(self) -> Optional[List[int]]:
+        """
+        Get the timeframes the series data is aggregated to.
+
+        Returns:
+            Optional[List[int]]: Timeframes in seconds, ascending, or None when the
+                data is always sent at its own resolution.
+        """
+        return self._timeframes
+
+    @timeframes.setter
+    def timeframes(self, value: Optional[Sequence[Union[str, int]]]) -> None:
+        """
+        Set the timeframes the series data is aggregated to.
+
+        When set, the series builds an OhlcvPyramid of its data with these
+        timeframes and only sends the finest resolution that shows visible_range
+        in at most max_bars bars (see pyramid). The series data is not changed.
+
+        Args:
+            value (Optional[Sequence[Union[str, int]]]): Timeframes such as "5m",
+                "1h" or "1D", or numbers of seconds (see
+                data.aggregation.parse_timeframe()), or None to send every bar.
+
+        Raises:
+            ValueError: If the series type cannot be aggregated or a timeframe is
+                invalid.
+        """
+        if value is None:
+            self._timeframes = None
+            self._pyramid = None
+            self._pyramid_source = None
+            return
+        if not self.SUPPORTS_AGGREGATION or not issubclass(self.data_class, OhlcData):
+            raise ValueError(f"{type(self).__name__} does not support timeframe aggregation")
+        self._timeframes = sorted({parse_timeframe(timeframe) for timeframe in value})
+        self._pyramid = None
+        self._pyramid_source = None
+
+    @property
+    def max_bars(self) -> int:
+        """
+        Get the number of bars sent for visible_range when aggregating.
+
+        Returns:
+            int: The maximum number of bars in the visible range.
+        """
+        return self._max_bars
+
+    @max_bars.setter
+    def max_bars(self, value: int) -> None:
+        """
+        Set the number of bars sent for visible_range when aggregating.
+
+        Args:
+            value (int): The maximum number of bars in the visible range, e.g. about
+                the width of the chart in pixels.
+
+        Raises:
+            ValueError: If value is not a positive integer.
+        """
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            raise ValueError("max_bars must be a positive integer")
+        self._max_bars = value
+
+    @property
+    def visible_range(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the time range the aggregation resolution is chosen for.
+
+        Returns:
+            Optional[Tuple[int, int]]: (start, end) UNIX times, or None for the
+                whole history.
+        """
+        return self._visible_range
+
+    @visible_range.setter
+    def visible_range(self, value: Optional[Tuple[Any, Any]]) -> None:
+        """
+        Set the time range the aggregation resolution is chosen for.
+
+        Only used with a pyramid: the bars sent are those of the chosen
+        resolution around this range (see OhlcvPyramid.window()).
+
+        Args:
+            value (Optional[Tuple[Any, Any]]): (start, end) times in any format
+                accepted by to_utc_timestamp(), or None for the whole history.
+
+        Raises:
+            ValueError: If value is not a pair of times with start <= end.
+        """
+        if value is None:
+            self._visible_range = None
+            return
+        try:
+            start, end = value
+        except (TypeError, ValueError) as exc:
+            raise ValueError("visible_range must be a (start, end) pair or None") from exc
+        start, end = to_utc_timestamp(start), to_utc_timestamp(end)
+        if start > end:
+            raise ValueError(f"visible_range start {start} is after its end {end}")
+        self._visible_range = (start, end)
+
+    @property
+    def pyramid(self) -> Optional[OhlcvPyramid]:
+        """
+        Get the multi-resolution view of the series data.
+
+        With timeframes set, the pyramid is built from the series data on first
+        use and rebuilt after the data changes. Its levels are aggregated lazily
+        and cached.
+
+        Returns:
+            Optional[OhlcvPyramid]: The pyramid, or None when the series is not
+                aggregated.
+        """
+        if self._pyramid is not None and self._pyramid_source is None:
+            # Assigned by the user (e.g. shared by price and volume series)
+            return self._pyramid
+        if self._timeframes is None:
+            return None
+        if self._pyramid is None or self._pyramid_source is not self.data:
+            data = self.data
+            if not isinstance(data, SeriesData):
+                data = SeriesData.from_data(self.data_class, data)
+            self._pyramid = OhlcvPyramid(data, self._timeframes)
+            self._pyramid_source = self.data
+        return self._pyramid
+
+    @pyramid.setter
+    def pyramid(self, value: Optional[OhlcvPyramid]) -> None:
+        """
+        Show the levels of an existing pyramid instead of the series data.
+
+        This lets several series share one pyramid, e.g. the price and volume
+        series of the same OHLCV data. The pyramid is used as-is: assign a new
+        one after changing the underlying bars.
+
+        Args:
+            value (Optional[OhlcvPyramid]): The pyramid, or None to send the series
+                data again.
+
+        Raises:
+            ValueError: If the series type cannot show pyramid levels.
+            TypeError: If value is not an OhlcvPyramid.
+        """
+        if value is None:
+            self._pyramid = None
+            self._pyramid_source = None
+            self._timeframes = None
+            return
+        if not self.SUPPORTS_AGGREGATION:
+            raise ValueError(f"{type(self).__name__} does not support timeframe aggregation")
+        if not isinstance(value, OhlcvPyramid):
+            raise TypeError(f"pyramid must be an OhlcvPyramid, got {type(value).__name__}")
+        self._pyramid = value
+        self._pyramid_source = None
+        self._timeframes = list(value.timeframes)
+
+    @property
+    def data_provider(self) -> Optional[DataProvider]:
+        """
+        Get the function loading the series data for the range on screen.
+
+        Returns:
+            Optional[DataProvider]: The data provider, or None when the series
+                always holds its whole data.
+        """
+        return self._data_provider
+
+    @data_provider.setter
+    def data_provider(self, value: Optional[DataProvider]) -> None:
+        """
+        Set the function loading the series data for the range on screen.
+
+        The provider is called as provider(start, end, max_bars) and returns the
+        bars between the UNIX times start and end, in any form the constructor
+        accepts (DataFrames use the column mapping of the series), preferably at
+        a resolution giving no more than about max_bars bars. start and end are
+        None before the frontend reported a viewport, in which case the provider
+        picks the initial window (e.g. the most recent bars). Chart.render()
+        calls it with the range around the viewport (see set_viewport()).
+
+        Args:
+            value (Optional[DataProvider]): The data provider, or None.
+
+        Raises:
+            TypeError: If value is not callable.
+        """
+        if value is not None and not callable(value):
+            raise TypeError(f"data_provider must be callable, got {type(value).__name__}")
+        self._data_provider = value
+
+    def set_viewport(
+        self, start: Optional[int], end: Optional[int], max_bars: Optional[int] = None
+    ) -> "Series":
+        """
+        Show a time range: load it from the data provider and pick its resolution.
+
+        The series data is replaced by what data_provider returns for the range
+        widened by its own length on both sides (so the chart can pan a little
+        before a new window is needed), with a budget of three times max_bars.
+        Series with a pyramid show the finest resolution fitting max_bars bars
+        in the range (see visible_range).
+
+        Args:
+            start (Optional[int]): First visible UNIX time, or None for the default
+                window.
+            end (Optional[int]): Last visible UNIX time, or None.
+            max_bars (Optional[int]): Bars worth sending for the range, e.g.
+                Viewport.bar_budget(). Defaults to max_bars.
+
+        Returns:
+            Series: Self for method chaining.
+        """
+        self._viewport_max_bars = max_bars
+        budget = self._bar_limit()
+        if start is not None and end is not None:
+            self.visible_range = (start, end)
+        if self._data_provider is not None:
+            if start is not None and end is not None:
+                width = end - start
+                window = self._data_provider(start - width, end + width, budget * 3)
+            else:
+                window = self._data_provider(start, end, budget)
+            self.data = self._coerce_data(window, self._column_mapping)
+            self._discard_built_pyramid()
+        return self
+
+    def _bar_limit(self) -> int:
+        """Return the number of bars to send for visible_range."""
+        if self._viewport_max_bars is None:
+            return self._max_bars
+        return min(self._max_bars, self._viewport_max_bars)
+
+    @property
+    def resolution(self) -> Optional[int]:
+        """
+        Get the timeframe of the bars currently sent to the frontend.
+
+        Returns:
+            Optional[int]: Timeframe in seconds, or None when the series data is
+                sent at its own resolution.
+        """
+        pyramid = self.pyramid
+        if pyramid is None:
+            return None
+        start, end = self._visible_range or (None, None)
+        return pyramid.select_timeframe(start, end, self._bar_limit())
+
+    def _resolution_data(
+        self, data: Union[SeriesData, List[Data]]
+    ) -> Union[SeriesData, List[Data]]:
+        """
+        Get the bars of the resolution chosen for visible_range.
+
+        Args:
+            data (Union[SeriesData, List[Data]]): The series data.
+
+        Returns:
+            Union[SeriesData, List[Data]]: data itself when the series is not
+                aggregated, otherwise the pyramid bars around visible_range.
+        """
+        pyramid = self.pyramid
+        if pyramid is None:
+            return data
+        start, end = self._visible_range or (None, None)
+        timeframe = pyramid.select_timeframe(start, end, self._bar_limit())
+        if timeframe is None and self._pyramid_source is data and self._visible_range is None:
+            return data
+        return self._pyramid_view(pyramid.window(timeframe, start, end))
+
+    def _pyramid_view(self, bars: SeriesData) -> SeriesData:
+        """
+        Convert pyramid bars to the data class of the series.
+
+        Args:
+            bars (SeriesData): Bars of one pyramid level.
+
+        Returns:
+            SeriesData: The fields of the bars the data class of the series has.
+        """
+        if bars.data_class is self.data_class:
+            return bars
+        names = {data_field.name for data_field in fields(self.data_class)}
+        return SeriesData(
+            self.data_class,
+            {name: values for name, values in bars.columns.items() if name in names},
+        )
+
+    def _data_dicts(self, data: Union[SeriesData, List[Data]]) -> List[Dict[str, Any]]:
+        """Serialize the given points, which are the series data or a downsampled copy."""
+        if data is self.data:
+            return self.data_dict
+        if isinstance(data, SeriesData):
+            return data.asdicts()
+        return [point.asdict() for point in data]
+
+    def append(
+        self,
+        data: Union[Data, List[Data], SeriesData, pd.DataFrame, pd.Series],
+        column_mapping: Optional[dict] = None,
+    ) -> "Series":
+        """
+        Add new points at the end of the series.
+
+        Points are stored in a growable columnar buffer, so appending is
+        amortized O(1) per point. When max_points is set, the oldest points are
+        dropped to keep the series bounded. Serialization afterwards only
+        converts the new points (see SeriesData.dirty_range).
+
+        Args:
+            data (Union[Data, List[Data], SeriesData, pd.DataFrame, pd.Series]): A
+                data object, a list of data objects, a SeriesData, or a DataFrame or
+                Series with the same layout as the constructor accepts.
+            column_mapping (Optional[dict]): Column mapping for DataFrame/Series
+                input. Defaults to the mapping the series was created with.
+
+        Returns:
+            Series: Self for method chaining.
+
+        Raises:
+            ValueError: If data has an invalid type, if a DataFrame is given without
+                a column mapping, or if the new points do not start after the last
+                point of the series.
+            TypeError: If the data objects do not match the series data class.
+
+        Example:
+            ```python
+            series = CandlestickSeries(data=history_df, column_mapping=mapping)
+            series.max_points = 5_000
+            series.append(CandlestickData(time=next_time, open=1, high=2, low=0.5, close=1.5))
+            series.append(new_bars_df)  # Uses the mapping given at construction
+            ```
+        """
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            column_mapping = column_mapping or self._column_mapping
+            if column_mapping is None:
+                raise ValueError(
+                    "column_mapping is required when appending DataFrame or Series data"
+                )
+            new_points = self._process_dataframe_input(data, column_mapping)
+        elif isinstance(data, SeriesData):
+            new_points = data
+        elif isinstance(data, Data):
+            new_points = [data]
+        elif isinstance(data, list):
+            if not all(isinstance(item, Data) for item in data):
+                raise ValueError(
+                    "All items in data list must be instances of Data or its subclasses"
+                )
+            new_points = data
+        else:
+            raise ValueError(
+                "data must be a data object, a list of data objects, SeriesData, DataFrame, "
+                f"or Series, got {type(data)}"
+            )
+        if len(new_points) == 0:
+            return self
+
+        current = self._streaming_data()
+        self._discard_built_pyramid()
+        if len(current) > 0:
+            first_time = (
+                new_points.columns["time"][0]
+                if isinstance(new_points, SeriesData)
+                else new_points[0].time
+            )
+            last_time = (
+                current.columns["time"][-1] if isinstance(current, SeriesData) else current[-1].time
+            )
+            if first_time <= last_time:
+                raise ValueError(
+                    f"Appended points must start after the last point (time {last_time}), "
+                    f"got time {first_time}; use update_last() to change the last point"
+                )
+
+        if isinstance(current, SeriesData):
+            current.extend(new_points)
+        else:
+            if isinstance(new_points, SeriesData):
+                new_points = new_points.to_data_list()
+            current.extend(new_points)
+            if self._max_points is not None and len(current) > self._max_points:
+                del current[: len(current) - self._max_points]
+        return self
+
+    def update_last(self, point: Data) -> "Series":
+        """
+        Replace the last point of the series, e.g. the bar still being formed.
+
+        Args:
+            point (Data): New value of the last point. It must have the same time.
+
+        Returns:
+            Series: Self for method chaining.
+
+        Raises:
+            TypeError: If point is not a data object of the series data class.
+            ValueError: If the series is empty or point has another time.
+
+        Example:
+            ```python
+            series.update_last(CandlestickData(time=bar_time, open=1, high=2.5, low=0.5, close=2))
+            ```
+        """
+        if not isinstance(point, Data):
+            raise TypeError(f"point must be a data object, got {type(point).__name__}")
+
+        current = self._streaming_data()
+        self._discard_built_pyramid()
+        if isinstance(current, SeriesData):
+            current.update_last(point)
+            return self
+
+        if not current:
+            raise ValueError("Cannot update the last point of empty data")
+        if point.time != current[-1].time:
+            raise ValueError(
+                f"update_last() expects the time of the last point ({current[-1].time}), "
+                f"got {point.time}"
+            )
+        current[-1] = point
+        return self
+
+    def _discard_built_pyramid(self) -> None:
+        """Drop a pyramid built from the series data, which is about to change."""
+        if self._pyramid_source is not None:
+            self._pyramid = None
+            self._pyramid_source = None
+
+    def _streaming_data(self) -> Union[SeriesData, List[Data]]:
+        """
+        Get the series data in a form that supports append() and update_last().
+
+        Lists of data objects of exactly the series data class are converted to
+        a SeriesData once; other lists (e.g. mixed data classes) stay lists.
+
+        Returns:
+            Union[SeriesData, List[Data]]: The series data.
+        """
+        if isinstance(self.data, list) and all(
+            type(point) is self.data_class for point in self.data  # noqa: E721
+        ):
+            self.data = SeriesData.from_data(self.data_class, self.data)
+            if self._max_points is not None:
+                self.data.max_points = self._max_points
+        return self.data
+
     def add_marker(self, marker: MarkerBase) -> "Series":
         """
         Add a marker to this series.
@@ -520,24 +1642,74 @@ class Series(ABC):
                 f"Invalid position '{marker.position}' for marker type {type(marker).__name__}"
             )
 
-        self._markers.append(marker)
+        self._extend_markers([marker])
         return self
 
-    def add_markers(self, markers: List[MarkerBase]) -> "Series":
+    def add_markers(
+        self,
+        markers: Union[List[MarkerBase], SeriesData, pd.DataFrame],
+        column_mapping: Optional[Dict[str, str]] = None,
+        marker_class: Type[MarkerBase] = BarMarker,
+    ) -> "Series":
         """
         Add multiple markers to this series.
 
         Adds a list of markers to the series. Returns self for method chaining.
 
+        Many markers (e.g. the signals of a strategy) are better given as
+        columns: a DataFrame with a column mapping, or a SeriesData of a marker
+        class. They are validated in bulk, stored as one array per field and
+        serialized straight from the arrays, without one marker object each.
+
         Args:
-            markers: List of marker objects to add. Must be MarkerBase subclasses.
+            markers: List of marker objects to add, a SeriesData of a marker
+                class, or a DataFrame with one marker per row.
+            column_mapping: Mapping of marker fields to DataFrame columns (or
+                index levels); required for DataFrame input.
+            marker_class: Marker class of the DataFrame rows.
 
         Returns:
             Series: Self for method chaining.
 
         Raises:
-            ValueError: If any marker position is not valid for its type.
+            ValueError: If any marker position is not valid for its type, or a
+                DataFrame is given without column_mapping.
+            TypeError: If a SeriesData does not hold markers.
+
+        Example:
+            ```python
+            signals = df[df["signal"] != 0].assign(
+                position=np.where(df["signal"] > 0, "belowBar", "aboveBar"),
+                shape=np.where(df["signal"] > 0, "arrowUp", "arrowDown"),
+            )
+            series.add_markers(
+                signals,
+                column_mapping={"time": "datetime", "position": "position", "shape": "shape"},
+            )
+            ```
         """
+        converted = isinstance(markers, pd.DataFrame)
+        if converted:
+            if column_mapping is None:
+                raise ValueError("column_mapping is required when providing DataFrame markers")
+            markers = self._convert_dataframe(markers, dict(column_mapping), marker_class)
+
+        if isinstance(markers, SeriesData):
+            if not issubclass(markers.data_class, MarkerBase):
+                raise TypeError(
+                    f"markers must hold MarkerBase subclasses, got {markers.data_class.__name__}"
+                )
+            positions = markers.columns.get("position")
+            if positions is None:
+                positions = np.array([markers.data_class.position])
+            markers.data_class.validate_positions(positions)
+            if not converted:
+                # Later additions extend the stored markers in place, which must
+                # not change the caller's SeriesData or other series given it
+                markers = markers.copy()
+            self._extend_markers(markers)
+            return self
+
         # Validate all markers before adding
         for marker in markers:
             if not marker.validate_position():
@@ -545,9 +1717,29 @@ class Series(ABC):
                     f"Invalid position '{marker.position}' for marker type {type(marker).__name__}"
                 )
 
-        self._markers.extend(markers)
+        self._extend_markers(markers)
         return self
 
+    def _extend_markers(self, markers: Union[List[MarkerBase], SeriesData]) -> None:
+        """Store validated markers, keeping them as columns while they share one class."""
+        current = self._markers
+        if current is None:
+            current = self._markers = []
+        if isinstance(markers, SeriesData):
+            if len(current) == 0:
+                self._markers = markers
+            elif isinstance(current, SeriesData) and current.data_class is markers.data_class:
+                current.extend(markers)
+            else:
+                self._markers = list(current) + list(markers)
+        elif isinstance(current, SeriesData):
+            if all(type(marker) is current.data_class for marker in markers):  # noqa: E721
+                current.extend(markers)
+            else:
+                self._markers = list(current) + list(markers)
+        else:
+            current.extend(markers)
+
     def clear_markers(self) -> "Series":
         """
         Clear all markers from this series.
@@ -557,7 +1749,10 @@ class Series(ABC):
         Returns:
             Series: Self for method chaining.
         """
-        self._markers.clear()
+        if isinstance(self._markers, list):
+            self._markers.clear()
+        else:
+            self._markers = []
         return self
 
     def add_price_line(self, price_line: PriceLineOptions) -> "Series":
@@ -791,64 +1986,96 @@ class Series(ABC):
         Convert series to dictionary representation.
 
         This method creates a dictionary representation of the series
-        that can be consumed by the frontend React component.
+        that can be consumed by the frontend React component. When downsample
+        is set, the data only holds the points kept by downsampling; with a
+        pyramid, it holds the bars of the resolution chosen for visible_range.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing series configuration for the frontend.
+        """
+        data = self._downsampled_data(self._resolution_data(self.data))
+        return self._config_with_data(self._data_dicts(data))
+
+    def asdict_encoded(self) -> Dict[str, Any]:
+        """
+        Convert series to dictionary representation with pre-encoded data.
+
+        Same as asdict(), except that columnar data (SeriesData) is written
+        straight to JSON as EncodedRows instead of one dictionary per data point.
+        The result is meant to be encoded with utils.serialization.dumps(), which
+        produces the JSON encoding of asdict(). Series whose data is a list, or
+        that customize asdict(), fall back to asdict().
+
+        With the COLUMNAR transport, the data is given as ColumnarData instead,
+        which utils.serialization.encode_payload() sends as binary columns.
+
+        Like asdict(), only the points kept by downsampling or the bars of the
+        chosen pyramid resolution are included.
+
+        Large data that is not modified in place is serialized through the
+        process-wide payload cache (see utils.payload_cache), so sessions
+        showing the same points share one serialized copy.
 
         Returns:
             Dict[str, Any]: Dictionary containing series configuration for the frontend.
         """
+        if type(self).asdict is not Series.asdict:
+            return self.asdict()
+        data = self.data
+        if self._transport == DataTransport.COLUMNAR and isinstance(data, list) and data:
+            data = self._streaming_data()
+        data = self._downsampled_data(self._resolution_data(data))
+        if self._transport == DataTransport.COLUMNAR:
+            if isinstance(data, SeriesData) and data.data_class.asdict is Data.asdict:
+                return self._config_with_data(shared_payload(data, columnar=True), encoded=True)
+        if not isinstance(data, SeriesData):
+            return self._config_with_data(self._data_dicts(data), encoded=True)
+        return self._config_with_data(shared_payload(data), encoded=True)
+
+    def _config_with_data(self, data: Any, encoded: bool = False) -> Dict[str, Any]:
+        """
+        Build the frontend configuration of the series around serialized data.
+
+        Properties stored as SeriesData (such as markers given as columns) are
+        serialized from their columns, as EncodedRows when encoded is set.
+        """
         # Validate pane configuration
         self._validate_pane_config()
 
         # Get base configuration
         config = {
             "type": self.chart_type.value,
-            "data": self.data_dict,
+            "data": data,
         }
 
-        # Add options from chainable properties only
+        # Add options from chainable properties only, following the plan of the
+        # class instead of reflecting over it on every call
         options = {}
-        for attr_name in dir(self):
-            if attr_name.startswith("_"):
-                continue
-            # Skip data attribute as it's handled separately
-            if attr_name == "data":
-                continue
-            # Skip class attributes (like DATA_CLASS)
-            if attr_name.isupper():
-                continue
-            # Skip class properties (like data_class)
-            if attr_name == "data_class":
-                continue
+        for prop in serialization_plan(type(self)):
+            attr_value = getattr(self, prop.name)
 
-            # Rule 1: Only include attributes decorated with chainable_property
-            if not self._is_chainable_property(attr_name):
+            # Skip if None and allow_none is True
+            if attr_value is None and prop.allow_none:
                 continue
 
-            attr_value = getattr(self, attr_name)
+            target = config if prop.top_level else options
 
-            # Rule 2: Skip if None and allow_none is True
-            if attr_value is None and self._is_allow_none(attr_name):
-                continue
-
-            # Determine if this should go to top level or options
-            is_top_level = self._is_top_level(attr_name)
+            # Columnar values, e.g. markers, serialized without building objects
+            if isinstance(attr_value, SeriesData):
+                if len(attr_value):
+                    target[prop.key] = attr_value.encoded() if encoded else attr_value.asdicts()
 
             # Handle objects with asdict() method
-            if (
+            elif (
                 hasattr(attr_value, "asdict")
                 and callable(getattr(attr_value, "asdict"))
                 and not isinstance(attr_value, type)
             ):
-                # Rule 3: If property ends with _options, flatten it into options
-                if attr_name.endswith("_options"):
+                # If property ends with _options, flatten it into options
+                if prop.flatten:
                     options.update(attr_value.asdict())
                 else:
-                    # Convert snake_case to camelCase for the key
-                    key = snake_to_camel(attr_name)
-                    if is_top_level:
-                        config[key] = attr_value.asdict()
-                    else:
-                        options[key] = attr_value.asdict()
+                    target[prop.key] = attr_value.asdict()
 
             # Handle lists of objects with asdict() method
             elif (
@@ -857,12 +2084,7 @@ class Series(ABC):
                 and hasattr(attr_value[0], "asdict")
                 and callable(getattr(attr_value[0], "asdict"))
             ):
-                # Convert list of objects to list of dictionaries
-                key = snake_to_camel(attr_name)
-                if is_top_level:
-                    config[key] = [item.asdict() for item in attr_value]
-                else:
-                    options[key] = [item.asdict() for item in attr_value]
+                target[prop.key] = [item.asdict() for item in attr_value]
 
             # Also include individual option attributes that are not None
             elif (
@@ -874,15 +2096,12 @@ class Series(ABC):
                 if isinstance(attr_value, list) and not attr_value:
                     continue
 
-                # Convert snake_case to camelCase for the key
-                key = snake_to_camel(attr_name)
-                if is_top_level:
+                if prop.top_level:
                     # Include empty strings for top-level properties (they are valid)
-                    config[key] = attr_value
-                else:
+                    config[prop.key] = attr_value
+                elif attr_value != "":
                     # Skip empty strings for options (they are not meaningful)
-                    if attr_value != "":
-                        options[key] = attr_value
+                    options[prop.key] = attr_value
 
         # Only include options field if it's not empty
         if options:
@@ -890,54 +2109,6 @@ class Series(ABC):
 
         return config
 
-    def _is_chainable_property(self, attr_name: str) -> bool:
-        """
-        Check if an attribute is decorated with chainable_property.
-
-        Args:
-            attr_name: Name of the attribute to check
-
-        Returns:
-            bool: True if the attribute is a chainable property
-        """
-        return (
-            hasattr(self.__class__, "_chainable_properties")
-            and attr_name
-            in self.__class__._chainable_properties  # pylint: disable=protected-access
-        )
-
-    def _is_allow_none(self, attr_name: str) -> bool:
-        """
-        Check if a chainable property allows None values.
-
-        Args:
-            attr_name: Name of the attribute to check
-
-        Returns:
-            bool: True if the property allows None values
-        """
-        if self._is_chainable_property(attr_name):
-            return self.__class__._chainable_properties[attr_name][
-                "allow_none"
-            ]  # pylint: disable=protected-access
-        return False
-
-    def _is_top_level(self, attr_name: str) -> bool:
-        """
-        Check if a chainable property should be output at the top level.
-
-        Args:
-            attr_name: Name of the attribute to check
-
-        Returns:
-            bool: True if the attribute should be at the top level
-        """
-        if self._is_chainable_property(attr_name):
-            return self.__class__._chainable_properties[attr_name][
-                "top_level"
-            ]  # pylint: disable=protected-access
-        return False
-
     @classproperty
     def data_class(cls) -> Type[Data]:  # pylint: disable=no-self-argument
         """
@@ -974,13 +2145,8 @@ class Series(ABC):
             ValueError: If required columns are missing in column_mapping or DataFrame.
             AttributeError: If the data class does not define REQUIRED_COLUMNS.
         """
-        # Convert Series to DataFrame if needed
-        if isinstance(df, pd.Series):
-            df = df.to_frame()
-
         data_class = cls.data_class
         required = data_class.required_columns
-        optional = data_class.optional_columns
 
         # Check required columns in column_mapping
         missing_mapping = [col for col in required if col not in column_mapping]
@@ -993,34 +2159,11 @@ class Series(ABC):
         else:
             pass  # Removed print
 
-        # Prepare index for all column mappings
-        df = cls.prepare_index(df, column_mapping)
-
-        # Check required columns in DataFrame (including index) - after processing
-        for key in required:
-            col = column_mapping[key]
-            if col not in df.columns:
-                raise ValueError(f"DataFrame is missing required column: {col}")
-            else:
-                pass  # Removed print
-
-        # Build data objects
-        data = []
-        for i in range(len(df)):
-            kwargs_data = {}
-            for key in required.union(optional):
-                if key in column_mapping:
-                    col = column_mapping[key]
-                    if col in df.columns:
-                        value = df.iloc[i][col]
-                        kwargs_data[key] = value
-                    else:
-                        raise ValueError(f"DataFrame is missing required column: {col}")
-                else:
-                    # Skip optional columns that are not in column_mapping
-                    continue
-
-            data.append(data_class(**kwargs_data))
+        # Normalize and validate whole columns at once, through the conversion
+        # caches; Data objects are built lazily
+        data = cls._convert_dataframe(df, column_mapping)
 
         result = cls(data=data, price_scale_id=price_scale_id, **kwargs)
+        # Keep the mapping for DataFrames passed to append() later, as __init__ does
+        result._column_mapping = column_mapping
         return result
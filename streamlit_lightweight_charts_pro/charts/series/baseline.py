@@ -32,11 +32,11 @@ import pandas as pd
 from streamlit_lightweight_charts_pro.charts.options.line_options import LineOptions
 from streamlit_lightweight_charts_pro.charts.series.base import Series
 from streamlit_lightweight_charts_pro.data.baseline_data import BaselineData
-from streamlit_lightweight_charts_pro.type_definitions import (
-    ChartType,
-)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions import ChartType, DownsampleMethod
 from streamlit_lightweight_charts_pro.utils import chainable_property
 from streamlit_lightweight_charts_pro.utils.data_utils import is_valid_color
+from streamlit_lightweight_charts_pro.utils.downsampling import DEFAULT_DOWNSAMPLE_POINTS
 
 
 def _validate_base_value_static(base_value) -> Dict[str, Any]:
@@ -64,14 +64,17 @@ class BaselineSeries(Series):
     """Baseline series for lightweight charts."""
 
     DATA_CLASS = BaselineData
+    DOWNSAMPLE_FIELD = "value"
 
     def __init__(
         self,
-        data: Union[List[BaselineData], pd.DataFrame, pd.Series],
+        data: Union[List[BaselineData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "right",
         pane_id: Optional[int] = 0,
+        downsample: Optional[Union[DownsampleMethod, str]] = None,
+        downsample_points: int = DEFAULT_DOWNSAMPLE_POINTS,
     ):
         super().__init__(
             data=data,
@@ -80,6 +83,8 @@ class BaselineSeries(Series):
             price_scale_id=price_scale_id,
             pane_id=pane_id,
         )
+        self.downsample = downsample
+        self.downsample_points = downsample_points
 
         # Initialize LineOptions for common line properties
         self._line_options = LineOptions()
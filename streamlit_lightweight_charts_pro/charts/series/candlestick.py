@@ -24,12 +24,14 @@ Example:
     series.down_color = "#F44336"
 """
 
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
 
 import pandas as pd
 
 from streamlit_lightweight_charts_pro.charts.series.base import Series
+from streamlit_lightweight_charts_pro.data.aggregation import DEFAULT_MAX_BARS
 from streamlit_lightweight_charts_pro.data.candlestick_data import CandlestickData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.type_definitions import ChartType
 from streamlit_lightweight_charts_pro.utils import chainable_property
 from streamlit_lightweight_charts_pro.utils.data_utils import is_valid_color
@@ -49,14 +51,17 @@ class CandlestickSeries(Series):
     """Candlestick series for lightweight charts."""
 
     DATA_CLASS = CandlestickData
+    SUPPORTS_AGGREGATION = True
 
     def __init__(
         self,
-        data: Union[List[CandlestickData], pd.DataFrame, pd.Series],
+        data: Union[List[CandlestickData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "right",
         pane_id: Optional[int] = 0,
+        timeframes: Optional[Sequence[Union[str, int]]] = None,
+        max_bars: int = DEFAULT_MAX_BARS,
     ):
         super().__init__(
             data=data,
@@ -65,6 +70,8 @@ class CandlestickSeries(Series):
             price_scale_id=price_scale_id,
             pane_id=pane_id,
         )
+        self.timeframes = timeframes
+        self.max_bars = max_bars
 
         # Initialize candlestick-specific properties with default values
         self._up_color = "#26a69a"
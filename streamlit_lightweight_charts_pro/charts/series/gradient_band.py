@@ -13,6 +13,7 @@ import pandas as pd
 
 from streamlit_lightweight_charts_pro.charts.series.band import BandSeries
 from streamlit_lightweight_charts_pro.data.gradient_band import GradientBandData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.type_definitions import ChartType
 from streamlit_lightweight_charts_pro.utils import chainable_property
 
@@ -54,7 +55,7 @@ class GradientBandSeries(BandSeries):
 
     def __init__(
         self,
-        data: Union[List[GradientBandData], pd.DataFrame, pd.Series],
+        data: Union[List[GradientBandData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "",
@@ -160,6 +161,8 @@ class GradientBandSeries(BandSeries):
                 range_grad = max_grad - min_grad
 
                 if range_grad > 0:  # Avoid division by zero
+                    # Normalize copies: the points may be shared with the data's payload cache
+                    data_dict["data"] = [dict(item) for item in data_dict["data"]]
                     # Normalize gradients in the output
                     for i, item in enumerate(data_dict["data"]):
                         if item.get("gradient") is not None:
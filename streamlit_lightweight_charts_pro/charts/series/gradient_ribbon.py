@@ -13,6 +13,7 @@ import pandas as pd
 
 from streamlit_lightweight_charts_pro.charts.series.ribbon import RibbonSeries
 from streamlit_lightweight_charts_pro.data.gradient_ribbon import GradientRibbonData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.type_definitions import ChartType
 from streamlit_lightweight_charts_pro.utils import chainable_property
 
@@ -53,7 +54,7 @@ class GradientRibbonSeries(RibbonSeries):
 
     def __init__(
         self,
-        data: Union[List[GradientRibbonData], pd.DataFrame, pd.Series],
+        data: Union[List[GradientRibbonData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "",
@@ -157,6 +158,8 @@ class GradientRibbonSeries(RibbonSeries):
                 range_grad = max_grad - min_grad
 
                 if range_grad > 0:  # Avoid division by zero
+                    # Normalize copies: the points may be shared with the data's payload cache
+                    data_dict["data"] = [dict(item) for item in data_dict["data"]]
                     # Normalize gradients in the output
                     for i, item in enumerate(data_dict["data"]):
                         if item.get("gradient") is not None:
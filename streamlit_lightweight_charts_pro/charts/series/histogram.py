@@ -24,17 +24,73 @@ Example:
     series.base = 0
 """
 
-from typing import List, Optional, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 
-from streamlit_lightweight_charts_pro.charts.series.base import Series
+from streamlit_lightweight_charts_pro.charts.series.base import Series, _frozen_columns
 from streamlit_lightweight_charts_pro.data import Data
+from streamlit_lightweight_charts_pro.data.data import validate_color_column
 from streamlit_lightweight_charts_pro.data.histogram_data import HistogramData
 from streamlit_lightweight_charts_pro.data.ohlcv_data import OhlcvData
-from streamlit_lightweight_charts_pro.type_definitions import ChartType
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions import ChartType, DownsampleMethod
 from streamlit_lightweight_charts_pro.utils import chainable_property
+from streamlit_lightweight_charts_pro.utils.downsampling import DEFAULT_DOWNSAMPLE_POINTS
+
+# Default colors of volume bars for up and down candles
+VOLUME_UP_COLOR = "rgba(38,166,154,0.5)"
+VOLUME_DOWN_COLOR = "rgba(239,83,80,0.5)"
+
+# Fields of OHLCV bars that column mappings may name
+OHLCV_FIELDS = ("time", "open", "high", "low", "close", "volume")
+
+
+def _volume_color_column(
+    open_values: np.ndarray, close_values: np.ndarray, up_color: str, down_color: str
+) -> np.ndarray:
+    """Color volume bars like volume_colors(), validating each color used once."""
+    up = np.asarray(close_values) >= np.asarray(open_values)
+    used = [color for color, bars in ((up_color, up), (down_color, ~up)) if bars.any()]
+    validate_color_column(
+        np.array(used, dtype=object),
+        lambda color: f"Invalid color format: {color!r}. Must be hex or rgba.",
+    )
+    # Every bar references one of the two color strings
+    return np.array([down_color, up_color], dtype=object)[up.view(np.uint8)]
+
+
+def ohlcv_series_data(
+    data: Union[Sequence[OhlcvData], pd.DataFrame], column_mapping: Dict[str, str]
+) -> Optional[SeriesData]:
+    """
+    Parse OHLCV bars once, for price and volume series that share the columns.
+
+    The columns are read-only, so that series built from them copy a column
+    before updating it in place instead of changing the other series.
+
+    Args:
+        data (Union[Sequence[OhlcvData], pd.DataFrame]): OHLCV bars.
+        column_mapping (Dict[str, str]): Mapping of fields to column names; the
+            volume column defaults to "volume".
+
+    Returns:
+        Optional[SeriesData]: OhlcvData columns, or None for sequences holding
+            other objects than OhlcvData.
+
+    Raises:
+        ValueError: If a column is missing or a bar is invalid.
+    """
+    if isinstance(data, pd.DataFrame):
+        mapping = {key: col for key, col in column_mapping.items() if key in OHLCV_FIELDS}
+        mapping.setdefault("volume", "volume")
+        ohlcv = Series._convert_dataframe(data, mapping, data_class=OhlcvData)
+    elif all(isinstance(item, OhlcvData) for item in data):
+        ohlcv = SeriesData.from_data(OhlcvData, data)
+    else:
+        return None
+    return SeriesData(OhlcvData, _frozen_columns(ohlcv))
 
 
 @chainable_property("color", str, validator="color")
@@ -59,6 +115,9 @@ class HistogramSeries(Series):
     """
 
     DATA_CLASS = HistogramData
+    DOWNSAMPLE_FIELD = "value"
+    # Shows the volume of OhlcvPyramid levels, colored like create_volume_series()
+    SUPPORTS_AGGREGATION = True
 
     @property
     def chart_type(self) -> ChartType:
@@ -70,8 +129,8 @@ class HistogramSeries(Series):
         cls,
         data: Union[Sequence[OhlcvData], pd.DataFrame],
         column_mapping: dict,
-        up_color: str = "rgba(38,166,154,0.5)",
-        down_color: str = "rgba(239,83,80,0.5)",
+        up_color: str = VOLUME_UP_COLOR,
+        down_color: str = VOLUME_DOWN_COLOR,
         **kwargs,
     ) -> "HistogramSeries":
         """
@@ -92,33 +151,41 @@ class HistogramSeries(Series):
             HistogramSeries: Configured histogram series for volume visualization
         """
         if isinstance(data, pd.DataFrame):
-            # Use vectorized operations for color assignment
-            df = data.copy()
-
             # Get open and close columns
             open_col = column_mapping.get("open", "open")
             close_col = column_mapping.get("close", "close")
 
             # Vectorized color assignment based on price movement
-            colors = np.where(df[close_col] >= df[open_col], up_color, down_color)
-
-            # Add color column to DataFrame
-            df["color"] = colors
+            colors = _volume_color_column(
+                data[open_col].to_numpy(), data[close_col].to_numpy(), up_color, down_color
+            )
 
-            # Update column mapping to include color
+            # Map volume to value for HistogramSeries; colors are added as a
+            # column afterwards, so the DataFrame is not copied
             volume_col = column_mapping.get("volume", "volume")
-            updated_mapping = column_mapping.copy()
-            updated_mapping["color"] = "color"
-            # Map volume to value for HistogramSeries
+            updated_mapping = {key: col for key, col in column_mapping.items() if key != "color"}
             updated_mapping["value"] = volume_col
-            # Use from_dataframe factory method
-            return cls.from_dataframe(df, column_mapping=updated_mapping, **kwargs)
+            volume = cls._convert_dataframe(data, updated_mapping)
+            volume = SeriesData(cls.data_class, {**volume.columns, "color": colors})
+
+            # Drawn as an overlay unless a price scale is given, like from_dataframe()
+            kwargs.setdefault("price_scale_id", "")
+            volume_series = cls(data=volume, **kwargs)
+            volume_series._volume_colors = (up_color, down_color)
+            return volume_series
         else:
             # For sequence of OhlcvData objects, process each item
             if data is None:
                 # Return empty series for None data
                 return cls(data=[])
 
+            if all(isinstance(item, OhlcvData) for item in data):
+                volume_series = cls.from_ohlcv(
+                    SeriesData.from_data(OhlcvData, data), up_color, down_color, **kwargs
+                )
+                volume_series.last_value_visible = False
+                return volume_series
+
             processed_data = []
             for item in data:
                 if isinstance(item, dict):
@@ -128,7 +195,7 @@ class HistogramSeries(Series):
                     processed_item["color"] = color
                     processed_data.append(processed_item)
                 else:
-                    # For OhlcvData objects, convert to dict and add color
+                    # For other objects, convert to dict and add color
                     item_dict = item.asdict() if hasattr(item, "asdict") else item.__dict__
                     color = (
                         up_color
@@ -148,16 +215,60 @@ class HistogramSeries(Series):
 
             volume_series = cls.from_dataframe(df, column_mapping=updated_mapping, **kwargs)
             volume_series.last_value_visible = False
+            volume_series._volume_colors = (up_color, down_color)
 
             return volume_series
 
+    @classmethod
+    def from_ohlcv(
+        cls,
+        data: SeriesData,
+        up_color: str = VOLUME_UP_COLOR,
+        down_color: str = VOLUME_DOWN_COLOR,
+        **kwargs,
+    ) -> "HistogramSeries":
+        """
+        Create a volume histogram series from parsed OHLCV bars.
+
+        The series shares the time and volume columns of data instead of
+        copying them, and its colors come from one comparison of the open and
+        close columns (see create_volume_series()).
+
+        Args:
+            data (SeriesData): OHLCV bars, e.g. from ohlcv_series_data().
+            up_color (str): Color for bullish candles (close >= open).
+            down_color (str): Color for bearish candles (close < open).
+            **kwargs: Additional arguments for HistogramSeries. Without a
+                price_scale_id the volume is drawn as an overlay ("").
+
+        Returns:
+            HistogramSeries: Configured histogram series for volume visualization.
+        """
+        kwargs.setdefault("price_scale_id", "")
+        columns = data.columns
+        volume = SeriesData(
+            cls.data_class,
+            {
+                "time": columns["time"],
+                "value": columns["volume"],
+                "color": _volume_color_column(
+                    columns["open"], columns["close"], up_color, down_color
+                ),
+            },
+        )
+        volume_series = cls(data=volume, **kwargs)
+        volume_series._volume_colors = (up_color, down_color)
+        return volume_series
+
     def __init__(
         self,
-        data: Union[List[Data], pd.DataFrame, pd.Series],
+        data: Union[List[Data], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "right",
         pane_id: Optional[int] = 0,
+        downsample: Optional[Union[DownsampleMethod, str]] = None,
+        downsample_points: int = DEFAULT_DOWNSAMPLE_POINTS,
     ):
         """
         Initialize a histogram series with data and configuration.
@@ -168,6 +279,10 @@ class HistogramSeries(Series):
             visible: Whether the series is visible. Defaults to True.
             price_scale_id: ID of the price scale to attach to. Defaults to "right".
             pane_id: The pane index this series belongs to. Defaults to 0.
+            downsample: Downsampling method for large data ("lttb", "minmax" or "m4"),
+                or None to send every point. Defaults to None.
+            downsample_points: Maximum number of points sent when downsampling.
+                Defaults to 2000.
 
 
         Raises:
@@ -199,7 +314,43 @@ class HistogramSeries(Series):
             price_scale_id=price_scale_id,
             pane_id=pane_id,
         )
+        self.downsample = downsample
+        self.downsample_points = downsample_points
+        # Colors of the volume bars built from pyramid levels
+        self._volume_colors = (VOLUME_UP_COLOR, VOLUME_DOWN_COLOR)
 
         # Initialize histogram-specific properties with default values
         self._color = "#26a69a"
         self._base = 0
+
+    def _pyramid_view(self, bars: SeriesData) -> SeriesData:
+        """
+        Convert OHLCV pyramid bars to volume bars.
+
+        Bars are colored by price movement with the colors given to
+        create_volume_series(), so aggregated volume matches the volume of the
+        original bars.
+
+        Args:
+            bars (SeriesData): Bars of one pyramid level.
+
+        Returns:
+            SeriesData: HistogramData bars with the volume as value.
+
+        Raises:
+            ValueError: If the bars have no volume.
+        """
+        columns = bars.columns
+        if "volume" not in columns:
+            raise ValueError("HistogramSeries can only show pyramids of bars with volume")
+        up_color, down_color = self._volume_colors
+        return SeriesData(
+            HistogramData,
+            {
+                "time": columns["time"],
+                "value": columns["volume"],
+                "color": _volume_color_column(
+                    columns["open"], columns["close"], up_color, down_color
+                ),
+            },
+        )
@@ -36,15 +36,14 @@ import pandas as pd
 from streamlit_lightweight_charts_pro.charts.options.line_options import LineOptions
 from streamlit_lightweight_charts_pro.charts.series.base import Series
 from streamlit_lightweight_charts_pro.data.line_data import LineData
-from streamlit_lightweight_charts_pro.type_definitions import (
-    ChartType,
-)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions import ChartType, DownsampleMethod
 from streamlit_lightweight_charts_pro.utils import chainable_property
+from streamlit_lightweight_charts_pro.utils.downsampling import DEFAULT_DOWNSAMPLE_POINTS
 
 
 @chainable_property("line_options", LineOptions, allow_none=True)
 class LineSeries(Series):
-    DATA_CLASS = LineData
     """
     Line series for lightweight charts.
 
@@ -62,17 +61,22 @@ class LineSeries(Series):
         markers: List of markers to display on this series (set after construction)
     """
 
+    DATA_CLASS = LineData
+    DOWNSAMPLE_FIELD = "value"
+
     @property
     def chart_type(self) -> ChartType:
         return ChartType.LINE
 
     def __init__(
         self,
-        data: Union[List[LineData], pd.DataFrame, pd.Series],
+        data: Union[List[LineData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "right",
         pane_id: Optional[int] = 0,
+        downsample: Optional[Union[DownsampleMethod, str]] = None,
+        downsample_points: int = DEFAULT_DOWNSAMPLE_POINTS,
     ):
         super().__init__(
             data=data,
@@ -81,5 +85,7 @@ class LineSeries(Series):
             price_scale_id=price_scale_id,
             pane_id=pane_id,
         )
+        self.downsample = downsample
+        self.downsample_points = downsample_points
         # Initialize line_options with default value
         self._line_options = LineOptions()
@@ -12,6 +12,7 @@ from typing import List, Optional, Union
 import pandas as pd
 
 from streamlit_lightweight_charts_pro.charts.series.base import Series
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.data.signal_data import SignalData
 from streamlit_lightweight_charts_pro.type_definitions import ChartType
 from streamlit_lightweight_charts_pro.utils import chainable_property
@@ -68,7 +69,7 @@ class SignalSeries(Series):
 
     def __init__(
         self,
-        data: Union[List[SignalData], pd.DataFrame, pd.Series],
+        data: Union[List[SignalData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         neutral_color: str = "#f0f0f0",
         signal_color: str = "#ff0000",
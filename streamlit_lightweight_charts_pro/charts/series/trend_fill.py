@@ -17,6 +17,7 @@ import pandas as pd
 
 from streamlit_lightweight_charts_pro.charts.options.line_options import LineOptions
 from streamlit_lightweight_charts_pro.charts.series.base import Series
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.data.trend_fill import TrendFillData
 from streamlit_lightweight_charts_pro.type_definitions.enums import ChartType
 from streamlit_lightweight_charts_pro.utils import chainable_property
@@ -55,7 +56,7 @@ class TrendFillSeries(Series):
 
     def __init__(
         self,
-        data: Union[List[TrendFillData], pd.DataFrame, pd.Series],
+        data: Union[List[TrendFillData], SeriesData, pd.DataFrame, pd.Series],
         column_mapping: Optional[dict] = None,
         visible: bool = True,
         price_scale_id: str = "",
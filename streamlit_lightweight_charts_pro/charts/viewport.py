@@ -0,0 +1,129 @@
+"""
+Viewport reporting for streamlit-lightweight-charts.
+
+A chart normally ships its whole history to the browser. With viewport
+reporting enabled, the frontend tells Python which range the user is looking
+at, so that the next Streamlit rerun only sends that window, at a resolution
+that fits the width of the chart.
+
+When the user pans, zooms or picks a range in the range switcher, the
+frontend waits until the chart has been still for a short while and sets its
+component value to:
+
+    {
+        "viewport": {
+            "chartId": "chart-...",
+            "from": 1704067200,  # First visible time, UNIX seconds
+            "to": 1706745600,  # Last visible time
+            "logicalFrom": 1520.5,  # Visible logical (bar index) range
+            "logicalTo": 1730.2,
+            "width": 980,  # Width of the time scale in pixels
+        },
+        "resyncRequest": ...,  # Only when the frontend asked for a full config
+    }
+
+Chart.render() reads the value reported on the previous rerun, loads the
+window from the data providers of its series (see Series.data_provider), sets
+the visible range of aggregated series (see Series.pyramid) and returns the
+Viewport.
+
+Example:
+    ```python
+    def load_bars(start, end, max_bars):
+        # start/end are None on the first render, before the frontend reported a range
+        return database.ohlcv("AAPL", start, end, max_bars)  # DataFrame
+
+    series = CandlestickSeries(data=[], column_mapping=mapping)
+    series.data_provider = load_bars
+    viewport = Chart(series=series).render(key="aapl")
+    ```
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# Data provider of a series: (start, end, max_bars) -> data accepted by the series
+DataProvider = Callable[[Optional[int], Optional[int], int], Any]
+
+# Delay without further changes before the frontend reports a new viewport
+DEFAULT_VIEWPORT_DEBOUNCE_MS = 300
+
+# Bars the chart can show per pixel at its minimum bar spacing of 0.5 pixels
+_BARS_PER_PIXEL = 2
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """
+    Range of a chart the user is looking at, as reported by the frontend.
+
+    Attributes:
+        chart_id (str): ID of the chart (see Chart.structure_key()).
+        start (int): First visible time, as UNIX seconds.
+        end (int): Last visible time, as UNIX seconds.
+        logical_from (Optional[float]): First visible logical (bar index) position.
+        logical_to (Optional[float]): Last visible logical position.
+        width (Optional[int]): Width of the time scale in pixels.
+    """
+
+    chart_id: str
+    start: int
+    end: int
+    logical_from: Optional[float] = None
+    logical_to: Optional[float] = None
+    width: Optional[int] = None
+
+    @classmethod
+    def from_component_value(cls, value: Any, chart_id: str) -> Optional["Viewport"]:
+        """
+        Read the viewport of a chart from the value reported by the component.
+
+        Args:
+            value (Any): Component value, as returned by the Streamlit component.
+            chart_id (str): ID of the chart the viewport must belong to.
+
+        Returns:
+            Optional[Viewport]: The viewport, or None when the value holds no valid
+                viewport for this chart.
+        """
+        if not isinstance(value, dict):
+            return None
+        report = value.get("viewport")
+        if not isinstance(report, dict) or report.get("chartId") != chart_id:
+            return None
+        try:
+            start, end = int(report["from"]), int(report["to"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if start > end:
+            return None
+
+        def optional_number(key: str, kind: type) -> Optional[Any]:
+            number = report.get(key)
+            return kind(number) if isinstance(number, (int, float)) else None
+
+        return cls(
+            chart_id=chart_id,
+            start=start,
+            end=end,
+            logical_from=optional_number("logicalFrom", float),
+            logical_to=optional_number("logicalTo", float),
+            width=optional_number("width", int),
+        )
+
+    def bar_budget(self, max_bars: int) -> int:
+        """
+        Get the number of bars worth sending for this viewport.
+
+        A chart cannot show more than two bars per pixel, so the budget is the
+        smaller of max_bars and twice the width of the chart.
+
+        Args:
+            max_bars (int): Upper bound, e.g. Series.max_bars.
+
+        Returns:
+            int: Number of bars to send.
+        """
+        if not self.width or self.width <= 0:
+            return max_bars
+        return max(1, min(max_bars, self.width * _BARS_PER_PIXEL))
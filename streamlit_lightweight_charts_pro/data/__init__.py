@@ -11,11 +11,13 @@ type safety and validation for financial data structures.
 
 The module includes:
     - Base data classes: Data, SingleValueData, LineData, etc.
+    - Columnar container: SeriesData for large, array-backed series
+    - Timeframe aggregation: OhlcvPyramid, aggregate_ohlcv
     - OHLC data classes: CandlestickData, OhlcvData, BarData
     - Specialized data classes: AreaData, BaselineData, HistogramData, BandData
     - Marker classes: MarkerBase, PriceMarker, BarMarker, Marker
     - Annotation system: Annotation, AnnotationLayer, AnnotationManager
-    - Trade visualization: TradeData, TradeType, TradeVisualizationOptions
+    - Trade visualization: TradeData, TradeBatch, TradeType, TradeVisualizationOptions
     - Tooltip system: TooltipConfig, TooltipManager, various tooltip creators
     - Signal data: SignalData for signal-based visualizations
 
@@ -47,6 +49,9 @@ from streamlit_lightweight_charts_pro.charts.options.trade_visualization_options
     TradeVisualizationOptions,
 )
 
+# Import timeframe aggregation of OHLC(V) data
+from streamlit_lightweight_charts_pro.data.aggregation import OhlcvPyramid, aggregate_ohlcv
+
 # Import annotation classes
 from streamlit_lightweight_charts_pro.data.annotation import (
     Annotation,
@@ -84,6 +89,9 @@ from streamlit_lightweight_charts_pro.data.marker import BarMarker, Marker, Mark
 from streamlit_lightweight_charts_pro.data.ohlcv_data import OhlcvData
 from streamlit_lightweight_charts_pro.data.ribbon import RibbonData
 
+# Import columnar series data container
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+
 # Import signal data classes
 from streamlit_lightweight_charts_pro.data.signal_data import SignalData
 from streamlit_lightweight_charts_pro.data.single_value_data import SingleValueData
@@ -103,6 +111,7 @@ from streamlit_lightweight_charts_pro.data.tooltip import (
 
 # Import trade classes
 from streamlit_lightweight_charts_pro.data.trade import (
+    TradeBatch,
     TradeData,
     TradeType,
 )
@@ -119,6 +128,9 @@ from streamlit_lightweight_charts_pro.type_definitions.enums import (
 __all__ = [
     # Base data classes
     "Data",
+    "SeriesData",
+    "OhlcvPyramid",
+    "aggregate_ohlcv",
     # Single value data classes
     "SingleValueData",
     "LineData",
@@ -142,6 +154,7 @@ __all__ = [
     "BarMarker",
     "Marker",
     # Trade classes
+    "TradeBatch",
     "TradeData",
     "TradeType",
     "TradeVisualization",
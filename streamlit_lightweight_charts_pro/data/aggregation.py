@@ -0,0 +1,344 @@
+"""
+Timeframe aggregation of OHLC(V) data for streamlit-lightweight-charts.
+
+This module resamples bar data to coarser timeframes (e.g. 1-minute bars to
+5-minute, hourly or daily bars) with NumPy operations over whole columns: each
+bar falls into the bucket starting at its time rounded down to the timeframe,
+and each bucket takes the first open, highest high, lowest low, last close and
+summed volume of its bars.
+
+OhlcvPyramid builds a set of such resolutions once from the same data and
+caches them, so a chart can ship the finest resolution that fits a number of
+bars for the range it shows instead of the whole history.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.data import OhlcvData, OhlcvPyramid, SeriesData
+
+    minutes = SeriesData.from_columns(OhlcvData, {...})
+    pyramid = OhlcvPyramid(minutes, ["5m", "1h", "1D"])
+    pyramid.level("1h")  # SeriesData of hourly OhlcvData bars
+    timeframe = pyramid.select_timeframe(start, end, max_bars=2000)
+    bars = pyramid.window(timeframe, start, end)
+    ```
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+
+# Number of bars sent for the visible range when no explicit limit is given
+DEFAULT_MAX_BARS = 2000
+
+# Aggregated fields: the first four are required, volume is summed when present
+_OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Seconds per timeframe unit; weeks start on Monday
+_TIMEFRAME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# 1970-01-01 was a Thursday, so weekly buckets are shifted to start on Monday
+_WEEK_OFFSET = 4 * 86400
+
+_TIMEFRAME_PATTERN = re.compile(r"^\s*(\d+)\s*([a-zA-Z]+)\s*$")
+
+_UNIT_ALIASES = {
+    "s": "s",
+    "sec": "s",
+    "min": "m",
+    "m": "m",
+    "h": "h",
+    "d": "d",
+    "w": "w",
+}
+
+
+def parse_timeframe(timeframe: Union[str, int]) -> int:
+    """
+    Convert a timeframe to a number of seconds.
+
+    Args:
+        timeframe (Union[str, int]): Number of seconds, or a count followed by a
+            unit: "s", "m"/"min", "h", "D" or "W" (e.g. "5m", "1h", "1D").
+            Units are case-insensitive, except that "M" is rejected.
+
+    Returns:
+        int: Length of the timeframe in seconds.
+
+    Raises:
+        ValueError: If the timeframe is not positive or has an unknown unit.
+    """
+    if isinstance(timeframe, bool):
+        raise ValueError(f"Invalid timeframe: {timeframe!r}")
+    if isinstance(timeframe, (int, np.integer)):
+        seconds = int(timeframe)
+    else:
+        match = _TIMEFRAME_PATTERN.match(str(timeframe))
+        unit = None
+        # "M" means months to pandas but would be minutes in lower case, so reject it
+        if match and match.group(2) != "M":
+            unit = _UNIT_ALIASES.get(match.group(2).lower())
+        if unit is None:
+            raise ValueError(
+                f"Invalid timeframe: {timeframe!r}; expected e.g. '30s', '5m', '1h', '1D' or '1W'"
+            )
+        seconds = int(match.group(1)) * _TIMEFRAME_UNITS[unit]
+    if seconds <= 0:
+        raise ValueError(f"timeframe must be positive, got {timeframe!r}")
+    return seconds
+
+
+def _bucket_offset(seconds: int) -> int:
+    """Return the start of the first bucket after UNIX time 0 modulo the bucket length."""
+    return _WEEK_OFFSET if seconds % _TIMEFRAME_UNITS["w"] == 0 else 0
+
+
+def bucket_times(times: np.ndarray, seconds: int) -> np.ndarray:
+    """
+    Round times down to the start of their bucket.
+
+    Buckets are aligned to UNIX time 0 (midnight UTC), except weekly and longer
+    buckets made of whole weeks, which start on Monday.
+
+    Args:
+        times (np.ndarray): UNIX times in seconds.
+        seconds (int): Bucket length in seconds.
+
+    Returns:
+        np.ndarray: int64 start time of the bucket of each time.
+    """
+    times = np.asarray(times, dtype=np.int64)
+    offset = _bucket_offset(seconds)
+    return (times - offset) // seconds * seconds + offset
+
+
+def volume_colors(
+    open_values: np.ndarray, close_values: np.ndarray, up_color: str, down_color: str
+) -> np.ndarray:
+    """
+    Color volume bars by price movement.
+
+    Args:
+        open_values (np.ndarray): Open prices.
+        close_values (np.ndarray): Close prices.
+        up_color (str): Color of bars that closed at or above their open.
+        down_color (str): Color of bars that closed below their open.
+
+    Returns:
+        np.ndarray: Object array with one color per bar.
+    """
+    up = np.asarray(close_values) >= np.asarray(open_values)
+    # Every bar references one of the two color strings
+    return np.array([down_color, up_color], dtype=object)[up.view(np.uint8)]
+
+
+def aggregate_ohlcv(data: SeriesData, timeframe: Union[str, int]) -> SeriesData:
+    """
+    Aggregate OHLC(V) bars to a coarser timeframe.
+
+    The bars must be in ascending time order, as the chart requires. Each
+    bucket becomes one bar with the first open, highest high, lowest low, last
+    close and, when present, the summed volume. Per-bar styling columns (such
+    as color) are not carried over.
+
+    Args:
+        data (SeriesData): Bars with open, high, low and close columns.
+        timeframe (Union[str, int]): Target timeframe (see parse_timeframe()).
+
+    Returns:
+        SeriesData: Aggregated bars of the same data class.
+
+    Raises:
+        ValueError: If data has no open, high, low and close columns.
+    """
+    seconds = parse_timeframe(timeframe)
+    columns = data.columns
+    missing = [name for name in _OHLCV_FIELDS[:4] if name not in columns]
+    if missing:
+        raise ValueError(f"OHLC aggregation requires {missing} columns")
+
+    buckets = bucket_times(columns["time"], seconds)
+    if len(buckets) == 0:
+        starts = np.zeros(0, dtype=np.int64)
+    else:
+        starts = np.concatenate(([0], np.flatnonzero(buckets[1:] != buckets[:-1]) + 1))
+    stops = np.append(starts[1:], len(buckets)) - 1
+
+    aggregated = {"time": buckets[starts]}
+    if len(starts):
+        aggregated["open"] = columns["open"][starts]
+        aggregated["high"] = np.fmax.reduceat(columns["high"], starts)
+        aggregated["low"] = np.fmin.reduceat(columns["low"], starts)
+        aggregated["close"] = columns["close"][stops]
+        if "volume" in columns:
+            aggregated["volume"] = np.add.reduceat(columns["volume"], starts)
+    else:
+        for name in _OHLCV_FIELDS:
+            if name in columns:
+                aggregated[name] = columns[name][:0]
+    return SeriesData(data.data_class, aggregated)
+
+
+class OhlcvPyramid:
+    """
+    Cached multi-resolution view of OHLC(V) bars.
+
+    The pyramid holds the original bars and one aggregated copy per timeframe.
+    Each level is built on first use from the coarsest cached level whose
+    buckets each lie within one of its buckets (or from the original bars) and
+    kept afterwards, so zooming out repeatedly costs one aggregation per
+    timeframe. Levels are identified by
+    their timeframe in seconds; None stands for the original bars.
+
+    The pyramid is built from a snapshot of the data: rebuild it after changing
+    the bars.
+
+    Attributes:
+        base (SeriesData): The original bars.
+        timeframes (List[int]): Aggregated timeframes in seconds, ascending.
+    """
+
+    def __init__(self, data: SeriesData, timeframes: Sequence[Union[str, int]]):
+        """
+        Create a pyramid over the given bars.
+
+        Args:
+            data (SeriesData): Bars with open, high, low and close columns (and
+                optionally volume), in ascending time order.
+            timeframes (Sequence[Union[str, int]]): Timeframes to aggregate to
+                (see parse_timeframe()).
+
+        Raises:
+            ValueError: If data has no OHLC columns or a timeframe is invalid.
+        """
+        missing = [name for name in _OHLCV_FIELDS[:4] if name not in data.columns]
+        if missing:
+            raise ValueError(f"OhlcvPyramid requires {missing} columns")
+        self.base = data
+        self.timeframes: List[int] = sorted({parse_timeframe(tf) for tf in timeframes})
+        self._levels: Dict[int, SeriesData] = {}
+
+    def level(self, timeframe: Optional[Union[str, int]]) -> SeriesData:
+        """
+        Get the bars of one resolution, aggregating them on first use.
+
+        Args:
+            timeframe (Optional[Union[str, int]]): Timeframe of the level, or None
+                for the original bars. It does not need to be one of timeframes.
+
+        Returns:
+            SeriesData: Bars of the level.
+        """
+        if timeframe is None:
+            return self.base
+        seconds = parse_timeframe(timeframe)
+        cached = self._levels.get(seconds)
+        if cached is None:
+            # Aggregate from the coarsest cached level whose buckets tile this
+            # one's: its length divides this one and its buckets start on the
+            # same boundaries (weekly buckets start on Monday, others do not)
+            offset = _bucket_offset(seconds)
+            source = self.base
+            for finer in sorted(self._levels, reverse=True):
+                if (
+                    finer < seconds
+                    and seconds % finer == 0
+                    and (offset - _bucket_offset(finer)) % finer == 0
+                ):
+                    source = self._levels[finer]
+                    break
+            cached = aggregate_ohlcv(source, seconds)
+            self._levels[seconds] = cached
+        return cached
+
+    def build(self) -> "OhlcvPyramid":
+        """
+        Aggregate every level now instead of on first use.
+
+        Returns:
+            OhlcvPyramid: Self for method chaining.
+        """
+        for seconds in self.timeframes:
+            self.level(seconds)
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the aggregated levels, in bytes."""
+        return sum(level.nbytes for level in self._levels.values())
+
+    def select_timeframe(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_bars: int = DEFAULT_MAX_BARS,
+    ) -> Optional[int]:
+        """
+        Pick the finest resolution showing a time range in at most max_bars bars.
+
+        Args:
+            start (Optional[int]): First UNIX time of the range, or None for the
+                first bar.
+            end (Optional[int]): Last UNIX time of the range, or None for the last bar.
+            max_bars (int): Maximum number of bars in the range.
+
+        Returns:
+            Optional[int]: Timeframe in seconds, None for the original bars. The
+                coarsest timeframe when none fits.
+        """
+        chosen = None
+        for timeframe in [None] + self.timeframes:
+            chosen = timeframe
+            bounds = self._bounds(self.level(timeframe), start, end)
+            if bounds[1] - bounds[0] <= max_bars:
+                break
+        return chosen
+
+    def window(
+        self,
+        timeframe: Optional[Union[str, int]],
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> SeriesData:
+        """
+        Get the bars of one resolution around a time range.
+
+        The range is widened by its own length on both sides, so the chart can
+        pan a little without running out of bars.
+
+        Args:
+            timeframe (Optional[Union[str, int]]): Timeframe of the level, or None
+                for the original bars.
+            start (Optional[int]): First UNIX time of the range, or None.
+            end (Optional[int]): Last UNIX time of the range, or None.
+
+        Returns:
+            SeriesData: The bars of the level, or the slice around the range.
+        """
+        level = self.level(timeframe)
+        if start is None and end is None:
+            return level
+        if start is not None and end is not None:
+            width = end - start
+            start, end = start - width, end + width
+        first, stop = self._bounds(level, start, end)
+        if first == 0 and stop == len(level):
+            return level
+        return level[first:stop]
+
+    @staticmethod
+    def _bounds(level: SeriesData, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        """Return the (start, stop) positions of the bars of a level within a time range."""
+        times = level.columns["time"]
+        first = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+        stop = len(times) if end is None else int(np.searchsorted(times, end, side="right"))
+        return first, max(first, stop)
+
+    def __repr__(self) -> str:
+        """Return a short description of the pyramid."""
+        return (
+            f"OhlcvPyramid({len(self.base)} bars, timeframes={self.timeframes}, "
+            f"built={sorted(self._levels)})"
+        )
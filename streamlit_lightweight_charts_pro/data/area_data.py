@@ -8,6 +8,9 @@ including optional color properties for line, top, and bottom colors.
 from dataclasses import dataclass
 from typing import Optional
 
+import pandas as pd
+
+from streamlit_lightweight_charts_pro.data.data import validate_color_column
 from streamlit_lightweight_charts_pro.data.single_value_data import SingleValueData
 from streamlit_lightweight_charts_pro.utils.data_utils import is_valid_color
 
@@ -53,3 +56,27 @@ class AreaData(SingleValueData):
             else:
                 # Set to None if empty/whitespace
                 setattr(self, color_attr, None)
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        """Validate and clean up color columns for columnar ingestion."""
+        columns = super().normalize_columns(columns)
+
+        for color_attr in ["line_color", "top_color", "bottom_color"]:
+            if color_attr not in columns:
+                continue
+            values = columns[color_attr]
+            # Set empty/whitespace colors to None
+            blanks = [
+                value
+                for value in pd.unique(values)
+                if value is None or (isinstance(value, str) and not value.strip())
+            ]
+            if blanks:
+                values = values.astype(object)
+                values[pd.Series(values).isin(blanks).to_numpy()] = None
+            validate_color_column(
+                values, lambda color, name=color_attr: f"Invalid {name} format: {color}"
+            )
+            columns[color_attr] = values
+        return columns
@@ -8,7 +8,7 @@ band charts such as Bollinger Bands and other envelope indicators.
 import math
 from dataclasses import dataclass
 
-from streamlit_lightweight_charts_pro.data.data import Data
+from streamlit_lightweight_charts_pro.data.data import Data, fill_nan_column
 
 
 @dataclass
@@ -49,3 +49,10 @@ class BandData(Data):
             self.lower = 0.0
         elif self.lower is None:
             raise ValueError("lower must not be None")
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        for field_name in ["upper", "middle", "lower"]:
+            columns[field_name] = fill_nan_column(columns[field_name], field_name)
+        return columns
@@ -79,3 +79,22 @@ class BaselineData(SingleValueData):
                         f"Invalid color format for {prop_name}: {color_value!r}. Must be hex or"
                         " rgba."
                     )
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        """Validate color columns after the single value normalization."""
+        columns = super().normalize_columns(columns)
+        color_properties = [
+            "top_fill_color1",
+            "top_fill_color2",
+            "top_line_color",
+            "bottom_fill_color1",
+            "bottom_fill_color2",
+            "bottom_line_color",
+        ]
+        cls.validate_color_columns(
+            columns,
+            color_properties,
+            "Invalid color format for {name}: {color!r}. Must be hex or rgba.",
+        )
+        return columns
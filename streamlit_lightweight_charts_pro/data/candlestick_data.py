@@ -48,3 +48,13 @@ class CandlestickData(OhlcData):
                         f"Invalid color format for {prop_name}: {color_value!r}. "
                         "Must be hex or rgba."
                     )
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        cls.validate_color_columns(
+            columns,
+            ["color", "border_color", "wick_color"],
+            "Invalid color format for {name}: {color!r}. Must be hex or rgba.",
+        )
+        return columns
@@ -44,15 +44,84 @@ import math
 from abc import ABC
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Dict
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
 
 from streamlit_lightweight_charts_pro.logging_config import get_logger
 from streamlit_lightweight_charts_pro.type_definitions.enums import ColumnNames
-from streamlit_lightweight_charts_pro.utils.data_utils import normalize_time, snake_to_camel
+from streamlit_lightweight_charts_pro.utils.data_utils import (
+    is_valid_color,
+    normalize_time,
+    normalize_time_array,
+    snake_to_camel,
+)
 
 logger = get_logger(__name__)
 
 
+def fill_nan_column(values: np.ndarray, name: str, fill: Optional[float] = 0.0) -> np.ndarray:
+    """
+    Apply the per-point NaN/None rules of the data classes to a whole column.
+
+    With a numeric ``fill`` NaN values are replaced by it and None values raise,
+    matching ``__post_init__`` of value fields such as ``SingleValueData.value``.
+    With ``fill=None`` NaN values become None (the point omits the field), matching
+    fields that allow missing data such as ``RibbonData.upper``.
+
+    Args:
+        values: Column values.
+        name: Field name used in error messages.
+        fill: Replacement for NaN, or None to mark NaN values as missing.
+
+    Returns:
+        np.ndarray: Column with NaN values handled.
+
+    Raises:
+        ValueError: If the column contains None and ``fill`` is not None.
+    """
+    if values.dtype.kind == "f":
+        mask = np.isnan(values)
+        if not mask.any():
+            return values
+        if fill is not None:
+            return np.where(mask, fill, values)
+        result = values.astype(object)
+        result[mask] = None
+        return result
+    if values.dtype == object:
+        result = values.copy()
+        for i, value in enumerate(result):
+            if value is None:
+                if fill is not None:
+                    raise ValueError(f"{name} must not be None")
+            elif isinstance(value, float) and math.isnan(value):
+                result[i] = fill
+        return result
+    return values
+
+
+def validate_color_column(values: np.ndarray, error: Callable[[object], str]) -> None:
+    """
+    Validate every distinct color of a column once.
+
+    None and empty strings are skipped, like in the per-point validation.
+
+    Args:
+        values: Column of color values.
+        error: Builds the ValueError message for an invalid color.
+
+    Raises:
+        ValueError: If any color is not a valid hex or rgba string.
+    """
+    for color in pd.unique(values):
+        if color is None or color == "":
+            continue
+        if not is_valid_color(color):
+            raise ValueError(error(color))
+
+
 # The following disables are for custom class property pattern, which pylint does not recognize.
 # pylint: disable=no-self-argument, no-member, invalid-name
 # Note: 'classproperty' intentionally uses snake_case for compatibility with Python conventions.
@@ -222,6 +291,68 @@ class Data(ABC):
         # Normalize time to ensure consistent format
         self.time = normalize_time(self.time)
 
+    @classmethod
+    def normalize_columns(cls, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Vectorized counterpart of __post_init__ for columnar ingestion.
+
+        Receives one array per mapped field and applies the same normalization
+        and validation that __post_init__ applies to a single point, for the
+        whole column at once. Subclasses that override __post_init__ must
+        override this method as well (calling super first); otherwise columnar
+        ingestion falls back to building one instance per row.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Field name to column values. Always
+                contains "time".
+
+        Returns:
+            Dict[str, np.ndarray]: The normalized columns.
+        """
+        columns["time"] = normalize_time_array(columns["time"])
+        return columns
+
+    @staticmethod
+    def validate_color_columns(
+        columns: Dict[str, np.ndarray],
+        names: Iterable[str] = ("color",),
+        message: str = "Invalid color format: {color!r}. Must be hex or rgba.",
+    ) -> None:
+        """
+        Validate the color columns of a normalize_columns() call.
+
+        Columns that are not mapped are skipped.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Field name to column values.
+            names (Iterable[str]): Names of the color fields.
+            message (str): Error message template, formatted with ``color`` and ``name``.
+
+        Raises:
+            ValueError: If any color is not a valid hex or rgba string.
+        """
+        for name in names:
+            if name in columns:
+                validate_color_column(
+                    columns[name],
+                    lambda color, name=name: message.format(color=color, name=name),
+                )
+
+    @classmethod
+    def supports_columnar(cls) -> bool:
+        """
+        Check whether normalize_columns mirrors every __post_init__ in the MRO.
+
+        Returns:
+            bool: True if columns can be validated without building instances.
+        """
+        for base in cls.__mro__:
+            if base is Data:
+                return True
+            if "__post_init__" in vars(base) and "normalize_columns" not in vars(base):
+                return False
+        return True
+
     def asdict(self) -> Dict[str, object]:
         """
         Serialize the data class to a dict with camelCase keys for frontend.
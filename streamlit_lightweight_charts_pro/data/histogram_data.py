@@ -34,3 +34,9 @@ class HistogramData(SingleValueData):
         if self.color is not None and self.color != "":
             if not is_valid_color(self.color):
                 raise ValueError(f"Invalid color format: {self.color!r}. Must be hex or rgba.")
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        cls.validate_color_columns(columns)
+        return columns
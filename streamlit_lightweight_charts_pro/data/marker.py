@@ -3,14 +3,44 @@ Marker data classes for streamlit-lightweight-charts.
 
 This module provides data classes for chart markers used to highlight
 specific data points or events on charts, following the TradingView Lightweight Charts API.
+
+Markers are Data classes, so many markers can also be stored as columns in a
+SeriesData (e.g. signals built from a DataFrame, see Series.add_markers()).
+normalize_columns() validates such columns in one pass, and stores each
+distinct position, shape, color, id and text once.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Optional, Type, Union
+
+import numpy as np
+import pandas as pd
 
 from streamlit_lightweight_charts_pro.data.data import Data
 from streamlit_lightweight_charts_pro.type_definitions.enums import MarkerPosition, MarkerShape
 
+# Marker fields holding strings repeated across markers
+_INTERNED_FIELDS = ("color", "id", "text")
+
+
+def _enum_column(values: np.ndarray, enum_class: Type) -> np.ndarray:
+    """Convert a column to enum members, converting each distinct value once."""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+    members = np.empty(len(uniques), dtype=object)
+    members[:] = [
+        value if isinstance(value, enum_class) else enum_class(value) for value in uniques
+    ]
+    return members[codes]
+
+
+def _interned_column(values: np.ndarray) -> np.ndarray:
+    """Return a column referencing one object per distinct value, None where missing."""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    # Missing values have code -1, which picks the trailing None
+    table = np.empty(len(uniques) + 1, dtype=object)
+    table[:-1] = uniques
+    return table[codes]
+
 
 @dataclass
 class MarkerBase(Data):
@@ -34,6 +64,9 @@ class MarkerBase(Data):
     REQUIRED_COLUMNS = {"position", "shape"}
     OPTIONAL_COLUMNS = {"text", "color", "size", "id"}
 
+    # Positions allowed for this marker type, None for any position
+    VALID_POSITIONS = None
+
     position: Union[str, MarkerPosition] = MarkerPosition.ABOVE_BAR
     shape: Union[str, MarkerShape] = MarkerShape.CIRCLE
     color: str = "#2196F3"  # Default blue color
@@ -54,6 +87,18 @@ class MarkerBase(Data):
         if isinstance(self.shape, str):
             self.shape = MarkerShape(self.shape)
 
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        if "position" in columns:
+            columns["position"] = _enum_column(columns["position"], MarkerPosition)
+        if "shape" in columns:
+            columns["shape"] = _enum_column(columns["shape"], MarkerShape)
+        for name in _INTERNED_FIELDS:
+            if name in columns and columns[name].dtype == object:
+                columns[name] = _interned_column(columns[name])
+        return columns
+
     def validate_position(self) -> bool:
         """
         Validate that the position is valid for this marker type.
@@ -61,8 +106,27 @@ class MarkerBase(Data):
         Returns:
             bool: True if position is valid, False otherwise.
         """
-        # Base class allows all positions - subclasses will override
-        return True
+        return self.VALID_POSITIONS is None or self.position in self.VALID_POSITIONS
+
+    @classmethod
+    def validate_positions(cls, positions: np.ndarray) -> None:
+        """
+        Validate a column of positions for this marker type.
+
+        Bulk counterpart of validate_position(), checking each distinct
+        position once.
+
+        Args:
+            positions (np.ndarray): Positions of the markers.
+
+        Raises:
+            ValueError: If a position is not valid for this marker type.
+        """
+        if cls.VALID_POSITIONS is None:
+            return
+        for position in pd.unique(np.asarray(positions, dtype=object)):
+            if position not in cls.VALID_POSITIONS:
+                raise ValueError(f"Invalid position '{position}' for marker type {cls.__name__}")
 
 
 @dataclass
@@ -87,6 +151,14 @@ class PriceMarker(MarkerBase):
     REQUIRED_COLUMNS = {"position", "shape", "price"}
     OPTIONAL_COLUMNS = {"text", "color", "size", "id"}
 
+    VALID_POSITIONS = frozenset(
+        {
+            MarkerPosition.AT_PRICE_TOP,
+            MarkerPosition.AT_PRICE_BOTTOM,
+            MarkerPosition.AT_PRICE_MIDDLE,
+        }
+    )
+
     price: float = 0.0  # Required for price markers
 
     def __post_init__(self):
@@ -97,19 +169,12 @@ class PriceMarker(MarkerBase):
         if self.price == 0.0:
             raise ValueError("Price is required for PriceMarker")
 
-    def validate_position(self) -> bool:
-        """
-        Validate that the position is valid for price markers.
-
-        Returns:
-            bool: True if position is valid, False otherwise.
-        """
-        valid_positions = {
-            MarkerPosition.AT_PRICE_TOP,
-            MarkerPosition.AT_PRICE_BOTTOM,
-            MarkerPosition.AT_PRICE_MIDDLE,
-        }
-        return self.position in valid_positions
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        if "price" not in columns or (np.asarray(columns["price"]) == 0.0).any():
+            raise ValueError("Price is required for PriceMarker")
+        return columns
 
 
 @dataclass
@@ -134,21 +199,15 @@ class BarMarker(MarkerBase):
     REQUIRED_COLUMNS = {"position", "shape"}
     OPTIONAL_COLUMNS = {"text", "color", "size", "id", "price"}
 
-    price: Optional[float] = None
-
-    def validate_position(self) -> bool:
-        """
-        Validate that the position is valid for bar markers.
-
-        Returns:
-            bool: True if position is valid, False otherwise.
-        """
-        valid_positions = {
+    VALID_POSITIONS = frozenset(
+        {
             MarkerPosition.ABOVE_BAR,
             MarkerPosition.BELOW_BAR,
             MarkerPosition.IN_BAR,
         }
-        return self.position in valid_positions
+    )
+
+    price: Optional[float] = None
 
 
 # Backward compatibility alias
@@ -8,7 +8,9 @@ used in candlestick and bar charts.
 import math
 from dataclasses import dataclass
 
-from streamlit_lightweight_charts_pro.data.data import Data
+import numpy as np
+
+from streamlit_lightweight_charts_pro.data.data import Data, fill_nan_column
 
 
 @dataclass
@@ -52,3 +54,22 @@ class OhlcData(Data):
                 setattr(self, field_name, 0.0)
             elif value is None:
                 raise ValueError(f"{field_name} must not be None")
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+
+        # Validate OHLC relationships (NaN compares as False, like the scalar checks)
+        prices = {
+            name: np.asarray(columns[name], dtype=np.float64)
+            for name in ["open", "high", "low", "close"]
+        }
+        if (prices["high"] < prices["low"]).any():
+            raise ValueError("high must be greater than or equal to low")
+        if any((values < 0).any() for values in prices.values()):
+            raise ValueError("all OHLC values must be non-negative")
+
+        # Handle NaN values
+        for field_name in ["open", "high", "low", "close"]:
+            columns[field_name] = fill_nan_column(columns[field_name], field_name)
+        return columns
@@ -8,6 +8,9 @@ used in candlestick and bar charts.
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
+from streamlit_lightweight_charts_pro.data.data import fill_nan_column
 from streamlit_lightweight_charts_pro.data.ohlc_data import OhlcData
 
 
@@ -47,3 +50,12 @@ class OhlcvData(OhlcData):
                 setattr(self, field_name, 0.0)
             elif value is None:
                 raise ValueError(f"{field_name} must not be None")
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+
+        if (np.asarray(columns["volume"], dtype=np.float64) < 0).any():
+            raise ValueError("volume must be non-negative")
+        columns["volume"] = fill_nan_column(columns["volume"], "volume")
+        return columns
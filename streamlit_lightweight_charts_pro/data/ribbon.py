@@ -9,7 +9,7 @@ import math
 from dataclasses import dataclass
 from typing import Optional
 
-from streamlit_lightweight_charts_pro.data.data import Data
+from streamlit_lightweight_charts_pro.data.data import Data, fill_nan_column
 
 
 @dataclass
@@ -47,3 +47,11 @@ class RibbonData(Data):
         if isinstance(self.lower, float) and math.isnan(self.lower):
             self.lower = None
         # Allow None for missing data (no validation error)
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        # NaN marks missing data, like in __post_init__
+        for field_name in ["upper", "lower"]:
+            columns[field_name] = fill_nan_column(columns[field_name], field_name, fill=None)
+        return columns
@@ -0,0 +1,1119 @@
+"""
+Columnar series data for streamlit-lightweight-charts.
+
+This module provides the SeriesData class, which stores the data points of a
+series as one NumPy array per field instead of one Data instance per point.
+A point costs a few bytes per field instead of a full dataclass instance,
+DataFrame ingestion fills the arrays with vectorized operations, and the
+frontend payload is produced straight from the arrays following the same rules
+as Data.asdict(), either as dictionaries (asdicts()), directly as JSON
+(encoded() and to_json()) or as columns for binary transport (columnar()).
+
+SeriesData behaves like a list of data objects: it is a MutableSequence
+supporting len(), indexing, slicing, iteration, item assignment and deletion,
+insert(), pop(), remove(), sort(), reverse(), + and +=, and it can grow with
+append() and extend(). Indexing and iteration build Data objects on the fly. These are
+views of the stored point: setting one of their fields validates the point
+again and writes it back to the container, as editing an element of a list of
+data objects does. Slices, copies and pickles of the views are detached.
+
+For streaming use, the columns live in preallocated buffers that grow
+geometrically, so appending a point is amortized O(1). With max_points set
+the container keeps only the most recent points, like a ring buffer: older
+points are dropped from the front and the buffers never grow past twice that
+size. Once the container has been modified, it also tracks which points
+changed since the last asdicts() call (see dirty_range) and only serializes
+those, reusing the payload of the unchanged points.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.data import OhlcvData, SeriesData
+
+    series_data = SeriesData.from_columns(
+        OhlcvData,
+        {
+            "time": df["datetime"],
+            "open": df["o"],
+            "high": df["h"],
+            "low": df["l"],
+            "close": df["c"],
+            "volume": df["v"],
+        },
+    )
+    len(series_data)  # Number of points
+    series_data[-1]  # OhlcvData for the last point
+    series_data[-100:]  # SeriesData with the last 100 points
+    payload = series_data.asdicts()  # Same as [point.asdict() for point in points]
+
+    # Streaming: keep the last 10,000 bars
+    series_data.max_points = 10_000
+    series_data.append(OhlcvData(time=next_time, open=1, high=2, low=0.5, close=1.5, volume=10))
+    series_data.update_last(
+        OhlcvData(time=next_time, open=1, high=2.5, low=0.5, close=2, volume=12)
+    )
+    ```
+"""
+
+import copy
+import hashlib
+import itertools
+import math
+from collections.abc import MutableSequence
+from dataclasses import MISSING, fields
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from streamlit_lightweight_charts_pro.data.data import Data
+from streamlit_lightweight_charts_pro.type_definitions.enums import ColumnNames
+from streamlit_lightweight_charts_pro.utils.data_utils import normalize_time_array, snake_to_camel
+from streamlit_lightweight_charts_pro.utils.serialization import (
+    ColumnarData,
+    EncodedRows,
+    dumps,
+    encode_column,
+    encode_rows,
+    encode_value,
+)
+
+# Marker for values that Data.asdict() leaves out of the payload
+_SKIP = object()
+
+# Number of points converted to Python values at a time while iterating
+_ITER_CHUNK_SIZE = 4096
+
+# Number of points encoded to JSON at a time
+_ENCODE_CHUNK_SIZE = 65536
+
+# Smallest buffer allocated when a container starts growing
+_MIN_CAPACITY = 16
+
+
+def _frontend_key(name: str) -> str:
+    """Return the payload key for a data class field, as Data.asdict() does."""
+    if name == "time":
+        return ColumnNames.TIME.value
+    if name == "value":
+        return ColumnNames.VALUE.value
+    return snake_to_camel(name)
+
+
+def _frontend_value(value: Any) -> Any:
+    """Convert a single value the way Data.asdict() does, or return _SKIP."""
+    if value is None or (isinstance(value, str) and value == ""):
+        return _SKIP
+    if isinstance(value, float) and math.isnan(value):
+        value = 0.0
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, Enum):
+        value = value.value
+    return value
+
+
+def _encode_objects(column: np.ndarray) -> List[Any]:
+    """Encode an object column as JSON tokens, None for values that are left out."""
+    tokens = {}
+    encoded = []
+    for value in column.tolist():
+        value = _frontend_value(value)
+        if value is _SKIP:
+            encoded.append(None)
+            continue
+        # Key on the type too, as True == 1 == 1.0 but their JSON differs
+        key = (type(value), value)
+        try:
+            token = tokens.get(key)
+        except TypeError:
+            # Unhashable values are encoded every time
+            encoded.append(encode_value(value))
+            continue
+        if token is None:
+            token = tokens[key] = encode_value(value)
+        encoded.append(token)
+    return encoded
+
+
+def _as_column(values: Any) -> np.ndarray:
+    """Convert array-like values to a column, keeping strings as Python objects."""
+    column = np.asarray(values)
+    if column.dtype.kind in "US":
+        # Keep the original objects: NumPy would turn str enums into plain strings
+        column = np.array(values if isinstance(values, list) else column, dtype=object)
+    return column
+
+
+def _field_default(data_field) -> Any:
+    """Return the default value of a dataclass field, or MISSING."""
+    if data_field.default is not MISSING:
+        return data_field.default
+    if data_field.default_factory is not MISSING:
+        return data_field.default_factory()
+    return MISSING
+
+
+def _default_column(data_field, length: int, like: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return a column holding the field default, with the dtype of like if numeric."""
+    default = _field_default(data_field)
+    if default is None or isinstance(default, str):
+        return np.full(length, default, dtype=object)
+    return np.full(length, default, dtype=like.dtype if like is not None else None)
+
+
+class _PayloadCache:
+    """Serialized points from absolute position first, valid up to position valid."""
+
+    __slots__ = ("items", "first", "valid")
+
+    def __init__(self, first: int):
+        self.items: List[Any] = []
+        self.first = first
+        self.valid = first
+
+
+def _detached_point(point_class: Type[Data], state: Dict[str, Any]) -> Data:
+    """Build a plain data object of point_class from the attributes of a view."""
+    point = object.__new__(point_class)
+    point.__dict__.update(state)
+    point.__dict__.pop("_series_binding", None)
+    return point
+
+
+class _PointView:
+    """
+    Mixin making a data object write its field changes back to a SeriesData.
+
+    SeriesData builds plain data objects and then switches their class to a
+    subclass of the data class with this mixin (see _view_class()), so that
+    building them costs the same as building detached ones.
+    """
+
+    __slots__ = ()
+
+    # Set on each view class by _view_class()
+    _point_class: Type[Data]
+    _field_names: Tuple[str, ...]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and write the validated point back to its container."""
+        binding = self.__dict__.get("_series_binding")
+        if binding is None or name not in self._field_names:
+            object.__setattr__(self, name, value)
+            return
+        values = {field_name: getattr(self, field_name) for field_name in self._field_names}
+        values[name] = value
+        # Validate and normalize the new values, like building the point would
+        point = self._point_class(**values)
+        for field_name in self._field_names:
+            object.__setattr__(self, field_name, getattr(point, field_name))
+        container, position, generation = binding
+        if not container._write_back(position, generation, point):
+            # The point was dropped or replaced since: keep the view detached
+            del self.__dict__["_series_binding"]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare fields with views and detached objects of the same data class."""
+        if getattr(type(other), "_point_class", type(other)) is not self._point_class:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._field_names)
+
+    __hash__ = None
+
+    def _detached(self) -> Data:
+        """Return a plain data object with the values of the view."""
+        return _detached_point(self._point_class, self.__dict__)
+
+    def __copy__(self) -> Data:
+        """Copies are detached from the container."""
+        return self._detached()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Data:
+        """Deep copies are detached from the container."""
+        return copy.deepcopy(self._detached(), memo)
+
+    def __reduce_ex__(self, protocol):
+        """Pickle as a detached data object."""
+        state = dict(self.__dict__)
+        state.pop("_series_binding", None)
+        return _detached_point, (self._point_class, state)
+
+
+# Write-through subclass of each data class, see _view_class()
+_VIEW_CLASSES: Dict[Type[Data], type] = {}
+
+
+def _view_class(data_class: Type[Data]) -> type:
+    """Return the subclass of data_class whose instances write back to a SeriesData."""
+    view_class = _VIEW_CLASSES.get(data_class)
+    if view_class is None:
+        # data_class comes first so the subclass keeps its layout, which the
+        # __class__ switch requires; the mixin methods that dataclasses
+        # generate on data_class are set on the subclass itself
+        view_class = _VIEW_CLASSES[data_class] = type(
+            data_class.__name__,
+            (data_class, _PointView),
+            {
+                "__qualname__": data_class.__qualname__,
+                "__module__": data_class.__module__,
+                "__eq__": _PointView.__eq__,
+                "__hash__": None,
+                "_point_class": data_class,
+                "_field_names": tuple(data_field.name for data_field in fields(data_class)),
+            },
+        )
+    return view_class
+
+
+class SeriesData(MutableSequence):
+    """
+    Column-oriented container for the data points of a series.
+
+    Each field of the data class is stored as a NumPy array: the time column is
+    an int64 array of UNIX seconds, numeric fields are numeric arrays and other
+    fields (colors, enums) are object arrays. Fields without a column take
+    their dataclass default for every point. The columns are validated once,
+    through Data.normalize_columns(), when the container is built with
+    from_columns().
+
+    All Series classes accept a SeriesData as their data and serialize it
+    without creating Data objects.
+
+    Attributes:
+        data_class (Type[Data]): Data class describing a single point.
+        columns (Dict[str, np.ndarray]): Field name to column values.
+        max_points (Optional[int]): Maximum number of points kept, or None for
+            unbounded data.
+    """
+
+    # Containers are mutable, so they are not hashable (like lists)
+    __hash__ = None
+
+    def __init__(
+        self,
+        data_class: Type[Data],
+        columns: Dict[str, np.ndarray],
+        max_points: Optional[int] = None,
+    ):
+        """
+        Wrap already normalized columns.
+
+        Args:
+            data_class (Type[Data]): Data class describing a single point.
+            columns (Dict[str, np.ndarray]): Normalized field columns, including "time".
+            max_points (Optional[int]): Maximum number of points to keep. When the
+                container holds more, the oldest points are dropped.
+
+        Raises:
+            ValueError: If the columns are missing "time" or have different lengths.
+            ValueError: If max_points is not a positive integer.
+        """
+        if "time" not in columns:
+            raise ValueError("columns must include 'time'")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("all columns must have the same length")
+
+        self.data_class = data_class
+        # Absolute position of the first live point, counting dropped points
+        self._first = 0
+        self._max_points: Optional[int] = None
+        self.columns = columns
+        self.max_points = max_points
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the field columns, as views of the live part of the buffers."""
+        start, stop = self._start, self._stop
+        if start == 0 and stop == len(self._buffers["time"]):
+            return dict(self._buffers)
+        return {name: buffer[start:stop] for name, buffer in self._buffers.items()}
+
+    @columns.setter
+    def columns(self, columns: Dict[str, np.ndarray]) -> None:
+        """Replace all columns, forgetting any serialization state."""
+        self._buffers = dict(columns)
+        self._start = 0
+        self._stop = len(self._buffers["time"])
+        # Points handed out before no longer write back (see _write_back())
+        self._generation = getattr(self, "_generation", 0) + 1
+        # Serialized points kept between calls, for asdicts() and encoded();
+        # None until the container is first modified in place
+        self._payload: Optional[_PayloadCache] = None
+        self._encoded: Optional[_PayloadCache] = None
+        self._content_hash: Optional[str] = None
+
+    @property
+    def max_points(self) -> Optional[int]:
+        """Return the maximum number of points kept, or None when unbounded."""
+        return self._max_points
+
+    @max_points.setter
+    def max_points(self, value: Optional[int]) -> None:
+        """
+        Set the maximum number of points kept, dropping the oldest ones if needed.
+
+        Raises:
+            ValueError: If value is not None or a positive integer.
+        """
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, int) or value <= 0
+        ):
+            raise ValueError("max_points must be a positive integer or None")
+        self._max_points = value
+        self._drop_oldest()
+
+    @property
+    def dirty_range(self) -> Optional[Tuple[int, int]]:
+        """
+        Return the points changed since the last asdicts() call.
+
+        Only containers that were modified in place track changes; for the others
+        every point counts as changed.
+
+        Returns:
+            Optional[Tuple[int, int]]: (start, stop) positions of the points whose
+                payload asdicts() will rebuild, or None if all points are clean.
+        """
+        length = len(self)
+        if self._payload is None:
+            return (0, length) if length else None
+        start = min(max(self._payload.valid - self._first, 0), length)
+        return (start, length) if start < length else None
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """
+        Return a hash of the data class and the points, computed on first use.
+
+        Containers holding the same points of the same data class have the same
+        hash within a process, so that their payloads can be shared (see
+        utils.payload_cache). Containers modified in place have none, as they
+        serialize incrementally instead (see dirty_range).
+
+        Returns:
+            Optional[str]: Hexadecimal BLAKE2b digest, or None for containers
+                modified in place.
+        """
+        if self._payload is not None:
+            return None
+        if self._content_hash is None:
+            digest = hashlib.blake2b(digest_size=16, person=b"series")
+            digest.update(f"{self.data_class.__module__}.{self.data_class.__qualname__}".encode())
+            for name, column in sorted(self.columns.items()):
+                digest.update(f"\n{name}:{column.dtype.str}:{len(column)}:".encode())
+                if column.dtype.kind == "O":
+                    # Enums, colors and the like; repr keeps 1, 1.0 and True apart
+                    digest.update(repr(column.tolist()).encode("utf-8", "surrogatepass"))
+                else:
+                    digest.update(np.ascontiguousarray(column).view(np.uint8))
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    @classmethod
+    def from_columns(cls, data_class: Type[Data], columns: Dict[str, Any]) -> "SeriesData":
+        """
+        Build series data from one array-like per data class field.
+
+        The columns are normalized and validated with data_class.normalize_columns().
+        Data classes whose __post_init__ has no vectorized counterpart (see
+        Data.supports_columnar()) are validated point by point instead before
+        being stored as columns.
+
+        Args:
+            data_class (Type[Data]): Data class describing a single point.
+            columns (Dict[str, Any]): Field name to array-like values (NumPy arrays,
+                pandas Series or lists). Must include "time".
+
+        Returns:
+            SeriesData: Columnar data for the given data class.
+
+        Raises:
+            ValueError: If a value fails the data class validation.
+        """
+        columns = dict(columns)
+        time = normalize_time_array(columns.pop("time"))
+        arrays = {"time": time}
+        for name, values in columns.items():
+            arrays[name] = _as_column(values)
+
+        if not data_class.supports_columnar():
+            return cls.from_data(data_class, cls(data_class, arrays).to_data_list())
+
+        return cls(data_class, data_class.normalize_columns(arrays))
+
+    @classmethod
+    def from_data(cls, data_class: Type[Data], points: Iterable[Data]) -> "SeriesData":
+        """
+        Build series data from existing data objects.
+
+        The objects are already validated, so their values are stored as they
+        are. Optional fields that are None for every point get no column.
+
+        Args:
+            data_class (Type[Data]): Data class describing a single point.
+            points (Iterable[Data]): Data objects of data_class.
+
+        Returns:
+            SeriesData: Columnar copy of the points.
+
+        Raises:
+            TypeError: If a point is not an instance of data_class.
+        """
+        points = list(points)
+        for point in points:
+            if not isinstance(point, data_class):
+                raise TypeError(
+                    f"Expected {data_class.__name__} instances, got {type(point).__name__}"
+                )
+
+        columns = {"time": np.array([point.time for point in points], dtype=np.int64)}
+        for data_field in fields(data_class):
+            name = data_field.name
+            if name == "time":
+                continue
+            values = [getattr(point, name) for point in points]
+            if _field_default(data_field) is None and all(value is None for value in values):
+                continue
+            columns[name] = _as_column(values)
+        return cls(data_class, columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the column values, in bytes."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return self._stop - self._start
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Data, "SeriesData"]:
+        """
+        Return one point as a data object, or a slice as a new SeriesData.
+
+        Args:
+            index (Union[int, slice]): Point position (negative values count from
+                the end) or slice of positions.
+
+        Returns:
+            Union[Data, SeriesData]: The data object for an integer index, or a
+                SeriesData sharing no state with this one for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return SeriesData(
+                self.data_class,
+                {name: values[index].copy() for name, values in self.columns.items()},
+            )
+
+        index = self._position(index)
+        return self._view(self._point(index), index)
+
+    def __setitem__(self, index: int, point: Data) -> None:
+        """
+        Replace one point.
+
+        Args:
+            index (int): Point position (negative values count from the end).
+            point (Data): Data object of the container's data class.
+
+        Raises:
+            IndexError: If the index is out of range.
+            TypeError: If index is a slice or point is not an instance of the
+                container's data class.
+        """
+        if isinstance(index, slice):
+            raise TypeError("SeriesData does not support slice assignment")
+        self._replace(self._position(index), self._coerce([point]))
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Remove one point, or the points of a slice.
+
+        Removing points at the end keeps the serialization state of the others,
+        like append(); removing points before the end rebuilds the columns and
+        detaches the data objects handed out before.
+
+        Args:
+            index (Union[int, slice]): Point position (negative values count from
+                the end) or slice of positions.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step == 1 and stop >= length:
+                self._truncate(min(start, length))
+                return
+            keep = np.ones(length, dtype=bool)
+            keep[index] = False
+        else:
+            index = self._position(index)
+            if index == length - 1:
+                self._truncate(index)
+                return
+            keep = np.ones(length, dtype=bool)
+            keep[index] = False
+        self._rebuild({name: values[keep] for name, values in self.columns.items()})
+
+    def insert(self, index: int, value: Data) -> None:
+        """
+        Insert one data object before a position, like list.insert().
+
+        Inserting at the end is the same as append(); inserting before the end
+        rebuilds the columns and detaches the data objects handed out before.
+
+        Args:
+            index (int): Position to insert before (negative values count from
+                the end, out-of-range values are clamped).
+            value (Data): Data object of the container's data class.
+
+        Raises:
+            TypeError: If value is not an instance of the container's data class.
+        """
+        length = len(self)
+        index = min(max(index + length if index < 0 else index, 0), length)
+        if index == length:
+            self.append(value)
+            return
+        self._rebuild(self._concatenate([self[:index], self._coerce([value]), self[index:]]))
+
+    def pop(self, index: int = -1) -> Data:
+        """
+        Remove and return one point, the last one by default.
+
+        Args:
+            index (int): Point position (negative values count from the end).
+
+        Returns:
+            Data: The removed point, detached from the container.
+
+        Raises:
+            IndexError: If the container is empty or the index is out of range.
+        """
+        if len(self) == 0:
+            raise IndexError("pop from empty SeriesData")
+        index = self._position(index)
+        point = self._point(index)
+        del self[index]
+        return point
+
+    def clear(self) -> None:
+        """Remove all points."""
+        del self[:]
+
+    def reverse(self) -> None:
+        """Reverse the order of the points in place."""
+        self._rebuild({name: values[::-1].copy() for name, values in self.columns.items()})
+
+    def sort(self, key: Optional[Callable[[Data], Any]] = None, reverse: bool = False) -> None:
+        """
+        Sort the points in place, by time unless a key is given.
+
+        Data objects do not define an order, so unlike list.sort() the default
+        key is the point time. The sort is stable, like list.sort().
+
+        Args:
+            key (Optional[Callable[[Data], Any]]): Function computing the sort key
+                of a data object.
+            reverse (bool): Whether to sort in descending order.
+        """
+        length = len(self)
+        if key is None:
+            times = self.columns["time"]
+            if reverse:
+                # Stable descending order: equal times keep their order
+                order = length - 1 - np.argsort(times[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(times, kind="stable")
+        else:
+            keys = [key(point) for point in self._points(views=False)]
+            order = np.array(
+                sorted(range(length), key=keys.__getitem__, reverse=reverse), dtype=np.intp
+            )
+        self._rebuild({name: values[order] for name, values in self.columns.items()})
+
+    def copy(self) -> "SeriesData":
+        """Return a copy sharing no state with this container, like list.copy()."""
+        return self[:]
+
+    def __add__(self, other: Union[Iterable[Data], "SeriesData"]) -> "SeriesData":
+        """Return a new container with the points of both operands."""
+        if not isinstance(other, (SeriesData, list)):
+            return NotImplemented
+        return SeriesData(self.data_class, self._concatenate([self, self._coerce(other)]))
+
+    def __radd__(self, other: List[Data]) -> List[Data]:
+        """Return a list of the data objects of both operands, like list + list."""
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + self.to_data_list()
+
+    def __iadd__(self, other: Union[Iterable[Data], "SeriesData"]) -> "SeriesData":
+        """Add points at the end in place, like extend()."""
+        self.extend(other)
+        return self
+
+    def _point(self, index: int) -> Data:
+        """Build a detached data object for the point at a non-negative index."""
+        kwargs = {}
+        for name, values in self.columns.items():
+            value = values[index]
+            kwargs[name] = value.item() if isinstance(value, np.generic) else value
+        return self.data_class(**kwargs)
+
+    def _truncate(self, length: int) -> None:
+        """Drop the points from length on, keeping the payloads of the others."""
+        if length >= len(self):
+            return
+        self._start_tracking()
+        self._stop = self._start + length
+        self._invalidate(self._first + length)
+
+    def _rebuild(self, columns: Dict[str, np.ndarray]) -> None:
+        """Replace the columns after a change that moves points, keeping max_points."""
+        self.columns = columns
+        self._drop_oldest()
+
+    def _concatenate(self, parts: List["SeriesData"]) -> Dict[str, np.ndarray]:
+        """Join containers of the container's data class into new columns."""
+        columns = {}
+        for data_field in fields(self.data_class):
+            name = data_field.name
+            present = [part.columns.get(name) for part in parts]
+            like = next((values for values in present if values is not None), None)
+            if like is None:
+                continue
+            columns[name] = np.concatenate(
+                [
+                    values if values is not None else _default_column(data_field, len(part), like)
+                    for part, values in zip(parts, present)
+                ]
+            )
+        return columns
+
+    def _position(self, index: int) -> int:
+        """Return the position of an index counting from the end when negative."""
+        length = len(self)
+        if not -length <= index < length:
+            raise IndexError("SeriesData index out of range")
+        return index + length if index < 0 else index
+
+    def _view(self, point: Data, index: int) -> Data:
+        """Turn a data object built from the point at index into a write-through view."""
+        object.__setattr__(point, "__class__", _view_class(self.data_class))
+        point.__dict__["_series_binding"] = (self, self._first + index, self._generation)
+        return point
+
+    def _replace(self, index: int, other: "SeriesData") -> None:
+        """Overwrite the point at index with the single point of other."""
+        self._start_tracking()
+        self._write(other, self._start + index)
+        self._invalidate(self._first + index)
+
+    def _write_back(self, position: int, generation: int, point: Data) -> bool:
+        """
+        Store a point edited through a view.
+
+        Args:
+            position (int): Absolute position of the point, counting dropped points.
+            generation (int): Generation of the columns when the view was built.
+            point (Data): The edited point, already validated.
+
+        Returns:
+            bool: Whether the point is still in the container and was written.
+        """
+        index = position - self._first
+        if generation != self._generation or not 0 <= index < len(self):
+            return False
+        self._replace(index, SeriesData.from_data(self.data_class, [point]))
+        return True
+
+    def take(self, indices: np.ndarray) -> "SeriesData":
+        """
+        Return the points at the given positions as a new SeriesData.
+
+        Args:
+            indices (np.ndarray): Point positions, e.g. the points kept by downsampling.
+
+        Returns:
+            SeriesData: The selected points, sharing no state with this container.
+        """
+        return SeriesData(
+            self.data_class, {name: values[indices] for name, values in self.columns.items()}
+        )
+
+    def __iter__(self) -> Iterator[Data]:
+        """Yield one write-through data object per point (see __getitem__())."""
+        return self._points(views=True)
+
+    def _points(self, views: bool) -> Iterator[Data]:
+        """Yield one data object per point, converting the columns chunk by chunk."""
+        names = list(self.columns)
+        data_class = self.data_class
+        view_class = _view_class(data_class)
+        generation = self._generation
+        for start in range(0, len(self), _ITER_CHUNK_SIZE):
+            stop = start + _ITER_CHUNK_SIZE
+            values = [self.columns[name][start:stop].tolist() for name in names]
+            for position, row in enumerate(zip(*values), self._first + start):
+                point = data_class(**dict(zip(names, row)))
+                if views:
+                    object.__setattr__(point, "__class__", view_class)
+                    point.__dict__["_series_binding"] = (self, position, generation)
+                yield point
+
+    def __eq__(self, other: object) -> bool:
+        """Compare point by point with another SeriesData or a list of data objects."""
+        if isinstance(other, SeriesData):
+            return self.data_class is other.data_class and self.asdicts() == other.asdicts()
+        if isinstance(other, list):
+            return len(self) == len(other) and list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return a short description of the container."""
+        return f"SeriesData({self.data_class.__name__}, points={len(self)})"
+
+    def append(self, value: Data) -> None:
+        """
+        Add one data object at the end.
+
+        Args:
+            value (Data): Data object of the container's data class.
+
+        Raises:
+            TypeError: If value is not an instance of the container's data class.
+        """
+        self.extend([value])
+
+    def extend(self, values: Union[Iterable[Data], "SeriesData"]) -> None:
+        """
+        Add several points at the end.
+
+        Args:
+            values (Union[Iterable[Data], SeriesData]): Data objects of the
+                container's data class, or another SeriesData of the same class.
+
+        Raises:
+            TypeError: If the values do not match the container's data class.
+        """
+        other = self._coerce(values)
+        if len(other) == 0:
+            return
+
+        self._start_tracking()
+        self._reserve(len(other))
+        self._write(other, self._stop)
+        self._stop += len(other)
+        self._drop_oldest()
+
+    def update_last(self, point: Data) -> None:
+        """
+        Replace the last point, e.g. the bar still being formed.
+
+        Args:
+            point (Data): Data object of the container's data class, with the time
+                of the current last point.
+
+        Raises:
+            TypeError: If point is not an instance of the container's data class.
+            ValueError: If the container is empty or point has another time.
+        """
+        other = self._coerce([point])
+        if len(self) == 0:
+            raise ValueError("Cannot update the last point of empty data")
+        last_time = self._buffers["time"][self._stop - 1]
+        if other.columns["time"][0] != last_time:
+            raise ValueError(
+                f"update_last() expects the time of the last point ({last_time}), "
+                f"got {other.columns['time'][0]}"
+            )
+
+        self._start_tracking()
+        self._write(other, self._stop - 1)
+        self._invalidate(self._first + len(self) - 1)
+
+    def _coerce(self, points: Union[Iterable[Data], "SeriesData"]) -> "SeriesData":
+        """Return points as a SeriesData of the container's data class."""
+        if isinstance(points, SeriesData):
+            if points.data_class is not self.data_class:
+                raise TypeError(
+                    f"Cannot extend {self.data_class.__name__} data with "
+                    f"{points.data_class.__name__} data"
+                )
+            return points
+        return SeriesData.from_data(self.data_class, points)
+
+    def _start_tracking(self) -> None:
+        """Start caching payloads so that later serializations only cover changes."""
+        if self._payload is None:
+            self._payload = _PayloadCache(self._first)
+            self._encoded = _PayloadCache(self._first)
+
+    def _invalidate(self, position: int) -> None:
+        """Mark the cached payloads stale from an absolute position on."""
+        for cache in (self._payload, self._encoded):
+            if cache is not None:
+                cache.valid = min(cache.valid, position)
+
+    def _reserve(self, count: int) -> None:
+        """Make room for count more points after the live ones."""
+        capacity = len(self._buffers["time"])
+        if self._stop + count <= capacity:
+            return
+
+        # Grow geometrically; bounded containers settle at twice max_points, so
+        # moving the live points to the front happens once every max_points appends
+        length = len(self)
+        needed = length + count
+        if self._max_points is not None:
+            capacity = max(2 * self._max_points, needed)
+        else:
+            capacity = max(2 * needed, _MIN_CAPACITY)
+        buffers = {}
+        for name, buffer in self._buffers.items():
+            grown = np.empty(capacity, dtype=buffer.dtype)
+            grown[:length] = buffer[self._start : self._stop]
+            buffers[name] = grown
+        self._buffers = buffers
+        self._start = 0
+        self._stop = length
+
+    def _write(self, other: "SeriesData", position: int) -> None:
+        """Write the points of other into the buffers, starting at position."""
+        count = len(other)
+        other_columns = other.columns
+        for data_field in fields(self.data_class):
+            name = data_field.name
+            buffer = self._buffers.get(name)
+            values = other_columns.get(name)
+            if buffer is None and values is None:
+                continue
+            if buffer is None:
+                # First value for an optional field: earlier points keep the default
+                buffer = _default_column(data_field, len(self._buffers["time"]), like=values)
+            if values is None:
+                values = _default_column(data_field, count, like=buffer)
+
+            dtype = np.promote_types(buffer.dtype, values.dtype)
+            if dtype != buffer.dtype:
+                # e.g. int values followed by floats: earlier payloads are stale
+                buffer = buffer.astype(dtype)
+                self._invalidate(self._first)
+            elif not buffer.flags.writeable:
+                # Shared read-only column, e.g. from the series conversion cache
+                buffer = buffer.copy()
+            buffer[position : position + count] = values
+            self._buffers[name] = buffer
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest points beyond max_points."""
+        if self._max_points is None:
+            return
+        excess = len(self) - self._max_points
+        if excess > 0:
+            self._start += excess
+            self._first += excess
+            self._content_hash = None
+
+    def to_data_list(self) -> List[Data]:
+        """
+        Build one data class instance per point.
+
+        Returns:
+            List[Data]: Data objects in column order, detached from the container.
+        """
+        return list(self._points(views=False))
+
+    def asdicts(self) -> List[Dict[str, Any]]:
+        """
+        Serialize all points for the frontend.
+
+        Produces exactly what calling asdict() on every data object would, without
+        creating the objects: camelCase keys in field order, NaN converted to 0.0,
+        NumPy scalars and enums converted to plain values, and None or empty
+        string values left out. Data classes that override asdict() are
+        serialized through their own method.
+
+        Containers modified with append(), extend() or update_last() keep the
+        payload between calls and only serialize the points in dirty_range; the
+        dictionaries of unchanged points are shared between calls and must not
+        be modified.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per data point.
+        """
+        if self._payload is None:
+            return self._serialize(0, len(self))
+        return list(self._cached(self._payload, self._serialize))
+
+    def encoded(self) -> EncodedRows:
+        """
+        Serialize all points for the frontend as pre-encoded JSON.
+
+        Produces the JSON encoding of asdicts() without building any dictionary:
+        numeric columns are encoded in bulk and joined into one JSON object per
+        point. Like asdicts(), containers modified in place only encode the
+        points that changed since the previous call.
+
+        Returns:
+            EncodedRows: One JSON object per data point, with the point times.
+        """
+        if self._encoded is None:
+            rows = self._encode(0, len(self))
+        else:
+            rows = self._cached(self._encoded, self._encode)
+        # Copy the times: the buffers are reused as the container changes
+        return EncodedRows(rows, self._buffers["time"][self._start : self._stop].copy())
+
+    def to_json(self) -> bytes:
+        """
+        Serialize all points for the frontend as a JSON array.
+
+        Returns:
+            bytes: UTF-8 encoded JSON, equal to encoding asdicts().
+        """
+        return self.encoded().to_json()
+
+    def columnar(self) -> ColumnarData:
+        """
+        Serialize all points for the frontend as columns.
+
+        Produces the points of asdicts() as one column per key: numeric fields
+        as float or integer arrays (NaN converted to 0.0), other fields as lists
+        of plain values with None where asdicts() leaves the key out, and fields
+        without a column as a single constant. The arrays are copies, so the
+        result does not change when the container does.
+
+        Returns:
+            ColumnarData: The points, ready for utils.serialization.encode_payload().
+
+        Raises:
+            TypeError: If the data class overrides asdict(), as its points cannot
+                be described by columns.
+        """
+        if self.data_class.asdict is not Data.asdict:
+            raise TypeError(
+                f"{self.data_class.__name__} customizes asdict() and cannot be sent as columns"
+            )
+
+        keys = []
+        numeric = {}
+        values = {}
+        constants = {}
+        for data_field in fields(self.data_class):
+            name = data_field.name
+            key = _frontend_key(name)
+            buffer = self._buffers.get(name)
+            if buffer is not None:
+                column = buffer[self._start : self._stop]
+                if column.dtype.kind == "f":
+                    numeric[key] = np.where(np.isnan(column), 0.0, column)
+                elif column.dtype.kind in "iu":
+                    numeric[key] = column.copy()
+                else:
+                    column_values = (_frontend_value(value) for value in column.tolist())
+                    values[key] = [None if value is _SKIP else value for value in column_values]
+            else:
+                default = _field_default(data_field)
+                if default is MISSING:
+                    raise ValueError(f"No column provided for required field '{name}'")
+                default = _frontend_value(default)
+                if default is _SKIP:
+                    continue
+                constants[key] = default
+            keys.append(key)
+        return ColumnarData(keys, numeric, values, constants)
+
+    def _cached(self, cache: "_PayloadCache", serialize) -> List[Any]:
+        """Serialize all points, reusing the cached payload of unchanged points."""
+        first = self._first
+        reuse_start = first - cache.first
+        reuse_stop = max(cache.valid - cache.first, reuse_start)
+        reused = cache.items[reuse_start:reuse_stop]
+        items = reused + serialize(len(reused), len(self))
+        cache.items = items
+        cache.first = first
+        cache.valid = first + len(items)
+        return items
+
+    def _encode(self, start: int, stop: int) -> List[bytes]:
+        """Encode the points between two positions, see encoded()."""
+        if self.data_class.asdict is not Data.asdict:
+            return [dumps(point.asdict()) for point in self[start:stop]]
+        if stop - start > _ENCODE_CHUNK_SIZE:
+            # Encode in chunks so that the per-value tokens stay small in memory
+            rows = []
+            for chunk_start in range(start, stop, _ENCODE_CHUNK_SIZE):
+                rows.extend(self._encode(chunk_start, min(chunk_start + _ENCODE_CHUNK_SIZE, stop)))
+            return rows
+
+        keys = []
+        tokens = []
+        for data_field in fields(self.data_class):
+            name = data_field.name
+            buffer = self._buffers.get(name)
+            if buffer is not None:
+                column = buffer[self._start + start : self._start + stop]
+                if column.dtype.kind in "biuf":
+                    column_tokens = encode_column(column)
+                else:
+                    column_tokens = _encode_objects(column)
+            else:
+                default = _field_default(data_field)
+                if default is MISSING:
+                    raise ValueError(f"No column provided for required field '{name}'")
+                default = _frontend_value(default)
+                if default is _SKIP:
+                    continue
+                column_tokens = itertools.repeat(encode_value(default))
+            keys.append(_frontend_key(name))
+            tokens.append(column_tokens)
+        return encode_rows(keys, tokens)
+
+    def _serialize(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Serialize the points between two positions, see asdicts()."""
+        if self.data_class.asdict is not Data.asdict:
+            return [point.asdict() for point in self[start:stop]]
+
+        columns = {
+            name: buffer[self._start + start : self._start + stop]
+            for name, buffer in self._buffers.items()
+        }
+        keys = []
+        values = []
+        sparse = False
+        for data_field in fields(self.data_class):
+            name = data_field.name
+            if name in columns:
+                column = columns[name]
+                if column.dtype == object:
+                    column_values = [_frontend_value(value) for value in column.tolist()]
+                    sparse = sparse or any(value is _SKIP for value in column_values)
+                else:
+                    if column.dtype.kind == "f" and np.isnan(column).any():
+                        column = np.where(np.isnan(column), 0.0, column)
+                    column_values = column.tolist()
+            else:
+                # Fields without a column keep their dataclass default
+                default = _field_default(data_field)
+                if default is MISSING:
+                    raise ValueError(f"No column provided for required field '{name}'")
+                default = _frontend_value(default)
+                if default is _SKIP:
+                    continue
+                column_values = itertools.repeat(default)
+            keys.append(_frontend_key(name))
+            values.append(column_values)
+
+        rows = zip(*values)
+        if sparse:
+            return [
+                {key: value for key, value in zip(keys, row) if value is not _SKIP} for row in rows
+            ]
+        return [dict(zip(keys, row)) for row in rows]
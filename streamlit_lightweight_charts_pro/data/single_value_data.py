@@ -8,7 +8,7 @@ used throughout the library for representing financial data points.
 import math
 from dataclasses import dataclass
 
-from streamlit_lightweight_charts_pro.data.data import Data
+from streamlit_lightweight_charts_pro.data.data import Data, fill_nan_column
 from streamlit_lightweight_charts_pro.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -46,3 +46,9 @@ class SingleValueData(Data):
             self.value = 0.0
         elif self.value is None:
             raise ValueError("value must not be None")
+
+    @classmethod
+    def normalize_columns(cls, columns):
+        columns = super().normalize_columns(columns)
+        columns["value"] = fill_nan_column(columns["value"], "value")
+        return columns
@@ -1,18 +1,55 @@
-"""Trade data model for visualizing trades on charts."""
+"""
+Trade data model for visualizing trades on charts.
 
+TradeData describes a single trade. TradeBatch holds many trades as one
+array per field, for backtests with too many trades to build one TradeData
+(and two markers) per trade.
+"""
+
+import copy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 from streamlit_lightweight_charts_pro.data.marker import BarMarker
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
 from streamlit_lightweight_charts_pro.type_definitions.enums import (
     MarkerPosition,
     MarkerShape,
+    TimeAlignment,
     TradeType,
 )
-from streamlit_lightweight_charts_pro.utils.data_utils import from_utc_timestamp, to_utc_timestamp
+from streamlit_lightweight_charts_pro.utils.data_utils import normalize_time_array, to_utc_timestamp
+from streamlit_lightweight_charts_pro.utils.serialization import (
+    EncodedRows,
+    encode_column,
+    encode_rows,
+    encode_value,
+)
+from streamlit_lightweight_charts_pro.utils.time_index import TimeIndex
+
+# Fields of a trade, in the order of TradeData
+TRADE_FIELDS = (
+    "entry_time",
+    "entry_price",
+    "exit_time",
+    "exit_price",
+    "quantity",
+    "trade_type",
+    "id",
+    "notes",
+    "text",
+)
+REQUIRED_TRADE_FIELDS = ("entry_time", "entry_price", "exit_time", "exit_price", "quantity")
+
+# Default marker colors, as used by TradeData.to_markers()
+LONG_ENTRY_COLOR = "#2196F3"
+SHORT_ENTRY_COLOR = "#FF9800"
+WIN_EXIT_COLOR = "#4CAF50"
+LOSS_EXIT_COLOR = "#F44336"
 
 
 @dataclass
@@ -29,7 +66,9 @@ class TradeData:
         trade_type: Type of trade (long or short)
         id: Optional trade identifier
         notes: Optional trade notes
-        text: Optional tooltip text for the trade
+        text: Optional custom tooltip text for the trade. When None, the
+            frontend formats the default text (see generate_tooltip_text())
+            from the numeric fields, so it is only built on demand.
     """
 
     entry_time: Union[pd.Timestamp, datetime, str, int, float]
@@ -66,20 +105,27 @@ class TradeData:
         if isinstance(self.trade_type, str):
             self.trade_type = TradeType(self.trade_type.lower())
 
-        # Generate tooltip text if not provided
-        if self.text is None:
-            self.text = self.generate_tooltip_text()
+    @property
+    def entry_timestamp(self) -> int:
+        """Return the entry time as UNIX seconds."""
+        return self._entry_timestamp
+
+    @property
+    def exit_timestamp(self) -> int:
+        """Return the exit time as UNIX seconds."""
+        return self._exit_timestamp
+
+    @property
+    def tooltip_text(self) -> str:
+        """Return the custom tooltip text, or the generated one when there is none."""
+        return self.text if self.text is not None else self.generate_tooltip_text()
 
     def generate_tooltip_text(self) -> str:
-        """Generate tooltip text for the trade."""
+        """Generate the default tooltip text for the trade."""
         pnl = self.pnl
         pnl_pct = self.pnl_percentage
         win_loss = "Win" if pnl > 0 else "Loss"
 
-        # Format dates
-        from_utc_timestamp(self._entry_timestamp)
-        from_utc_timestamp(self._exit_timestamp)
-
         tooltip_parts = [
             f"Entry: {self.entry_price:.2f}",
             f"Exit: {self.exit_price:.2f}",
@@ -134,10 +180,12 @@ class TradeData:
         """
         # Default colors based on trade type and profit
         if entry_color is None:
-            entry_color = "#2196F3" if self.trade_type == TradeType.LONG else "#FF9800"
+            entry_color = (
+                LONG_ENTRY_COLOR if self.trade_type == TradeType.LONG else SHORT_ENTRY_COLOR
+            )
 
         if exit_color is None:
-            exit_color = "#4CAF50" if self.is_profitable else "#F44336"
+            exit_color = WIN_EXIT_COLOR if self.is_profitable else LOSS_EXIT_COLOR
 
         markers = []
 
@@ -187,13 +235,18 @@ class TradeData:
 
         return markers
 
-    def asdict(self) -> Dict[str, Any]:
+    def asdict(self, include_text: bool = True) -> Dict[str, Any]:
         """
         Serialize the trade data to a dict with camelCase keys for frontend.
 
         Converts the trade to a dictionary format suitable for frontend
         communication. Returns the trade data in the format expected by
-        the frontend TradeConfig interface.
+        the frontend TradeConfig interface. Only custom text is sent: the
+        frontend formats the default tooltip text from the numeric fields.
+
+        Args:
+            include_text (bool): Whether to include the custom text, e.g. False
+                when the visualization style does not display it.
 
         Returns:
             Dict[str, Any]: Serialized trade with camelCase keys ready for
@@ -216,7 +269,492 @@ class TradeData:
             trade_dict["id"] = self.id
         if self.notes:
             trade_dict["notes"] = self.notes
-        if self.text:
+        if include_text and self.text:
             trade_dict["text"] = self.text
 
         return trade_dict
+
+
+def _choose(condition: np.ndarray, if_true: Any, if_false: Any) -> np.ndarray:
+    """Pick one of two objects per element, as an object array referencing them."""
+    palette = np.empty(2, dtype=object)
+    palette[0], palette[1] = if_false, if_true
+    return palette[np.asarray(condition, dtype=bool).view(np.uint8)]
+
+
+def _interleave(entries: np.ndarray, exits: np.ndarray) -> np.ndarray:
+    """Merge entry and exit values into one column, entry first for each trade."""
+    merged = np.empty(2 * len(entries), dtype=np.result_type(entries, exits))
+    merged[0::2] = entries
+    merged[1::2] = exits
+    return merged
+
+
+def _optional_strings(values: Any, count: int) -> Optional[np.ndarray]:
+    """Convert an optional text field to an object column, None where unset."""
+    if values is None:
+        return None
+    if isinstance(values, str):
+        values = [values] * count
+    column = np.array(values, dtype=object)
+    if column.shape != (count,):
+        raise ValueError("All trade fields must have the same length")
+    # Missing values and empty strings are left out of the payload, like in asdict()
+    unset = pd.isna(column) | (column == "")
+    column[unset] = None
+    return None if unset.all() else column
+
+
+def _long_sides(trade_type: Any, count: int) -> np.ndarray:
+    """Return whether each trade is long, from one trade type or one per trade."""
+    if isinstance(trade_type, (str, TradeType)):
+        trade_type = [trade_type]
+        codes = np.zeros(count, dtype=np.intp)
+    else:
+        codes, trade_type = pd.factorize(
+            np.asarray(trade_type, dtype=object), use_na_sentinel=False
+        )
+        if len(codes) != count:
+            raise ValueError("All trade fields must have the same length")
+    long_types = np.array(
+        [
+            (TradeType(value.lower()) if isinstance(value, str) else TradeType(value))
+            == TradeType.LONG
+            for value in trade_type
+        ],
+        dtype=bool,
+    )
+    return long_types[codes]
+
+
+class TradeBatch:
+    """
+    Many trades held as one array per field.
+
+    TradeBatch is the columnar counterpart of a list of TradeData: times are
+    normalized, and the P&L, P&L percentage, profitability, tooltip texts and
+    markers of all trades are computed at once, so that large backtests do not
+    build one TradeData and two BarMarker objects per trade. Chart.add_trades()
+    accepts a TradeBatch wherever it accepts a list of TradeData, and sends it
+    to the frontend exactly like the equivalent list.
+
+    Like a list of TradeData, TradeBatch supports len(), indexing and
+    iteration, which return TradeData objects.
+
+    Attributes:
+        entry_time (np.ndarray): Entry times as int64 UNIX seconds.
+        entry_price (np.ndarray): Entry prices.
+        exit_time (np.ndarray): Exit times as int64 UNIX seconds.
+        exit_price (np.ndarray): Exit prices.
+        quantity (np.ndarray): Trade quantities, as int64 like TradeData.
+        is_long (np.ndarray): Whether each trade is long rather than short.
+        id (Optional[np.ndarray]): Trade identifiers, None where unset.
+        notes (Optional[np.ndarray]): Trade notes, None where unset.
+        text (Optional[np.ndarray]): Tooltip texts, None where they are generated.
+
+    Example:
+        ```python
+        from streamlit_lightweight_charts_pro.data import TradeBatch
+
+        trades = TradeBatch.from_dataframe(
+            backtest_df,
+            column_mapping={"entry_time": "opened", "exit_time": "closed", "trade_type": "side"},
+        )
+        chart.add_trades(trades)
+        ```
+    """
+
+    def __init__(
+        self,
+        entry_time: Any,
+        entry_price: Any,
+        exit_time: Any,
+        exit_price: Any,
+        quantity: Any,
+        *,
+        trade_type: Any = TradeType.LONG,
+        id: Any = None,  # pylint: disable=redefined-builtin
+        notes: Any = None,
+        text: Any = None,
+    ):
+        """
+        Build a batch from one array-like per field.
+
+        Args:
+            entry_time (Any): Entry times, in any format of normalize_time_array().
+            entry_price (Any): Entry prices.
+            exit_time (Any): Exit times, in any format of normalize_time_array().
+            exit_price (Any): Exit prices.
+            quantity (Any): Trade quantities.
+            trade_type (Any): One TradeType (or "long"/"short") for every trade,
+                or one per trade. Defaults to TradeType.LONG.
+            id (Any): Optional trade identifiers.
+            notes (Any): Optional trade notes.
+            text (Any): Optional tooltip texts; generated where unset.
+
+        Raises:
+            ValueError: If the fields have different lengths, a quantity is not
+                finite, or a trade does not exit after its entry.
+        """
+        self.entry_time = normalize_time_array(entry_time)
+        self.exit_time = normalize_time_array(exit_time)
+        self.entry_price = np.asarray(entry_price, dtype=np.float64)
+        self.exit_price = np.asarray(exit_price, dtype=np.float64)
+        quantity = np.asarray(quantity, dtype=np.float64)
+        count = len(self.entry_time)
+        if any(
+            len(column) != count
+            for column in (self.exit_time, self.entry_price, self.exit_price, quantity)
+        ):
+            raise ValueError("All trade fields must have the same length")
+        if not np.isfinite(quantity).all():
+            raise ValueError("quantity must be finite")
+        self.quantity = quantity.astype(np.int64)
+        if (self.exit_time <= self.entry_time).any():
+            raise ValueError("Exit time must be after entry time")
+        self.is_long = _long_sides(trade_type, count)
+        self.id = _optional_strings(id, count)
+        self.notes = _optional_strings(notes, count)
+        self.text = _optional_strings(text, count)
+
+    @classmethod
+    def from_dataframe(
+        cls, df: pd.DataFrame, column_mapping: Optional[Dict[str, str]] = None
+    ) -> "TradeBatch":
+        """
+        Build a batch from one row per trade.
+
+        Args:
+            df (pd.DataFrame): Trades, one per row.
+            column_mapping (Optional[Dict[str, str]]): Mapping of TradeData
+                fields to column (or index) names. Fields that are not mapped
+                are read from the column of the same name, if any.
+
+        Returns:
+            TradeBatch: The trades of df.
+
+        Raises:
+            ValueError: If a field is unknown or a required column is missing.
+        """
+        mapping = {field: field for field in TRADE_FIELDS}
+        for field, column in (column_mapping or {}).items():
+            if field not in mapping:
+                raise ValueError(f"Unknown trade field in column_mapping: {field}")
+            mapping[field] = column
+
+        columns = {}
+        for field, column in mapping.items():
+            if column in df.columns:
+                columns[field] = df[column]
+            elif column is not None and column in df.index.names:
+                columns[field] = df.index.get_level_values(column)
+            elif field in REQUIRED_TRADE_FIELDS:
+                raise ValueError(f"DataFrame is missing required column: {column}")
+        return cls(**columns)
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[TradeData]) -> "TradeBatch":
+        """
+        Build a batch from TradeData objects.
+
+        Args:
+            trades (Sequence[TradeData]): Trades to hold.
+
+        Returns:
+            TradeBatch: The same trades as one array per field.
+        """
+        return cls(
+            entry_time=np.array([trade.entry_timestamp for trade in trades], dtype=np.int64),
+            entry_price=[trade.entry_price for trade in trades],
+            exit_time=np.array([trade.exit_timestamp for trade in trades], dtype=np.int64),
+            exit_price=[trade.exit_price for trade in trades],
+            quantity=[trade.quantity for trade in trades],
+            trade_type=[trade.trade_type for trade in trades],
+            id=[trade.id for trade in trades],
+            notes=[trade.notes for trade in trades],
+            text=[trade.text for trade in trades],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of trades."""
+        return len(self.entry_time)
+
+    def __getitem__(self, index: int) -> TradeData:
+        """Return one trade as TradeData."""
+        if not -len(self) <= index < len(self):
+            raise IndexError("TradeBatch index out of range")
+        optional = {
+            name: column[index]
+            for name, column in (("id", self.id), ("notes", self.notes), ("text", self.text))
+            if column is not None
+        }
+        return TradeData(
+            entry_time=int(self.entry_time[index]),
+            entry_price=float(self.entry_price[index]),
+            exit_time=int(self.exit_time[index]),
+            exit_price=float(self.exit_price[index]),
+            quantity=int(self.quantity[index]),
+            trade_type=TradeType.LONG if self.is_long[index] else TradeType.SHORT,
+            **optional,
+        )
+
+    def __iter__(self) -> Iterator[TradeData]:
+        """Yield one TradeData per trade."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Return a short description of the batch."""
+        return f"TradeBatch({len(self)} trades)"
+
+    @property
+    def pnl(self) -> np.ndarray:
+        """Return the profit or loss of each trade."""
+        move = self.exit_price - self.entry_price
+        return np.where(self.is_long, move, -move) * self.quantity
+
+    @property
+    def pnl_percentage(self) -> np.ndarray:
+        """Return the profit or loss of each trade, in percent of its entry price."""
+        move = self.exit_price - self.entry_price
+        return (np.where(self.is_long, move, -move) / self.entry_price) * 100
+
+    @property
+    def is_profitable(self) -> np.ndarray:
+        """Return whether each trade is profitable."""
+        return self.pnl > 0
+
+    def take(self, indices: np.ndarray) -> "TradeBatch":
+        """
+        Return the trades at the given positions as a new TradeBatch.
+
+        Args:
+            indices (np.ndarray): Trade positions.
+
+        Returns:
+            TradeBatch: The selected trades, sharing no arrays with this batch.
+        """
+        batch = copy.copy(self)
+        for name, column in vars(self).items():
+            if column is not None:
+                setattr(batch, name, column[indices])
+        return batch
+
+    def aligned(
+        self, index: TimeIndex, policy: Union[TimeAlignment, str] = TimeAlignment.NEAREST
+    ) -> "TradeBatch":
+        """
+        Move the entry and exit times onto the bar times of an index.
+
+        Trades whose entry or exit is left out by the policy are dropped. A
+        trade lasting less than a bar may enter and exit on the same bar.
+
+        Args:
+            index (TimeIndex): Bar times of the chart.
+            policy (Union[TimeAlignment, str]): How to align the times.
+
+        Returns:
+            TradeBatch: The kept trades, with aligned times.
+        """
+        entry_time, entry_kept = index.align(self.entry_time, policy)
+        exit_time, exit_kept = index.align(self.exit_time, policy)
+        batch = copy.copy(self)
+        batch.entry_time = entry_time
+        batch.exit_time = exit_time
+        kept = entry_kept & exit_kept
+        return batch if kept.all() else batch.take(np.flatnonzero(kept))
+
+    def tooltip_texts(self) -> np.ndarray:
+        """
+        Return the tooltip text of each trade.
+
+        Texts given to the batch are kept; the others are generated like
+        TradeData.tooltip_text does. The frontend formats the generated texts
+        itself, so they are not part of the payload.
+
+        Returns:
+            np.ndarray: Object array with one string per trade.
+        """
+        pnl = self.pnl
+        columns = (
+            self.entry_price.tolist(),
+            self.exit_price.tolist(),
+            self.quantity.tolist(),
+            pnl.tolist(),
+            self.pnl_percentage.tolist(),
+            _choose(pnl > 0, "Win", "Loss").tolist(),
+        )
+        texts = np.array(
+            [
+                f"Entry: {entry:.2f}\nExit: {exit_:.2f}\nQty: {quantity:.2f}\n"
+                f"P&L: {trade_pnl:.2f} ({percentage:.1f}%)\n{outcome}"
+                for entry, exit_, quantity, trade_pnl, percentage, outcome in zip(*columns)
+            ],
+            dtype=object,
+        )
+        if self.notes is not None:
+            noted = np.flatnonzero(pd.notna(self.notes))
+            texts[noted] = texts[noted] + "\nNotes: " + self.notes[noted]
+        if self.text is not None:
+            given = pd.notna(self.text)
+            texts[given] = self.text[given]
+        return texts
+
+    def marker_columns(
+        self,
+        entry_color: Optional[str] = None,
+        exit_color: Optional[str] = None,
+        show_pnl: bool = True,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Return the entry and exit markers of the trades as BarMarker columns.
+
+        The markers are those of TradeData.to_markers(), in the same order:
+        the entry marker of each trade followed by its exit marker.
+
+        Args:
+            entry_color (Optional[str]): Color of the entry markers; by trade
+                type when None.
+            exit_color (Optional[str]): Color of the exit markers; by
+                profitability when None.
+            show_pnl (bool): Whether to show the P&L in the exit marker text.
+
+        Returns:
+            Dict[str, np.ndarray]: time, position, shape, color and text columns.
+        """
+        is_long = self.is_long
+        pnl = self.pnl
+        if entry_color is None:
+            entry_colors = _choose(is_long, LONG_ENTRY_COLOR, SHORT_ENTRY_COLOR)
+        else:
+            entry_colors = np.full(len(self), entry_color, dtype=object)
+        if exit_color is None:
+            exit_colors = _choose(pnl > 0, WIN_EXIT_COLOR, LOSS_EXIT_COLOR)
+        else:
+            exit_colors = np.full(len(self), exit_color, dtype=object)
+
+        entry_texts = [f"Entry: ${price:.2f}" for price in self.entry_price.tolist()]
+        if self.id is not None:
+            entry_texts = [
+                text if trade_id is None else f"{trade_id} - {text}"
+                for trade_id, text in zip(self.id.tolist(), entry_texts)
+            ]
+        if show_pnl:
+            rows = zip(self.exit_price.tolist(), pnl.tolist(), self.pnl_percentage.tolist())
+            exit_texts = [
+                f"Exit: ${price:.2f} (P&L: ${trade_pnl:.2f}, {percentage:+.1f}%)"
+                for price, trade_pnl, percentage in rows
+            ]
+        else:
+            exit_texts = [f"Exit: ${price:.2f}" for price in self.exit_price.tolist()]
+
+        return {
+            "time": _interleave(self.entry_time, self.exit_time),
+            "position": _interleave(
+                _choose(is_long, MarkerPosition.BELOW_BAR, MarkerPosition.ABOVE_BAR),
+                _choose(is_long, MarkerPosition.ABOVE_BAR, MarkerPosition.BELOW_BAR),
+            ),
+            "shape": _interleave(
+                _choose(is_long, MarkerShape.ARROW_UP, MarkerShape.ARROW_DOWN),
+                _choose(is_long, MarkerShape.ARROW_DOWN, MarkerShape.ARROW_UP),
+            ),
+            "color": _interleave(entry_colors, exit_colors),
+            "text": _interleave(
+                np.array(entry_texts, dtype=object), np.array(exit_texts, dtype=object)
+            ),
+        }
+
+    def marker_data(
+        self,
+        entry_color: Optional[str] = None,
+        exit_color: Optional[str] = None,
+        show_pnl: bool = True,
+    ) -> SeriesData:
+        """
+        Convert the trades to entry and exit markers stored as columns.
+
+        Args:
+            entry_color (Optional[str]): Color of the entry markers.
+            exit_color (Optional[str]): Color of the exit markers.
+            show_pnl (bool): Whether to show the P&L in the exit marker text.
+
+        Returns:
+            SeriesData: BarMarker columns of every trade, see marker_columns(),
+                ready for Series.add_markers().
+        """
+        return SeriesData(BarMarker, self.marker_columns(entry_color, exit_color, show_pnl))
+
+    def to_markers(
+        self,
+        entry_color: Optional[str] = None,
+        exit_color: Optional[str] = None,
+        show_pnl: bool = True,
+    ) -> List[BarMarker]:
+        """
+        Convert the trades to entry and exit markers.
+
+        Args:
+            entry_color (Optional[str]): Color of the entry markers.
+            exit_color (Optional[str]): Color of the exit markers.
+            show_pnl (bool): Whether to show the P&L in the exit marker text.
+
+        Returns:
+            List[BarMarker]: The markers of every trade, see marker_columns().
+        """
+        return self.marker_data(entry_color, exit_color, show_pnl).to_data_list()
+
+    def encoded(self, include_text: bool = True) -> EncodedRows:
+        """
+        Encode the trades the way TradeData.asdict() serializes each of them.
+
+        Args:
+            include_text (bool): Whether to include the custom texts.
+
+        Returns:
+            EncodedRows: One JSON object per trade, for the "trades" payload.
+        """
+        keys = [
+            "entryTime",
+            "entryPrice",
+            "exitTime",
+            "exitPrice",
+            "quantity",
+            "tradeType",
+            "isProfitable",
+            "pnl",
+            "pnlPercentage",
+        ]
+        pnl = self.pnl
+        tokens = [
+            encode_column(self.entry_time),
+            encode_column(self.entry_price),
+            encode_column(self.exit_time),
+            encode_column(self.exit_price),
+            encode_column(self.quantity),
+            _choose(
+                self.is_long,
+                encode_value(TradeType.LONG.value),
+                encode_value(TradeType.SHORT.value),
+            ).tolist(),
+            encode_column(pnl > 0),
+            encode_column(pnl),
+            encode_column(self.pnl_percentage),
+        ]
+        text = self.text if include_text else None
+        for key, column in (("id", self.id), ("notes", self.notes), ("text", text)):
+            if column is not None:
+                keys.append(key)
+                tokens.append([None if value is None else encode_value(value) for value in column])
+        return EncodedRows(encode_rows(keys, tokens), self.entry_time)
+
+    def asdicts(self, include_text: bool = True) -> List[Dict[str, Any]]:
+        """
+        Serialize every trade like TradeData.asdict().
+
+        Args:
+            include_text (bool): Whether to include the custom texts.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per trade.
+        """
+        return self.encoded(include_text).to_list()
@@ -9,10 +9,13 @@ import {
   IPrimitivePaneRenderer,
   IPanePrimitive,
   PaneAttachedParameter,
+  LogicalRange,
+  Range,
   Time
 } from 'lightweight-charts'
 import {
   ComponentConfig,
+  ConfigDelta,
   ChartConfig,
   SeriesConfig,
   TradeConfig,
@@ -31,6 +34,9 @@ import {TradeRectanglePlugin} from './tradeVisualization'
 
 import {cleanLineStyleOptions} from './utils/lineStyle'
 import {createSeries} from './utils/seriesFactory'
+import {createFrameCoalescer, FrameCoalescer, getLegendIndex} from './utils/legendValues'
+import {isEmptyDelta, reconcileConfig} from './utils/reconcile'
+import {createViewportReporter, ViewportReport, ViewportReporter} from './utils/viewport'
 import {getCachedDOMElement, createOptimizedStyles} from './utils/performance'
 import {ErrorBoundary} from './components/ErrorBoundary'
 import {ChartCoordinateService} from './services/ChartCoordinateService'
@@ -567,14 +573,29 @@ class LegendPanePrimitivePaneRenderer implements IPrimitivePaneRenderer {
 
 interface LightweightChartsProps {
   config: ComponentConfig
+  // Changes that turned the previous config into `config`, applied to the live
+  // charts instead of rebuilding them
+  delta?: ConfigDelta | null
   height?: number | null
   width?: number | null
   onChartsReady?: () => void
+  // Called with the range shown by charts whose config asks for viewport reports
+  onViewportChange?: (viewport: ViewportReport) => void
+}
+
+// Remove a series created by createSeries(): plugin series wrap their own remove()
+const removeChartSeries = (chart: IChartApi, series: ISeriesApi<any>) => {
+  const removable = series as any
+  if (typeof removable.remove === 'function') {
+    removable.remove()
+  } else {
+    chart.removeSeries(series)
+  }
 }
 
 // Performance optimization: Memoize the component to prevent unnecessary re-renders
 const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
-  ({config, height = 400, width = null, onChartsReady}) => {
+  ({config, delta = null, height = 400, width = null, onChartsReady, onViewportChange}) => {
     // Component initialization
 
     const chartRefs = useRef<{[key: string]: IChartApi}>({})
@@ -591,6 +612,36 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
     const prevConfigRef = useRef<ComponentConfig | null>(null)
     const chartContainersRef = useRef<{[key: string]: HTMLElement}>({})
     const debounceTimersRef = useRef<{[key: string]: NodeJS.Timeout}>({})
+    // Config shown by the live charts. With a stable component key Streamlit
+    // keeps this component mounted across reruns, so a new full config is
+    // reconciled against it instead of rebuilding the charts.
+    const mountedConfigRef = useRef<ComponentConfig | null>(null)
+    // Last delta applied to the live charts, so that it is applied only once
+    const appliedDeltaRef = useRef<ConfigDelta | null>(null)
+    // Bars trimmed from the front of bounded series but still drawn, per chartId
+    // and series index. The chart has no API to drop old bars, so the series is
+    // reset once the stale bars outnumber the live ones.
+    const staleBarsRef = useRef<{[chartId: string]: number[]}>({})
+    // Visible logical range per chartId, restored when a chart with the same
+    // chartId is rebuilt for a new config so zoom/scroll survive reruns
+    const preservedRangesRef = useRef<{[chartId: string]: LogicalRange}>({})
+    // Visible time range per chartId of charts reporting their viewport. Their
+    // data is a window around the viewport that changes between reruns, so the
+    // time range is restored rather than the logical (bar index) range.
+    const preservedTimeRangesRef = useRef<{[chartId: string]: Range<Time>}>({})
+    // Debounced viewport reports, sent through the latest onViewportChange
+    const onViewportChangeRef = useRef(onViewportChange)
+    onViewportChangeRef.current = onViewportChange
+    const viewportReporterRef = useRef<ViewportReporter | null>(null)
+    if (viewportReporterRef.current === null) {
+      viewportReporterRef.current = createViewportReporter(viewport => {
+        if (onViewportChangeRef.current) {
+          onViewportChangeRef.current(viewport)
+        }
+      })
+    }
+    // Crosshair moves waiting for the next animation frame to update the legends
+    const legendUpdatesRef = useRef<FrameCoalescer<string, MouseEventParams> | null>(null)
 
     // Store function references to avoid dependency issues
     const functionRefs = useRef<{
@@ -865,6 +916,16 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
         }
       })
 
+      // Drop legend updates scheduled for the charts being removed
+      if (legendUpdatesRef.current) {
+        legendUpdatesRef.current.cancel()
+      }
+
+      // Drop viewport reports scheduled for the charts being removed
+      if (viewportReporterRef.current) {
+        viewportReporterRef.current.cancel()
+      }
+
       // Clean up legend resize observers
       Object.values(legendResizeObserverRefs.current).forEach(resizeObserver => {
         try {
@@ -892,6 +953,7 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       rectanglePluginRefs.current = {}
       signalPluginRefs.current = {}
       chartConfigs.current = {}
+      staleBarsRef.current = {}
       legendResizeObserverRefs.current = {}
       chartContainersRef.current = {}
 
@@ -1223,85 +1285,29 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       >
     >(new Map())
 
-    // Function to update legend values based on crosshair position
-    const updateLegendValues = useCallback(
-      (chart: IChartApi, chartId: string, param: MouseEventParams) => {
+    // Update the legend values of a chart for a crosshair position
+    const renderLegendValues = useCallback(
+      (chartId: string, param: MouseEventParams) => {
         const legendSeriesData = legendSeriesDataRef.current.get(chartId)
-        if (!legendSeriesData || !param.time) {
+        if (!legendSeriesData || typeof param.time !== 'number') {
           return
         }
+        const crosshairTime = param.time
 
         legendSeriesData.forEach(({series, legendConfig, paneId, seriesName}, index) => {
           try {
-            // Safely get series options
-            let seriesOptions: any = {}
-            try {
-              if (typeof series.options === 'function') {
-                seriesOptions = series.options()
-              } else if (series.options) {
-                seriesOptions = series.options
-              }
-            } catch (error) {
-              console.warn('Could not get series options:', error)
-            }
-
-            // Safely get series type
-            let seriesType = 'Unknown'
-            try {
-              if (typeof series.seriesType === 'function') {
-                seriesType = String(series.seriesType())
-              } else if (series.seriesType && typeof series.seriesType === 'string') {
-                seriesType = series.seriesType as any
-              }
-            } catch (error) {
-              console.warn('Could not get series type:', error)
-            }
-
-            // Get data point at crosshair time
-            const data = series.data()
-
-            if (!data || data.length === 0) {
-              return
-            }
-
-            // Find the data point closest to the crosshair time
-            let closestDataPoint: any = null
-            let minTimeDiff = Infinity
-
-            for (const point of data) {
-              if (
-                point.time &&
-                param.time &&
-                typeof point.time === 'number' &&
-                typeof param.time === 'number'
-              ) {
-                const timeDiff = Math.abs(point.time - param.time)
-                if (timeDiff < minTimeDiff) {
-                  minTimeDiff = timeDiff
-                  closestDataPoint = point
-                }
-              }
-            }
+            // Sorted time index and metadata of the series, kept in sync with its data
+            const legendIndex = getLegendIndex(series)
+            const closestDataPoint = legendIndex.nearest(crosshairTime)
 
             if (!closestDataPoint) {
               return
             }
+            const {color: seriesColor, type: seriesType} = legendIndex.getMetadata()
 
             // Use the stored seriesName from when the legend was created
             // This ensures consistency between creation and updates
 
-            // Get series color
-            let seriesColor = '#2196f3' // default
-            if (seriesOptions.color) {
-              seriesColor = seriesOptions.color
-            } else if (seriesType === 'Candlestick') {
-              seriesColor = '#26a69a'
-            } else if (seriesType === 'Histogram') {
-              seriesColor = '#ff9800'
-            } else if (seriesType === 'Area') {
-              seriesColor = seriesOptions.topColor || '#4caf50'
-            }
-
             // Prepare template data with crosshair values
             const templateData = {
               title: seriesName, // Use the stored seriesName
@@ -1413,6 +1419,20 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       []
     )
 
+    // Function to update legend values based on crosshair position, at most
+    // once per chart and animation frame
+    const updateLegendValues = useCallback(
+      (chart: IChartApi, chartId: string, param: MouseEventParams) => {
+        if (!legendUpdatesRef.current) {
+          legendUpdatesRef.current = createFrameCoalescer<string, MouseEventParams>(updates =>
+            updates.forEach((latest, id) => renderLegendValues(id, latest))
+          )
+        }
+        legendUpdatesRef.current.schedule(chartId, param)
+      },
+      [renderLegendValues]
+    )
+
     const addLegend = useCallback(
       async (
         chart: IChartApi,
@@ -1756,6 +1776,140 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       })
     }, [config.charts, width, height])
 
+    // Apply an incremental update to the live charts. Returns false when the
+    // update does not match the mounted charts, which must then be rebuilt.
+    const patchCharts = useCallback(
+      (configDelta: ConfigDelta): boolean => {
+        const mounted = configDelta.charts.every(
+          chartDelta =>
+            chartRefs.current[chartDelta.chartId] && seriesRefs.current[chartDelta.chartId]
+        )
+        if (!mounted) {
+          return false
+        }
+
+        try {
+          configDelta.charts.forEach(chartDelta => {
+            const chartId = chartDelta.chartId
+            const chart = chartRefs.current[chartId]
+            const seriesList = seriesRefs.current[chartId]
+            const chartConfig = processedChartConfigs.find(
+              processedConfig => processedConfig.chartId === chartId
+            )
+            if (chartConfig) {
+              chartConfigs.current[chartId] = chartConfig
+            }
+
+            if (chartDelta.options !== undefined && chartConfig) {
+              chart.applyOptions(chartConfig.chartOptions)
+            }
+
+            // Keep legends pointing at live series
+            const replaceLegendSeries = (
+              oldSeries: ISeriesApi<any>,
+              newSeries: ISeriesApi<any> | null
+            ) => {
+              const legendSeriesData = legendSeriesDataRef.current.get(chartId)
+              if (legendSeriesData) {
+                legendSeriesDataRef.current.set(
+                  chartId,
+                  legendSeriesData
+                    .map(entry =>
+                      entry.series === oldSeries && newSeries
+                        ? {...entry, series: newSeries}
+                        : entry
+                    )
+                    .filter(entry => entry.series !== oldSeries)
+                )
+              }
+            }
+
+            const staleBars = staleBarsRef.current[chartId] || []
+            staleBarsRef.current[chartId] = staleBars
+
+            // A new window or resolution around the viewport shifts bar indices,
+            // so keep the time range on screen instead of the logical range
+            const replacesData = chartDelta.series.some(
+              operation => operation.op === 'setData' || operation.op === 'replace'
+            )
+            const visibleTimeRange =
+              chartConfig?.viewport && replacesData ? chart.timeScale().getVisibleRange() : null
+
+            chartDelta.series.forEach(operation => {
+              switch (operation.op) {
+                case 'append': {
+                  const stale = (staleBars[operation.index] || 0) + (operation.trim || 0)
+                  const liveData = chartConfig?.series?.[operation.index]?.data
+                  if (stale > 0 && liveData && stale >= liveData.length) {
+                    seriesList[operation.index].setData(liveData)
+                    staleBars[operation.index] = 0
+                  } else {
+                    operation.data.forEach(bar => seriesList[operation.index].update(bar))
+                    staleBars[operation.index] = stale
+                  }
+                  break
+                }
+                case 'setData':
+                  seriesList[operation.index].setData(operation.data)
+                  staleBars[operation.index] = 0
+                  break
+                case 'options':
+                  seriesList[operation.index].applyOptions(
+                    cleanLineStyleOptions(operation.options)
+                  )
+                  break
+                case 'remove': {
+                  const removed = seriesList[operation.index]
+                  removeChartSeries(chart, removed)
+                  seriesList.splice(operation.index, 1)
+                  staleBars.splice(operation.index, 1)
+                  replaceLegendSeries(removed, null)
+                  break
+                }
+                case 'replace':
+                case 'add': {
+                  const series = createSeries(
+                    chart,
+                    operation.series,
+                    {signalPluginRefs},
+                    chartId,
+                    operation.index
+                  )
+                  if (!series) {
+                    throw new Error(`Could not create series ${operation.index}`)
+                  }
+                  if (operation.op === 'replace') {
+                    const replaced = seriesList[operation.index]
+                    removeChartSeries(chart, replaced)
+                    seriesList[operation.index] = series
+                    staleBars[operation.index] = 0
+                    replaceLegendSeries(replaced, series)
+                  } else {
+                    seriesList.splice(operation.index, 0, series)
+                    staleBars.splice(operation.index, 0, 0)
+                  }
+                  break
+                }
+              }
+            })
+
+            if (visibleTimeRange) {
+              try {
+                chart.timeScale().setVisibleRange(visibleTimeRange)
+              } catch (error) {
+                // Range not covered by the new data
+              }
+            }
+          })
+          return true
+        } catch (error) {
+          console.warn('Incremental chart update failed, rebuilding the charts:', error)
+          return false
+        }
+      },
+      [processedChartConfigs]
+    )
+
     // Initialize charts
     const initializeCharts = useCallback(
       (isInitialRender = false) => {
@@ -2065,6 +2219,33 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
 
             seriesRefs.current[chartId] = seriesList
 
+            // Restore the zoom/scroll of the chart this one replaces (same chartId)
+            const preservedRange = preservedRangesRef.current[chartId]
+            delete preservedRangesRef.current[chartId]
+            const preservedTimeRange = preservedTimeRangesRef.current[chartId]
+            delete preservedTimeRangesRef.current[chartId]
+            if (preservedRange && seriesList.length > 0) {
+              try {
+                if (preservedTimeRange) {
+                  chart.timeScale().setVisibleRange(preservedTimeRange)
+                } else {
+                  chart.timeScale().setVisibleLogicalRange(preservedRange)
+                }
+              } catch (error) {
+                // Range no longer applies to the new data
+              }
+            }
+
+            // Report the range on screen once the user stops panning or zooming
+            if (chartConfig.viewport) {
+              const debounceMs = chartConfig.viewport.debounceMs
+              chart.timeScale().subscribeVisibleLogicalRangeChange(() => {
+                if (!isDisposingRef.current && viewportReporterRef.current) {
+                  viewportReporterRef.current.schedule(chartId, chart, debounceMs)
+                }
+              })
+            }
+
             // Process pending trade rectangles after all series are created
             if (
               (chart as any)._pendingTradeRectangles &&
@@ -2162,8 +2343,10 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
             setTimeout(() => {
               if (!isDisposingRef.current && chartRefs.current[chartId]) {
                 try {
-                  // Force chart to fit content
-                  chart.timeScale().fitContent()
+                  // Force chart to fit content, unless a previous range was restored
+                  if (!preservedRange) {
+                    chart.timeScale().fitContent()
+                  }
 
                   // Add legends if configured
                   if (chartConfig.legends && Object.keys(chartConfig.legends).length > 0) {
@@ -2220,11 +2403,17 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
               functionRefs.current.setupChartSynchronization(chart, chartId, config.syncConfig)
             }
 
-            // Setup fitContent functionality
-            functionRefs.current.setupFitContent(chart, chartConfig)
+            // Setup fitContent functionality (no fit on load when a range was restored)
+            functionRefs.current.setupFitContent(
+              chart,
+              preservedRange
+                ? {...chartConfig, chart: {...chartConfig.chart, fitContentOnLoad: false}}
+                : chartConfig
+            )
 
             // Call fitContent after all series are created and data is loaded
             const shouldFitContentOnLoad =
+              !preservedRange &&
               chartConfig.chart?.timeScale?.fitContentOnLoad !== false &&
               chartConfig.chart?.fitContentOnLoad !== false
 
@@ -2294,9 +2483,51 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
 
     useEffect(() => {
       if (stableConfig && stableConfig.charts && stableConfig.charts.length > 0) {
+        if (isInitializedRef.current) {
+          if (delta) {
+            // Incremental update from Python: patch the live charts in place
+            if (delta === appliedDeltaRef.current) {
+              return
+            }
+            appliedDeltaRef.current = delta
+            if (patchCharts(delta)) {
+              mountedConfigRef.current = stableConfig
+              return
+            }
+          } else if (mountedConfigRef.current) {
+            // Full config for the mounted charts, versioned or not: only
+            // update the charts and series that differ from the config they
+            // show, and rebuild when that is not possible
+            const reconciled = reconcileConfig(mountedConfigRef.current, stableConfig)
+            if (reconciled && (isEmptyDelta(reconciled) || patchCharts(reconciled))) {
+              mountedConfigRef.current = stableConfig
+              return
+            }
+          }
+
+          // New config for the mounted component: remember each chart's visible
+          // range, then rebuild the charts in place
+          Object.entries(chartRefs.current).forEach(([chartId, chart]) => {
+            try {
+              const range = chart.timeScale().getVisibleLogicalRange()
+              if (range) {
+                preservedRangesRef.current[chartId] = range
+              }
+              const timeRange = chart.timeScale().getVisibleRange()
+              if (timeRange && chartConfigs.current[chartId]?.viewport) {
+                preservedTimeRangesRef.current[chartId] = timeRange
+              }
+            } catch (error) {
+              // Chart already disposed
+            }
+          })
+          cleanupCharts()
+        }
+        mountedConfigRef.current = stableConfig
+        appliedDeltaRef.current = delta
         initializeCharts(true)
       }
-    }, [stableConfig, initializeCharts])
+    }, [stableConfig, delta, initializeCharts, cleanupCharts, patchCharts])
 
     // Cleanup on unmount
     useEffect(() => {
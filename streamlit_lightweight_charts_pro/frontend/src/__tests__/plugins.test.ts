@@ -1,6 +1,6 @@
 import {RectangleOverlayPlugin} from '../rectanglePlugin'
 import {SignalSeries} from '../signalSeriesPlugin'
-import {createTradeVisualElements} from '../tradeVisualization'
+import {createTradeVisualElements, formatTradeText} from '../tradeVisualization'
 import {createAnnotationVisualElements} from '../annotationSystem'
 
 // Mock the lightweight-charts library
@@ -232,6 +232,60 @@ describe('Chart Plugins', () => {
       const elements = createTradeVisualElements(trades)
       expect(elements).toBeDefined()
     })
+
+    it('should format the default tooltip text of trades sent without text', () => {
+      const trade = {
+        entryTime: 1704067200,
+        entryPrice: 100,
+        exitTime: 1704153600,
+        exitPrice: 90,
+        quantity: 5,
+        tradeType: 'short' as const,
+        notes: 'stopped',
+        pnl: 50,
+        pnlPercentage: 10,
+        isProfitable: true
+      }
+
+      expect(formatTradeText(trade)).toBe(
+        'Entry: 100.00\nExit: 90.00\nQty: 5.00\nP&L: 50.00 (10.0%)\nWin\nNotes: stopped'
+      )
+
+      const {markers} = createTradeVisualElements([trade], {
+        style: 'markers',
+        showPnlInMarkers: true
+      })
+      expect(markers.map(marker => marker.text)).toEqual([
+        formatTradeText(trade),
+        formatTradeText(trade)
+      ])
+
+      const custom = createTradeVisualElements([{...trade, text: 'custom'}], {
+        style: 'markers',
+        showPnlInMarkers: true
+      })
+      expect(custom.markers[0].text).toBe('custom')
+    })
+
+    it('should only snap trade times that are not aligned yet', () => {
+      const trade = {
+        entryTime: 1704067230,
+        entryPrice: 100,
+        exitTime: 1704067290,
+        exitPrice: 110,
+        quantity: 1,
+        tradeType: 'long' as const,
+        isProfitable: true
+      }
+      const chartData = [{time: 1704067200}, {time: 1704067260}, {time: 1704067320}]
+      const options = {style: 'markers' as const}
+
+      const snapped = createTradeVisualElements([trade], options, chartData)
+      expect(snapped.markers.map(marker => marker.time)).toEqual([1704067200, 1704067260])
+
+      const aligned = createTradeVisualElements([trade], options, chartData, undefined, true)
+      expect(aligned.markers.map(marker => marker.time)).toEqual([1704067230, 1704067290])
+    })
   })
 
   describe('Annotation System', () => {
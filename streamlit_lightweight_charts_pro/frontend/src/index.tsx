@@ -1,9 +1,11 @@
-import React, {useEffect, useRef, useCallback} from 'react'
+import React, {useEffect, useRef, useCallback, useMemo} from 'react'
 import ReactDOM from 'react-dom'
 import {Streamlit} from 'streamlit-component-lib'
 import {StreamlitProvider, useRenderData} from 'streamlit-component-lib-react-hooks'
 import LightweightCharts from './LightweightCharts'
 import {ComponentConfig} from './types'
+import {ConfigSynchronizer} from './utils/configDelta'
+import {ViewportReport} from './utils/viewport'
 // import { ChartReadyDetector } from './utils/chartReadyDetection'
 import {ResizeObserverManager} from './utils/resizeObserverManager'
 
@@ -17,11 +19,55 @@ const App: React.FC = () => {
   const lastReportTime = useRef(0)
   const isReportingHeight = useRef(false) // Prevent recursive height reporting
   const lastReportedHeight = useRef(0) // Track last reported height to prevent unnecessary reports
+  const configSynchronizer = useRef(new ConfigSynchronizer())
+  // Everything reported to Python. Setting the component value replaces it, so
+  // a viewport report must not drop a pending resync request and vice versa.
+  const componentValue = useRef<{
+    resyncRequest?: number
+    dataCache?: string[]
+    viewport?: ViewportReport
+  }>({})
+
+  // Python sends either a full config or a delta against the previous version, as JSON bytes,
+  // with the data of columnar series as a separate binary buffer. Resolved by argument
+  // identity: the StrictMode double render must not apply the same delta twice.
+  const resolved = useMemo(
+    () =>
+      configSynchronizer.current.resolveArgs(renderData?.args?.config, renderData?.args?.buffers),
+    [renderData?.args?.config, renderData?.args?.buffers]
+  )
+
+  // A delta for a version this component does not hold: ask Python for a full config
+  useEffect(() => {
+    if (resolved.needsResync) {
+      try {
+        // Report the series data held, so Python only leaves out data this component has
+        componentValue.current = {
+          ...componentValue.current,
+          resyncRequest: Date.now(),
+          dataCache: configSynchronizer.current.dataCache.hashes()
+        }
+        Streamlit.setComponentValue(componentValue.current)
+      } catch (error) {
+        console.warn('[StreamlitComponent] Failed to request a config resync:', error)
+      }
+    }
+  }, [resolved])
 
   const handleChartsReady = () => {
     isReadyRef.current = true
   }
 
+  // The user panned or zoomed a chart whose data depends on the range on screen
+  const handleViewportChange = useCallback((viewport: ViewportReport) => {
+    try {
+      componentValue.current = {...componentValue.current, viewport}
+      Streamlit.setComponentValue(componentValue.current)
+    } catch (error) {
+      console.warn('[StreamlitComponent] Failed to report the viewport:', error)
+    }
+  }, [])
+
   // Enhanced height reporting with multiple detection methods
   const reportHeightWithFallback = useCallback(async () => {
     if (!containerRef.current || !isReadyRef.current || !isMountedRef.current) {
@@ -224,12 +270,17 @@ const App: React.FC = () => {
     return <div>Loading...</div>
   }
 
-  const config = renderData.args?.config as ComponentConfig
   const height = (renderData.args?.height as number) || 400
 
   return (
     <div ref={containerRef} style={{width: '100%', minHeight: height}}>
-      <LightweightCharts config={config} height={height} onChartsReady={handleChartsReady} />
+      <LightweightCharts
+        config={resolved.config as ComponentConfig}
+        delta={resolved.delta}
+        height={height}
+        onChartsReady={handleChartsReady}
+        onViewportChange={handleViewportChange}
+      />
     </div>
   )
 }
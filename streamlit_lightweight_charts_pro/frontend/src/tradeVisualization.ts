@@ -12,6 +12,7 @@ import {
   LineSeries
 } from 'lightweight-charts'
 import {TradeConfig, TradeVisualizationOptions} from './types'
+import {getTimeIndex} from './utils/timeIndex'
 
 // Trade rectangle interfaces
 interface TradeRectangleData {
@@ -296,7 +297,8 @@ export class TradeRectanglePlugin implements ISeriesPrimitive<Time> {
 function createTradeRectangles(
   trades: TradeConfig[],
   options: TradeVisualizationOptions,
-  chartData?: any[]
+  chartData?: any[],
+  timesAligned = false
 ): TradeRectangleData[] {
   const rectangles: TradeRectangleData[] = []
 
@@ -319,11 +321,11 @@ function createTradeRectangles(
       return
     }
 
-    // Find nearest available times in chart data if provided
+    // Find nearest available times in chart data if provided and not aligned yet
     let adjustedTime1 = time1
     let adjustedTime2 = time2
 
-    if (chartData && chartData.length > 0) {
+    if (!timesAligned && chartData && chartData.length > 0) {
       const nearestTime1 = findNearestTime(time1, chartData)
       const nearestTime2 = findNearestTime(time2, chartData)
 
@@ -360,11 +362,34 @@ function createTradeRectangles(
   return rectangles
 }
 
+// Default tooltip text of a trade, formatted from its numeric fields like
+// TradeData.generate_tooltip_text() on the Python side, which no longer sends it
+export function formatTradeText(trade: TradeConfig): string {
+  const move =
+    trade.tradeType === 'long'
+      ? trade.exitPrice - trade.entryPrice
+      : trade.entryPrice - trade.exitPrice
+  const pnl = trade.pnl ?? move * trade.quantity
+  const pnlPercentage = trade.pnlPercentage ?? (move / trade.entryPrice) * 100
+  const parts = [
+    `Entry: ${trade.entryPrice.toFixed(2)}`,
+    `Exit: ${trade.exitPrice.toFixed(2)}`,
+    `Qty: ${trade.quantity.toFixed(2)}`,
+    `P&L: ${pnl.toFixed(2)} (${pnlPercentage.toFixed(1)}%)`,
+    pnl > 0 ? 'Win' : 'Loss'
+  ]
+  if (trade.notes) {
+    parts.push(`Notes: ${trade.notes}`)
+  }
+  return parts.join('\n')
+}
+
 // Create trade markers
 function createTradeMarkers(
   trades: TradeConfig[],
   options: TradeVisualizationOptions,
-  chartData?: any[]
+  chartData?: any[],
+  timesAligned = false
 ): SeriesMarker<Time>[] {
   const markers: SeriesMarker<Time>[] = []
 
@@ -389,11 +414,11 @@ function createTradeMarkers(
       return
     }
 
-    // Find nearest available times in chart data if provided
+    // Find nearest available times in chart data if provided and not aligned yet
     let adjustedEntryTime = entryTime
     let adjustedExitTime = exitTime
 
-    if (chartData && chartData.length > 0) {
+    if (!timesAligned && chartData && chartData.length > 0) {
       const nearestEntryTime = findNearestTime(entryTime, chartData)
       const nearestExitTime = findNearestTime(exitTime, chartData)
 
@@ -412,10 +437,9 @@ function createTradeMarkers(
       position: trade.tradeType === 'long' ? 'belowBar' : 'aboveBar',
       color: entryColor,
       shape: trade.tradeType === 'long' ? 'arrowUp' : 'arrowDown',
-      text:
-        options.showPnlInMarkers && trade.text
-          ? trade.text
-          : `Entry: $${trade.entryPrice.toFixed(2)}`
+      text: options.showPnlInMarkers
+        ? trade.text || formatTradeText(trade)
+        : `Entry: $${trade.entryPrice.toFixed(2)}`
     }
     markers.push(entryMarker)
 
@@ -429,8 +453,9 @@ function createTradeMarkers(
       position: trade.tradeType === 'long' ? 'aboveBar' : 'belowBar',
       color: exitColor,
       shape: trade.tradeType === 'long' ? 'arrowDown' : 'arrowUp',
-      text:
-        options.showPnlInMarkers && trade.text ? trade.text : `Exit: $${trade.exitPrice.toFixed(2)}`
+      text: options.showPnlInMarkers
+        ? trade.text || formatTradeText(trade)
+        : `Exit: $${trade.exitPrice.toFixed(2)}`
     }
     markers.push(exitMarker)
   })
@@ -438,41 +463,12 @@ function createTradeMarkers(
   return markers
 }
 
-// Find nearest available time in chart data
+// Find nearest available time in chart data, using its shared sorted time index
 function findNearestTime(targetTime: UTCTimestamp, chartData: any[]): UTCTimestamp | null {
   if (!chartData || chartData.length === 0) {
     return null
   }
-
-  // Convert chart data times to timestamps for comparison
-  const availableTimes = chartData
-    .map(item => {
-      if (typeof item.time === 'number') {
-        return item.time
-      } else if (typeof item.time === 'string') {
-        return Math.floor(new Date(item.time).getTime() / 1000) as UTCTimestamp
-      }
-      return null
-    })
-    .filter(time => time !== null) as UTCTimestamp[]
-
-  if (availableTimes.length === 0) {
-    return null
-  }
-
-  // Find the nearest time
-  let nearestTime = availableTimes[0]
-  let minDiff = Math.abs(targetTime - nearestTime)
-
-  for (const time of availableTimes) {
-    const diff = Math.abs(targetTime - time)
-    if (diff < minDiff) {
-      minDiff = diff
-      nearestTime = time
-    }
-  }
-
-  return nearestTime
+  return getTimeIndex(chartData).nearest(targetTime) as UTCTimestamp | null
 }
 
 // Parse time string to UTC timestamp
@@ -520,7 +516,8 @@ export function createTradeVisualElements(
   trades: TradeConfig[],
   options: TradeVisualizationOptions,
   chartData?: any[],
-  priceScaleId?: string
+  priceScaleId?: string,
+  timesAligned = false
 ): {
   markers: SeriesMarker<Time>[]
   rectangles: TradeRectangleData[]
@@ -536,12 +533,12 @@ export function createTradeVisualElements(
 
   // Create markers if enabled
   if (options.style === 'markers' || options.style === 'both') {
-    markers.push(...createTradeMarkers(trades, options, chartData))
+    markers.push(...createTradeMarkers(trades, options, chartData, timesAligned))
   }
 
   // Create rectangles if enabled
   if (options.style === 'rectangles' || options.style === 'both') {
-    const newRectangles = createTradeRectangles(trades, options, chartData)
+    const newRectangles = createTradeRectangles(trades, options, chartData, timesAligned)
     rectangles.push(...newRectangles)
   }
 
@@ -574,7 +571,10 @@ export function createTradeVisualElements(
         return
       }
 
-      const midTime = (entryTime + exitTime) / 2
+      let midTime = (entryTime + exitTime) / 2
+      if (chartData && chartData.length > 0) {
+        midTime = findNearestTime(midTime as UTCTimestamp, chartData) ?? midTime
+      }
       const midPrice = (trade.entryPrice + trade.exitPrice) / 2
 
       annotations.push({
@@ -10,7 +10,7 @@ export interface TradeConfig {
   tradeType: 'long' | 'short'
   id?: string
   notes?: string
-  text?: string // Custom tooltip text
+  text?: string // Custom tooltip text, formatted from the numeric fields when absent
   pnl?: number
   pnlPercentage?: number
   isProfitable?: boolean
@@ -132,6 +132,7 @@ export interface SeriesConfig {
     | 'signal'
     | 'trend_fill'
   data: any[]
+  dataHash?: string // Content hash of data, see utils/dataCache
   options?: any
   name?: string
   priceScale?: any
@@ -139,6 +140,7 @@ export interface SeriesConfig {
   lastValueVisible?: boolean // Add lastValueVisible support for series
   lastPriceAnimation?: number // Add lastPriceAnimation support for series
   markers?: SeriesMarker<Time>[]
+  timesAligned?: boolean // Marker and trade times are already bar times (Chart.align_times())
   priceLines?: any[] // Add price lines to series
   trades?: TradeConfig[] // Add trades to series
   tradeVisualizationOptions?: TradeVisualizationOptions
@@ -189,6 +191,7 @@ export interface ChartConfig {
   tooltip?: TooltipConfig // Add chart-level tooltip configuration
   tooltipConfigs?: Record<string, TooltipConfig> // Add multiple tooltip configurations
   tradeVisualizationOptions?: TradeVisualizationOptions // Add chart-level trade visualization options
+  viewport?: ViewportConfig // Report the visible range to Python (see utils/viewport)
   autoSize?: boolean
   autoWidth?: boolean
   autoHeight?: boolean
@@ -199,6 +202,11 @@ export interface ChartConfig {
   // paneHeights is now accessed from chart.layout.paneHeights
 }
 
+// Viewport reporting: debounce delay of reports in milliseconds
+export interface ViewportConfig {
+  debounceMs?: number
+}
+
 // Range Switcher Configuration
 export interface RangeConfig {
   label: string
@@ -243,6 +251,44 @@ export interface ComponentConfig {
   charts: ChartConfig[]
   syncConfig: SyncConfig
   callbacks?: string[]
+  version?: number // Protocol version, set when sent by Chart.render()
+}
+
+// Series data sent as binary float64 columns, in place of the data array
+export interface ColumnarDataDescriptor {
+  length: number
+  keys: string[] // Keys of the data points, in order
+  numeric: {[key: string]: number} // Byte offset of each column in the binary buffer
+  values?: {[key: string]: any[]} // Other columns, null where a point has no value
+  constants?: {[key: string]: any} // Values shared by every point
+}
+
+// Incremental update of a single series, addressed by its position in the chart
+export type SeriesOperation =
+  // Bars for series.update(), in order, after dropping `trim` bars from the front
+  | {op: 'append'; index: number; data: any[]; trim?: number}
+  | {op: 'setData'; index: number; data: any[]; dataHash?: string}
+  | {op: 'options'; index: number; options: any}
+  | {op: 'replace'; index: number; series: SeriesConfig}
+  | {op: 'add'; index: number; series: SeriesConfig}
+  | {op: 'remove'; index: number}
+
+// Incremental update of a single chart
+export interface ChartDelta {
+  chartId: string
+  options?: any // New chart options, when they changed
+  series: SeriesOperation[]
+}
+
+export interface ConfigDelta {
+  charts: ChartDelta[]
+}
+
+// Payload sent by Python instead of a ComponentConfig when only part of it changed
+export interface ComponentConfigDelta {
+  version: number
+  baseVersion: number
+  delta: ConfigDelta
 }
 
 // Modular Tooltip System
@@ -0,0 +1,147 @@
+import {decodeColumnarData, decodeColumnarPayload, isColumnarData} from '../columnarData'
+import {ComponentConfig, ComponentConfigDelta} from '../../types'
+
+// Columns written one after the other, as encode_payload() does
+const buffer = (...columns: number[][]) => new Uint8Array(new Float64Array(columns.flat()).buffer)
+
+const times = [1700000000, 1700000060, 1700000120]
+
+describe('isColumnarData', () => {
+  it('recognizes descriptors only', () => {
+    expect(isColumnarData({$columnar: {length: 0, keys: [], numeric: {}}})).toBe(true)
+    expect(isColumnarData([{time: 1, value: 2}])).toBe(false)
+    expect(isColumnarData(undefined)).toBe(false)
+  })
+})
+
+describe('decodeColumnarData', () => {
+  it('builds OHLC points from float64 columns', () => {
+    const bytes = buffer(times, [1, 2, 3], [1.5, 2.5, 3.5])
+
+    const points = decodeColumnarData(
+      {length: 3, keys: ['time', 'open', 'close'], numeric: {time: 0, open: 24, close: 48}},
+      bytes
+    )
+
+    expect(points).toEqual([
+      {time: 1700000000, open: 1, close: 1.5},
+      {time: 1700000060, open: 2, close: 2.5},
+      {time: 1700000120, open: 3, close: 3.5}
+    ])
+  })
+
+  it('adds value columns and constants, leaving out missing values', () => {
+    const points = decodeColumnarData(
+      {
+        length: 3,
+        keys: ['time', 'value', 'color', 'lineWidth'],
+        numeric: {time: 0, value: 24},
+        values: {color: ['#f00', null, '#0f0']},
+        constants: {lineWidth: 2}
+      },
+      buffer(times, [4, 5, 6])
+    )
+
+    expect(points).toEqual([
+      {time: 1700000000, value: 4, color: '#f00', lineWidth: 2},
+      {time: 1700000060, value: 5, lineWidth: 2},
+      {time: 1700000120, value: 6, color: '#0f0', lineWidth: 2}
+    ])
+  })
+
+  it('reads columns from an unaligned view', () => {
+    const aligned = buffer(times)
+    const shifted = new Uint8Array(aligned.byteLength + 3)
+    shifted.set(aligned, 3)
+
+    const points = decodeColumnarData(
+      {length: 3, keys: ['time'], numeric: {time: 0}},
+      shifted.subarray(3)
+    )
+
+    expect(points.map(point => point.time)).toEqual(times)
+  })
+
+  it('matches the JSON transport for the bytes written by encode_payload()', () => {
+    // encode_payload({"data": data.columnar()}) for three CandlestickData points,
+    // the second one without a color and the last one with a NaN open
+    const descriptor = {
+      length: 3,
+      keys: ['time', 'open', 'high', 'low', 'close', 'color'],
+      numeric: {time: 0, open: 24, high: 48, low: 72, close: 96},
+      values: {color: ['#ff0000', null, '#00ff00']},
+      constants: {}
+    }
+    const encoded = Buffer.from(
+      'AAAAQPxU2UEAAABP/FTZQQAAAF78VNlBAAAAAAAA8D8AAAAAAAAEQAAAAAAAAAAAAAAAAAAAAEAAAAAA' +
+        'AAAIQAAAAAAAABBAAAAAAAAA4D8AAAAAAADwPwAAAAAAAPg/AAAAAAAA+D8AAAAAAAAAQAAAAAAAAApA',
+      'base64'
+    )
+    // Streamlit may deliver the bytes as a view into a larger buffer
+    const delivered = new Uint8Array(encoded.length + 5)
+    delivered.set(encoded, 5)
+
+    // data.asdicts() of the same points
+    expect(decodeColumnarData(descriptor, delivered.subarray(5))).toEqual([
+      {time: 1700000000, open: 1.0, high: 2, low: 0.5, close: 1.5, color: '#ff0000'},
+      {time: 1700000060, open: 2.5, high: 3, low: 1.0, close: 2.0},
+      {time: 1700000120, open: 0.0, high: 4, low: 1.5, close: 3.25, color: '#00ff00'}
+    ])
+  })
+
+  it('rejects columns outside the buffer', () => {
+    expect(() =>
+      decodeColumnarData({length: 4, keys: ['time'], numeric: {time: 0}}, buffer(times))
+    ).toThrow('out of the bounds')
+  })
+})
+
+describe('decodeColumnarPayload', () => {
+  const descriptor = {
+    $columnar: {length: 3, keys: ['time', 'value'], numeric: {time: 0, value: 24}}
+  }
+  const expected = times.map((time, i) => ({time, value: i}))
+
+  it('decodes series data of a full config', () => {
+    const config = {
+      charts: [{chartId: 'a', chart: {}, series: [{type: 'Line', data: descriptor}]}],
+      syncConfig: {enabled: false, crosshair: false, timeRange: false}
+    } as unknown as ComponentConfig
+
+    const decoded = decodeColumnarPayload(config, buffer(times, [0, 1, 2]))
+
+    expect(decoded.charts[0].series[0].data).toEqual(expected)
+  })
+
+  it('decodes data and series of delta operations', () => {
+    const delta = {
+      version: 2,
+      baseVersion: 1,
+      delta: {
+        charts: [
+          {
+            chartId: 'a',
+            series: [
+              {op: 'append', index: 0, data: descriptor},
+              {op: 'add', index: 1, series: {type: 'Line', data: descriptor}},
+              {op: 'remove', index: 2}
+            ]
+          }
+        ]
+      }
+    } as unknown as ComponentConfigDelta
+
+    const decoded = decodeColumnarPayload(delta, buffer(times, [0, 1, 2]))
+    const operations: any[] = decoded.delta.charts[0].series
+
+    expect(operations[0].data).toEqual(expected)
+    expect(operations[1].series.data).toEqual(expected)
+    expect(operations[2]).toEqual({op: 'remove', index: 2})
+  })
+
+  it('returns payloads without a buffer as they are', () => {
+    const config = {charts: []} as unknown as ComponentConfig
+
+    expect(decodeColumnarPayload(config, undefined)).toBe(config)
+  })
+})
@@ -0,0 +1,193 @@
+import {TextDecoder as NodeTextDecoder} from 'util'
+import {appendBars, applyConfigDelta, ConfigSynchronizer, parseConfigArg} from '../configDelta'
+import {ComponentConfig} from '../../types'
+
+const bars = (count: number) =>
+  Array.from({length: count}, (_, i) => ({time: 1700000000 + i * 60, value: i}))
+
+const fullConfig = (version: number, data = bars(3)): ComponentConfig => ({
+  charts: [
+    {
+      chartId: 'chart-a',
+      chart: {height: 400},
+      series: [
+        {type: 'Line', data, options: {color: '#2196f3'}},
+        {type: 'Histogram', data: bars(3), options: {}}
+      ]
+    }
+  ],
+  syncConfig: {enabled: false, crosshair: false, timeRange: false},
+  version
+})
+
+describe('appendBars', () => {
+  it('appends new bars', () => {
+    expect(appendBars(bars(2), bars(4).slice(2))).toEqual(bars(4))
+  })
+
+  it('replaces the last bar when the first bar has its time', () => {
+    const updated = {time: 1700000060, value: 42}
+
+    expect(appendBars(bars(2), [updated])).toEqual([bars(2)[0], updated])
+  })
+
+  it('drops trimmed bars from the front', () => {
+    expect(appendBars(bars(3), bars(4).slice(3), 1)).toEqual(bars(4).slice(1))
+  })
+
+  it('does not modify the original data', () => {
+    const data = bars(2)
+    appendBars(data, bars(3).slice(2))
+
+    expect(data).toHaveLength(2)
+  })
+})
+
+const encode = (payload: any) => new Uint8Array(Buffer.from(JSON.stringify(payload)))
+
+beforeAll(() => {
+  // jsdom does not provide TextDecoder
+  if (typeof global.TextDecoder === 'undefined') {
+    ;(global as any).TextDecoder = NodeTextDecoder
+  }
+})
+
+describe('parseConfigArg', () => {
+  it('decodes JSON bytes', () => {
+    const config = fullConfig(1)
+
+    expect(parseConfigArg(encode(config))).toEqual(config)
+  })
+
+  it('returns objects and missing values as they are', () => {
+    const config = fullConfig(1)
+
+    expect(parseConfigArg(config)).toBe(config)
+    expect(parseConfigArg(undefined)).toBeUndefined()
+  })
+})
+
+describe('applyConfigDelta', () => {
+  it('applies series operations and options', () => {
+    const config = fullConfig(1)
+    const added = {type: 'Area' as const, data: bars(1), options: {}}
+
+    const result = applyConfigDelta(
+      config,
+      {
+        charts: [
+          {
+            chartId: 'chart-a',
+            options: {height: 500},
+            series: [
+              {op: 'append', index: 0, data: bars(4).slice(3)},
+              {op: 'options', index: 0, options: {color: '#ff0000'}},
+              {op: 'remove', index: 1},
+              {op: 'add', index: 1, series: added}
+            ]
+          }
+        ]
+      },
+      2
+    )
+
+    const chart = result.charts[0]
+    expect(result.version).toBe(2)
+    expect(chart.chart).toEqual({height: 500})
+    expect(chart.series[0].data).toEqual(bars(4))
+    expect(chart.series[0].options).toEqual({color: '#ff0000'})
+    expect(chart.series[1]).toBe(added)
+    // The previous config is left untouched
+    expect(config.charts[0].series[0].data).toHaveLength(3)
+    expect(config.charts[0].series).toHaveLength(2)
+  })
+
+  it('keeps unchanged series', () => {
+    const config = fullConfig(1)
+
+    const result = applyConfigDelta(config, {
+      charts: [{chartId: 'chart-a', series: [{op: 'setData', index: 0, data: bars(1)}]}]
+    })
+
+    expect(result.charts[0].series[1]).toBe(config.charts[0].series[1])
+    expect(result.charts[0].chart).toBe(config.charts[0].chart)
+  })
+})
+
+describe('ConfigSynchronizer', () => {
+  const delta = (version: number, baseVersion: number) => ({
+    version,
+    baseVersion,
+    delta: {
+      charts: [
+        {chartId: 'chart-a', series: [{op: 'append' as const, index: 0, data: bars(5).slice(2)}]}
+      ]
+    }
+  })
+
+  it('applies deltas on top of the matching version', () => {
+    const synchronizer = new ConfigSynchronizer()
+    synchronizer.resolve(fullConfig(1))
+
+    const resolved = synchronizer.resolve(delta(2, 1))
+
+    expect(resolved.needsResync).toBe(false)
+    expect(resolved.delta).not.toBeNull()
+    expect(resolved.config?.version).toBe(2)
+    expect(resolved.config?.charts[0].series[0].data).toEqual(bars(5))
+  })
+
+  it('asks for a resync on a version mismatch', () => {
+    const synchronizer = new ConfigSynchronizer()
+    const first = synchronizer.resolve(fullConfig(1))
+
+    const resolved = synchronizer.resolve(delta(4, 3))
+
+    expect(resolved.needsResync).toBe(true)
+    expect(resolved.delta).toBeNull()
+    expect(resolved.config).toBe(first.config)
+  })
+
+  it('asks for a resync when a delta arrives first', () => {
+    const resolved = new ConfigSynchronizer().resolve(delta(2, 1))
+
+    expect(resolved.needsResync).toBe(true)
+    expect(resolved.config).toBeNull()
+  })
+
+  it('resolves the same payload only once', () => {
+    const synchronizer = new ConfigSynchronizer()
+    synchronizer.resolve(fullConfig(1))
+    const payload = delta(2, 1)
+
+    const first = synchronizer.resolve(payload)
+    const second = synchronizer.resolve(payload)
+
+    expect(second).toBe(first)
+    expect(second.needsResync).toBe(false)
+  })
+
+  it('resolves the same arguments only once, however often they are parsed', () => {
+    const synchronizer = new ConfigSynchronizer()
+    synchronizer.resolveArgs(encode(fullConfig(1)))
+    const arg = encode(delta(2, 1))
+
+    const first = synchronizer.resolveArgs(arg)
+    const second = synchronizer.resolveArgs(arg)
+
+    expect(second).toBe(first)
+    expect(second.needsResync).toBe(false)
+    expect(second.config?.version).toBe(2)
+  })
+
+  it('replaces the config with a full config', () => {
+    const synchronizer = new ConfigSynchronizer()
+    synchronizer.resolve(fullConfig(1))
+    const full = fullConfig(7, bars(10))
+
+    const resolved = synchronizer.resolve(full)
+
+    expect(resolved.config).toBe(full)
+    expect(synchronizer.resolve(delta(8, 7)).needsResync).toBe(false)
+  })
+})
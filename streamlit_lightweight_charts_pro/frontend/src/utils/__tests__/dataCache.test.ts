@@ -0,0 +1,114 @@
+import {SeriesDataCache} from '../dataCache'
+import {ConfigSynchronizer} from '../configDelta'
+import {ComponentConfig} from '../../types'
+
+const points = [{time: 1700000000, value: 1}]
+
+const fullConfig = (data: any, dataHash: string, version: number): ComponentConfig => ({
+  charts: [{chartId: 'chart-a', chart: {}, series: [{type: 'Line', data, dataHash}]}],
+  syncConfig: {enabled: false, crosshair: false, timeRange: false},
+  version
+})
+
+describe('SeriesDataCache', () => {
+  it('evicts the least recently used data', () => {
+    const cache = new SeriesDataCache(2)
+    cache.put('a', [1])
+    cache.put('b', [2])
+    cache.get('a')
+    cache.put('c', [3])
+
+    expect(cache.hashes()).toEqual(['a', 'c'])
+    expect(cache.get('b')).toBeUndefined()
+  })
+
+  it('keeps data sent with a hash and fills in references', () => {
+    const cache = new SeriesDataCache()
+    expect(cache.resolve(fullConfig(points, 'h1', 1))).toBe(true)
+
+    const config = fullConfig({$cached: 'h1'}, 'h1', 2)
+    expect(cache.resolve(config)).toBe(true)
+    expect(config.charts[0].series[0].data).toBe(points)
+  })
+
+  it('fills in setData operations and reports missing data', () => {
+    const cache = new SeriesDataCache()
+    cache.put('h1', points)
+    const operation = {op: 'setData', index: 0, data: {$cached: 'h1'}, dataHash: 'h1'}
+    const delta = {charts: [{chartId: 'chart-a', series: [operation]}]} as any
+
+    expect(cache.resolve(delta)).toBe(true)
+    expect(delta.charts[0].series[0].data).toBe(points)
+
+    delta.charts[0].series[0] = {op: 'setData', index: 0, data: {$cached: 'h2'}, dataHash: 'h2'}
+    expect(cache.resolve(delta)).toBe(false)
+  })
+})
+
+describe('SeriesDataCache against DataCacheTracker', () => {
+  // Series data of five full configs of two line series, as written by
+  // DataCacheTracker(size=3).prepare() and encode_payload() in Python. The
+  // series values per config are (1, 2), (1, 3), (4, 2), (1, 5) and (2, 5).
+  const h1 = '9f01f483447b25d33b1a1e3692f84bee'
+  const h2 = '70393e70d9c3a67da802b0c358289f4d'
+  const h3 = '96fdcef737b5aea2a0b2c89b46e6084b'
+  const h4 = '872c840d0db643ae22eb6bd10930f86f'
+  const h5 = 'c13d4f24bc89988c43f4f633b41f3323'
+  const sent = (value: number) => [{time: 1700000000, value}]
+  const payloads = JSON.stringify([
+    [sent(1), h1, sent(2), h2],
+    [{$cached: h1}, h1, sent(3), h3],
+    [sent(4), h4, sent(2), h2],
+    [sent(1), h1, sent(5), h5],
+    [{$cached: h2}, h2, {$cached: h5}, h5]
+  ])
+  const values = [
+    [1, 2],
+    [1, 3],
+    [4, 2],
+    [1, 5],
+    [2, 5]
+  ]
+
+  it('resolves every reference Python sends and evicts the same data', () => {
+    const cache = new SeriesDataCache(3)
+
+    ;(JSON.parse(payloads) as any[][]).forEach(([data1, hash1, data2, hash2], i) => {
+      const config: ComponentConfig = {
+        charts: [
+          {
+            chartId: 'chart-a',
+            chart: {},
+            series: [
+              {type: 'Line', data: data1, dataHash: hash1},
+              {type: 'Line', data: data2, dataHash: hash2}
+            ]
+          } as any
+        ],
+        syncConfig: {enabled: false, crosshair: false, timeRange: false},
+        version: i + 1
+      }
+
+      expect(cache.resolve(config)).toBe(true)
+      expect(config.charts[0].series.map((series: any) => series.data[0].value)).toEqual(values[i])
+    })
+    // DataCacheTracker.held after the same payloads
+    expect(cache.hashes()).toEqual([h1, h2, h5])
+  })
+})
+
+describe('ConfigSynchronizer data cache', () => {
+  it('asks for a resync when referenced data is not held', () => {
+    const synchronizer = new ConfigSynchronizer()
+
+    const missing = synchronizer.resolve(fullConfig({$cached: 'h1'}, 'h1', 1))
+    expect(missing.needsResync).toBe(true)
+    expect(missing.config).toBeNull()
+
+    synchronizer.resolve(fullConfig(points, 'h1', 2))
+    const cached = synchronizer.resolve(fullConfig({$cached: 'h1'}, 'h1', 3))
+    expect(cached.needsResync).toBe(false)
+    expect(cached.config!.charts[0].series[0].data).toBe(points)
+    expect(synchronizer.dataCache.hashes()).toEqual(['h1'])
+  })
+})
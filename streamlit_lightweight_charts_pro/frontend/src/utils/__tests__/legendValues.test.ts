@@ -0,0 +1,197 @@
+import {createFrameCoalescer, getLegendIndex, SeriesLegendIndex} from '../legendValues'
+
+const START = 1700000000
+
+const bars = (count: number) =>
+  Array.from({length: count}, (_, i) => ({time: START + i * 60, value: i}))
+
+// Minimal stand-in for ISeriesApi, holding its data like lightweight-charts does
+const mockSeries = (data: any[], options: any = {color: '#123456'}, type = 'Line') => {
+  const series: any = {
+    data: jest.fn(() => data.slice()),
+    options: jest.fn(() => options),
+    seriesType: jest.fn(() => type),
+    setData: jest.fn((next: any[]) => {
+      data = next.slice()
+    }),
+    update: jest.fn((bar: any) => {
+      if (data.length > 0 && data[data.length - 1].time === bar.time) {
+        data[data.length - 1] = bar
+      } else {
+        data.push(bar)
+      }
+    }),
+    applyOptions: jest.fn((next: any) => {
+      options = {...options, ...next}
+    })
+  }
+  return series
+}
+
+// Nearest point by scanning every point, as the legend used to
+const scanNearest = (data: any[], time: number) => {
+  let closest: any = null
+  let minTimeDiff = Infinity
+  for (const point of data) {
+    const timeDiff = Math.abs(point.time - time)
+    if (timeDiff < minTimeDiff) {
+      minTimeDiff = timeDiff
+      closest = point
+    }
+  }
+  return closest
+}
+
+describe('SeriesLegendIndex', () => {
+  it('matches a linear scan', () => {
+    const data = bars(200)
+    const index = new SeriesLegendIndex(mockSeries(data))
+
+    for (let time = START - 100; time < START + 200 * 60 + 100; time += 7) {
+      expect(index.nearest(time)).toBe(scanNearest(data, time))
+    }
+  })
+
+  it('matches a linear scan over whitespace points and non-numeric times', () => {
+    const data: any[] = bars(50).map((bar, i) =>
+      i % 7 === 3 ? {time: bar.time} : i % 11 === 5 ? {...bar, time: '2024-01-02'} : bar
+    )
+    const index = new SeriesLegendIndex(mockSeries(data))
+
+    for (let time = START - 100; time < START + 50 * 60 + 100; time += 13) {
+      expect(index.nearest(time)).toBe(scanNearest(data, time))
+    }
+  })
+
+  it('finds nothing in series without numeric times', () => {
+    const index = new SeriesLegendIndex(mockSeries([{time: '2024-01-02', value: 1}]))
+
+    expect(index.nearest(START)).toBeNull()
+    expect(index.length).toBe(0)
+  })
+})
+
+describe('getLegendIndex', () => {
+  it('reads the series data once', () => {
+    const series = mockSeries(bars(100))
+    const index = getLegendIndex(series)
+
+    index.nearest(START)
+    index.nearest(START + 600)
+
+    expect(series.data).toHaveBeenCalledTimes(1)
+    expect(getLegendIndex(series)).toBe(index)
+  })
+
+  it('follows updates without reading the data again', () => {
+    const series = mockSeries(bars(3))
+    const index = getLegendIndex(series)
+    index.nearest(START)
+
+    series.update({time: START + 120, value: 42})
+    series.update({time: START + 180, value: 43})
+
+    expect(index.nearest(START + 120)).toEqual({time: START + 120, value: 42})
+    expect(index.nearest(START + 999)).toEqual({time: START + 180, value: 43})
+    expect(series.data).toHaveBeenCalledTimes(1)
+  })
+
+  it('rebuilds after setData', () => {
+    const series = mockSeries(bars(3))
+    const index = getLegendIndex(series)
+    index.nearest(START)
+
+    series.setData(bars(10))
+
+    expect(index.length).toBe(10)
+    expect(series.data).toHaveBeenCalledTimes(2)
+  })
+
+  it('caches the metadata until the options change', () => {
+    const series = mockSeries(bars(3), {}, 'Candlestick')
+    const index = getLegendIndex(series)
+
+    expect(index.getMetadata()).toEqual({color: '#26a69a', type: 'Candlestick'})
+    index.getMetadata()
+    expect(series.options).toHaveBeenCalledTimes(1)
+
+    series.applyOptions({color: '#ff0000'})
+
+    expect(index.getMetadata()).toEqual({color: '#ff0000', type: 'Candlestick'})
+  })
+})
+
+describe('createFrameCoalescer', () => {
+  const originalRequestAnimationFrame = window.requestAnimationFrame
+  const originalCancelAnimationFrame = window.cancelAnimationFrame
+  let frames: FrameRequestCallback[]
+
+  beforeEach(() => {
+    frames = []
+    window.requestAnimationFrame = jest.fn(callback => frames.push(callback))
+    window.cancelAnimationFrame = jest.fn(id => {
+      frames[id - 1] = () => undefined
+    })
+  })
+
+  afterEach(() => {
+    window.requestAnimationFrame = originalRequestAnimationFrame
+    window.cancelAnimationFrame = originalCancelAnimationFrame
+  })
+
+  it('flushes the latest value per key once per frame', () => {
+    const flush = jest.fn()
+    const coalescer = createFrameCoalescer<string, number>(flush)
+
+    coalescer.schedule('a', 1)
+    coalescer.schedule('a', 2)
+    coalescer.schedule('b', 3)
+    frames[0](0)
+
+    expect(window.requestAnimationFrame).toHaveBeenCalledTimes(1)
+    expect(flush).toHaveBeenCalledTimes(1)
+    expect(Array.from(flush.mock.calls[0][0].entries())).toEqual([
+      ['a', 2],
+      ['b', 3]
+    ])
+  })
+
+  it('drops cancelled values', () => {
+    const flush = jest.fn()
+    const coalescer = createFrameCoalescer<string, number>(flush)
+
+    coalescer.schedule('a', 1)
+    coalescer.cancel()
+    frames[0](0)
+
+    expect(flush).not.toHaveBeenCalled()
+  })
+})
+
+describe('legend lookup benchmark', () => {
+  // Average time of one crosshair lookup on a series of the given length
+  const lookupTime = (length: number, lookups = 20000) => {
+    const index = new SeriesLegendIndex(mockSeries(bars(length)))
+    index.nearest(START)
+    const span = length * 60
+    const start = performance.now()
+    for (let i = 0; i < lookups; i++) {
+      index.nearest(START + ((i * 7919) % span))
+    }
+    return (performance.now() - start) / lookups
+  }
+
+  it('keeps the per-event cost nearly constant as series grow', () => {
+    lookupTime(1000) // Warm up
+    const small = lookupTime(1000)
+    const large = lookupTime(500000)
+
+    console.log(
+      `Legend lookup: ${(small * 1000).toFixed(2)} us at 1k bars, ` +
+        `${(large * 1000).toFixed(2)} us at 500k bars`
+    )
+
+    // A linear scan would be about 500 times slower; a binary search stays within a few times
+    expect(large).toBeLessThan(Math.max(small * 10, 0.01))
+  })
+})
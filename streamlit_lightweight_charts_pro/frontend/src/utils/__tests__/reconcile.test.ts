@@ -0,0 +1,134 @@
+import {dataFingerprint, diffData, hashPoints, isEmptyDelta, reconcileConfig} from '../reconcile'
+import {ComponentConfig, SeriesConfig} from '../../types'
+
+const bars = (count: number, offset = 0) =>
+  Array.from({length: count}, (_, i) => ({time: 1700000000 + i * 60, value: i + offset}))
+
+const line = (data: any[], options: any = {color: '#2196f3'}, paneId = 0): SeriesConfig => ({
+  type: 'Line',
+  data,
+  options,
+  paneId,
+  priceScaleId: 'right'
+})
+
+const config = (series: SeriesConfig[], extra: any = {}): ComponentConfig => ({
+  charts: [{chartId: 'chart-a', chart: {height: 400}, series, ...extra}],
+  syncConfig: {enabled: false, crosshair: false, timeRange: false}
+})
+
+describe('diffData', () => {
+  it('ignores equal data in a new array', () => {
+    expect(diffData(bars(100), bars(100))).toBeNull()
+  })
+
+  it('appends bars and updates the last one', () => {
+    const updated = bars(100)
+    updated[99] = {...updated[99], value: 1000}
+    updated.push({time: 1700000000 + 100 * 60, value: 1})
+
+    expect(diffData(bars(100), updated)).toEqual({op: 'append', data: updated.slice(99)})
+  })
+
+  it('replaces data changed before the last bar', () => {
+    const changed = bars(100)
+    changed[10] = {...changed[10], value: -1}
+
+    expect(diffData(bars(100), changed)).toEqual({op: 'setData', data: changed})
+    expect(diffData(bars(100), bars(50))?.op).toBe('setData')
+  })
+
+  it('caches fingerprints per array', () => {
+    const data = bars(10)
+    expect(dataFingerprint(data)).toBe(dataFingerprint(data))
+    expect(dataFingerprint(data).full).not.toEqual(dataFingerprint(bars(10, 1)).full)
+  })
+
+  it('hashes points with two independent 32-bit lanes', () => {
+    const [first, second] = hashPoints(bars(10))
+
+    expect(first).not.toBe(second)
+    expect(hashPoints(bars(10), 5, 10, hashPoints(bars(10), 0, 5))).toEqual([first, second])
+  })
+
+  it('never takes data as unchanged when told it changed', () => {
+    const data = bars(100)
+
+    expect(diffData(data, bars(100), true)).toEqual({op: 'append', data: data.slice(99)})
+    expect(diffData(data, data, true)).not.toBeNull()
+  })
+})
+
+describe('reconcileConfig', () => {
+  it('finds nothing to do for an identical config', () => {
+    const delta = reconcileConfig(config([line(bars(10))]), config([line(bars(10))]))
+
+    expect(delta).not.toBeNull()
+    expect(isEmptyDelta(delta!)).toBe(true)
+  })
+
+  it('updates options and data of matched series only', () => {
+    const before = config([line(bars(10)), line(bars(10), {color: 'red'}, 1)])
+    const after = config([line(bars(10)), line(bars(10, 5), {color: 'blue'}, 1)])
+    after.charts[0].chart = {height: 500}
+
+    expect(reconcileConfig(before, after)).toEqual({
+      charts: [
+        {
+          chartId: 'chart-a',
+          options: {height: 500},
+          series: [
+            {op: 'setData', index: 1, data: after.charts[0].series[1].data},
+            {op: 'options', index: 1, options: {color: 'blue'}}
+          ]
+        }
+      ]
+    })
+  })
+
+  it('follows the content hashes sent by Python over the fingerprints', () => {
+    const hashed = (data: any[], dataHash: string) => ({...line(data), dataHash})
+    const same = reconcileConfig(
+      config([hashed(bars(10), 'a')]),
+      config([hashed(bars(10, 1), 'a')])
+    )
+    const changed = reconcileConfig(
+      config([hashed(bars(10), 'a')]),
+      config([hashed(bars(10), 'b')])
+    )
+
+    expect(isEmptyDelta(same!)).toBe(true)
+    expect(changed!.charts[0].series.map(operation => operation.op)).toEqual(['append'])
+  })
+
+  it('adds and removes series by key, leaving the others in place', () => {
+    const price = line(bars(10))
+    const volume = {...line(bars(10), {}, 1), type: 'Histogram' as const}
+    const signal = line(bars(10), {}, 2)
+    const before = config([price, signal])
+    const after = config([price, volume])
+
+    expect(reconcileConfig(before, after)!.charts[0].series).toEqual([
+      {op: 'remove', index: 1},
+      {op: 'add', index: 1, series: volume}
+    ])
+  })
+
+  it('recreates series whose markers changed', () => {
+    const before = config([line(bars(10))])
+    const after = config([{...line(bars(10)), markers: [] as any[]}])
+
+    expect(reconcileConfig(before, after)!.charts[0].series).toEqual([
+      {op: 'replace', index: 0, series: after.charts[0].series[0]}
+    ])
+  })
+
+  it('rebuilds for chart-level changes it cannot patch', () => {
+    const before = config([line(bars(10))])
+    const renamed = config([line(bars(10))])
+    renamed.charts[0].chartId = 'chart-b'
+
+    expect(reconcileConfig(before, config([line(bars(10))], {annotations: [{}]}))).toBeNull()
+    expect(reconcileConfig(before, renamed)).toBeNull()
+  })
+})
@@ -0,0 +1,189 @@
+import {findNearestIndex, getTimeIndex, TimeIndex, toTimestamp} from '../timeIndex'
+import {createTradeVisualElements} from '../../tradeVisualization'
+
+const START = 1700000000
+
+const bars = (count: number) =>
+  Array.from({length: count}, (_, i) => ({time: START + i * 60, value: i}))
+
+// Nearest time by mapping and scanning all the data, as markers used to be snapped
+const scanNearestTime = (data: any[], time: number) => {
+  const availableTimes = data
+    .map(item => {
+      if (typeof item.time === 'number') {
+        return item.time
+      } else if (typeof item.time === 'string') {
+        return Math.floor(new Date(item.time).getTime() / 1000)
+      }
+      return null
+    })
+    .filter(item => item !== null)
+  return availableTimes.reduce((nearest, current) =>
+    Math.abs(current - time) < Math.abs(nearest - time) ? current : nearest
+  )
+}
+
+describe('findNearestIndex', () => {
+  const times = [10, 20, 30, 40]
+
+  it('finds exact and nearest times', () => {
+    expect(findNearestIndex(times, 30)).toBe(2)
+    expect(findNearestIndex(times, 31)).toBe(2)
+    expect(findNearestIndex(times, 39)).toBe(3)
+  })
+
+  it('clamps times outside the range', () => {
+    expect(findNearestIndex(times, 0)).toBe(0)
+    expect(findNearestIndex(times, 99)).toBe(3)
+    expect(findNearestIndex([], 10)).toBe(-1)
+  })
+
+  it('prefers the earlier time on a tie', () => {
+    expect(findNearestIndex(times, 25)).toBe(1)
+  })
+})
+
+describe('toTimestamp', () => {
+  it('converts numbers and date strings', () => {
+    expect(toTimestamp(START)).toBe(START)
+    expect(toTimestamp('2023-11-14T22:13:20Z')).toBe(START)
+  })
+
+  it('rejects other times', () => {
+    expect(toTimestamp('not a date')).toBeNull()
+    expect(toTimestamp({year: 2023, month: 11, day: 14})).toBeNull()
+    expect(toTimestamp(undefined)).toBeNull()
+  })
+})
+
+describe('TimeIndex', () => {
+  it('matches a linear scan', () => {
+    const data = bars(200)
+    const index = TimeIndex.fromData(data)
+
+    for (let time = START - 100; time < START + 200 * 60 + 100; time += 7) {
+      expect(index.nearest(time)).toBe(scanNearestTime(data, time))
+    }
+  })
+
+  it('sorts unordered data and skips unusable times', () => {
+    const data = [{time: START + 120}, {time: 'bad'}, {time: '2023-11-14T22:13:20Z'}, {}]
+    const index = TimeIndex.fromData(data)
+
+    expect(Array.from(index.times)).toEqual([START, START + 120])
+    expect(index.nearest(START + 100)).toBe(START + 120)
+    expect(TimeIndex.fromData([]).nearest(START)).toBeNull()
+  })
+})
+
+describe('getTimeIndex', () => {
+  it('reuses the index of a data array', () => {
+    const data = bars(10)
+
+    expect(getTimeIndex(data)).toBe(getTimeIndex(data))
+    expect(getTimeIndex(bars(10))).not.toBe(getTimeIndex(data))
+  })
+
+  it('rebuilds the index when the array grows', () => {
+    const data = bars(10)
+    const index = getTimeIndex(data)
+
+    data.push({time: START + 6000, value: 100})
+
+    expect(getTimeIndex(data)).not.toBe(index)
+    expect(getTimeIndex(data).nearest(START + 9999)).toBe(START + 6000)
+  })
+
+  it('rebuilds the index when the last point is replaced', () => {
+    const data = bars(10)
+    const index = getTimeIndex(data)
+
+    data[9] = {time: START + 6000, value: 100}
+
+    expect(getTimeIndex(data)).not.toBe(index)
+    expect(getTimeIndex(data).nearest(START + 9999)).toBe(START + 6000)
+  })
+})
+
+describe('trade snapping', () => {
+  const trade = (i: number) => ({
+    entryTime: START + i * 600 + 17,
+    entryPrice: 100,
+    exitTime: START + i * 600 + 331,
+    exitPrice: 110,
+    quantity: 1,
+    tradeType: 'long',
+    isProfitable: true,
+    id: `t${i}`,
+    pnlPercentage: 10
+  })
+
+  it('snaps markers, rectangles and annotations to bar times', () => {
+    const data = bars(100)
+    const trades = [trade(1), trade(5)] as any[]
+
+    const elements = createTradeVisualElements(
+      trades,
+      {style: 'both', showAnnotations: true} as any,
+      data
+    )
+
+    expect(elements.markers.map(marker => marker.time)).toEqual([
+      scanNearestTime(data, trades[0].entryTime),
+      scanNearestTime(data, trades[0].exitTime),
+      scanNearestTime(data, trades[1].entryTime),
+      scanNearestTime(data, trades[1].exitTime)
+    ])
+    expect(elements.rectangles[0].time1).toBe(START + 600)
+    expect(elements.rectangles[0].time2).toBe(START + 600 + 360)
+    expect(elements.annotations[0].time).toBe(START + 600 + 180)
+  })
+
+  it('snaps to date string times like the linear scan', () => {
+    const data = bars(100).map(bar => ({...bar, time: new Date(bar.time * 1000).toISOString()}))
+    const trades = [trade(1), trade(5)] as any[]
+
+    const elements = createTradeVisualElements(trades, {style: 'markers'} as any, data)
+
+    expect(elements.markers.map(marker => marker.time)).toEqual([
+      scanNearestTime(data, trades[0].entryTime),
+      scanNearestTime(data, trades[0].exitTime),
+      scanNearestTime(data, trades[1].entryTime),
+      scanNearestTime(data, trades[1].exitTime)
+    ])
+    expect(elements.markers[0].time).toBe(START + 600)
+  })
+
+  it('ignores data times that do not parse', () => {
+    // The linear scan kept them as NaN, which could win every comparison
+    const data = [{time: 'not a date'}, ...bars(10)]
+
+    const elements = createTradeVisualElements([trade(0)] as any[], {style: 'markers'} as any, data)
+
+    expect(elements.markers.map(marker => marker.time)).toEqual([START, START + 360])
+  })
+})
+
+describe('snapping benchmark', () => {
+  it('is much faster than scanning the data for each marker', () => {
+    const data = bars(20000)
+    const times = Array.from({length: 1000}, (_, i) => START + ((i * 7919 * 60) % 1200000) + 13)
+
+    let start = performance.now()
+    const scanned = times.map(time => scanNearestTime(data, time))
+    const scanTime = performance.now() - start
+
+    start = performance.now()
+    const index = getTimeIndex(data)
+    const searched = times.map(time => index.nearest(time))
+    const searchTime = performance.now() - start
+
+    console.log(
+      `Snapping 1000 markers to 20000 bars: ${scanTime.toFixed(1)} ms scanning, ` +
+        `${searchTime.toFixed(1)} ms with the time index`
+    )
+
+    expect(searched).toEqual(scanned)
+    expect(searchTime).toBeLessThan(scanTime / 10)
+  })
+})
@@ -0,0 +1,83 @@
+import {IChartApi} from 'lightweight-charts'
+import {createViewportReporter, readViewport, timeToSeconds} from '../viewport'
+
+// Chart stub whose visible range can be changed between reports
+const fakeChart = (range: {from: any; to: any} | null, width = 800) => {
+  const state = {range, width}
+  const chart = {
+    timeScale: () => ({
+      getVisibleRange: () => state.range,
+      getVisibleLogicalRange: () => (state.range ? {from: 10.5, to: 110.5} : null),
+      width: () => state.width
+    })
+  } as unknown as IChartApi
+  return {chart, state}
+}
+
+describe('timeToSeconds', () => {
+  it('accepts timestamps, date strings and business days', () => {
+    expect(timeToSeconds(1704067200)).toBe(1704067200)
+    expect(timeToSeconds('2024-01-01')).toBe(1704067200)
+    expect(timeToSeconds({year: 2024, month: 1, day: 1})).toBe(1704067200)
+    expect(timeToSeconds({})).toBeNull()
+  })
+})
+
+describe('readViewport', () => {
+  it('reports times, logical range and width', () => {
+    const {chart} = fakeChart({from: 1704067200, to: 1704153600}, 640.4)
+
+    expect(readViewport('chart-1', chart)).toEqual({
+      chartId: 'chart-1',
+      from: 1704067200,
+      to: 1704153600,
+      logicalFrom: 10.5,
+      logicalTo: 110.5,
+      width: 640
+    })
+  })
+
+  it('returns null for charts without data', () => {
+    expect(readViewport('chart-1', fakeChart(null).chart)).toBeNull()
+  })
+})
+
+describe('createViewportReporter', () => {
+  beforeEach(() => jest.useFakeTimers())
+  afterEach(() => jest.useRealTimers())
+
+  it('reports once the chart stops moving', () => {
+    const send = jest.fn()
+    const reporter = createViewportReporter(send)
+    const {chart, state} = fakeChart({from: 100, to: 200})
+
+    reporter.schedule('chart-1', chart, 300)
+    jest.advanceTimersByTime(200)
+    state.range = {from: 150, to: 250}
+    reporter.schedule('chart-1', chart, 300)
+    jest.advanceTimersByTime(299)
+    expect(send).not.toHaveBeenCalled()
+
+    jest.advanceTimersByTime(1)
+    expect(send).toHaveBeenCalledTimes(1)
+    expect(send.mock.calls[0][0]).toMatchObject({chartId: 'chart-1', from: 150, to: 250})
+  })
+
+  it('drops repeated and cancelled reports', () => {
+    const send = jest.fn()
+    const reporter = createViewportReporter(send)
+    const {chart, state} = fakeChart({from: 100, to: 200})
+
+    reporter.schedule('chart-1', chart, 10)
+    jest.advanceTimersByTime(10)
+    reporter.schedule('chart-1', chart, 10)
+    jest.advanceTimersByTime(10)
+    expect(send).toHaveBeenCalledTimes(1)
+
+    state.range = {from: 300, to: 400}
+    reporter.schedule('chart-1', chart, 10)
+    reporter.cancel()
+    jest.advanceTimersByTime(10)
+    expect(send).toHaveBeenCalledTimes(1)
+  })
+})
@@ -0,0 +1,149 @@
+/**
+ * Binary columnar series data sent by Chart.render()
+ *
+ * Series with the COLUMNAR transport are not sent as one JSON object per point.
+ * Their data is replaced in the JSON payload by a descriptor, and the numeric
+ * columns are sent as one binary buffer of little-endian float64 values next
+ * to it. The columns are read with Float64Array views of that buffer and turned
+ * into the point objects lightweight-charts expects, without parsing any JSON.
+ */
+
+import {ColumnarDataDescriptor, ComponentConfig, ComponentConfigDelta} from '../types'
+
+export const COLUMNAR_KEY = '$columnar'
+
+const FLOAT64_BYTES = Float64Array.BYTES_PER_ELEMENT
+
+// Typed arrays use the byte order of the platform, Python writes little-endian
+const LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1
+
+export function isColumnarData(data: unknown): data is {[COLUMNAR_KEY]: ColumnarDataDescriptor} {
+  return !!data && typeof data === 'object' && !Array.isArray(data) && COLUMNAR_KEY in data
+}
+
+/**
+ * Bytes of the binary buffer argument. Streamlit delivers bytes as a Uint8Array,
+ * which may be a view at any offset of a larger buffer.
+ */
+function asBytes(buffer: unknown): Uint8Array {
+  if (buffer instanceof Uint8Array) {
+    return buffer
+  }
+  if (ArrayBuffer.isView(buffer)) {
+    return new Uint8Array(buffer.buffer, buffer.byteOffset, buffer.byteLength)
+  }
+  if (buffer instanceof ArrayBuffer) {
+    return new Uint8Array(buffer)
+  }
+  throw new Error('Columnar series data requires the binary buffer argument')
+}
+
+/**
+ * Read a float64 column. The view shares the buffer when it is 8-byte aligned,
+ * otherwise the column is copied to an aligned buffer first. Big-endian
+ * platforms read the values one by one instead.
+ */
+function readColumn(bytes: Uint8Array, offset: number, length: number): Float64Array {
+  const start = bytes.byteOffset + offset
+  if (offset < 0 || offset + length * FLOAT64_BYTES > bytes.byteLength) {
+    throw new Error('Columnar series data is out of the bounds of the binary buffer')
+  }
+  if (!LITTLE_ENDIAN) {
+    const view = new DataView(bytes.buffer, start, length * FLOAT64_BYTES)
+    const column = new Float64Array(length)
+    for (let i = 0; i < length; i++) {
+      column[i] = view.getFloat64(i * FLOAT64_BYTES, true)
+    }
+    return column
+  }
+  if (start % FLOAT64_BYTES === 0) {
+    return new Float64Array(bytes.buffer, start, length)
+  }
+  return new Float64Array(bytes.slice(offset, offset + length * FLOAT64_BYTES).buffer)
+}
+
+/**
+ * Build the data points described by a columnar descriptor, with the same keys
+ * in the same order as the JSON transport.
+ */
+export function decodeColumnarData(descriptor: ColumnarDataDescriptor, buffer: unknown): any[] {
+  const bytes = asBytes(buffer)
+  const {length, keys} = descriptor
+  const numeric = descriptor.numeric || {}
+  const values = descriptor.values || {}
+  const constants = descriptor.constants || {}
+
+  // One column per key, in the key order of the JSON transport
+  const columns = keys.map(key => ({
+    key,
+    numbers: key in numeric ? readColumn(bytes, numeric[key], length) : null,
+    values: key in values ? values[key] : null,
+    constant: constants[key]
+  }))
+
+  const points = new Array(length)
+  for (let i = 0; i < length; i++) {
+    const point: any = {}
+    for (let k = 0; k < columns.length; k++) {
+      const column = columns[k]
+      if (column.numbers) {
+        point[column.key] = column.numbers[i]
+      } else if (column.values) {
+        const value = column.values[i]
+        if (value !== null && value !== undefined) {
+          point[column.key] = value
+        }
+      } else {
+        point[column.key] = column.constant
+      }
+    }
+    points[i] = point
+  }
+  return points
+}
+
+function decodeData(data: any, buffer: unknown): any {
+  return isColumnarData(data) ? decodeColumnarData(data[COLUMNAR_KEY], buffer) : data
+}
+
+function decodeSeries(series: any, buffer: unknown): any {
+  return series && isColumnarData(series.data)
+    ? {...series, data: decodeData(series.data, buffer)}
+    : series
+}
+
+/**
+ * Replace the columnar descriptors of a full config or a delta by their data
+ * points. Payloads without binary data are returned as they are.
+ */
+export function decodeColumnarPayload<T extends ComponentConfig | ComponentConfigDelta | undefined>(
+  payload: T,
+  buffer: unknown
+): T {
+  if (!payload || buffer === null || buffer === undefined) {
+    return payload
+  }
+  if ('delta' in payload) {
+    const {delta} = payload as ComponentConfigDelta
+    const charts = delta.charts.map(chart => ({
+      ...chart,
+      series: chart.series.map((operation: any) => {
+        const decoded = {...operation}
+        if ('data' in operation) {
+          decoded.data = decodeData(operation.data, buffer)
+        }
+        if ('series' in operation) {
+          decoded.series = decodeSeries(operation.series, buffer)
+        }
+        return decoded
+      })
+    }))
+    return {...payload, delta: {...delta, charts}} as T
+  }
+  const config = payload as ComponentConfig
+  const charts = (config.charts || []).map(chart => ({
+    ...chart,
+    series: (chart.series || []).map(series => decodeSeries(series, buffer))
+  }))
+  return {...config, charts} as T
+}
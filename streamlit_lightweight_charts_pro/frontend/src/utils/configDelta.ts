@@ -0,0 +1,212 @@
+/**
+ * Versioned incremental config updates sent by Chart.render()
+ *
+ * Python sends either a full ComponentConfig with a `version`, or a delta
+ * ({version, baseVersion, delta}) describing what changed since `baseVersion`.
+ * A delta only applies on top of the config with that exact version; otherwise
+ * the component asks Python for a full resync through its component value.
+ */
+
+import {
+  ChartConfig,
+  ComponentConfig,
+  ComponentConfigDelta,
+  ConfigDelta,
+  SeriesConfig,
+  SeriesOperation
+} from '../types'
+import {decodeColumnarPayload} from './columnarData'
+import {SeriesDataCache} from './dataCache'
+
+export interface ResolvedConfig {
+  // Complete config to display, or null while none has been received
+  config: ComponentConfig | null
+  // Delta that produced `config` from the previous one, to patch the live charts
+  delta: ConfigDelta | null
+  // True when a delta did not match the current version
+  needsResync: boolean
+}
+
+export function isConfigDelta(payload: any): payload is ComponentConfigDelta {
+  return !!payload && typeof payload === 'object' && payload.delta !== undefined
+}
+
+/**
+ * Decode the config argument. Python sends it as UTF-8 encoded JSON, which
+ * Streamlit delivers as a Uint8Array; plain objects are returned as they are.
+ * Series data sent as binary columns is read from the `buffers` argument.
+ */
+export function parseConfigArg(
+  arg: unknown,
+  buffers?: unknown
+): ComponentConfig | ComponentConfigDelta | undefined {
+  if (arg === null || arg === undefined) {
+    return undefined
+  }
+  let payload: ComponentConfig | ComponentConfigDelta
+  if (ArrayBuffer.isView(arg) || arg instanceof ArrayBuffer) {
+    payload = JSON.parse(new TextDecoder().decode(arg))
+  } else if (typeof arg === 'string') {
+    payload = JSON.parse(arg)
+  } else {
+    payload = arg as ComponentConfig | ComponentConfigDelta
+  }
+  return decodeColumnarPayload(payload, buffers)
+}
+
+/**
+ * Merge appended bars into series data, after dropping `trim` bars from the
+ * front. The first bar replaces the current last bar when it has the same
+ * time, like series.update() does.
+ */
+export function appendBars(data: any[], bars: any[], trim = 0): any[] {
+  if (bars.length === 0 && trim === 0) {
+    return data
+  }
+  const merged = data.slice(trim)
+  if (bars.length === 0) {
+    return merged
+  }
+  let first = 0
+  if (merged.length > 0 && merged[merged.length - 1].time === bars[0].time) {
+    merged[merged.length - 1] = bars[0]
+    first = 1
+  }
+  // Push one by one: spreading a large array can overflow the call stack
+  for (let i = first; i < bars.length; i++) {
+    merged.push(bars[i])
+  }
+  return merged
+}
+
+export function applySeriesOperations(
+  seriesConfigs: SeriesConfig[],
+  operations: SeriesOperation[]
+): SeriesConfig[] {
+  if (operations.length === 0) {
+    return seriesConfigs
+  }
+  const result = seriesConfigs.slice()
+  operations.forEach(operation => {
+    switch (operation.op) {
+      case 'append':
+        result[operation.index] = {
+          ...result[operation.index],
+          data: appendBars(result[operation.index].data || [], operation.data, operation.trim),
+          dataHash: undefined
+        }
+        break
+      case 'setData':
+        result[operation.index] = {
+          ...result[operation.index],
+          data: operation.data,
+          dataHash: operation.dataHash
+        }
+        break
+      case 'options':
+        result[operation.index] = {...result[operation.index], options: operation.options}
+        break
+      case 'replace':
+        result[operation.index] = operation.series
+        break
+      case 'add':
+        result.splice(operation.index, 0, operation.series)
+        break
+      case 'remove':
+        result.splice(operation.index, 1)
+        break
+    }
+  })
+  return result
+}
+
+/**
+ * Build the config obtained by applying a delta to a config, without modifying
+ * either of them. Unchanged charts and series keep their identity.
+ */
+export function applyConfigDelta(
+  config: ComponentConfig,
+  delta: ConfigDelta,
+  version?: number
+): ComponentConfig {
+  const chartDeltas = new Map(delta.charts.map(chartDelta => [chartDelta.chartId, chartDelta]))
+  const charts = config.charts.map((chartConfig: ChartConfig) => {
+    const chartDelta = chartConfig.chartId ? chartDeltas.get(chartConfig.chartId) : undefined
+    if (!chartDelta) {
+      return chartConfig
+    }
+    return {
+      ...chartConfig,
+      chart: chartDelta.options !== undefined ? chartDelta.options : chartConfig.chart,
+      series: applySeriesOperations(chartConfig.series || [], chartDelta.series)
+    }
+  })
+  return {...config, charts, version}
+}
+
+/**
+ * Tracks the config version held by the component and resolves each payload
+ * received from Python into the complete config to display.
+ *
+ * Resolving the same payload object twice returns the same result. Render
+ * code, which may run more than once per payload (e.g. under React.StrictMode),
+ * should call resolveArgs() with the raw component arguments: parsing them
+ * builds a new payload object every time.
+ *
+ * Series data that Python left out because this component already holds it
+ * is taken from the data cache; a payload naming data that is not held asks
+ * for a resync like a delta for another version does.
+ */
+export class ConfigSynchronizer {
+  readonly dataCache = new SeriesDataCache()
+  private config: ComponentConfig | null = null
+  private version: number | undefined = undefined
+  private lastPayload: any = undefined
+  private lastArgs: [unknown, unknown] | null = null
+  private lastResult: ResolvedConfig = {config: null, delta: null, needsResync: false}
+
+  /**
+   * Parse and resolve the `config` and `buffers` component arguments. The same
+   * arguments resolve only once, like the same payload object in resolve().
+   */
+  resolveArgs(config: unknown, buffers?: unknown): ResolvedConfig {
+    if (this.lastArgs && this.lastArgs[0] === config && this.lastArgs[1] === buffers) {
+      return this.lastResult
+    }
+    const result = this.resolve(parseConfigArg(config, buffers))
+    this.lastArgs = [config, buffers]
+    return result
+  }
+
+  resolve(payload: ComponentConfig | ComponentConfigDelta | null | undefined): ResolvedConfig {
+    if (payload === this.lastPayload) {
+      return this.lastResult
+    }
+    this.lastPayload = payload
+
+    if (!payload) {
+      this.lastResult = {config: this.config, delta: null, needsResync: false}
+    } else if (isConfigDelta(payload)) {
+      if (
+        this.config &&
+        this.version !== undefined &&
+        this.version === payload.baseVersion &&
+        this.dataCache.resolve(payload.delta)
+      ) {
+        this.config = applyConfigDelta(this.config, payload.delta, payload.version)
+        this.version = payload.version
+        this.lastResult = {config: this.config, delta: payload.delta, needsResync: false}
+      } else {
+        // Keep showing the current config until Python sends a full one
+        this.lastResult = {config: this.config, delta: null, needsResync: true}
+      }
+    } else if (this.dataCache.resolve(payload)) {
+      this.config = payload
+      this.version = payload.version
+      this.lastResult = {config: payload, delta: null, needsResync: false}
+    } else {
+      this.lastResult = {config: this.config, delta: null, needsResync: true}
+    }
+    return this.lastResult
+  }
+}
@@ -0,0 +1,99 @@
+/**
+ * Content-addressed series data cache
+ *
+ * Series data sent in full comes with a content hash (`dataHash`). The decoded
+ * data is kept in a least recently used cache keyed by that hash, so Python
+ * can send {"$cached": hash} instead of data the component already holds
+ * (see charts/data_cache.py). Python mirrors this cache by applying the same
+ * insertions and lookups in the same order, so both must visit the data of a
+ * payload in the same order and evict the same way.
+ */
+
+import {ComponentConfig, ConfigDelta} from '../types'
+
+// Number of data sets kept; must match DATA_CACHE_SIZE in charts/data_cache.py
+export const DATA_CACHE_SIZE = 16
+
+export const CACHED_KEY = '$cached'
+
+export interface CachedDataRef {
+  $cached: string
+}
+
+export function isCachedDataRef(data: unknown): data is CachedDataRef {
+  return !!data && typeof data === 'object' && typeof (data as any)[CACHED_KEY] === 'string'
+}
+
+// Series configs and operations of a payload that carry full data, in payload order
+function dataHolders(payload: ComponentConfig | ConfigDelta): any[] {
+  const holders: any[] = []
+  payload.charts.forEach((chart: any) => {
+    ;(chart.series || []).forEach((item: any) => {
+      if (item.op === 'setData') {
+        holders.push(item)
+      } else if (item.op === 'replace' || item.op === 'add') {
+        holders.push(item.series)
+      } else if (item.op === undefined) {
+        holders.push(item)
+      }
+    })
+  })
+  return holders
+}
+
+export class SeriesDataCache {
+  private entries = new Map<string, any[]>()
+
+  constructor(private readonly size: number = DATA_CACHE_SIZE) {}
+
+  // Hashes held, least recently used first, as reported to Python
+  hashes(): string[] {
+    return Array.from(this.entries.keys())
+  }
+
+  get(hash: string): any[] | undefined {
+    const data = this.entries.get(hash)
+    if (data !== undefined) {
+      this.entries.delete(hash)
+      this.entries.set(hash, data)
+    }
+    return data
+  }
+
+  put(hash: string, data: any[]): void {
+    this.entries.delete(hash)
+    this.entries.set(hash, data)
+    while (this.entries.size > this.size) {
+      this.entries.delete(this.entries.keys().next().value as string)
+    }
+  }
+
+  clear(): void {
+    this.entries.clear()
+  }
+
+  /**
+   * Replace the cached data references of a full config or of the delta of a
+   * delta payload with the data they name, in place, and keep the data sent
+   * with a hash. Returns false when a reference names data that is not held,
+   * in which case the payload must not be applied.
+   */
+  resolve(payload: ComponentConfig | ConfigDelta): boolean {
+    for (const holder of dataHolders(payload)) {
+      const hash = holder.dataHash
+      if (typeof hash !== 'string') {
+        continue
+      }
+      if (isCachedDataRef(holder.data)) {
+        const data = this.get(holder.data.$cached)
+        if (data === undefined) {
+          return false
+        }
+        holder.data = data
+      } else if (Array.isArray(holder.data)) {
+        this.put(hash, holder.data)
+      }
+    }
+    return true
+  }
+}
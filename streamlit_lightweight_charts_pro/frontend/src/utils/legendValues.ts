@@ -0,0 +1,225 @@
+/**
+ * Crosshair lookups for legend values
+ *
+ * Legends show the data point nearest to the crosshair time. Reading
+ * series.data() and scanning it on every crosshair move costs O(n) per series
+ * and event, which makes the crosshair stutter on series with hundreds of
+ * thousands of bars. SeriesLegendIndex keeps the times of a series sorted in an
+ * array, built once after setData() and kept in sync by update(), so that each
+ * lookup is a binary search. It also caches the legend color and type of the
+ * series until its options change.
+ */
+
+import {ISeriesApi} from 'lightweight-charts'
+import {findNearestIndex} from './timeIndex'
+
+export interface LegendSeriesMetadata {
+  color: string
+  type: string
+}
+
+/**
+ * Legend color and type of a series, as shown when the options set no color.
+ */
+export function legendSeriesMetadata(series: ISeriesApi<any>): LegendSeriesMetadata {
+  let options: any = {}
+  try {
+    if (typeof series.options === 'function') {
+      options = series.options()
+    } else if (series.options) {
+      options = series.options
+    }
+  } catch (error) {
+    console.warn('Could not get series options:', error)
+  }
+
+  let type = 'Unknown'
+  try {
+    if (typeof series.seriesType === 'function') {
+      type = String(series.seriesType())
+    } else if (series.seriesType && typeof series.seriesType === 'string') {
+      type = series.seriesType as any
+    }
+  } catch (error) {
+    console.warn('Could not get series type:', error)
+  }
+
+  let color = '#2196f3'
+  if (options.color) {
+    color = options.color
+  } else if (type === 'Candlestick') {
+    color = '#26a69a'
+  } else if (type === 'Histogram') {
+    color = '#ff9800'
+  } else if (type === 'Area') {
+    color = options.topColor || '#4caf50'
+  }
+  return {color, type}
+}
+
+/**
+ * Sorted time index and cached metadata of one series. Only points with a
+ * numeric time are indexed, like the crosshair only reports numeric times.
+ */
+export class SeriesLegendIndex {
+  private points: any[] = []
+  private times: number[] = []
+  private stale = true
+  private metadata: LegendSeriesMetadata | null = null
+
+  constructor(private readonly series: ISeriesApi<any>) {}
+
+  // The series data was replaced: rebuild the index on the next lookup
+  invalidate(): void {
+    this.stale = true
+  }
+
+  // The series options changed: read the metadata again on the next lookup
+  invalidateMetadata(): void {
+    this.metadata = null
+  }
+
+  // Mirror series.update(): replace the last point or append a newer one
+  update(bar: any): void {
+    if (this.stale || !bar || typeof bar.time !== 'number' || !bar.time) {
+      this.stale = true
+      return
+    }
+    const last = this.times.length - 1
+    if (last >= 0 && this.times[last] === bar.time) {
+      this.points[last] = bar
+    } else if (last < 0 || this.times[last] < bar.time) {
+      this.points.push(bar)
+      this.times.push(bar.time)
+    } else {
+      this.stale = true
+    }
+  }
+
+  get length(): number {
+    this.rebuild()
+    return this.times.length
+  }
+
+  nearest(time: number): any | null {
+    this.rebuild()
+    const index = findNearestIndex(this.times, time)
+    return index < 0 ? null : this.points[index]
+  }
+
+  getMetadata(): LegendSeriesMetadata {
+    if (!this.metadata) {
+      this.metadata = legendSeriesMetadata(this.series)
+    }
+    return this.metadata
+  }
+
+  private rebuild(): void {
+    if (!this.stale) {
+      return
+    }
+    const data = (this.series.data() || []) as any[]
+    const points: any[] = []
+    const times: number[] = []
+    let sorted = true
+    for (let i = 0; i < data.length; i++) {
+      const point = data[i]
+      if (point && typeof point.time === 'number' && point.time) {
+        if (times.length > 0 && point.time < times[times.length - 1]) {
+          sorted = false
+        }
+        points.push(point)
+        times.push(point.time)
+      }
+    }
+    if (!sorted) {
+      const order = times.map((_, i) => i).sort((a, b) => times[a] - times[b] || a - b)
+      this.points = order.map(i => points[i])
+      this.times = order.map(i => times[i])
+    } else {
+      this.points = points
+      this.times = times
+    }
+    this.stale = false
+  }
+}
+
+const legendIndexes = new WeakMap<object, SeriesLegendIndex>()
+
+/**
+ * Index of a series, created on first use. The series' setData(), update() and
+ * applyOptions() are wrapped once so that the index follows every data and
+ * options change, wherever it is made.
+ */
+export function getLegendIndex(series: ISeriesApi<any>): SeriesLegendIndex {
+  let index = legendIndexes.get(series)
+  if (index) {
+    return index
+  }
+  const created = new SeriesLegendIndex(series)
+  const target = series as any
+  const {setData, update, applyOptions} = target
+  if (typeof setData === 'function') {
+    target.setData = (...args: any[]) => {
+      created.invalidate()
+      return setData.apply(series, args)
+    }
+  }
+  if (typeof update === 'function') {
+    target.update = (...args: any[]) => {
+      const result = update.apply(series, args)
+      created.update(args[0])
+      return result
+    }
+  }
+  if (typeof applyOptions === 'function') {
+    target.applyOptions = (...args: any[]) => {
+      created.invalidateMetadata()
+      return applyOptions.apply(series, args)
+    }
+  }
+  index = created
+  legendIndexes.set(series, index)
+  return index
+}
+
+export interface FrameCoalescer<K, V> {
+  // Keep `value` as the latest one for `key` and flush on the next animation frame
+  schedule(key: K, value: V): void
+  // Drop the pending values without flushing them
+  cancel(): void
+}
+
+/**
+ * Coalesce calls into at most one flush per animation frame. Only the latest
+ * value scheduled for each key is flushed.
+ */
+export function createFrameCoalescer<K, V>(
+  flush: (entries: Map<K, V>) => void
+): FrameCoalescer<K, V> {
+  let pending = new Map<K, V>()
+  let frame: number | null = null
+
+  const run = () => {
+    frame = null
+    const entries = pending
+    pending = new Map<K, V>()
+    flush(entries)
+  }
+
+  return {
+    schedule(key: K, value: V): void {
+      pending.set(key, value)
+      if (frame === null) {
+        frame = requestAnimationFrame(run)
+      }
+    },
+    cancel(): void {
+      if (frame !== null) {
+        cancelAnimationFrame(frame)
+        frame = null
+      }
+      pending = new Map<K, V>()
+    }
+  }
+}
@@ -0,0 +1,319 @@
+/**
+ * Keyed reconciliation of full configs against the mounted charts
+ *
+ * Python sends a full config on every rerun of a chart without incremental
+ * updates, and for charts with them (Chart.incremental_updates()) on the first
+ * render, after a resync and whenever its positional diff cannot express a
+ * change. Rebuilding every chart for such a config loses plugins, legends and
+ * tooltips and costs a full re-render. reconcileConfig() diffs the new config
+ * against the one the charts were built from and returns the operations that
+ * bring the live charts up to date, or null when the charts must be rebuilt.
+ * Configs are reconciled whether or not they carry a protocol version.
+ *
+ * Charts are matched by chartId and series by a key made of their type, pane
+ * and price scale (and their rank among series sharing these), so adding or
+ * removing one series leaves the others in place. Data is compared through the
+ * content hash sent by Python when both configs carry one, and otherwise
+ * through a 64-bit fingerprint cached per data array, so each array is hashed
+ * at most once.
+ */
+
+import {
+  ChartConfig,
+  ChartDelta,
+  ComponentConfig,
+  ConfigDelta,
+  SeriesConfig,
+  SeriesOperation
+} from '../types'
+
+// Chart keys updated in place, like _PATCHABLE_CHART_KEYS in config_delta.py
+const PATCHABLE_CHART_KEYS = new Set(['chartId', 'chart', 'series'])
+
+// Series keys updated in place; a change to any other key recreates the series
+const PATCHABLE_SERIES_KEYS = new Set(['data', 'dataHash', 'options'])
+
+// FNV-1a 32-bit parameters
+const FNV_OFFSET = 0x811c9dc5
+const FNV_PRIME = 0x01000193
+
+// Second 32-bit lane, FNV-1a with another offset and multiplier: a 32-bit
+// hash alone collides too often to decide that data did not change
+const LANE_OFFSET = 0x9e3779b9
+const LANE_PRIME = 0x5bd1e995
+
+const float64 = new Float64Array(1)
+const float64Words = new Uint32Array(float64.buffer)
+
+const mixWord = (hash: number, word: number, prime: number): number =>
+  Math.imul(hash ^ word, prime) >>> 0
+
+const mixString = (hash: number, text: string, prime: number): number => {
+  for (let i = 0; i < text.length; i++) {
+    hash = mixWord(hash, text.charCodeAt(i), prime)
+  }
+  return hash
+}
+
+const mixValue = (hash: number, value: unknown, prime: number): number => {
+  switch (typeof value) {
+    case 'number':
+      float64[0] = value
+      return mixWord(mixWord(hash, float64Words[0], prime), float64Words[1], prime)
+    case 'string':
+      return mixWord(mixString(hash, value, prime), 0x22, prime)
+    case 'boolean':
+      return mixWord(hash, value ? 0x74 : 0x66, prime)
+    case 'undefined':
+      return mixWord(hash, 0x75, prime)
+    default:
+      return value === null
+        ? mixWord(hash, 0x6e, prime)
+        : mixString(hash, JSON.stringify(value), prime)
+  }
+}
+
+const hashLane = (
+  data: any[],
+  start: number,
+  stop: number,
+  hash: number,
+  prime: number
+): number => {
+  for (let i = start; i < stop; i++) {
+    const point = data[i]
+    if (point === null || typeof point !== 'object') {
+      hash = mixValue(hash, point, prime)
+      continue
+    }
+    for (const key in point) {
+      hash = mixValue(mixString(hash, key, prime), point[key], prime)
+    }
+    // Point separator
+    hash = mixWord(hash, 0x3b, prime)
+  }
+  return hash
+}
+
+/**
+ * 64-bit hash of data points, as two independent 32-bit lanes.
+ */
+export type PointsHash = [number, number]
+
+const EMPTY_HASH: PointsHash = [FNV_OFFSET, LANE_OFFSET]
+
+/**
+ * Hash data points [start, stop), continuing from `hash`.
+ */
+export function hashPoints(
+  data: any[],
+  start = 0,
+  stop = data.length,
+  hash: PointsHash = EMPTY_HASH
+): PointsHash {
+  return [
+    hashLane(data, start, stop, hash[0], FNV_PRIME),
+    hashLane(data, start, stop, hash[1], LANE_PRIME)
+  ]
+}
+
+const sameHash = (a: PointsHash, b: PointsHash): boolean => a[0] === b[0] && a[1] === b[1]
+
+export interface DataFingerprint {
+  length: number
+  // Hash of every point but the last, to recognize appended bars
+  head: PointsHash
+  // Hash of every point
+  full: PointsHash
+}
+
+const fingerprints = new WeakMap<any[], DataFingerprint>()
+
+/**
+ * Fingerprint of series data, computed once per data array.
+ */
+export function dataFingerprint(data: any[]): DataFingerprint {
+  let fingerprint = fingerprints.get(data)
+  if (!fingerprint) {
+    const head = hashPoints(data, 0, Math.max(0, data.length - 1))
+    const full = data.length > 0 ? hashPoints(data, data.length - 1, data.length, head) : head
+    fingerprint = {length: data.length, head, full}
+    fingerprints.set(data, fingerprint)
+  }
+  return fingerprint
+}
+
+/**
+ * Operation turning the old data into the new data, without its index, or
+ * null when the data did not change. New data that keeps every old point but
+ * the last, and the time of the last, is sent as bars to append (the first one
+ * updating the current last bar); anything else replaces the data. With
+ * `changed` set, as when the content hashes sent by Python differ, the data is
+ * never taken as unchanged, whatever the fingerprints.
+ */
+export function diffData(
+  oldData: any[],
+  newData: any[],
+  changed = false
+): {op: 'append' | 'setData'; data: any[]} | null {
+  if (oldData === newData && !changed) {
+    return null
+  }
+  const oldPrint = dataFingerprint(oldData)
+  const newPrint = dataFingerprint(newData)
+  if (!changed && oldPrint.length === newPrint.length && sameHash(oldPrint.full, newPrint.full)) {
+    return null
+  }
+  const last = oldPrint.length - 1
+  if (
+    last >= 0 &&
+    newPrint.length > last &&
+    newData[last] &&
+    oldData[last] &&
+    newData[last].time === oldData[last].time &&
+    sameHash(hashPoints(newData, 0, last), oldPrint.head)
+  ) {
+    return {op: 'append', data: newData.slice(last)}
+  }
+  return {op: 'setData', data: newData}
+}
+
+const sameJson = (a: unknown, b: unknown): boolean =>
+  a === b || JSON.stringify(a) === JSON.stringify(b)
+
+const differentKeys = (a: any, b: any, patchable: Set<string>): boolean => {
+  const keys = new Set([...Object.keys(a || {}), ...Object.keys(b || {})])
+  for (const key of keys) {
+    if (!patchable.has(key) && !sameJson(a?.[key], b?.[key])) {
+      return true
+    }
+  }
+  return false
+}
+
+/**
+ * Keys identifying the series of a chart across configs.
+ */
+export function seriesKeys(seriesList: SeriesConfig[]): string[] {
+  const seen = new Map<string, number>()
+  return seriesList.map(series => {
+    const base = `${series.type}|${series.paneId ?? 0}|${series.priceScaleId ?? ''}`
+    const rank = seen.get(base) || 0
+    seen.set(base, rank + 1)
+    return `${base}|${rank}`
+  })
+}
+
+function diffSeries(
+  oldSeries: SeriesConfig,
+  newSeries: SeriesConfig,
+  index: number
+): SeriesOperation[] {
+  if (oldSeries === newSeries) {
+    return []
+  }
+  if (differentKeys(oldSeries, newSeries, PATCHABLE_SERIES_KEYS)) {
+    return [{op: 'replace', index, series: newSeries}]
+  }
+  const operations: SeriesOperation[] = []
+  // Content hashes from Python decide over the fingerprints when both are sent
+  const hashed = oldSeries.dataHash !== undefined && newSeries.dataHash !== undefined
+  const dataOperation =
+    hashed && oldSeries.dataHash === newSeries.dataHash
+      ? null
+      : diffData(oldSeries.data || [], newSeries.data || [], hashed)
+  if (dataOperation) {
+    operations.push({...dataOperation, index})
+  }
+  if (!sameJson(oldSeries.options, newSeries.options)) {
+    operations.push({op: 'options', index, options: newSeries.options || {}})
+  }
+  return operations
+}
+
+/**
+ * Delta turning a mounted chart into a new one, or null if it must be rebuilt.
+ */
+export function reconcileChart(oldChart: ChartConfig, newChart: ChartConfig): ChartDelta | null {
+  if (oldChart.chartId === undefined || oldChart.chartId !== newChart.chartId) {
+    return null
+  }
+  if (differentKeys(oldChart, newChart, PATCHABLE_CHART_KEYS)) {
+    return null
+  }
+
+  const chartDelta: ChartDelta = {chartId: newChart.chartId, series: []}
+  if (!sameJson(oldChart.chart, newChart.chart)) {
+    chartDelta.options = newChart.chart
+  }
+
+  const oldList = oldChart.series || []
+  const newList = newChart.series || []
+  const oldKeys = seriesKeys(oldList)
+  const newKeys = seriesKeys(newList)
+  const newPositions = new Map(newKeys.map((key, index) => [key, index]))
+  const operations = chartDelta.series
+
+  // Remove series that are gone, from the end so that indexes stay valid
+  const kept: number[] = []
+  for (let index = oldList.length - 1; index >= 0; index--) {
+    if (newPositions.has(oldKeys[index])) {
+      kept.unshift(index)
+    } else {
+      operations.push({op: 'remove', index})
+    }
+  }
+  // Moving series is not supported: the kept ones must keep their order
+  for (let i = 1; i < kept.length; i++) {
+    if (newPositions.get(oldKeys[kept[i]])! < newPositions.get(oldKeys[kept[i - 1]])!) {
+      return null
+    }
+  }
+
+  // Walk the new list: kept series are updated, the others inserted
+  const oldByKey = new Map(kept.map(index => [oldKeys[index], oldList[index]]))
+  newList.forEach((series, index) => {
+    const oldSeries = oldByKey.get(newKeys[index])
+    if (oldSeries) {
+      operations.push(...diffSeries(oldSeries, series, index))
+    } else {
+      operations.push({op: 'add', index, series})
+    }
+  })
+  return chartDelta
+}
+
+/**
+ * Delta turning the config the charts were built from into a new full config,
+ * or null when the charts must be rebuilt (charts added, removed or moved, or
+ * changed annotations, trades, legends, tooltips or sync settings).
+ */
+export function reconcileConfig(
+  oldConfig: ComponentConfig,
+  newConfig: ComponentConfig
+): ConfigDelta | null {
+  const oldCharts = oldConfig.charts || []
+  const newCharts = newConfig.charts || []
+  if (oldCharts.length !== newCharts.length) {
+    return null
+  }
+  if (differentKeys(oldConfig, newConfig, new Set(['charts', 'version']))) {
+    return null
+  }
+  const charts: ChartDelta[] = []
+  for (let i = 0; i < oldCharts.length; i++) {
+    const chartDelta = reconcileChart(oldCharts[i], newCharts[i])
+    if (!chartDelta) {
+      return null
+    }
+    charts.push(chartDelta)
+  }
+  return {charts}
+}
+
+/**
+ * True when a delta changes nothing.
+ */
+export function isEmptyDelta(delta: ConfigDelta): boolean {
+  return delta.charts.every(chart => chart.options === undefined && chart.series.length === 0)
+}
@@ -15,6 +15,7 @@ import {createBandSeries, BandData} from '../bandSeriesPlugin'
 import {SignalSeries, createSignalSeriesPlugin} from '../signalSeriesPlugin'
 import {createTrendFillSeriesPlugin} from '../trendFillSeriesPlugin'
 import {cleanLineStyleOptions} from './lineStyle'
+import {getTimeIndex} from './timeIndex'
 import {createTradeVisualElements} from '../tradeVisualization'
 
 interface SeriesFactoryContext {
@@ -508,8 +509,11 @@ export function createSeries(
 
   if (seriesConfig.markers && Array.isArray(seriesConfig.markers)) {
     try {
-      // Apply timestamp snapping to all markers (like trade visualization)
-      const snappedMarkers = applyTimestampSnapping(seriesConfig.markers, data)
+      // Apply timestamp snapping to all markers (like trade visualization),
+      // unless their times were already aligned onto the bars in Python
+      const snappedMarkers = seriesConfig.timesAligned
+        ? seriesConfig.markers
+        : applyTimestampSnapping(seriesConfig.markers, data)
       createSeriesMarkers(series, snappedMarkers)
     } catch (error) {
       // Error handling
@@ -530,7 +534,13 @@ export function createSeries(
     try {
       // Create trade visual elements (markers, rectangles, annotations)
       const tradeOptions = seriesConfig.tradeVisualizationOptions
-      const visualElements = createTradeVisualElements(seriesConfig.trades, tradeOptions, data)
+      const visualElements = createTradeVisualElements(
+        seriesConfig.trades,
+        tradeOptions,
+        data,
+        undefined,
+        seriesConfig.timesAligned
+      )
 
       // Add trade markers to the series
       if (visualElements.markers && visualElements.markers.length > 0) {
@@ -571,41 +581,22 @@ function applyTimestampSnapping(markers: any[], chartData?: any[]): any[] {
     return markers
   }
 
-  // Extract available timestamps from chart data
-  const availableTimes = chartData
-    .map(item => {
-      if (typeof item.time === 'number') {
-        return item.time
-      } else if (typeof item.time === 'string') {
-        return Math.floor(new Date(item.time).getTime() / 1000)
-      }
-      return null
-    })
-    .filter(time => time !== null)
+  // Sorted timestamps of the chart data, shared with the trade visualization
+  const timeIndex = getTimeIndex(chartData)
 
-  if (availableTimes.length === 0) {
+  if (timeIndex.length === 0) {
     return markers
   }
 
   // Apply timestamp snapping to each marker
-  const snappedMarkers = markers.map((marker, index) => {
+  return markers.map(marker => {
     if (marker.time && typeof marker.time === 'number') {
-      // Find nearest available timestamp
-      const nearestTime = availableTimes.reduce((nearest, current) => {
-        const currentDiff = Math.abs(current - marker.time)
-        const nearestDiff = Math.abs(nearest - marker.time)
-        return currentDiff < nearestDiff ? current : nearest
-      })
-
-      // Return marker with snapped timestamp
+      // Return marker with the nearest available timestamp
       return {
         ...marker,
-        time: nearestTime
+        time: timeIndex.nearest(marker.time)
       }
-    } else {
-      return marker
     }
+    return marker
   })
-
-  return snappedMarkers
 }
@@ -0,0 +1,120 @@
+/**
+ * Viewport reporting
+ *
+ * Charts whose config has a `viewport` section tell Python which range the user
+ * is looking at, so that the next Streamlit rerun only ships that window at a
+ * suitable resolution (see charts/viewport.py). Panning and zooming fire many
+ * range changes per second, and every reported value triggers a rerun, so
+ * reports are debounced per chart and identical reports are dropped.
+ */
+
+import {IChartApi, Time} from 'lightweight-charts'
+import {toTimestamp} from './timeIndex'
+
+export const DEFAULT_VIEWPORT_DEBOUNCE_MS = 300
+
+export interface ViewportReport {
+  chartId: string
+  from: number
+  to: number
+  logicalFrom: number | null
+  logicalTo: number | null
+  width: number
+}
+
+/**
+ * UTC timestamp in seconds of a chart time: a number, a date string or a
+ * business day object.
+ */
+export function timeToSeconds(time: Time | unknown): number | null {
+  if (time && typeof time === 'object') {
+    const {year, month, day} = time as {year: number; month: number; day: number}
+    if ([year, month, day].every(Number.isFinite)) {
+      return Date.UTC(year, month - 1, day) / 1000
+    }
+    return null
+  }
+  return toTimestamp(time)
+}
+
+/**
+ * Viewport of a chart, or null while it shows no data.
+ */
+export function readViewport(chartId: string, chart: IChartApi): ViewportReport | null {
+  const timeScale = chart.timeScale()
+  const range = timeScale.getVisibleRange()
+  if (!range) {
+    return null
+  }
+  const from = timeToSeconds(range.from)
+  const to = timeToSeconds(range.to)
+  if (from === null || to === null) {
+    return null
+  }
+  const logicalRange = timeScale.getVisibleLogicalRange()
+  return {
+    chartId,
+    from: Math.floor(from),
+    to: Math.ceil(to),
+    logicalFrom: logicalRange ? logicalRange.from : null,
+    logicalTo: logicalRange ? logicalRange.to : null,
+    width: Math.round(timeScale.width())
+  }
+}
+
+const sameViewport = (a: ViewportReport, b: ViewportReport): boolean =>
+  a.chartId === b.chartId && a.from === b.from && a.to === b.to && a.width === b.width
+
+export interface ViewportReporter {
+  /** Schedule a report of the chart's viewport after `debounceMs` without changes */
+  schedule(chartId: string, chart: IChartApi, debounceMs?: number): void
+  /** Drop the scheduled reports, e.g. when the charts are removed */
+  cancel(): void
+}
+
+/**
+ * Debounced reporter calling `send` with the viewport of a chart once it has
+ * stopped moving. A viewport equal to the one last sent for the chart is not
+ * sent again, so restoring a range after new data arrives does not rerun the
+ * script once more.
+ */
+export function createViewportReporter(
+  send: (viewport: ViewportReport) => void
+): ViewportReporter {
+  const timers = new Map<string, ReturnType<typeof setTimeout>>()
+  const lastSent = new Map<string, ViewportReport>()
+
+  return {
+    schedule(chartId, chart, debounceMs = DEFAULT_VIEWPORT_DEBOUNCE_MS) {
+      const pending = timers.get(chartId)
+      if (pending !== undefined) {
+        clearTimeout(pending)
+      }
+      timers.set(
+        chartId,
+        setTimeout(() => {
+          timers.delete(chartId)
+          let viewport: ViewportReport | null = null
+          try {
+            viewport = readViewport(chartId, chart)
+          } catch (error) {
+            // Chart removed while the report was pending
+          }
+          if (!viewport) {
+            return
+          }
+          const previous = lastSent.get(chartId)
+          if (previous && sameViewport(previous, viewport)) {
+            return
+          }
+          lastSent.set(chartId, viewport)
+          send(viewport)
+        }, debounceMs)
+      )
+    },
+    cancel() {
+      timers.forEach(timer => clearTimeout(timer))
+      timers.clear()
+    }
+  }
+}
@@ -50,6 +50,8 @@ from streamlit_lightweight_charts_pro.type_definitions.enums import (
     ColorType,
     ColumnNames,
     CrosshairMode,
+    DataTransport,
+    DownsampleMethod,
     HorzAlign,
     LastPriceAnimationMode,
     LineStyle,
@@ -57,6 +59,7 @@ from streamlit_lightweight_charts_pro.type_definitions.enums import (
     MarkerPosition,
     MarkerShape,
     PriceScaleMode,
+    TimeAlignment,
     TrackingActivationMode,
     TrackingExitMode,
     TradeType,
@@ -84,6 +87,9 @@ __all__ = [
     "ColumnNames",
     "TradeType",
     "TradeVisualization",
+    "DataTransport",
+    "DownsampleMethod",
+    "TimeAlignment",
     # Colors
     "Background",
     "BackgroundSolid",
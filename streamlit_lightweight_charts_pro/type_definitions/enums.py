@@ -366,3 +366,61 @@ class TooltipPosition(str, Enum):
     CURSOR = "cursor"
     FIXED = "fixed"
     AUTO = "auto"
+
+
+class DataTransport(str, Enum):
+    """
+    Data transport enumeration.
+
+    Defines how the data points of a series are sent to the frontend.
+
+    Attributes:
+        JSON: JSON - one JSON object per data point.
+        COLUMNAR: Columnar - numeric fields are sent as binary float64 columns
+            next to the JSON payload and read as typed arrays by the frontend.
+    """
+
+    JSON = "json"
+    COLUMNAR = "columnar"
+
+
+class DownsampleMethod(str, Enum):
+    """
+    Downsampling method enumeration.
+
+    Defines how line-like series pick the points sent to the frontend when they
+    hold more points than the chart can show.
+
+    Attributes:
+        LTTB: Largest-Triangle-Three-Buckets - keeps the points that best
+            preserve the visual shape of the line.
+        MINMAX: Min-max - keeps the lowest and highest point of each bucket.
+        M4: M4 - keeps the first, lowest, highest and last point of each bucket.
+    """
+
+    LTTB = "lttb"
+    MINMAX = "minmax"
+    M4 = "m4"
+
+
+class TimeAlignment(str, Enum):
+    """
+    Time alignment enumeration.
+
+    Defines how the times of markers, trades and annotations are moved onto the
+    bar times of the chart before they are sent to the frontend.
+
+    Attributes:
+        NEAREST: Nearest - the nearest bar time, the earlier one on a tie.
+        PREVIOUS: Previous - the last bar time at or before the time; items
+            before the first bar are left out.
+        NEXT: Next - the first bar time at or after the time; items after the
+            last bar are left out.
+        DROP: Drop - times are kept, and items whose time is not a bar time
+            are left out.
+    """
+
+    NEAREST = "nearest"
+    PREVIOUS = "previous"
+    NEXT = "next"
+    DROP = "drop"
@@ -57,16 +57,88 @@ Author: Streamlit Lightweight Charts Contributors
 License: MIT
 """
 
-from typing import Any, Callable, Optional, Type, Union, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from .data_utils import (
     is_valid_color,
+    snake_to_camel,
     validate_min_move,
     validate_precision,
     validate_price_format_type,
 )
 
 
+class SerializedProperty(NamedTuple):
+    """
+    How a chainable property is written to the frontend configuration.
+
+    Attributes:
+        name (str): Attribute name of the property.
+        key (str): camelCase key in the configuration.
+        top_level (bool): Whether the value goes at the top level of the
+            configuration instead of its options.
+        allow_none (bool): Whether a None value is left out.
+        flatten (bool): Whether the dictionary of the value is merged into the
+            options (properties ending with "_options").
+    """
+
+    name: str
+    key: str
+    top_level: bool
+    allow_none: bool
+    flatten: bool
+
+
+# Serialization plans by class. chainable_property() clears them: the property
+# metadata is shared along a class hierarchy, so a decorator applied to one
+# class can change the plan of another.
+_serialization_plans: Dict[type, Tuple[SerializedProperty, ...]] = {}
+
+
+def serialization_plan(cls: type) -> Tuple[SerializedProperty, ...]:
+    """
+    Get the chainable properties of a class, as serialized by asdict().
+
+    The plan lists every public attribute of the class that was declared with
+    chainable_property(), in dir() order, with its configuration key and
+    placement. It is computed once per class and reused, so that serializing
+    an object does not reflect over its class every time.
+
+    Args:
+        cls (type): Class decorated with chainable_property().
+
+    Returns:
+        Tuple[SerializedProperty, ...]: The serialized properties, in order.
+    """
+    plan = _serialization_plans.get(cls)
+    if plan is None:
+        metadata = getattr(cls, "_chainable_properties", {})
+        plan = tuple(
+            SerializedProperty(
+                name=name,
+                key=snake_to_camel(name),
+                top_level=metadata[name]["top_level"],
+                allow_none=metadata[name]["allow_none"],
+                flatten=name.endswith("_options"),
+            )
+            for name in dir(cls)
+            if not name.startswith("_") and name in metadata
+        )
+        _serialization_plans[cls] = plan
+    return plan
+
+
 def _is_list_of_markers(value_type) -> bool:
     """
     Check if the type is List[MarkerBase] or similar.
@@ -108,7 +180,8 @@ def _validate_list_of_markers(value, attr_name: str) -> bool:
 
     This function performs runtime validation to ensure that a value is a list
     containing valid marker objects. It checks both the list structure and
-    the marker properties of each item.
+    the marker properties of each item. Markers stored as columns, in a
+    SeriesData of a marker class, are accepted as well.
 
     Args:
         value: The value to validate.
@@ -124,6 +197,16 @@ def _validate_list_of_markers(value, attr_name: str) -> bool:
         This function uses lazy loading to avoid circular import issues
         with the marker module.
     """
+    # Lazy load SeriesData to avoid circular imports
+    # pylint: disable=import-outside-toplevel
+    from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+
+    if isinstance(value, SeriesData):
+        from streamlit_lightweight_charts_pro.data.marker import MarkerBase
+
+        if not issubclass(value.data_class, MarkerBase):
+            raise TypeError(f"All items in {attr_name} must be instances of MarkerBase")
+        return True
     if not isinstance(value, list):
         raise TypeError(f"{attr_name} must be a list")
 
@@ -401,6 +484,7 @@ def chainable_property(
             "value_type": value_type,
             "top_level": top_level,
         }
+        _serialization_plans.clear()
 
         return cls
 
@@ -6,7 +6,8 @@ used throughout the library. It includes functions for time normalization,
 data validation, format conversion, and other common data operations.
 
 The module provides utilities for:
-    - Time conversion and normalization (UNIX timestamps)
+    - Time conversion and normalization (UNIX timestamps), for single values
+      and, vectorized, for whole columns
     - Color validation and format checking
     - String format conversion (snake_case to camelCase)
     - Data validation for chart configuration options
@@ -23,6 +24,7 @@ Example Usage:
 
     # Time normalization
     timestamp = normalize_time("2024-01-01T00:00:00")
+    timestamps = normalize_time_array(df["datetime"])  # int64 array
 
     # Color validation
     is_valid = is_valid_color("#FF0000")
@@ -38,10 +40,34 @@ License: MIT
 
 import re
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
+# Divisors from epoch units to seconds, by unit name
+_EPOCH_UNIT_DIVISORS = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+# Largest magnitude of an epoch value per unit when the unit is auto-detected.
+# 1e11 seconds is in the year 5138, so larger values cannot be seconds.
+_SECONDS_LIMIT = 10**11
+_EPOCH_UNIT_LIMITS = ((_SECONDS_LIMIT, "s"), (10**14, "ms"), (10**17, "us"))
+
+
+def _unit_of_magnitude(magnitude: float) -> str:
+    """Guess the unit of epoch values from their largest absolute value."""
+    for limit, unit in _EPOCH_UNIT_LIMITS:
+        if magnitude < limit:
+            return unit
+    return "ns"
+
+
+def _detect_epoch_unit(values: np.ndarray) -> str:
+    """Guess the unit of numeric epoch values from their largest magnitude."""
+    if len(values) == 0:
+        return "s"
+    return _unit_of_magnitude(np.abs(values).max())
+
 
 def normalize_time(time_value: Any) -> int:
     """
@@ -56,10 +82,12 @@ def normalize_time(time_value: Any) -> int:
 
     Args:
         time_value: Time value to convert. Supported types:
-            - int/float: Already in UNIX seconds
-            - str: Date/time string (parsed by pandas)
-            - datetime: Python datetime object
-            - pd.Timestamp: Pandas timestamp object
+            - int/float: UNIX epoch in seconds, milliseconds, microseconds or
+              nanoseconds, with the unit detected from the magnitude like
+              normalize_time_array() does
+            - str: Date/time string (parsed by pandas; naive strings are UTC)
+            - datetime: Python datetime object (naive values are local time)
+            - pd.Timestamp: Pandas timestamp object (naive values are UTC)
             - numpy types: Automatically converted to Python types
 
     Returns:
@@ -76,6 +104,7 @@ def normalize_time(time_value: Any) -> int:
 
         # Various input formats
         normalize_time(1640995200)  # 1640995200
+        normalize_time(1640995200000)  # 1640995200, read as milliseconds
         normalize_time("2024-01-01T00:00:00")  # 1704067200
         normalize_time(datetime(2024, 1, 1))  # 1704067200
         normalize_time(pd.Timestamp("2024-01-01"))  # 1704067200
@@ -86,6 +115,13 @@ def normalize_time(time_value: Any) -> int:
         a wide variety of date/time formats including ISO format, common
         date formats, and relative dates.
     """
+    # Fast path for values that are already UNIX seconds
+    if (
+        type(time_value) is int  # pylint: disable=unidiomatic-typecheck
+        and -_SECONDS_LIMIT < time_value < _SECONDS_LIMIT
+    ):
+        return time_value
+
     # Handle numpy types by converting to Python native types
     if hasattr(time_value, "item"):
         time_value = time_value.item()
@@ -98,9 +134,9 @@ def normalize_time(time_value: Any) -> int:
             time_value = int(time_value) if hasattr(time_value, "__int__") else float(time_value)
 
     if isinstance(time_value, int):
-        return time_value
+        return time_value // _EPOCH_UNIT_DIVISORS[_unit_of_magnitude(abs(time_value))]
     if isinstance(time_value, float):
-        return int(time_value)
+        return int(time_value / _EPOCH_UNIT_DIVISORS[_unit_of_magnitude(abs(time_value))])
     if isinstance(time_value, str):
         # Try to parse and normalize the string
         try:
@@ -115,6 +151,132 @@ def normalize_time(time_value: Any) -> int:
     raise TypeError(f"Unsupported time type: {type(time_value)}")
 
 
+def normalize_time_array(values: Any, unit: Optional[str] = None) -> np.ndarray:
+    """
+    Convert a whole column of time values to int64 UNIX seconds.
+
+    Vectorized counterpart of normalize_time() used by all DataFrame ingestion
+    paths. The conversion happens in one pass over the column instead of one
+    call per value.
+
+    Supported inputs:
+        - NumPy datetime64 arrays, pandas DatetimeIndex and datetime Series
+        - Timezone-aware Series/DatetimeIndex (converted to UTC)
+        - Epoch integers or floats in seconds, milliseconds, microseconds or
+          nanoseconds (unit auto-detected from the magnitude unless given)
+        - Date/time strings and datetime/Timestamp objects (parsed with
+          pandas.to_datetime; timezone offsets are honored). Like in
+          normalize_time(), naive strings and Timestamps are UTC, while naive
+          Python datetime objects are local time.
+
+    Args:
+        values: Array-like time values (NumPy array, pandas Series/Index or list).
+        unit (Optional[str]): Epoch unit of numeric input, one of "s", "ms",
+            "us" or "ns". Auto-detected when None.
+
+    Returns:
+        np.ndarray: int64 array of UNIX timestamps in seconds.
+
+    Raises:
+        ValueError: If the column contains missing values, unparseable strings,
+            or an unknown unit.
+        TypeError: If an element has an unsupported type.
+
+    Example:
+        ```python
+        normalize_time_array(pd.date_range("2024-01-01", periods=2, freq="D"))
+        # array([1704067200, 1704153600])
+        normalize_time_array(np.array([1704067200000, 1704153600000]))  # milliseconds
+        # array([1704067200, 1704153600])
+        normalize_time_array(["2024-01-01", "2024-01-02T00:00:00+00:00"])
+        # array([1704067200, 1704153600])
+        ```
+
+    Note:
+        Numeric columns have their unit detected from the largest absolute
+        value: below 1e11 seconds, below 1e14 milliseconds, below 1e17
+        microseconds, otherwise nanoseconds. normalize_time() detects the unit
+        of a single value the same way.
+    """
+    if unit is not None and unit not in _EPOCH_UNIT_DIVISORS:
+        raise ValueError(f"Invalid epoch unit: {unit!r}. Must be one of s, ms, us, ns")
+
+    if isinstance(getattr(values, "dtype", None), pd.DatetimeTZDtype):
+        values = pd.DatetimeIndex(values).tz_convert("UTC").tz_localize(None)
+    values = np.asarray(values)
+
+    if values.dtype.kind == "O" and len(values) > 0:
+        inferred = pd.api.types.infer_dtype(values, skipna=False)
+        if inferred in ("integer", "floating", "mixed-integer-float"):
+            values = values.astype(np.float64 if inferred != "integer" else np.int64)
+        elif inferred in ("mixed", "mixed-integer"):
+            # Epoch numbers mixed with strings or datetime objects: convert each
+            # group separately, since pandas would read the numbers as nanoseconds
+            is_number = np.fromiter(
+                (
+                    isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+                    for value in values
+                ),
+                dtype=bool,
+                count=len(values),
+            )
+            if is_number.any() and not is_number.all():
+                result = np.empty(len(values), dtype=np.int64)
+                result[is_number] = normalize_time_array(values[is_number].astype(np.float64), unit)
+                result[~is_number] = _parse_time_objects(values[~is_number])
+                return result
+
+    kind = values.dtype.kind
+    if kind == "M":
+        if np.isnat(values).any():
+            raise ValueError("time column must not contain missing values")
+        return values.astype("datetime64[s]").view(np.int64)
+    if kind in "iu":
+        values = values.astype(np.int64)
+        return values // _EPOCH_UNIT_DIVISORS[unit or _detect_epoch_unit(values)]
+    if kind == "f":
+        if np.isnan(values).any():
+            raise ValueError("time column must not contain missing values")
+        divisor = _EPOCH_UNIT_DIVISORS[unit or _detect_epoch_unit(values)]
+        return np.trunc(values / divisor).astype(np.int64)
+    if kind in "OUS":
+        return _parse_time_objects(values)
+    raise TypeError(f"Unsupported time column dtype: {values.dtype}")
+
+
+def _parse_time_objects(values: np.ndarray) -> np.ndarray:
+    """Parse strings and datetime objects in one pandas call, per value as a fallback."""
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+    if pd.isna(values).any():
+        raise ValueError("time column must not contain missing values")
+    # Naive datetime objects are local time, as datetime.timestamp() reads them
+    if pd.api.types.infer_dtype(values, skipna=False) != "string":
+        is_local = np.fromiter(
+            (
+                isinstance(value, datetime)
+                and not isinstance(value, pd.Timestamp)
+                and value.tzinfo is None
+                for value in values
+            ),
+            dtype=bool,
+            count=len(values),
+        )
+        if is_local.any():
+            result = np.empty(len(values), dtype=np.int64)
+            result[is_local] = [int(value.timestamp()) for value in values[is_local]]
+            result[~is_local] = _parse_time_objects(values[~is_local])
+            return result
+    for fmt in (None, "mixed"):
+        try:
+            parsed = pd.to_datetime(values, utc=True, format=fmt)
+        except (ValueError, TypeError, OverflowError):
+            continue
+        return parsed.tz_localize(None).to_numpy().astype("datetime64[s]").view(np.int64)
+    # Values pandas cannot parse together: report the offending value
+    return np.fromiter((normalize_time(value) for value in values), np.int64, len(values))
+
+
 def to_utc_timestamp(time_value: Any) -> int:
     """
     Convert time input to int UNIX seconds.
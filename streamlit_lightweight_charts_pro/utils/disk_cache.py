@@ -0,0 +1,385 @@
+"""
+Persistent on-disk cache of converted and serialized series data.
+
+The in-memory caches of this package (ConversionCache for DataFrame
+conversions, PayloadCache for serialized series data) start empty with every
+process, so the first render after a restart converts and encodes every large
+historical chart again. DiskCache keeps both results in a directory instead,
+addressed by a hash of their content:
+
+- Series.from_dataframe() and series built from a DataFrame that miss the
+  ConversionCache look the converted columns up by a hash of every value of
+  the index and the mapped columns, the data class and the column mapping, and
+  skip the pandas conversion on a hit.
+- Chart.to_frontend_config() looks the serialized data of large series up by
+  their SeriesData.content_hash, and skips encoding them on a hit.
+
+Each entry is a directory of NumPy .npy files, raw byte blobs and a small JSON
+description. Entries are written to a temporary directory first and renamed
+into place, so concurrent processes never read a partial entry, and they are
+read back as read-only memory maps, so their pages are loaded on use and
+shared by the processes reading them. Each cache keeps a running total of
+the size of its entries, measured once and then increased by every entry it
+writes; when that total exceeds max_bytes, the directory is scanned and the
+least recently used entries (by modification time, refreshed on every hit)
+are deleted.
+
+The cache is off by default. Enable it once per process, e.g. at the top of
+the Streamlit script:
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.utils.disk_cache import enable_disk_cache
+
+    cache = enable_disk_cache("/var/cache/charts", max_bytes=4 * 1024**3)
+    print(cache.hits, cache.misses, cache.nbytes)
+    ```
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+from streamlit_lightweight_charts_pro.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default size budget of a cache directory
+DEFAULT_DISK_CACHE_BYTES = 2 * 1024 * 1024 * 1024
+
+# Bumped whenever the layout of entries or of the cached data changes
+_FORMAT_VERSION = 1
+
+# File describing an entry, written last
+_META_FILE = "meta.json"
+
+# Prefix of entries being written
+_TEMPORARY_PREFIX = ".tmp-"
+
+
+class DiskEntry(NamedTuple):
+    """
+    Contents of a cache entry.
+
+    Attributes:
+        meta (Dict[str, Any]): JSON description stored with the entry.
+        arrays (Dict[str, np.ndarray]): Read-only arrays, memory-mapped where
+            possible.
+        blobs (Dict[str, Any]): Read-only bytes-like blobs, memory-mapped where
+            possible.
+    """
+
+    meta: Dict[str, Any]
+    arrays: Dict[str, np.ndarray]
+    blobs: Dict[str, Any]
+
+
+def disk_key(*parts: Any) -> str:
+    """
+    Build the key of an entry from the repr() of its parts.
+
+    Args:
+        *parts (Any): Values identifying the entry, with a stable repr().
+
+    Returns:
+        str: Hexadecimal BLAKE2b digest, also covering the cache format version.
+    """
+    digest = hashlib.blake2b(repr((_FORMAT_VERSION, parts)).encode("utf-8"), digest_size=20)
+    return digest.hexdigest()
+
+
+def _write_array(path: str, array: np.ndarray) -> Optional[str]:
+    """Write an array next to an entry; return its kind, or None if it cannot be stored."""
+    if array.dtype.kind == "O":
+        values = array.tolist()
+        if not all(value is None or isinstance(value, str) for value in values):
+            return None
+        with open(path + ".json", "w", encoding="utf-8") as file:
+            json.dump(values, file, ensure_ascii=False)
+        return "strings"
+    np.save(path + ".npy", np.ascontiguousarray(array), allow_pickle=False)
+    return "npy"
+
+
+def _read_array(path: str, kind: str) -> np.ndarray:
+    """Read an array written by _write_array()."""
+    if kind == "strings":
+        with open(path + ".json", encoding="utf-8") as file:
+            values = json.load(file)
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        array.flags.writeable = False
+        return array
+    try:
+        # A plain read-only ndarray over the memory map
+        return np.asarray(np.load(path + ".npy", mmap_mode="r", allow_pickle=False))
+    except ValueError:
+        # Empty arrays cannot be memory-mapped
+        array = np.load(path + ".npy", allow_pickle=False)
+        array.flags.writeable = False
+        return array
+
+
+def _read_blob(path: str) -> Any:
+    """Memory-map a blob read-only; empty blobs are returned as bytes."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        # The mapping stays valid after the file is closed
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _entry_size(path: str) -> int:
+    """Return the total size of the files of an entry, in bytes."""
+    size = 0
+    with os.scandir(path) as files:
+        for file in files:
+            size += file.stat().st_size
+    return size
+
+
+class DiskCache:
+    """
+    Content-addressed cache of arrays and blobs in a directory, bounded in size.
+
+    Attributes:
+        directory (str): Directory holding the entries.
+        max_bytes (int): Maximum total size of the entries, in bytes.
+        hits (int): Lookups served from the directory.
+        misses (int): Lookups that found no entry.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_DISK_CACHE_BYTES):
+        """
+        Open a cache directory, creating it if needed.
+
+        Args:
+            directory (str): Directory holding the entries.
+            max_bytes (int): Maximum total size of the entries, in bytes.
+        """
+        self.directory = os.path.abspath(os.fspath(directory))
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Size of the entries as of the last scan, plus the entries written
+        # since; None until the first scan. Entries written by other processes
+        # are only counted by the next scan.
+        self._tracked_bytes: Optional[int] = None
+        # Serializes the eviction scans and the size updates of this process
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Return the directory of the entry stored under key."""
+        return os.path.join(self.directory, key[:2], key)
+
+    def _entries(self):
+        """Yield the directory entries of every complete cache entry."""
+        with os.scandir(self.directory) as shards:
+            for shard in shards:
+                if shard.name.startswith(_TEMPORARY_PREFIX) or not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as entries:
+                    yield from (entry for entry in entries if entry.is_dir())
+
+    @property
+    def nbytes(self) -> int:
+        """Return the total size of the entries, in bytes."""
+        total = 0
+        for entry in self._entries():
+            try:
+                total += _entry_size(entry.path)
+            except OSError:
+                # Evicted by another process meanwhile
+                continue
+        return total
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return sum(1 for _ in self._entries())
+
+    def get(self, key: str) -> Optional[DiskEntry]:
+        """
+        Read the entry stored under key and mark it as recently used.
+
+        Args:
+            key (str): Key of the entry, see disk_key().
+
+        Returns:
+            Optional[DiskEntry]: The entry, or None if there is none (or it
+                cannot be read).
+        """
+        path = self._path(key)
+        try:
+            with open(os.path.join(path, _META_FILE), encoding="utf-8") as file:
+                description = json.load(file)
+            arrays = {
+                name: _read_array(os.path.join(path, f"a{number}"), kind)
+                for number, (name, kind) in enumerate(description["arrays"])
+            }
+            blobs = {
+                name: _read_blob(os.path.join(path, f"b{number}.bin"))
+                for number, name in enumerate(description["blobs"])
+            }
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning("Ignoring unreadable disk cache entry %s: %s", path, error)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return DiskEntry(description["meta"], arrays, blobs)
+
+    def put(
+        self,
+        key: str,
+        meta: Dict[str, Any],
+        arrays: Optional[Mapping[str, np.ndarray]] = None,
+        blobs: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        """
+        Store an entry under key, then evict entries if they exceed max_bytes.
+
+        Nothing is written if the entry already exists. Object arrays can only
+        be stored when they hold strings and None.
+
+        Args:
+            key (str): Key of the entry, see disk_key().
+            meta (Dict[str, Any]): JSON-serializable description of the entry.
+            arrays (Optional[Mapping[str, np.ndarray]]): Arrays to store.
+            blobs (Optional[Mapping[str, Any]]): Bytes-like blobs to store.
+
+        Returns:
+            bool: Whether the entry is in the cache.
+        """
+        path = self._path(key)
+        if os.path.isdir(path):
+            return True
+        temporary = None
+        try:
+            temporary = tempfile.mkdtemp(prefix=_TEMPORARY_PREFIX, dir=self.directory)
+            kinds = []
+            for number, (name, array) in enumerate((arrays or {}).items()):
+                kind = _write_array(os.path.join(temporary, f"a{number}"), np.asarray(array))
+                if kind is None:
+                    return False
+                kinds.append((name, kind))
+            for number, blob in enumerate((blobs or {}).values()):
+                with open(os.path.join(temporary, f"b{number}.bin"), "wb") as file:
+                    file.write(blob)
+            with open(os.path.join(temporary, _META_FILE), "w", encoding="utf-8") as file:
+                json.dump({"meta": meta, "arrays": kinds, "blobs": list(blobs or {})}, file)
+            size = _entry_size(temporary)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                os.rename(temporary, path)
+            except OSError:
+                # Another process stored the same entry first
+                if not os.path.isdir(path):
+                    raise
+                size = 0
+            else:
+                temporary = None
+        except (OSError, TypeError, ValueError) as error:
+            logger.warning("Could not write disk cache entry %s: %s", path, error)
+            return False
+        finally:
+            if temporary is not None:
+                shutil.rmtree(temporary, ignore_errors=True)
+        with self._lock:
+            if self._tracked_bytes is not None:
+                self._tracked_bytes += size
+            full = self._tracked_bytes is None or self._tracked_bytes > self.max_bytes
+        if full:
+            self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Scan the directory and delete the least recently used entries beyond max_bytes."""
+        with self._lock:
+            entries = []
+            for entry in self._entries():
+                try:
+                    entries.append((entry.stat().st_mtime, _entry_size(entry.path), entry.path))
+                except OSError:
+                    continue
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                # Readers keep their memory maps of deleted files on POSIX
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+            self._tracked_bytes = total
+
+    def clear(self) -> None:
+        """Delete every entry and reset the counters."""
+        with self._lock:
+            for entry in list(self._entries()):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            self._tracked_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class _DiskCacheSlot:
+    """Holder of the cache used by series and charts, None while disabled."""
+
+    __slots__ = ("cache",)
+
+    def __init__(self) -> None:
+        """Start with the disk cache disabled."""
+        self.cache: Optional[DiskCache] = None
+
+
+_active_disk_cache = _DiskCacheSlot()
+
+
+def enable_disk_cache(directory: str, max_bytes: int = DEFAULT_DISK_CACHE_BYTES) -> DiskCache:
+    """
+    Keep converted and serialized series data in a directory.
+
+    Calling it again with the same directory (e.g. on every script rerun)
+    keeps the current cache and only updates its size budget.
+
+    Args:
+        directory (str): Directory holding the entries, created if needed.
+        max_bytes (int): Maximum total size of the entries, in bytes.
+
+    Returns:
+        DiskCache: The cache now in use.
+    """
+    cache = _active_disk_cache.cache
+    if cache is None or cache.directory != os.path.abspath(os.fspath(directory)):
+        cache = _active_disk_cache.cache = DiskCache(directory, max_bytes)
+    elif cache.max_bytes != max_bytes:
+        cache.max_bytes = max_bytes
+        cache.evict()
+    return cache
+
+
+def disable_disk_cache() -> None:
+    """Stop using the disk cache; the entries are left in the directory."""
+    _active_disk_cache.cache = None
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    Return the disk cache in use.
+
+    Returns:
+        Optional[DiskCache]: The cache, or None while it is disabled.
+    """
+    return _active_disk_cache.cache
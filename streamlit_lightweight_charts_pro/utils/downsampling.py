@@ -0,0 +1,184 @@
+"""
+Downsampling of line-like series for streamlit-lightweight-charts.
+
+A chart a thousand pixels wide cannot show more than a few thousand distinct
+positions, yet line, area, baseline and histogram series send every point to
+the browser. This module picks the points worth sending, with NumPy operations
+over whole buckets of points:
+
+    - LTTB (Largest-Triangle-Three-Buckets) keeps, in each bucket, the point
+      forming the largest triangle with the point kept in the previous bucket
+      and the average of the next one, which follows the visual shape closely.
+    - Min-max keeps the lowest and highest point of each bucket.
+    - M4 keeps the first, lowest, highest and last point of each bucket, which
+      draws the same pixels as all the points when a bucket maps to a pixel.
+
+Lightweight-charts spaces points evenly whatever their times, so the buckets
+hold equal numbers of points and the position of a point is its x coordinate.
+All methods keep the first and last points and the lowest and highest values,
+and return the positions of the kept points in ascending order.
+
+Example:
+    ```python
+    import numpy as np
+
+    from streamlit_lightweight_charts_pro.utils.downsampling import downsample_indices
+
+    values = np.cumsum(np.random.standard_normal(5_000_000))
+    kept = downsample_indices(values, "lttb", 2000)  # 2000 positions
+    ```
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+
+from streamlit_lightweight_charts_pro.type_definitions.enums import DownsampleMethod
+
+# Number of points sent when downsampling without an explicit target
+DEFAULT_DOWNSAMPLE_POINTS = 2000
+
+# Smallest target, enough for the first, last, lowest and highest points
+MIN_DOWNSAMPLE_POINTS = 4
+
+
+def _bucket_edges(length: int, buckets: int) -> np.ndarray:
+    """Split length points into buckets of nearly equal size, as buckets + 1 edges."""
+    return (np.arange(buckets + 1, dtype=np.int64) * length) // buckets
+
+
+def _bucket_extrema(values: np.ndarray, edges: np.ndarray):
+    """Return the positions of the first lowest and first highest value of each bucket."""
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    positions = []
+    for reduce in (np.minimum, np.maximum):
+        extrema = np.repeat(reduce.reduceat(values, starts), sizes)
+        matches = np.flatnonzero(values == extrema)
+        # Matches are in ascending order, so the first match of a bucket comes first
+        buckets = np.searchsorted(edges, matches, side="right") - 1
+        _, first = np.unique(buckets, return_index=True)
+        positions.append(matches[first])
+    return positions[0], positions[1]
+
+
+def lttb_indices(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are kept and the others are split into points - 2
+    buckets. Buckets depend on the point kept in the previous one, so they are
+    visited in order, but the areas within a bucket and the bucket averages are
+    computed with array operations.
+
+    Args:
+        values (np.ndarray): Float values of the points, without NaN.
+        points (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Ascending positions of the kept points.
+    """
+    length = len(values)
+    if points >= length:
+        return np.arange(length)
+    if points <= 2:
+        return np.array([0, length - 1][:points], dtype=np.int64)
+
+    buckets = points - 2
+    # Bucket b holds positions edges[b]:edges[b + 1]; the last edge segment is the last point
+    edges = np.minimum((np.arange(points, dtype=np.int64) * (length - 2)) // buckets + 1, length)
+    sizes = np.diff(edges)
+    average_x = (edges[:-1] + edges[1:] - 1) / 2.0
+    average_y = np.add.reduceat(values, edges[:-1]) / sizes
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+    previous = 0
+    for bucket in range(buckets):
+        start, stop = edges[bucket], edges[bucket + 1]
+        ax, ay = float(previous), values[previous]
+        cx, cy = average_x[bucket + 1], average_y[bucket + 1]
+        area = np.abs(
+            (ax - cx) * (values[start:stop] - ay) - (ax - np.arange(start, stop)) * (cy - ay)
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def minmax_indices(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Select the lowest and highest point of each bucket, and the first and last points.
+
+    Args:
+        values (np.ndarray): Float values of the points, without NaN.
+        points (int): Maximum number of points to keep.
+
+    Returns:
+        np.ndarray: Ascending positions of the kept points.
+    """
+    length = len(values)
+    if points >= length:
+        return np.arange(length)
+    edges = _bucket_edges(length, max((points - 2) // 2, 1))
+    lowest, highest = _bucket_extrema(values, edges)
+    return np.unique(np.concatenate(([0, length - 1], lowest, highest)))
+
+
+def m4_indices(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Select the first, lowest, highest and last point of each bucket.
+
+    Args:
+        values (np.ndarray): Float values of the points, without NaN.
+        points (int): Maximum number of points to keep.
+
+    Returns:
+        np.ndarray: Ascending positions of the kept points.
+    """
+    length = len(values)
+    if points >= length:
+        return np.arange(length)
+    edges = _bucket_edges(length, max(points // 4, 1))
+    lowest, highest = _bucket_extrema(values, edges)
+    return np.unique(np.concatenate((edges[:-1], edges[1:] - 1, lowest, highest)))
+
+
+def downsample_indices(
+    values: np.ndarray, method: Union[DownsampleMethod, str], points: int
+) -> Optional[np.ndarray]:
+    """
+    Select at most points points of a series with the given method.
+
+    NaN values count as 0.0, the value they are sent with. LTTB is run for two
+    points fewer than the target so that the lowest and highest values can be
+    added.
+
+    Args:
+        values (np.ndarray): Values of the points, in series order.
+        method (Union[DownsampleMethod, str]): Downsampling method.
+        points (int): Maximum number of points to keep.
+
+    Returns:
+        Optional[np.ndarray]: Ascending positions of the kept points, or None
+            when the series has no more than points points.
+
+    Raises:
+        ValueError: If method is not a DownsampleMethod or points is too small.
+    """
+    method = DownsampleMethod(method)
+    if points < MIN_DOWNSAMPLE_POINTS:
+        raise ValueError(f"points must be at least {MIN_DOWNSAMPLE_POINTS}, got {points}")
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= points:
+        return None
+    values = np.where(np.isnan(values), 0.0, values)
+
+    if method == DownsampleMethod.MINMAX:
+        return minmax_indices(values, points)
+    if method == DownsampleMethod.M4:
+        return m4_indices(values, points)
+    selected = lttb_indices(values, points - 2)
+    extrema = [int(np.argmin(values)), int(np.argmax(values))]
+    return np.unique(np.concatenate((selected, extrema)))
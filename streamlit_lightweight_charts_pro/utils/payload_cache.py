@@ -0,0 +1,260 @@
+"""
+Process-wide cache of serialized series data for streamlit-lightweight-charts.
+
+Every Streamlit session runs its own script, so when many sessions show the
+same data (say, the dashboard of a popular symbol), each of them would encode
+the same points and keep its own copy of the result. Series.asdict_encoded()
+looks the encoded data of large series up here instead, by the content hash
+of their SeriesData (see SeriesData.content_hash) and the serialization
+format, so that sessions showing the same points share one EncodedRows,
+joined into its JSON array once and kept only in that form, or one
+ColumnarData.
+
+Cached payloads are frozen and shared: they must not be modified. The cache
+is bounded in entries and in resident bytes, evicts the least recently used
+payloads first and is safe to use from concurrent script runs. When several
+sessions miss the same payload at once, one of them encodes it while the
+others wait for the result. With the disk cache enabled (see
+utils.disk_cache), payloads missing here are read back from the disk before
+being encoded, and newly encoded ones are written to it.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.utils.payload_cache import payload_cache
+
+    stats = payload_cache.stats()
+    print(f"{stats.hit_rate:.0%} hits, {stats.resident_bytes / 2**20:.0f} MiB")
+    payload_cache.max_bytes = 512 * 1024 * 1024
+    ```
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from streamlit_lightweight_charts_pro.utils.disk_cache import disk_key, get_disk_cache
+from streamlit_lightweight_charts_pro.utils.serialization import (
+    ColumnarData,
+    EncodedRows,
+    json_backend,
+)
+
+# Serialized series data
+Payload = Union[EncodedRows, ColumnarData]
+
+# Bounds of the process-wide cache
+DEFAULT_PAYLOAD_CACHE_ENTRIES = 64
+DEFAULT_PAYLOAD_CACHE_BYTES = 1024 * 1024 * 1024
+
+# Series with fewer points are cheap to encode and are not cached
+MIN_SHARED_POINTS = 1000
+
+
+@dataclass(frozen=True)
+class PayloadCacheStats:
+    """
+    Snapshot of the counters of a PayloadCache.
+
+    Attributes:
+        hits (int): Lookups served from the cache, including those that waited
+            for another script run to encode the payload.
+        misses (int): Lookups that encoded the payload.
+        entries (int): Number of cached payloads.
+        resident_bytes (int): Approximate memory used by the cached payloads.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    resident_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups served from the cache, 0.0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Pending:
+    """Payload being encoded by one script run, awaited by the others."""
+
+    __slots__ = ("done", "payload")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.payload: Optional[Payload] = None
+
+
+class PayloadCache:
+    """
+    Least recently used cache of frozen series payloads, shared by all sessions.
+
+    Attributes:
+        max_entries (int): Maximum number of payloads kept; 0 disables the cache.
+        max_bytes (int): Maximum approximate memory used by the payloads, in bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PAYLOAD_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_PAYLOAD_CACHE_BYTES,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of payloads kept.
+            max_bytes (int): Maximum approximate memory used by the payloads, in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Payload]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached payloads."""
+        return len(self._entries)
+
+    def stats(self) -> PayloadCacheStats:
+        """
+        Return the counters of the cache.
+
+        Returns:
+            PayloadCacheStats: Hits, misses, entries and resident bytes.
+        """
+        with self._lock:
+            return PayloadCacheStats(
+                self._hits, self._misses, len(self._entries), self._resident_bytes
+            )
+
+    def get(self, key: Hashable, encode: Callable[[], Payload]) -> Payload:
+        """
+        Return the payload cached under key, encoding and caching it on a miss.
+
+        Args:
+            key (Hashable): Content hash and serialization format of the data.
+            encode (Callable[[], Payload]): Builds the payload on a miss.
+
+        Returns:
+            Payload: The frozen payload, possibly shared with other sessions.
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return payload
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _Pending()
+                self._misses += 1
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            pending.done.wait()
+            if pending.payload is not None:
+                with self._lock:
+                    self._hits += 1
+                return pending.payload
+            # The encoding failed in the other script run: try again here
+            return encode()
+
+        try:
+            payload = encode().freeze()
+            pending.payload = payload
+            self._store(key, payload)
+            return payload
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
+
+    def clear(self) -> None:
+        """Drop every payload and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._resident_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _store(self, key: Hashable, payload: Payload) -> None:
+        """Cache a payload, evicting the least recently used ones beyond the bounds."""
+        size = payload.nbytes
+        with self._lock:
+            if self.max_entries <= 0 or size > self.max_bytes:
+                return
+            self._entries[key] = payload
+            self._sizes[key] = size
+            self._resident_bytes += size
+            while len(self._entries) > self.max_entries or self._resident_bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self._resident_bytes -= self._sizes.pop(evicted)
+
+
+# Cache shared by every series of the process
+payload_cache = PayloadCache()
+
+
+def shared_payload(data: Any, columnar: bool = False) -> Payload:
+    """
+    Serialize series data through the process-wide payload cache.
+
+    Args:
+        data (SeriesData): Series data to serialize.
+        columnar (bool): Whether to build ColumnarData instead of EncodedRows.
+
+    Returns:
+        Payload: data.columnar() or data.encoded(), shared when data is large
+            and has a content hash.
+    """
+    encode = data.columnar if columnar else data.encoded
+    if payload_cache.max_entries <= 0 or len(data) < MIN_SHARED_POINTS:
+        return encode()
+    content_hash = data.content_hash
+    if content_hash is None:
+        return encode()
+    # Encoded numbers differ between the JSON backends
+    key = (content_hash, "columns" if columnar else "rows", json_backend())
+    return payload_cache.get(key, lambda: _stored_payload(key, encode))
+
+
+def _stored_payload(key: Tuple[Any, ...], encode: Callable[[], Payload]) -> Payload:
+    """Read a payload from the disk cache, or encode it and store it there."""
+    disk = get_disk_cache()
+    if disk is None:
+        return encode()
+    entry_key = disk_key("payload", *key)
+    entry = disk.get(entry_key)
+    if entry is not None:
+        if key[1] == "rows":
+            return EncodedRows.from_json(
+                entry.blobs["json"],
+                entry.arrays["bounds"],
+                entry.arrays["times"],
+                entry.meta["content_hash"],
+            )
+        return ColumnarData(
+            entry.meta["keys"], entry.arrays, entry.meta["values"], entry.meta["constants"]
+        )
+
+    payload = encode().freeze()
+    if isinstance(payload, EncodedRows):
+        disk.put(
+            entry_key,
+            {"content_hash": payload.content_hash},
+            arrays={"bounds": payload.row_bounds(), "times": payload.times},
+            blobs={"json": payload.to_json()},
+        )
+    else:
+        meta = {"keys": payload.keys, "values": payload.values, "constants": payload.constants}
+        disk.put(entry_key, meta, arrays=payload.numeric)
+    return payload
@@ -0,0 +1,707 @@
+"""
+Fast JSON serialization for streamlit-lightweight-charts.
+
+Chart payloads are dominated by series data: one JSON object per data point.
+Building a Python dictionary per point and letting Streamlit encode the result
+costs several times the size of the data in memory and most of the render
+time. This module writes data points straight from NumPy columns into compact
+JSON instead:
+
+- encode_column() turns a numeric column into one JSON token per value.
+- encode_rows() joins column tokens into one JSON object per data point.
+- EncodedRows holds the encoded points of a series, and can stand in for the
+  list of point dictionaries anywhere in a payload.
+- dumps() encodes a whole payload, splicing EncodedRows in as they are.
+
+For large series, ColumnarData keeps the numeric fields as arrays instead:
+encode_payload() writes them as raw little-endian float64 buffers next to the
+JSON payload, which the frontend reads back as typed arrays without parsing one
+JSON number per value.
+
+orjson is used when it is installed; otherwise the standard library json module
+produces the same output, more slowly.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.utils.serialization import dumps
+
+    payload = dumps({"charts": [...], "syncConfig": {...}})  # bytes
+    payload, buffers = encode_payload({"charts": [...]})  # ColumnarData as buffers
+    ```
+"""
+
+import hashlib
+import io
+import itertools
+import json
+import re
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# A JSON token: bytes when encoding with orjson, str with the json module
+Token = Union[bytes, str]
+
+# Stand-in string for EncodedRows inside a payload, replaced after encoding.
+# Private use characters do not occur in chart configuration.
+_PLACEHOLDER = "\ue000{}\ue000"
+_PLACEHOLDER_PATTERN = re.compile('"\ue000(\\d+)\ue000"'.encode("utf-8"))
+
+# Number of encoded points joined at a time when writing a payload
+_JOIN_CHUNK_SIZE = 65536
+
+# Key of the descriptor that encode_payload() writes in place of ColumnarData
+COLUMNAR_KEY = "$columnar"
+
+# Size in bytes of the content hashes of EncodedRows and ColumnarData
+_CONTENT_HASH_SIZE = 16
+
+
+def _use_orjson() -> bool:
+    """Return whether orjson is available."""
+    return orjson is not None
+
+
+def json_backend() -> str:
+    """
+    Return the name of the JSON backend in use.
+
+    Returns:
+        str: "orjson" when orjson is available, "json" otherwise.
+    """
+    return "orjson" if _use_orjson() else "json"
+
+
+def _encode_json(value: Any, default: Optional[Callable[[Any], Any]] = None) -> Token:
+    """Encode a value with the active backend: bytes with orjson, str otherwise."""
+    if _use_orjson():
+        return orjson.dumps(
+            value,
+            default=default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":"))
+
+
+def _to_bytes(token: Token) -> bytes:
+    """Return a token as UTF-8 bytes."""
+    return token if isinstance(token, bytes) else token.encode("utf-8")
+
+
+def _default(value: Any) -> Any:
+    """Convert values the JSON encoders do not support natively."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if hasattr(value, "asdict") and callable(value.asdict):
+        return value.asdict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class EncodedRows:
+    """
+    Data points of a series, each already encoded as a JSON object.
+
+    EncodedRows behaves like a read-only sequence of encoded points: len(),
+    indexing (returning the encoded bytes of a point) and slicing (returning
+    EncodedRows) are supported, and two instances are equal when they encode
+    the same points. dumps() writes it as a JSON array.
+
+    Attributes:
+        rows (List[bytes]): One JSON object per data point.
+        times (np.ndarray): Time of each data point, in the same order.
+    """
+
+    __slots__ = ("_rows", "times", "_content_hash", "_json", "_bounds")
+
+    def __init__(self, rows: List[bytes], times: Sequence[Any]):
+        """
+        Wrap encoded points.
+
+        Args:
+            rows (List[bytes]): One JSON object per data point.
+            times (Sequence[Any]): Time of each data point.
+
+        Raises:
+            ValueError: If rows and times have different lengths.
+        """
+        if len(rows) != len(times):
+            raise ValueError("rows and times must have the same length")
+        # None once the points only live in the JSON array
+        self._rows: Optional[List[bytes]] = rows
+        self.times = np.asarray(times)
+        self._content_hash: Optional[str] = None
+        # JSON array of the points, kept by freeze()
+        self._json: Optional[bytes] = None
+        # Start of each point in the JSON array, for instances without rows
+        self._bounds: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_json(
+        cls,
+        array: Any,
+        bounds: np.ndarray,
+        times: Sequence[Any],
+        content_hash: Optional[str] = None,
+    ) -> "EncodedRows":
+        """
+        Wrap a JSON array of points, such as one memory-mapped from a file.
+
+        The array is written as it is by dumps(); the rows are only split out
+        of it when they are used, e.g. to compare or slice the points.
+
+        Args:
+            array (Any): Bytes-like JSON array of the points, as returned by
+                to_json().
+            bounds (np.ndarray): Offset of each point in array, followed by the
+                length of the array, as returned by row_bounds().
+            times (Sequence[Any]): Time of each data point.
+            content_hash (Optional[str]): content_hash of the points, if known.
+
+        Returns:
+            EncodedRows: Frozen instance holding the points.
+
+        Raises:
+            ValueError: If bounds and times do not describe the same points.
+        """
+        if len(bounds) != len(times) + 1:
+            raise ValueError("bounds must hold one offset per point and the array length")
+        instance = cls([], [])
+        instance._rows = None
+        instance.times = np.asarray(times)
+        instance._content_hash = content_hash
+        instance._json = array
+        instance._bounds = np.asarray(bounds)
+        return instance
+
+    @property
+    def rows(self) -> List[bytes]:
+        """Return the encoded points, split out of the JSON array for frozen instances."""
+        if self._rows is not None:
+            return self._rows
+        return self._row_range(0, len(self))
+
+    def _row_range(self, start: int, stop: int) -> List[bytes]:
+        """Return the encoded points from start to stop, without keeping them."""
+        if self._rows is not None:
+            return self._rows[start:stop]
+        array, bounds = self._json, self._bounds[start : stop + 1].tolist()
+        # Each point is followed by a comma, or by the closing bracket
+        return [array[begin : end - 1] for begin, end in zip(bounds, bounds[1:])]
+
+    def row_bounds(self) -> np.ndarray:
+        """
+        Return the offset of each point in to_json(), followed by its length.
+
+        Returns:
+            np.ndarray: int64 offsets, one more than the number of points.
+        """
+        if self._bounds is not None:
+            return self._bounds
+        lengths = np.fromiter(map(len, self.rows), dtype=np.int64, count=len(self.rows))
+        # Skip the opening bracket, then each point and its separator
+        return np.concatenate([[1], 1 + np.cumsum(lengths + 1)]).astype(np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self.times)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bytes, "EncodedRows"]:
+        """Return the encoded point at index, or EncodedRows for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return EncodedRows(self._row_range(start, max(start, stop)), self.times[index])
+            return EncodedRows(self.rows[index], self.times[index])
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("EncodedRows index out of range")
+        return self._row_range(position, position + 1)[0]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the encoded points of two instances."""
+        if not isinstance(other, EncodedRows):
+            return NotImplemented
+        if self._json is not None and other._json is not None:
+            return memoryview(self._json) == memoryview(other._json)
+        return self.rows == other.rows
+
+    # Equality follows the content, so instances are not hashable (like lists)
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return a short description of the instance."""
+        return f"EncodedRows({len(self)} points)"
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Return a hash of the encoded points, computed on first use.
+
+        Instances holding the same points have the same hash.
+
+        Returns:
+            str: Hexadecimal BLAKE2b digest.
+        """
+        if self._content_hash is None:
+            digest = hashlib.blake2b(digest_size=_CONTENT_HASH_SIZE, person=b"rows")
+            for start in range(0, len(self), _JOIN_CHUNK_SIZE):
+                digest.update(b"\n".join(self._row_range(start, start + _JOIN_CHUNK_SIZE)))
+                digest.update(b"\n")
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    @property
+    def nbytes(self) -> int:
+        """Return the approximate memory used by the points, in bytes."""
+        size = self.times.nbytes
+        if self._rows is not None:
+            # Each row is a bytes object referenced from the list
+            overhead = sys.getsizeof(b"") + 8
+            size += sum(map(len, self._rows)) + overhead * len(self._rows)
+        if self._bounds is not None:
+            size += self._bounds.nbytes
+        return size + (len(self._json) if self._json is not None else 0)
+
+    @property
+    def frozen_json(self) -> Optional[bytes]:
+        """
+        Return the JSON array joined by freeze().
+
+        Returns:
+            Optional[bytes]: The array, or None if the instance is not frozen.
+        """
+        return self._json
+
+    def freeze(self) -> "EncodedRows":
+        """
+        Join the points into their JSON array once, for instances shared by payloads.
+
+        dumps() then copies the array instead of joining the rows again. Only
+        the array and the offsets of the points in it are kept: the separate
+        rows are dropped and split out of the array when used. The instance
+        must not be modified afterwards.
+
+        Returns:
+            EncodedRows: This instance.
+        """
+        if self._json is None:
+            self._bounds = self.row_bounds()
+            self._json = dumps(self)
+            self._rows = None
+        return self
+
+    def to_json(self) -> bytes:
+        """
+        Return the points as a JSON array.
+
+        Returns:
+            bytes: UTF-8 encoded JSON array of the points.
+        """
+        if self._json is not None:
+            return bytes(self._json)
+        return dumps(self)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Decode the points.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per data point.
+        """
+        return json.loads(self.to_json())
+
+
+class ColumnarData:
+    """
+    Data points of a series as one column per field.
+
+    Numeric fields are kept as arrays, which encode_payload() writes as binary
+    float64 buffers next to the JSON payload. Other fields are kept as lists of
+    JSON values, with None where a point leaves the key out, and fields that
+    have the same value for every point are kept once.
+
+    Like EncodedRows, ColumnarData behaves like a read-only sequence of points:
+    len(), indexing (returning the dictionary of a point) and slicing
+    (returning ColumnarData) are supported, and two instances are equal when
+    they hold the same points. dumps() writes it as a plain JSON array.
+
+    Attributes:
+        keys (List[str]): Keys of the point dictionaries, in order.
+        numeric (Dict[str, np.ndarray]): Numeric columns, with NaN already
+            replaced by 0.0. Must include the "time" column.
+        values (Dict[str, List[Any]]): Other columns, None where a point leaves
+            the key out.
+        constants (Dict[str, Any]): Values shared by every point.
+    """
+
+    __slots__ = ("keys", "numeric", "values", "constants", "_content_hash")
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        numeric: Dict[str, np.ndarray],
+        values: Optional[Dict[str, List[Any]]] = None,
+        constants: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Wrap the columns of a series.
+
+        Args:
+            keys (Sequence[str]): Keys of the point dictionaries, in order.
+            numeric (Dict[str, np.ndarray]): Numeric columns, including "time".
+            values (Optional[Dict[str, List[Any]]]): Other columns.
+            constants (Optional[Dict[str, Any]]): Values shared by every point.
+
+        Raises:
+            ValueError: If there is no time column, a key has no column, or the
+                columns have different lengths.
+        """
+        self.keys = list(keys)
+        self.numeric = {key: np.asarray(column) for key, column in numeric.items()}
+        self.values = dict(values or {})
+        self.constants = dict(constants or {})
+        self._content_hash: Optional[str] = None
+        if "time" not in self.numeric:
+            raise ValueError("ColumnarData requires a numeric time column")
+        for key in self.keys:
+            if key not in self.numeric and key not in self.values and key not in self.constants:
+                raise ValueError(f"No column provided for key '{key}'")
+        length = len(self)
+        columns = itertools.chain(self.numeric.values(), self.values.values())
+        if any(len(column) != length for column in columns):
+            raise ValueError("All columns must have the same length")
+
+    @property
+    def times(self) -> np.ndarray:
+        """Return the time of each data point."""
+        return self.numeric["time"]
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self.numeric["time"])
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], "ColumnarData"]:
+        """Return the dictionary of the point at index, or ColumnarData for a slice."""
+        if isinstance(index, slice):
+            return ColumnarData(
+                self.keys,
+                {key: column[index] for key, column in self.numeric.items()},
+                {key: column[index] for key, column in self.values.items()},
+                self.constants,
+            )
+        point = {}
+        for key in self.keys:
+            if key in self.numeric:
+                point[key] = self.numeric[key][index].item()
+            elif key in self.values:
+                value = self.values[key][index]
+                if value is not None:
+                    point[key] = value
+            else:
+                point[key] = self.constants[key]
+        return point
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the points of two instances."""
+        if not isinstance(other, ColumnarData):
+            return NotImplemented
+        return (
+            self.keys == other.keys
+            and self.constants == other.constants
+            and self.values == other.values
+            and self.numeric.keys() == other.numeric.keys()
+            and all(
+                np.array_equal(column, other.numeric[key]) for key, column in self.numeric.items()
+            )
+        )
+
+    # Equality follows the content, so instances are not hashable (like lists)
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return a short description of the instance."""
+        return f"ColumnarData({len(self)} points)"
+
+    @property
+    def nbytes(self) -> int:
+        """Return the approximate memory used by the columns, in bytes."""
+        size = sum(column.nbytes for column in self.numeric.values())
+        # Other columns are lists of references to mostly shared values
+        return size + 8 * sum(len(column) for column in self.values.values())
+
+    def freeze(self) -> "ColumnarData":
+        """
+        Make the numeric columns read-only, for instances shared by payloads.
+
+        Returns:
+            ColumnarData: This instance.
+        """
+        for column in self.numeric.values():
+            column.flags.writeable = False
+        return self
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Return a hash of the columns, computed on first use.
+
+        Numeric columns are hashed from their float64 bytes, as encode_payload()
+        sends them, so instances holding the same points have the same hash.
+
+        Returns:
+            str: Hexadecimal BLAKE2b digest.
+        """
+        if self._content_hash is None:
+            digest = hashlib.blake2b(digest_size=_CONTENT_HASH_SIZE, person=b"columns")
+            digest.update(dumps([self.keys, self.values, self.constants, list(self.numeric)]))
+            for column in self.numeric.values():
+                digest.update(np.ascontiguousarray(column, dtype="<f8").tobytes())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def to_rows(self) -> EncodedRows:
+        """
+        Encode each point as a JSON object.
+
+        Returns:
+            EncodedRows: The points, as written by dumps().
+        """
+        tokens = []
+        for key in self.keys:
+            if key in self.numeric:
+                tokens.append(encode_column(self.numeric[key]))
+            elif key in self.values:
+                tokens.append(
+                    [None if value is None else encode_value(value) for value in self.values[key]]
+                )
+            else:
+                tokens.append(itertools.repeat(encode_value(self.constants[key])))
+        return EncodedRows(encode_rows(self.keys, tokens), self.times)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Build the dictionary of every point.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per data point.
+        """
+        return [self[index] for index in range(len(self))]
+
+
+def _dumps(obj: Any, columnar: Optional[Callable[[ColumnarData], Any]] = None) -> bytes:
+    """Encode a payload, see dumps(); columnar replaces ColumnarData when given."""
+    fragments: List[EncodedRows] = []
+
+    def default(value: Any) -> Any:
+        if isinstance(value, ColumnarData):
+            if columnar is not None:
+                return columnar(value)
+            value = value.to_rows()
+        if isinstance(value, EncodedRows):
+            fragments.append(value)
+            return _PLACEHOLDER.format(len(fragments) - 1)
+        return _default(value)
+
+    encoded = _to_bytes(_encode_json(obj, default=default))
+    if not fragments:
+        return encoded
+
+    # Write the arrays in chunks: joining all rows at once needs a large
+    # intermediate buffer for a million points
+    output = io.BytesIO()
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(encoded):
+        output.write(encoded[position : match.start()])
+        fragment = fragments[int(match[1])]
+        position = match.end()
+        if fragment.frozen_json is not None:
+            # Already joined by freeze()
+            output.write(fragment.frozen_json)
+            continue
+        rows = fragment.rows
+        output.write(b"[")
+        for start in range(0, len(rows), _JOIN_CHUNK_SIZE):
+            if start:
+                output.write(b",")
+            output.write(b",".join(rows[start : start + _JOIN_CHUNK_SIZE]))
+        output.write(b"]")
+    output.write(encoded[position:])
+    return output.getvalue()
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode a payload as compact JSON.
+
+    Enums are written as their value, NumPy values as plain values and objects
+    with an asdict() method as their dictionary. EncodedRows are spliced in
+    without decoding them, and ColumnarData is written as a JSON array of
+    points. Non-finite floats are written as null with orjson.
+
+    Args:
+        obj (Any): Payload to encode, e.g. the result of Chart.to_frontend_config().
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+
+    Raises:
+        TypeError: If the payload contains a value that cannot be encoded.
+    """
+    return _dumps(obj)
+
+
+def encode_payload(obj: Any) -> Tuple[bytes, bytes]:
+    """
+    Encode a payload as compact JSON plus a binary buffer of numeric columns.
+
+    Like dumps(), except that every ColumnarData is replaced by a descriptor
+    object {"$columnar": {...}} holding its keys, length, non-numeric columns
+    and constants, and the byte offset of each numeric column in the buffer.
+    Numeric columns are written to the buffer one after the other as
+    little-endian float64 values, so every offset is a multiple of 8 and can be
+    read with a Float64Array view.
+
+    Args:
+        obj (Any): Payload to encode.
+
+    Returns:
+        Tuple[bytes, bytes]: The UTF-8 encoded JSON and the buffer, which is
+            empty when the payload holds no ColumnarData.
+
+    Raises:
+        TypeError: If the payload contains a value that cannot be encoded.
+    """
+    buffer = io.BytesIO()
+
+    def columnar(value: ColumnarData) -> Dict[str, Any]:
+        offsets = {}
+        for key, column in value.numeric.items():
+            offsets[key] = buffer.tell()
+            buffer.write(np.ascontiguousarray(column, dtype="<f8").tobytes())
+        return {
+            COLUMNAR_KEY: {
+                "length": len(value),
+                "keys": value.keys,
+                "numeric": offsets,
+                "values": value.values,
+                "constants": value.constants,
+            }
+        }
+
+    payload = _dumps(obj, columnar)
+    return payload, buffer.getvalue()
+
+
+def encode_value(value: Any) -> Token:
+    """
+    Encode a single value as a JSON token.
+
+    Args:
+        value (Any): Value to encode.
+
+    Returns:
+        Token: The JSON token, as bytes with orjson and str otherwise.
+    """
+    return _encode_json(value, default=_default)
+
+
+def encode_column(column: np.ndarray) -> List[Token]:
+    """
+    Encode each value of a numeric column as a JSON token.
+
+    Floats are encoded as float64, with NaN written as 0.0 like Data.asdict()
+    does, and infinities as null.
+
+    Args:
+        column (np.ndarray): Column of integers, floats or booleans.
+
+    Returns:
+        List[Token]: One token per value, as bytes with orjson and str otherwise.
+
+    Raises:
+        TypeError: If the column is not numeric.
+    """
+    kind = column.dtype.kind
+    if kind not in "biuf":
+        raise TypeError(f"Cannot encode a column of dtype {column.dtype} as numbers")
+    if len(column) == 0:
+        return []
+
+    non_finite = None
+    if kind == "f":
+        column = column.astype(np.float64, copy=False)
+        finite = np.isfinite(column)
+        if not finite.all():
+            column = np.where(np.isnan(column), 0.0, column)
+            non_finite = np.flatnonzero(np.isinf(column))
+
+    if _use_orjson():
+        # orjson writes infinities as null already
+        encoded = orjson.dumps(np.ascontiguousarray(column), option=orjson.OPT_SERIALIZE_NUMPY)
+        return encoded[1:-1].split(b",")
+
+    if kind == "b":
+        return ["true" if value else "false" for value in column.tolist()]
+    tokens = list(map(repr, column.tolist()))
+    if non_finite is not None:
+        for index in non_finite.tolist():
+            tokens[index] = "null"
+    return tokens
+
+
+def encode_rows(keys: Sequence[str], columns: Sequence[Iterable[Optional[Token]]]) -> List[bytes]:
+    """
+    Join column tokens into one JSON object per row.
+
+    Args:
+        keys (Sequence[str]): Object key of each column.
+        columns (Sequence[Iterable[Optional[Token]]]): Tokens of each column, as
+            returned by encode_column() or encode_value(). A None token leaves the
+            key out of that row; columns without None tokens should be lists or
+            itertools.repeat() of a single token.
+
+    Returns:
+        List[bytes]: One UTF-8 encoded JSON object per row.
+    """
+    as_bytes = _use_orjson()
+    quoted_keys = [json.dumps(key) for key in keys]
+    sparse = any(isinstance(tokens, list) and None in tokens for tokens in columns)
+    rows_tokens = zip(*columns)
+
+    if as_bytes and not sparse:
+        template = ("{" + ",".join(f"{key}:%b" for key in quoted_keys) + "}").encode("utf-8")
+        return list(map(template.__mod__, rows_tokens))
+    if not sparse:
+        template = "{" + ",".join(f"{key}:%s" for key in quoted_keys) + "}"
+        return [(template % row).encode("utf-8") for row in rows_tokens]
+
+    prefixes = [f"{key}:" for key in quoted_keys]
+    if as_bytes:
+        byte_prefixes = [prefix.encode("utf-8") for prefix in prefixes]
+        return [
+            b"{"
+            + b",".join(
+                prefix + token for prefix, token in zip(byte_prefixes, row) if token is not None
+            )
+            + b"}"
+            for row in rows_tokens
+        ]
+    return [
+        (
+            "{"
+            + ",".join(prefix + token for prefix, token in zip(prefixes, row) if token is not None)
+            + "}"
+        ).encode("utf-8")
+        for row in rows_tokens
+    ]
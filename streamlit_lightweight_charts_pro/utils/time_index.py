@@ -0,0 +1,141 @@
+"""
+Sorted bar-time index for streamlit-lightweight-charts.
+
+Markers, trade entries and exits and annotations often carry times that fall
+between bars, e.g. the fill time of an order on minute bars. Lightweight-charts
+only draws them on bar times, so they have to be moved onto one. TimeIndex
+sorts the bar times of a series once and aligns whole columns of times with
+np.searchsorted, following a TimeAlignment policy:
+
+    - NEAREST moves each time to the nearest bar time, the earlier one on a
+      tie, like the snapping done by the frontend.
+    - PREVIOUS moves each time to the last bar time at or before it.
+    - NEXT moves each time to the first bar time at or after it.
+    - DROP keeps the times, and leaves out those that are not bar times.
+
+PREVIOUS and NEXT leave out the times that have no bar before, respectively
+after them. Chart.align_times() uses an index of the primary series to send
+pre-aligned times to the frontend (see Chart.to_frontend_config()).
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.utils.time_index import TimeIndex
+
+    index = TimeIndex([60, 120, 180])
+    times, kept = index.align([59, 150, 200], "previous")
+    # times[kept] == [120, 180]
+    ```
+"""
+
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from streamlit_lightweight_charts_pro.type_definitions.enums import TimeAlignment
+from streamlit_lightweight_charts_pro.utils.serialization import ColumnarData, EncodedRows
+
+
+class TimeIndex:
+    """
+    Ascending unique bar times, aligning other times onto them.
+
+    Attributes:
+        times (np.ndarray): Sorted unique bar times as int64 UNIX seconds.
+    """
+
+    def __init__(self, times: Any):
+        """
+        Index bar times.
+
+        Args:
+            times (Any): Array-like bar times in UNIX seconds, in any order.
+        """
+        self.times = np.unique(np.asarray(times, dtype=np.int64))
+
+    @classmethod
+    def from_payload(cls, data: Any) -> "TimeIndex":
+        """
+        Index the times of serialized series data.
+
+        Args:
+            data (Any): The "data" of a series configuration: EncodedRows,
+                ColumnarData or a list of dictionaries.
+
+        Returns:
+            TimeIndex: The times of the points sent to the frontend.
+        """
+        if isinstance(data, EncodedRows):
+            return cls(data.times)
+        if isinstance(data, ColumnarData):
+            return cls(data.numeric["time"])
+        return cls(
+            [point["time"] for point in data or () if isinstance(point.get("time"), (int, float))]
+        )
+
+    def __len__(self) -> int:
+        """Return the number of bar times."""
+        return len(self.times)
+
+    def align(
+        self, times: Any, policy: Union[TimeAlignment, str] = TimeAlignment.NEAREST
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Align times onto the bar times.
+
+        Args:
+            times (Any): Array-like times in UNIX seconds.
+            policy (Union[TimeAlignment, str]): How to align the times.
+                Defaults to TimeAlignment.NEAREST.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The aligned int64 times, and whether
+                each time is kept. Times that are left out are not aligned.
+                With an empty index, all times are kept as they are.
+        """
+        policy = TimeAlignment(policy)
+        times = np.asarray(times, dtype=np.int64)
+        bars = self.times
+        count = len(bars)
+        if count == 0:
+            return times.copy(), np.ones(len(times), dtype=bool)
+
+        if policy == TimeAlignment.PREVIOUS:
+            after = np.searchsorted(bars, times, side="right")
+            kept = after > 0
+            return np.where(kept, bars[np.maximum(after - 1, 0)], times), kept
+
+        following = np.searchsorted(bars, times, side="left")
+        if policy == TimeAlignment.NEXT:
+            kept = following < count
+            return np.where(kept, bars[np.minimum(following, count - 1)], times), kept
+
+        if policy == TimeAlignment.DROP:
+            kept = bars[np.minimum(following, count - 1)] == times
+            return times.copy(), kept
+
+        earlier = bars[np.clip(following - 1, 0, count - 1)]
+        later = bars[np.minimum(following, count - 1)]
+        aligned = np.where(times - earlier <= later - times, earlier, later)
+        return aligned, np.ones(len(times), dtype=bool)
+
+    def align_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        policy: Union[TimeAlignment, str] = TimeAlignment.NEAREST,
+    ) -> List[Dict[str, Any]]:
+        """
+        Align the "time" of serialized items, such as annotations.
+
+        Args:
+            rows (List[Dict[str, Any]]): Items serialized with a "time" in UNIX seconds.
+            policy (Union[TimeAlignment, str]): How to align the times.
+
+        Returns:
+            List[Dict[str, Any]]: Copies of the kept items with aligned times.
+        """
+        times, kept = self.align([row["time"] for row in rows], policy)
+        return [
+            {**row, "time": time}
+            for row, time, keep in zip(rows, times.tolist(), kept.tolist())
+            if keep
+        ]
@@ -16,6 +16,7 @@ import psutil
 import pytest
 
 from streamlit_lightweight_charts_pro.charts.series.histogram import HistogramSeries
+from streamlit_lightweight_charts_pro.utils.data_utils import normalize_time, normalize_time_array
 
 
 class TestHistogramSeriesPerformance:
@@ -290,11 +291,21 @@ class TestHistogramSeriesPerformance:
             ("pandas_timestamps", large_dataset),
             ("string_timestamps", large_dataset.copy()),
             ("mixed_formats", large_dataset.copy()),
+            ("tz_aware_timestamps", large_dataset.copy()),
+            ("epoch_milliseconds", large_dataset.copy()),
         ]
 
         # Convert to string timestamps for one test
         test_cases[1][1]["time"] = test_cases[1][1]["time"].dt.strftime("%Y-%m-%d %H:%M:%S")
 
+        # Timezone-aware timestamps and epoch milliseconds
+        test_cases[3][1]["time"] = (
+            test_cases[3][1]["time"].dt.tz_localize("UTC").dt.tz_convert("America/New_York")
+        )
+        test_cases[4][1]["time"] = (
+            test_cases[4][1]["time"].astype("datetime64[ms]").astype(np.int64)
+        )
+
         # Convert to mixed formats for another test
         mixed_df = test_cases[2][1].copy()
         mixed_df["time"] = mixed_df["time"].apply(
@@ -332,6 +343,42 @@ class TestHistogramSeriesPerformance:
         # All should be reasonably fast
         assert all(time < 30.0 for time in results.values())
 
+    def test_normalize_time_array_performance(self, large_dataset):
+        """Compare vectorized normalize_time_array with per-value normalize_time."""
+        times = large_dataset["time"]
+        formats = {
+            "datetime64": times,
+            "tz_aware": times.dt.tz_localize("UTC").dt.tz_convert("Asia/Tokyo"),
+            "epoch_seconds": times.astype("datetime64[s]").astype(np.int64),
+            "epoch_nanoseconds": times.astype("datetime64[ns]").astype(np.int64),
+            "strings": times.dt.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        expected = times.astype("datetime64[s]").astype(np.int64).to_numpy()
+        scalar_sample = 2000
+
+        for name, values in formats.items():
+            start_time = time.time()
+            result = normalize_time_array(values)
+            array_time = time.time() - start_time
+
+            # Per-value baseline on a sample, extrapolated to the full column
+            sample = values.iloc[:scalar_sample]
+            if name == "epoch_nanoseconds":
+                sample = sample // 10**9  # normalize_time expects seconds
+            start_time = time.time()
+            scalar_result = [normalize_time(value) for value in sample]
+            scalar_time = (time.time() - start_time) * len(values) / scalar_sample
+
+            print(
+                f"{name}: array {array_time:.4f}s, per-value {scalar_time:.4f}s "
+                f"({scalar_time / max(array_time, 1e-9):.0f}x)"
+            )
+
+            np.testing.assert_array_equal(result, expected)
+            assert scalar_result == expected[:scalar_sample].tolist()
+            assert array_time < 2.0
+            assert array_time * 10 < scalar_time
+
     def test_scalability_analysis(self):
         """Analyze scalability across different dataset sizes."""
         dataset_sizes = [1000, 5000, 10000, 50000, 100000]
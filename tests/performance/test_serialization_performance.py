@@ -0,0 +1,136 @@
+"""
+Performance tests for chart payload serialization.
+
+This module compares the two ways of producing the JSON sent to the frontend
+for a chart with 1,000,000 candlesticks (about 2 years of 1-minute data):
+
+- Reference: Chart.to_frontend_config() builds one dictionary per candle, then
+  the result is encoded with json.dumps(), as Streamlit does.
+- Direct: Chart.to_frontend_json() writes the candles straight from the NumPy
+  columns to JSON.
+
+It also compares the JSON payload with the columnar transport, which sends the
+candles as binary float64 columns (encode_payload()).
+"""
+
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.series import CandlestickSeries
+from streamlit_lightweight_charts_pro.type_definitions.enums import DataTransport
+from streamlit_lightweight_charts_pro.utils import serialization
+from streamlit_lightweight_charts_pro.utils.serialization import COLUMNAR_KEY, encode_payload
+
+
+class TestChartSerializationPerformance:
+    """Performance tests for Chart.to_frontend_json()."""
+
+    @pytest.fixture
+    def million_candle_chart(self) -> Chart:
+        """Chart with 1,000,000 one-minute candlesticks."""
+        n = 1_000_000
+        rng = np.random.default_rng(42)
+        # Geometric random walk, so that prices stay positive over 1M steps
+        close = 100.0 * np.exp((rng.standard_normal(n) * 0.0005).cumsum())
+        open_price = close * (1 + rng.standard_normal(n) * 0.001)
+        df = pd.DataFrame(
+            {
+                "datetime": pd.date_range("2020-01-01 09:30", periods=n, freq="min"),
+                "open": open_price,
+                "high": np.maximum(open_price, close) * 1.002,
+                "low": np.minimum(open_price, close) * 0.998,
+                "close": close,
+            }
+        )
+        series = CandlestickSeries.from_dataframe(
+            df,
+            column_mapping={
+                "time": "datetime",
+                "open": "open",
+                "high": "high",
+                "low": "low",
+                "close": "close",
+            },
+        )
+        return Chart(series=series)
+
+    def test_million_candles_speedup(self, million_candle_chart):
+        """Test direct serialization is faster and lighter than dictionaries plus json.dumps."""
+        start_time = time.perf_counter()
+        reference = json.dumps(million_candle_chart.to_frontend_config()).encode("utf-8")
+        reference_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        direct = million_candle_chart.to_frontend_json()
+        direct_time = time.perf_counter() - start_time
+
+        assert json.loads(direct) == json.loads(reference)
+        del reference
+
+        # Peak memory, measured separately as tracing slows allocations down
+        tracemalloc.start()
+        json.dumps(million_candle_chart.to_frontend_config())
+        reference_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tracemalloc.start()
+        million_candle_chart.to_frontend_json()
+        direct_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        speedup = reference_time / direct_time
+        backend = "orjson" if serialization.orjson is not None else "json"
+        print("\nChart Serialization Performance (1,000,000 candles):")
+        print(f"  Dictionaries + json.dumps: {reference_time:.2f} seconds")
+        print(f"  Direct ({backend}): {direct_time:.2f} seconds")
+        print(f"  Speedup: {speedup:.1f}x")
+        print(f"  Peak memory: {reference_peak / 2**20:.0f} MB -> {direct_peak / 2**20:.0f} MB")
+        print(f"  Payload size: {len(direct) / 2**20:.0f} MB")
+
+        assert direct_peak < reference_peak
+        if backend != "orjson":
+            # The pure-Python fallback is only about 1.4x faster: too close to
+            # noise for a gate that would catch regressions
+            pytest.skip("the speedup target needs orjson")
+        assert speedup >= 3
+
+    def test_million_candles_columnar_transport(self, million_candle_chart):
+        """Test the columnar transport is smaller and faster to decode than JSON."""
+        start_time = time.perf_counter()
+        json_payload = million_candle_chart.to_frontend_json()
+        json_encode_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        json_points = json.loads(json_payload)["charts"][0]["series"][0]["data"]
+        json_decode_time = time.perf_counter() - start_time
+
+        million_candle_chart.series[0].transport = DataTransport.COLUMNAR
+        start_time = time.perf_counter()
+        payload, buffer = encode_payload(million_candle_chart.to_frontend_config(encode_data=True))
+        columnar_encode_time = time.perf_counter() - start_time
+        # Decode like the frontend: parse the small JSON, then view the columns
+        start_time = time.perf_counter()
+        descriptor = json.loads(payload)["charts"][0]["series"][0]["data"][COLUMNAR_KEY]
+        columns = {
+            key: np.frombuffer(buffer, dtype="<f8", count=descriptor["length"], offset=offset)
+            for key, offset in descriptor["numeric"].items()
+        }
+        columnar_decode_time = time.perf_counter() - start_time
+
+        for key in descriptor["keys"]:
+            assert np.array_equal(columns[key][::997], [point[key] for point in json_points[::997]])
+
+        json_size = len(json_payload)
+        columnar_size = len(payload) + len(buffer)
+        print("\nColumnar Transport Performance (1,000,000 candles):")
+        print(f"  Wire size: {json_size / 2**20:.0f} MB -> {columnar_size / 2**20:.0f} MB")
+        print(f"  Encode: {json_encode_time:.2f} -> {columnar_encode_time:.2f} seconds")
+        print(f"  Decode: {json_decode_time:.2f} -> {columnar_decode_time:.4f} seconds")
+
+        assert json_size >= 2.5 * columnar_size
+        assert columnar_encode_time < json_encode_time
+        assert json_decode_time >= 10 * columnar_decode_time
@@ -0,0 +1,268 @@
+"""
+Tests for timeframe aggregation of OHLC(V) data.
+
+This module checks aggregate_ohlcv() against pandas resampling, the caching and
+resolution choice of OhlcvPyramid, and the timeframes option of candlestick and
+bar series, including the pyramid shared by Chart price and volume series.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.series import (
+    BarSeries,
+    CandlestickSeries,
+    HistogramSeries,
+    LineSeries,
+)
+from streamlit_lightweight_charts_pro.data import (
+    CandlestickData,
+    OhlcvData,
+    OhlcvPyramid,
+    SeriesData,
+    aggregate_ohlcv,
+)
+from streamlit_lightweight_charts_pro.data.aggregation import bucket_times, parse_timeframe
+
+# 2024-01-01 00:00 UTC, a Monday
+START = 1_704_067_200
+OHLC_MAPPING = {name: name for name in ["time", "open", "high", "low", "close"]}
+OHLCV_MAPPING = {**OHLC_MAPPING, "volume": "volume"}
+
+
+def _minute_bars(length, seed=0):
+    """Build a DataFrame of one-minute OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(length)) * 0.1
+    open_ = np.concatenate(([100.0], close[:-1]))
+    spread = rng.random(length)
+    return pd.DataFrame(
+        {
+            "time": START + np.arange(length, dtype=np.int64) * 60,
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.random(length) * 1000,
+        }
+    )
+
+
+def _series_data(df):
+    """Convert a DataFrame of OHLCV bars to SeriesData."""
+    return SeriesData.from_columns(OhlcvData, {name: df[name] for name in OHLCV_MAPPING})
+
+
+class TestParseTimeframe:
+    """Test timeframe parsing."""
+
+    @pytest.mark.parametrize(
+        "timeframe,seconds",
+        [(90, 90), ("30s", 30), ("5m", 300), ("15min", 900), ("1h", 3600), ("1D", 86400)],
+    )
+    def test_valid(self, timeframe, seconds):
+        """Test timeframes given as seconds or with a unit."""
+        assert parse_timeframe(timeframe) == seconds
+
+    @pytest.mark.parametrize("timeframe", ["1M", "5x", "h", 0, -60, True])
+    def test_invalid(self, timeframe):
+        """Test that unknown units and non-positive timeframes are rejected."""
+        with pytest.raises(ValueError):
+            parse_timeframe(timeframe)
+
+    def test_weeks_start_on_monday(self):
+        """Test that weekly buckets start on Monday."""
+        wednesday = START + 2 * 86400 + 3600
+        assert bucket_times(np.array([wednesday]), parse_timeframe("1W"))[0] == START
+
+
+class TestAggregateOhlcv:
+    """Test aggregation to a coarser timeframe."""
+
+    @pytest.mark.parametrize("timeframe,rule", [("5m", "5min"), ("1h", "1h"), ("1D", "1D")])
+    def test_matches_pandas_resample(self, timeframe, rule):
+        """Test first/max/min/last/sum against pandas."""
+        df = _minute_bars(5_000)
+        expected = (
+            df.set_index(pd.to_datetime(df["time"], unit="s"))
+            .resample(rule)
+            .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+            .dropna()
+        )
+
+        result = aggregate_ohlcv(_series_data(df), timeframe)
+
+        columns = result.columns
+        np.testing.assert_array_equal(columns["time"], expected.index.as_unit("s").asi8)
+        for name in ["open", "high", "low", "close", "volume"]:
+            np.testing.assert_allclose(columns[name], expected[name].to_numpy())
+        assert result.data_class is OhlcvData
+
+    def test_gaps_and_empty_data(self):
+        """Test that empty buckets produce no bars and empty data stays empty."""
+        df = _minute_bars(10).iloc[[0, 1, 8, 9]]
+        result = aggregate_ohlcv(_series_data(df), "5m")
+        assert result.columns["time"].tolist() == [START, START + 300]
+
+        empty = aggregate_ohlcv(_series_data(df.iloc[:0]), "5m")
+        assert len(empty) == 0
+
+    def test_requires_ohlc(self):
+        """Test that data without OHLC columns is rejected."""
+        data = SeriesData.from_columns(
+            HistogramSeries.data_class, {"time": [START], "value": [1.0]}
+        )
+        with pytest.raises(ValueError):
+            aggregate_ohlcv(data, "5m")
+
+
+class TestOhlcvPyramid:
+    """Test the multi-resolution cache."""
+
+    def test_levels_are_cached(self):
+        """Test that levels are built once and match direct aggregation."""
+        data = _series_data(_minute_bars(3_000))
+        pyramid = OhlcvPyramid(data, ["1h", "5m"]).build()
+
+        assert pyramid.timeframes == [300, 3600]
+        assert pyramid.level("1h") is pyramid.level(3600)
+        assert pyramid.level(None) is data
+        # Built from the 5m level, so sums may differ in the last bits
+        direct = aggregate_ohlcv(data, "1h")
+        for name, values in pyramid.level("1h").columns.items():
+            np.testing.assert_allclose(values, direct.columns[name])
+        assert pyramid.nbytes > 0
+
+    def test_weekly_levels_are_not_built_from_unaligned_levels(self):
+        """Test that 3-day buckets, which straddle Mondays, do not feed 3-week buckets."""
+        days = 60
+        data = SeriesData.from_columns(
+            OhlcvData,
+            {
+                "time": START + np.arange(days, dtype=np.int64) * 86400,
+                "open": np.ones(days),
+                "high": np.ones(days),
+                "low": np.ones(days),
+                "close": np.ones(days),
+                "volume": np.ones(days),
+            },
+        )
+        pyramid = OhlcvPyramid(data, ["3D", "3W"])
+
+        pyramid.level("3D")
+        weekly = pyramid.level("3W")
+
+        direct = aggregate_ohlcv(data, "3W")
+        np.testing.assert_array_equal(weekly.columns["time"], direct.columns["time"])
+        np.testing.assert_array_equal(weekly.columns["volume"], direct.columns["volume"])
+
+    def test_select_timeframe(self):
+        """Test that the finest level fitting max_bars is chosen."""
+        pyramid = OhlcvPyramid(_series_data(_minute_bars(3_000)), ["5m", "1h"])
+
+        assert pyramid.select_timeframe(max_bars=3_000) is None
+        assert pyramid.select_timeframe(max_bars=600) == 300
+        assert pyramid.select_timeframe(max_bars=100) == 3600
+        assert pyramid.select_timeframe(max_bars=10) == 3600
+        assert pyramid.select_timeframe(START, START + 100 * 60, max_bars=200) is None
+
+    def test_window(self):
+        """Test that windows hold the range widened by its length on both sides."""
+        pyramid = OhlcvPyramid(_series_data(_minute_bars(3_000)), ["5m"])
+        bars = pyramid.window(None, START + 1_000 * 60, START + 1_100 * 60)
+
+        assert bars.columns["time"][0] == START + 900 * 60
+        assert bars.columns["time"][-1] == START + 1_200 * 60
+
+
+class TestSeriesTimeframes:
+    """Test the timeframes option of series."""
+
+    @pytest.mark.parametrize("series_class", [CandlestickSeries, BarSeries])
+    def test_asdict_sends_chosen_resolution(self, series_class):
+        """Test that only the chosen resolution is serialized."""
+        df = _minute_bars(20_000)
+        series = series_class(
+            data=df, column_mapping=OHLC_MAPPING, timeframes=["5m", "1h"], max_bars=500
+        )
+
+        data = series.asdict()["data"]
+
+        assert series.resolution == 3600
+        assert len(series.data) == 20_000
+        assert len(data) == len(series.pyramid.level("1h"))
+        assert data[0]["high"] == df["high"].iloc[:60].max()
+
+    def test_visible_range(self):
+        """Test that a short visible range is sent at full resolution."""
+        series = CandlestickSeries(
+            data=_minute_bars(20_000), column_mapping=OHLC_MAPPING, timeframes=["5m", "1h"]
+        )
+        series.visible_range = (START, START + 600 * 60)
+
+        data = series.asdict()["data"]
+
+        assert series.resolution is None
+        assert len(data) == 1_201
+        assert series.asdict_encoded()["data"] is not None
+
+    def test_list_data_and_append(self):
+        """Test pyramids of data objects and their rebuild after append()."""
+        bars = [
+            CandlestickData(time=START + i * 60, open=1.0, high=2.0, low=0.5, close=1.5)
+            for i in range(120)
+        ]
+        series = CandlestickSeries(data=bars, timeframes=["1h"], max_bars=10)
+        assert len(series.asdict()["data"]) == 2
+
+        series.append(
+            CandlestickData(time=START + 120 * 60, open=1.0, high=3.0, low=0.5, close=1.5)
+        )
+        assert len(series.asdict()["data"]) == 3
+
+    def test_unsupported_series(self):
+        """Test that series without OHLC data cannot be aggregated."""
+        series = LineSeries(data=[])
+        with pytest.raises(ValueError):
+            series.timeframes = ["5m"]
+        with pytest.raises(ValueError):
+            HistogramSeries(data=[]).timeframes = ["5m"]
+
+
+class TestChartPriceVolumePyramid:
+    """Test aggregation of price and volume series created together."""
+
+    def test_shared_pyramid(self):
+        """Test that price and volume share a pyramid and resolution."""
+        df = _minute_bars(10_000)
+        chart = Chart.from_price_volume_dataframe(
+            df,
+            column_mapping=dict(OHLCV_MAPPING),
+            price_kwargs={"timeframes": ["5m", "1h"], "max_bars": 500},
+        )
+        price, volume = chart.series
+
+        assert price.pyramid is volume.pyramid
+        series_configs = chart.to_frontend_config()["charts"][0]["series"]
+        assert len(series_configs[0]["data"]) == len(series_configs[1]["data"])
+
+        # Volume is summed and colored like create_volume_series() would
+        hourly = price.pyramid.level("1h")
+        first = series_configs[1]["data"][0]
+        assert first["value"] == pytest.approx(df["volume"].iloc[:60].sum())
+        up = hourly.columns["close"][0] >= hourly.columns["open"][0]
+        assert first["color"] == ("rgba(38,166,154,0.5)" if up else "rgba(239,83,80,0.5)")
+
+    def test_set_visible_range(self):
+        """Test that set_visible_range() updates every aggregated series."""
+        chart = Chart.from_price_volume_dataframe(
+            _minute_bars(10_000),
+            column_mapping=dict(OHLCV_MAPPING),
+            price_kwargs={"timeframes": ["5m", "1h"], "max_bars": 500},
+        )
+        chart.set_visible_range(START, START + 300 * 60)
+
+        assert [series.resolution for series in chart.series] == [None, None]
+        assert [series.visible_range for series in chart.series] == [(START, START + 300 * 60)] * 2
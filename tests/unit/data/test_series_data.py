@@ -0,0 +1,452 @@
+"""
+Tests for columnar series data.
+
+This module tests the SeriesData container used by DataFrame ingestion:
+- Payload conformance with per-object Data.asdict()
+- Vectorized validation matching __post_init__
+- Fallback to data objects for classes without columnar support
+"""
+
+import copy
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts.series import (
+    AreaSeries,
+    BandSeries,
+    BarSeries,
+    BaselineSeries,
+    CandlestickSeries,
+    HistogramSeries,
+    LineSeries,
+    RibbonSeries,
+)
+from streamlit_lightweight_charts_pro.data import (
+    CandlestickData,
+    LineData,
+    OhlcvData,
+)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.data.trend_fill import TrendFillData
+
+
+def _legacy_payload(data_class, df, column_mapping):
+    """Build the payload the row-by-row way: one data object per row, then asdict()."""
+    points = []
+    for i in range(len(df)):
+        kwargs = {}
+        for field, column in column_mapping.items():
+            if column in df.columns:
+                kwargs[field] = df[column].iloc[i]
+        points.append(data_class(**kwargs).asdict())
+    return points
+
+
+@pytest.fixture
+def ohlc_df():
+    """OHLCV frame with colors, NaN values and empty colors."""
+    n = 50
+    rng = np.random.default_rng(7)
+    close = 100 + rng.standard_normal(n).cumsum()
+    df = pd.DataFrame(
+        {
+            "datetime": pd.date_range("2024-01-01", periods=n, freq="h"),
+            "open": close + 0.5,
+            "high": close + 2.0,
+            "low": close - 2.0,
+            "close": close,
+            "volume": rng.integers(100, 1000, n).astype(float),
+            "color": ["#26a69a", "", "rgba(255, 0, 0, 0.5)", "#ef5350", ""] * 10,
+            "value": close,
+        }
+    )
+    df.loc[3, "close"] = np.nan
+    df.loc[5, "volume"] = np.nan
+    df.loc[7, "value"] = np.nan
+    return df
+
+
+class TestSeriesDataConformance:
+    """The columnar payload must be byte-identical to the per-object payload."""
+
+    @pytest.mark.parametrize(
+        "series_class,column_mapping",
+        [
+            (
+                CandlestickSeries,
+                {
+                    "time": "datetime",
+                    "open": "open",
+                    "high": "high",
+                    "low": "low",
+                    "close": "close",
+                    "color": "color",
+                },
+            ),
+            (
+                BarSeries,
+                {
+                    "time": "datetime",
+                    "open": "open",
+                    "high": "high",
+                    "low": "low",
+                    "close": "close",
+                    "color": "color",
+                },
+            ),
+            (LineSeries, {"time": "datetime", "value": "value", "color": "color"}),
+            (HistogramSeries, {"time": "datetime", "value": "volume", "color": "color"}),
+            (AreaSeries, {"time": "datetime", "value": "value", "line_color": "color"}),
+            (BaselineSeries, {"time": "datetime", "value": "value", "top_line_color": "color"}),
+            (
+                BandSeries,
+                {"time": "datetime", "upper": "high", "middle": "close", "lower": "low"},
+            ),
+            (RibbonSeries, {"time": "datetime", "upper": "high", "lower": "value"}),
+        ],
+    )
+    def test_payload_matches_asdict(self, series_class, column_mapping, ohlc_df):
+        """Test from_dataframe() output equals building every data object."""
+        series = series_class.from_dataframe(ohlc_df, column_mapping=column_mapping)
+        expected = _legacy_payload(series_class.DATA_CLASS, ohlc_df, column_mapping)
+
+        assert json.dumps(series.data_dict) == json.dumps(expected)
+
+    def test_data_objects_are_built_lazily(self, ohlc_df):
+        """Test the series keeps columnar data and builds data objects on access."""
+        series = CandlestickSeries.from_dataframe(
+            ohlc_df,
+            column_mapping={
+                "time": "datetime",
+                "open": "open",
+                "high": "high",
+                "low": "low",
+                "close": "close",
+            },
+        )
+
+        assert isinstance(series.data, SeriesData)
+        assert len(series.data_dict) == len(ohlc_df)
+        assert isinstance(series.data[0], CandlestickData)
+        assert series.data[3].close == 0.0
+
+    def test_tz_aware_time_column(self):
+        """Test timezone-aware datetimes are converted to UTC seconds."""
+        times = pd.date_range("2024-01-01 09:30", periods=3, freq="min", tz="America/New_York")
+        data = SeriesData.from_columns(LineData, {"time": times.to_series(), "value": [1, 2, 3]})
+
+        assert data.columns["time"].tolist() == [int(t.timestamp()) for t in times]
+
+
+class TestSeriesDataValidation:
+    """Vectorized validation raises the same errors as __post_init__."""
+
+    def test_high_below_low(self):
+        """Test OHLC validation is applied to the whole column."""
+        with pytest.raises(ValueError, match="high must be greater than or equal to low"):
+            SeriesData.from_columns(
+                OhlcvData,
+                {
+                    "time": [1, 2],
+                    "open": [1.0, 1.0],
+                    "high": [2.0, 0.5],
+                    "low": [0.5, 1.0],
+                    "close": [1.0, 1.0],
+                    "volume": [1.0, 1.0],
+                },
+            )
+
+    def test_negative_volume(self):
+        """Test volume validation is applied to the whole column."""
+        with pytest.raises(ValueError, match="volume must be non-negative"):
+            SeriesData.from_columns(
+                OhlcvData,
+                {
+                    "time": [1],
+                    "open": [1.0],
+                    "high": [2.0],
+                    "low": [0.5],
+                    "close": [1.0],
+                    "volume": [-1.0],
+                },
+            )
+
+    def test_invalid_color(self):
+        """Test color validation is applied to the whole column."""
+        with pytest.raises(ValueError, match="Invalid color format"):
+            SeriesData.from_columns(
+                LineData, {"time": [1, 2], "value": [1.0, 2.0], "color": ["#fff", "nope"]}
+            )
+
+    def test_none_value(self):
+        """Test None values are rejected like in SingleValueData."""
+        with pytest.raises(ValueError, match="value must not be None"):
+            SeriesData.from_columns(LineData, {"time": [1, 2], "value": [1.0, None]})
+
+    def test_mismatched_lengths(self):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            SeriesData(LineData, {"time": np.array([1, 2]), "value": np.array([1.0])})
+
+
+class TestSeriesDataFallback:
+    """Data classes without columnar validation are validated point by point."""
+
+    def test_unsupported_class_is_stored_as_columns(self):
+        """Test classes with an unmatched __post_init__ still end up columnar."""
+        assert not TrendFillData.supports_columnar()
+
+        data = SeriesData.from_columns(
+            TrendFillData,
+            {"time": [1, 2], "trend_direction": [1, -1], "base_line": [1.0, float("nan")]},
+        )
+
+        assert isinstance(data, SeriesData)
+        assert data[1].base_line is None
+        assert data.asdicts() == [
+            point.asdict()
+            for point in [
+                TrendFillData(time=1, trend_direction=1, base_line=1.0),
+                TrendFillData(time=2, trend_direction=-1, base_line=float("nan")),
+            ]
+        ]
+
+    def test_supported_classes(self):
+        """Test the built-in OHLC and single value classes support columnar ingestion."""
+        assert OhlcvData.supports_columnar()
+        assert CandlestickData.supports_columnar()
+        assert LineData.supports_columnar()
+
+
+class TestSeriesDataContainer:
+    """SeriesData behaves like a list of data objects."""
+
+    @pytest.fixture
+    def line_points(self):
+        """Five line points with a color on every other point."""
+        return [
+            LineData(time=1_700_000_000 + i * 60, value=float(i), color="#ff0000" if i % 2 else "")
+            for i in range(5)
+        ]
+
+    def test_from_data_round_trip(self, line_points):
+        """Test building from data objects keeps every point."""
+        data = SeriesData.from_data(LineData, line_points)
+
+        assert len(data) == 5
+        assert data == line_points
+        assert data.asdicts() == [point.asdict() for point in line_points]
+
+    def test_from_data_rejects_other_classes(self):
+        """Test points of another data class are rejected."""
+        with pytest.raises(TypeError, match="Expected LineData instances"):
+            SeriesData.from_data(LineData, [OhlcvData(1, 1.0, 2.0, 0.5, 1.0, 10.0)])
+
+    def test_indexing(self, line_points):
+        """Test integer indexing returns data objects, including negative indexes."""
+        data = SeriesData.from_data(LineData, line_points)
+
+        assert data[0] == line_points[0]
+        assert data[-1] == line_points[-1]
+        assert isinstance(data[2].value, float)
+        with pytest.raises(IndexError):
+            data[5]
+
+    def test_slicing(self, line_points):
+        """Test slices are independent SeriesData objects."""
+        data = SeriesData.from_data(LineData, line_points)
+
+        tail = data[-2:]
+        assert isinstance(tail, SeriesData)
+        assert tail == line_points[-2:]
+
+        tail.append(LineData(time=1_800_000_000, value=9.0))
+        assert len(data) == 5
+
+    def test_iteration_yields_data_objects(self, line_points):
+        """Test iteration yields data objects whose asdict() matches the payload."""
+        data = SeriesData.from_data(LineData, line_points)
+
+        assert [point.asdict() for point in data] == data.asdicts()
+
+    def test_edits_of_points_are_written_back(self, line_points):
+        """Test setting a field of an indexed or iterated point updates the container."""
+        data = SeriesData.from_data(LineData, line_points)
+        series = LineSeries(data=data)
+        assert series.data_dict[0]["value"] == 0.0
+
+        data[0].value = 42.0
+        for point in data:
+            point.value += 1
+
+        assert [point.value for point in data] == [43.0, 2.0, 3.0, 4.0, 5.0]
+        assert series.data_dict[0]["value"] == 43.0
+        assert data[0] == LineData(time=1_700_000_000, value=43.0, color="")
+
+    def test_set_item(self, line_points):
+        """Test assigning a data object replaces the point."""
+        data = SeriesData.from_data(LineData, line_points)
+        data[-1] = LineData(time=1_800_000_000, value=9.0)
+
+        assert data.asdicts()[-1] == {"time": 1_800_000_000, "value": 9.0}
+        with pytest.raises(TypeError):
+            data[0] = OhlcvData(1, 1.0, 2.0, 0.5, 1.0, 10.0)
+        with pytest.raises(TypeError):
+            data[0:2] = line_points[:2]
+
+    def test_invalid_edit_is_rejected(self, line_points):
+        """Test an edit failing validation leaves the point and the container unchanged."""
+        data = SeriesData.from_data(LineData, line_points)
+        point = data[1]
+
+        with pytest.raises(ValueError):
+            point.color = "bogus"
+
+        assert point.color == "#ff0000"
+        assert data.asdicts() == [point.asdict() for point in line_points]
+
+    def test_copies_are_detached(self, line_points):
+        """Test copies, pickles and to_data_list() points do not write back."""
+        data = SeriesData.from_data(LineData, line_points)
+        detached = [
+            copy.copy(data[0]),
+            copy.deepcopy(data[0]),
+            pickle.loads(pickle.dumps(data[0])),
+            data.to_data_list()[0],
+        ]
+
+        for point in detached:
+            assert type(point) is LineData
+            point.value = -1.0
+
+        assert data[0].value == 0.0
+
+    def test_view_of_dropped_point_is_detached(self, line_points):
+        """Test a point replaced since the view was built no longer writes back."""
+        data = SeriesData.from_data(LineData, line_points)
+        point = data[0]
+        data.columns = {name: column[1:] for name, column in data.columns.items()}
+
+        point.value = -1.0
+
+        assert -1.0 not in [value["value"] for value in data.asdicts()]
+
+    def test_append_and_extend(self, line_points):
+        """Test growing the container with data objects and other containers."""
+        data = SeriesData.from_data(LineData, line_points[:2])
+        data.append(line_points[2])
+        data.extend(line_points[3:4])
+        data.extend(SeriesData.from_data(LineData, line_points[4:]))
+
+        assert data == line_points
+
+    def test_extend_adds_missing_optional_column(self):
+        """Test extending with a field the container has no column for."""
+        data = SeriesData.from_columns(LineData, {"time": [1, 2], "value": [1.0, 2.0]})
+        data.append(LineData(time=3, value=3.0, color="#00ff00"))
+
+        assert data.asdicts() == [
+            {"time": 1, "value": 1.0},
+            {"time": 2, "value": 2.0},
+            {"time": 3, "value": 3.0, "color": "#00ff00"},
+        ]
+
+    def test_list_methods_match_a_list(self, line_points):
+        """Test insert, pop, deletion, sort, reverse and + edit like a list does."""
+        data = SeriesData.from_data(LineData, line_points)
+        expected = list(line_points)
+        extra = LineData(time=1_650_000_000, value=7.0, color="#00ff00")
+
+        data.insert(1, extra)
+        expected.insert(1, extra)
+        assert data == expected
+        assert data.pop() == expected.pop()
+        assert data.pop(0) == expected.pop(0)
+        del data[1]
+        del expected[1]
+        assert data == expected
+        data.sort()
+        expected.sort(key=lambda point: point.time)
+        assert data == expected
+        data.sort(key=lambda point: point.value, reverse=True)
+        expected.sort(key=lambda point: point.value, reverse=True)
+        assert data == expected
+        data.reverse()
+        expected.reverse()
+        assert data == expected
+        assert data.asdicts() == [point.asdict() for point in expected]
+
+        combined = data + line_points[:1]
+        assert isinstance(combined, SeriesData)
+        assert combined == expected + line_points[:1]
+        assert line_points[:1] + data == line_points[:1] + expected
+        data += line_points[:1]
+        assert data == combined
+        del data[::2]
+        assert data == combined[1::2]
+        data.clear()
+        assert len(data) == 0
+
+    def test_removing_the_tail_keeps_other_payloads(self, line_points):
+        """Test popping the last point only drops its payload."""
+        data = SeriesData.from_data(LineData, line_points)
+        data.append(LineData(time=1_800_000_000, value=9.0))
+        payload = data.asdicts()
+
+        data.pop()
+
+        assert data.dirty_range is None
+        assert data.asdicts() == payload[:-1]
+        assert data.asdicts()[0] is payload[0]
+
+    def test_insert_keeps_max_points(self, line_points):
+        """Test inserting into bounded data drops the oldest point."""
+        data = SeriesData.from_data(LineData, line_points)
+        data.max_points = 5
+        point = data[0]
+
+        data.insert(2, LineData(time=1_700_000_090, value=7.0))
+
+        assert [value.value for value in data] == [1.0, 7.0, 2.0, 3.0, 4.0]
+        point.value = -1.0
+        assert -1.0 not in [value.value for value in data]
+
+    def test_extend_rejects_other_classes(self, line_points):
+        """Test extending with another data class is rejected."""
+        data = SeriesData.from_data(LineData, line_points)
+        other = SeriesData.from_columns(
+            OhlcvData,
+            {
+                "time": [1],
+                "open": [1.0],
+                "high": [2.0],
+                "low": [0.5],
+                "close": [1.0],
+                "volume": [1.0],
+            },
+        )
+
+        with pytest.raises(TypeError, match="Cannot extend"):
+            data.extend(other)
+
+    def test_memory_footprint(self):
+        """Test a float series costs a few bytes per point."""
+        n = 100_000
+        data = SeriesData.from_columns(
+            LineData, {"time": np.arange(n, dtype=np.int64), "value": np.ones(n)}
+        )
+
+        assert data.nbytes == n * 16
+
+    def test_series_accepts_series_data(self, line_points):
+        """Test all series classes accept a SeriesData as data."""
+        data = SeriesData.from_data(LineData, line_points)
+        series = LineSeries(data=data)
+
+        assert series.data is data
+        assert len(series.data) == 5
+        assert series.data_dict == [point.asdict() for point in line_points]
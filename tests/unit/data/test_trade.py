@@ -32,7 +32,8 @@ class TestTradeData:
         assert trade.trade_type == TradeType.LONG
         assert trade.id is None
         assert trade.notes is None
-        assert trade.text is not None  # Should be auto-generated
+        assert trade.text is None  # Generated on demand
+        assert trade.tooltip_text == trade.generate_tooltip_text()
 
     def test_construction_with_all_parameters(self):
         """Test TradeData construction with all parameters."""
@@ -84,6 +85,23 @@ class TestTradeData:
         assert "pnlPercentage" in result
         assert result["id"] == "trade1"
         assert result["notes"] == "Test trade"
+        # The frontend formats the default text from the numeric fields
+        assert "text" not in result
+
+    def test_asdict_custom_text(self):
+        """Test custom text is sent unless the visualization does not show it."""
+        trade = TradeData(
+            entry_time=1640995200,
+            entry_price=100.0,
+            exit_time=1641081600,
+            exit_price=105.0,
+            quantity=1000,
+            text="Custom text",
+        )
+
+        assert trade.asdict()["text"] == "Custom text"
+        assert "text" not in trade.asdict(include_text=False)
+        assert trade.tooltip_text == "Custom text"
 
     def test_validation_required_fields(self):
         """Test validation of required fields."""
@@ -0,0 +1,175 @@
+"""
+Unit tests for TradeBatch.
+
+This module tests that a TradeBatch computes the same P&L, tooltips, markers
+and frontend payload as the equivalent list of TradeData, its construction
+from DataFrames and its validation, and how Chart.add_trades() uses it.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.options import ChartOptions
+from streamlit_lightweight_charts_pro.charts.options.trade_visualization_options import (
+    TradeVisualizationOptions,
+)
+from streamlit_lightweight_charts_pro.charts.series import LineSeries
+from streamlit_lightweight_charts_pro.data import LineData, TradeBatch, TradeData
+from streamlit_lightweight_charts_pro.type_definitions.enums import TradeType, TradeVisualization
+from streamlit_lightweight_charts_pro.utils.serialization import EncodedRows, dumps
+
+
+def _trades():
+    """Long and short trades, winning and losing, with and without optional fields."""
+    return [
+        TradeData("2024-01-01", 100.0, "2024-01-02", 110.5, 10, TradeType.LONG, id="t1"),
+        TradeData(1704067200, 100.0, 1704153600, 90.0, 5, "SHORT", notes="stopped"),
+        TradeData(1704067200, 100.0, 1704153600, 120.0, 5, "short", text="custom"),
+        TradeData(1704067200, 50.0, 1704240000, 45.0, 2, "long", id="t4", notes="n"),
+    ]
+
+
+class TestParity:
+    """A batch behaves like the list of TradeData it holds."""
+
+    def test_values_match_trade_data(self):
+        """Test P&L, profitability and tooltips are those of each TradeData."""
+        trades = _trades()
+        batch = TradeBatch.from_trades(trades)
+
+        assert len(batch) == 4
+        np.testing.assert_allclose(batch.pnl, [trade.pnl for trade in trades])
+        np.testing.assert_allclose(batch.pnl_percentage, [trade.pnl_percentage for trade in trades])
+        assert batch.is_profitable.tolist() == [trade.is_profitable for trade in trades]
+        assert batch.tooltip_texts().tolist() == [trade.tooltip_text for trade in trades]
+        assert batch.entry_time.tolist() == [trade.entry_timestamp for trade in trades]
+        assert batch.exit_time.tolist() == [trade.exit_timestamp for trade in trades]
+
+    def test_payload_matches_trade_data(self):
+        """Test asdicts() and encoded() serialize like TradeData.asdict()."""
+        trades = _trades()
+        batch = TradeBatch.from_trades(trades)
+
+        assert batch.asdicts() == [trade.asdict() for trade in trades]
+        assert json.loads(dumps(batch.encoded())) == [trade.asdict() for trade in trades]
+        assert [trade.asdict() for trade in batch] == [trade.asdict() for trade in trades]
+        assert batch.asdicts(include_text=False) == [
+            trade.asdict(include_text=False) for trade in trades
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"entry_color": "#111111", "exit_color": "#222222", "show_pnl": False}]
+    )
+    def test_markers_match_trade_data(self, kwargs):
+        """Test the markers are those of TradeData.to_markers(), entry first."""
+        trades = _trades()
+        expected = [marker.asdict() for trade in trades for marker in trade.to_markers(**kwargs)]
+
+        markers = TradeBatch.from_trades(trades).to_markers(**kwargs)
+
+        assert [marker.asdict() for marker in markers] == expected
+
+
+class TestConstruction:
+    """Batches are built from arrays and DataFrames, and validated."""
+
+    def test_from_dataframe_with_mapping(self):
+        """Test columns are read through the mapping and the index."""
+        df = pd.DataFrame(
+            {
+                "closed": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+                "entry_price": [1.0, 2.0],
+                "exit_price": [2.0, 1.0],
+                "quantity": [3, 4],
+                "side": ["long", "SHORT"],
+                "notes": ["", "hedge"],
+            },
+            index=pd.DatetimeIndex(pd.to_datetime(["2024-01-01", "2024-01-01"]), name="opened"),
+        )
+
+        batch = TradeBatch.from_dataframe(
+            df, column_mapping={"entry_time": "opened", "exit_time": "closed", "trade_type": "side"}
+        )
+
+        assert batch.entry_time.tolist() == [1704067200, 1704067200]
+        assert batch.is_long.tolist() == [True, False]
+        assert batch.notes.tolist() == [None, "hedge"]
+        assert batch.id is None
+        assert batch[1].trade_type == TradeType.SHORT
+        assert batch.pnl.tolist() == [3.0, 4.0]
+
+    def test_from_dataframe_errors(self):
+        """Test unknown fields and missing required columns are rejected."""
+        df = pd.DataFrame({"entry_time": [1], "exit_time": [2], "entry_price": [1.0]})
+
+        with pytest.raises(ValueError, match="Unknown trade field"):
+            TradeBatch.from_dataframe(df, column_mapping={"side": "x"})
+        with pytest.raises(ValueError, match="missing required column: exit_price"):
+            TradeBatch.from_dataframe(df)
+
+    def test_validation(self):
+        """Test the checks of TradeData are applied to every trade."""
+        with pytest.raises(ValueError, match="Exit time must be after entry time"):
+            TradeBatch([100, 200], [1.0, 1.0], [150, 200], [2.0, 2.0], [1, 1])
+        with pytest.raises(ValueError, match="same length"):
+            TradeBatch([100, 200], [1.0], [150, 250], [2.0, 2.0], [1, 1])
+        with pytest.raises(ValueError):
+            TradeBatch([100], [1.0], [150], [2.0], [1], trade_type=["sideways"])
+        with pytest.raises(IndexError):
+            TradeBatch([100], [1.0], [150], [2.0], [1])[1]
+
+
+class TestChartTrades:
+    """Chart.add_trades() accepts a batch like a list."""
+
+    @staticmethod
+    def _chart():
+        """Line chart drawing trades as markers."""
+        options = ChartOptions(
+            trade_visualization=TradeVisualizationOptions(style=TradeVisualization.BOTH)
+        )
+        return Chart(series=LineSeries(data=[LineData(1704067200, 1.0)]), options=options)
+
+    def test_batch_adds_markers_and_trades(self):
+        """Test markers and the trades payload equal those of the list."""
+        from_list = self._chart().add_trades(_trades())
+        from_batch = self._chart().add_trades(TradeBatch.from_trades(_trades()))
+
+        assert [m.asdict() for m in from_batch.series[0].markers] == [
+            m.asdict() for m in from_list.series[0].markers
+        ]
+        batch_chart = from_batch.to_frontend_config()["charts"][0]
+        assert batch_chart["trades"] == from_list.to_frontend_config()["charts"][0]["trades"]
+        assert "tradeVisualizationOptions" in batch_chart
+        # Only the custom text is sent, since the markers style shows it
+        assert [trade.get("text") for trade in batch_chart["trades"]] == [
+            None,
+            None,
+            "custom",
+            None,
+        ]
+
+    def test_hidden_text_is_not_sent(self):
+        """Test styles that do not show trade texts get none."""
+        options = ChartOptions(
+            trade_visualization=TradeVisualizationOptions(style=TradeVisualization.RECTANGLES)
+        )
+        chart = Chart(series=LineSeries(data=[LineData(1704067200, 1.0)]), options=options)
+        chart.add_trades(TradeBatch.from_trades(_trades()))
+
+        trades = chart.to_frontend_config()["charts"][0]["trades"]
+
+        assert all("text" not in trade for trade in trades)
+
+    def test_encoded_trades(self):
+        """Test encode_data sends the trades as pre-encoded rows."""
+        chart = self._chart().add_trades(TradeBatch.from_trades(_trades()))
+
+        trades = chart.to_frontend_config(encode_data=True)["charts"][0]["trades"]
+
+        assert isinstance(trades, EncodedRows)
+        assert json.loads(dumps(trades)) == [trade.asdict() for trade in _trades()]
@@ -2,7 +2,8 @@
 Tests for volume series creation.
 
 This module tests the HistogramSeries.create_volume_series class method
-for creating colored volume data.
+for creating colored volume data, and price and volume series sharing one
+parse of their OHLCV bars.
 """
 
 import json
@@ -11,7 +12,13 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from streamlit_lightweight_charts_pro.charts.series.histogram import HistogramSeries
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.series import conversion_cache
+from streamlit_lightweight_charts_pro.charts.series.histogram import (
+    HistogramSeries,
+    ohlcv_series_data,
+)
+from streamlit_lightweight_charts_pro.data.candlestick_data import CandlestickData
 from streamlit_lightweight_charts_pro.data.histogram_data import HistogramData
 from streamlit_lightweight_charts_pro.data.ohlcv_data import OhlcvData
 
@@ -523,3 +530,76 @@ class TestHistogramSeriesCreateVolumeSeries:
 
         # The real test is that we can create and delete the objects without errors
         # and that memory usage is reasonable
+
+
+class TestSharedOhlcv:
+    """Price and volume series are built from one parse of the bars."""
+
+    MAPPING = {"time": "time", "open": "o", "high": "h", "low": "l", "close": "c", "volume": "v"}
+
+    @staticmethod
+    def _frame(count=100):
+        """OHLCV bars alternating up and down, one minute apart."""
+        close = 100.0 + np.arange(count) % 2
+        return pd.DataFrame(
+            {"o": 100.5, "h": 102.0, "l": 99.0, "c": close, "v": np.arange(count, dtype=float)},
+            index=pd.date_range("2024-01-01", periods=count, freq="min"),
+        )
+
+    def test_price_and_volume_share_columns(self):
+        """Test the DataFrame is converted once and both series share its time column."""
+        conversion_cache.clear()
+        chart = Chart.from_price_volume_dataframe(self._frame(), column_mapping=dict(self.MAPPING))
+        price, volume = chart.series
+
+        assert conversion_cache.misses == 1
+        assert np.shares_memory(price.data.columns["time"], volume.data.columns["time"])
+        assert volume.data[0].color == "rgba(239,83,80,0.5)"
+        assert volume.data[1].color == "rgba(38,166,154,0.5)"
+        assert volume.data[1].value == 1.0
+
+    def test_updating_one_series_leaves_the_other(self):
+        """Test shared columns are copied before an in-place update."""
+        chart = Chart.from_price_volume_dataframe(self._frame(), column_mapping=dict(self.MAPPING))
+        price, volume = chart.series
+        last = price.data[-1]
+
+        price.update_last(CandlestickData(time=last.time, open=1, high=3, low=1, close=2))
+
+        assert price.data[-1].close == 2
+        assert not np.shares_memory(price.data.columns["time"], volume.data.columns["time"])
+        assert volume.data[-1].time == last.time
+
+    def test_ohlcv_objects(self):
+        """Test a list of OhlcvData is parsed into columns, other objects are not."""
+        bars = [
+            OhlcvData("2024-01-01", 10, 12, 9, 11, 100),
+            OhlcvData("2024-01-02", 11, 12, 9, 10, 200),
+        ]
+
+        ohlcv = ohlcv_series_data(bars, {})
+        volume = HistogramSeries.from_ohlcv(ohlcv, "#00ff00", "#ff0000")
+
+        assert not ohlcv.columns["close"].flags.writeable
+        assert [point.color for point in volume.data] == ["#00ff00", "#ff0000"]
+        assert ohlcv_series_data([{"time": 1}], {}) is None
+
+    def test_volume_is_an_overlay_by_default(self):
+        """Test volume series without a price scale are drawn as overlays, as before."""
+        bars = [
+            OhlcvData("2024-01-01", 10, 12, 9, 11, 100),
+            OhlcvData("2024-01-02", 11, 12, 9, 10, 200),
+        ]
+        mapping = {"time": "time", "volume": "volume"}
+
+        from_frame = HistogramSeries.create_volume_series(
+            self._frame(), column_mapping=dict(self.MAPPING)
+        )
+        from_objects = HistogramSeries.create_volume_series(bars, column_mapping=mapping)
+        on_scale = HistogramSeries.create_volume_series(
+            bars, column_mapping=mapping, price_scale_id="volume"
+        )
+
+        assert from_frame.asdict()["priceScaleId"] == ""
+        assert from_objects.asdict()["priceScaleId"] == ""
+        assert on_scale.asdict()["priceScaleId"] == "volume"
@@ -11,10 +11,13 @@ import pandas as pd
 import pytest
 
 from streamlit_lightweight_charts_pro.charts.options.price_line_options import PriceLineOptions
-from streamlit_lightweight_charts_pro.charts.series.base import Series
+from streamlit_lightweight_charts_pro.charts.series import AreaSeries, LineSeries
+from streamlit_lightweight_charts_pro.charts.series.base import Series, _column_plan
+from streamlit_lightweight_charts_pro.data.area_data import AreaData
 from streamlit_lightweight_charts_pro.data.data import classproperty
 from streamlit_lightweight_charts_pro.data.line_data import LineData
 from streamlit_lightweight_charts_pro.data.marker import MarkerBase
+from streamlit_lightweight_charts_pro.utils.chainable import serialization_plan
 
 
 class TestSeriesPrepareIndexEdgeCases:
@@ -371,62 +374,25 @@ class TestSeriesUtilityMethods:
         assert series._camel_to_snake("ABC") == "a_b_c"
         assert series._camel_to_snake("") == ""
 
-    def test_is_chainable_property(self):
-        """Test _is_chainable_property method."""
+    def test_serialization_plan(self):
+        """Test the serialization plan lists chainable properties with their placement."""
 
         class MockSeries(Series):
             @classproperty
             def data_class(cls):
                 return LineData
 
-        series = MockSeries(data=[LineData(time=1, value=10)])
-
-        # Test chainable property
-        assert series._is_chainable_property("price_scale_id") is True
-
-        # Test non-chainable property
-        assert series._is_chainable_property("data") is False
-
-        # Test non-existent property
-        assert series._is_chainable_property("nonexistent") is False
-
-    def test_is_allow_none(self):
-        """Test _is_allow_none method."""
-
-        class MockSeries(Series):
-            @classproperty
-            def data_class(cls):
-                return LineData
-
-        series = MockSeries(data=[LineData(time=1, value=10)])
-
-        # Test property with allow_none=True
-        assert series._is_allow_none("price_scale") is True
-
-        # Test property with allow_none=False
-        assert series._is_allow_none("price_scale_id") is False
-
-        # Test non-existent property
-        assert series._is_allow_none("nonexistent") is False
-
-    def test_is_top_level(self):
-        """Test _is_top_level method."""
-
-        class MockSeries(Series):
-            @classproperty
-            def data_class(cls):
-                return LineData
-
-        series = MockSeries(data=[LineData(time=1, value=10)])
-
-        # Test top-level property
-        assert series._is_top_level("price_scale_id") is True
+        plan = {prop.name: prop for prop in serialization_plan(MockSeries)}
 
-        # Test non-top-level property
-        assert series._is_top_level("price_format") is False
+        # Chainable properties, with or without allow_none and top_level
+        assert plan["price_scale"].allow_none is True
+        assert plan["price_scale_id"].allow_none is False
+        assert plan["price_scale_id"].top_level is True
+        assert plan["price_format"].top_level is False
 
-        # Test non-existent property
-        assert series._is_top_level("nonexistent") is False
+        # Non-chainable and non-existent properties
+        assert "data" not in plan
+        assert "nonexistent" not in plan
 
 
 class TestSeriesAsdictMethod:
@@ -566,3 +532,47 @@ class TestSeriesDataClassProperty:
         # Test on instance
         series = MockSeries(data=[LineData(time=1, value=10)])
         assert series.data_class == LineData
+
+
+class TestSeriesColumnPlan:
+    """Test the cached column plan used for DataFrame input in the constructor."""
+
+    def test_plan_resolves_snake_and_camel_keys(self):
+        """Test camelCase mapping keys are matched to snake_case fields."""
+        plan = _column_plan(AreaData, ("time", "value", "lineColor"))
+
+        assert dict(plan) == {"time": "time", "value": "value", "line_color": "lineColor"}
+
+    def test_plan_is_cached(self):
+        """Test the plan is computed once per data class and mapping keys."""
+        _column_plan.cache_clear()
+        df = pd.DataFrame({"t": [1, 2, 3], "v": [1.0, 2.0, 3.0]})
+
+        LineSeries(data=df, column_mapping={"time": "t", "value": "v"})
+        # Other values, as the conversion of equal data is cached as a whole
+        LineSeries(data=df * 2, column_mapping={"time": "t", "value": "v"})
+
+        info = _column_plan.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_plan_missing_required_mapping(self):
+        """Test a missing required field is reported with its original name."""
+        with pytest.raises(ValueError, match="missing required column mapping"):
+            _column_plan(LineData, ("time",))
+
+    def test_constructor_with_camel_case_mapping(self):
+        """Test DataFrame input with camelCase keys and index promotion."""
+        df = pd.DataFrame(
+            {"v": [1.0, 2.0], "c": ["#ff0000", "#00ff00"]},
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-02"], name="date"),
+        )
+
+        series = AreaSeries(
+            data=df, column_mapping={"time": "date", "value": "v", "lineColor": "c"}
+        )
+
+        assert series.data_dict == [
+            {"time": 1704067200, "value": 1.0, "lineColor": "#ff0000"},
+            {"time": 1704153600, "value": 2.0, "lineColor": "#00ff00"},
+        ]
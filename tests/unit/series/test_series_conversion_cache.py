@@ -0,0 +1,256 @@
+"""
+Tests for the DataFrame conversion cache of series.
+
+This module tests that series built again from an unchanged DataFrame reuse
+the earlier conversion, that changed data is converted again, and the bounds
+and counters of ConversionCache.
+"""
+
+import hashlib
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts.series import (
+    CandlestickSeries,
+    ConversionCache,
+    LineSeries,
+    base,
+    conversion_cache,
+)
+from streamlit_lightweight_charts_pro.data import CandlestickData
+
+MAPPING = {"time": "time", "open": "o", "high": "h", "low": "l", "close": "c"}
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    """Start and end every test with an empty shared cache."""
+    conversion_cache.clear()
+    yield
+    conversion_cache.clear()
+
+
+def _frame(count=5000, level=100.0):
+    """OHLC bars one minute apart, indexed by time."""
+    close = level + np.arange(count, dtype=float)
+    index = pd.date_range("2024-01-01", periods=count, freq="min")
+    return pd.DataFrame({"o": close, "h": close + 1, "l": close - 1, "c": close}, index=index)
+
+
+class TestConversionReuse:
+    """Series built from the same data share its conversion."""
+
+    def test_unchanged_frame_is_converted_once(self):
+        """Test a second series from the same DataFrame is a cache hit."""
+        df = _frame()
+
+        first = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        second = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+
+        assert (conversion_cache.hits, conversion_cache.misses) == (1, 1)
+        assert second.data == first.data
+        assert df.index.name is None
+
+    def test_resolved_mapping_is_restored(self):
+        """Test a hit resolves the column mapping like the conversion did."""
+        df = _frame().reset_index(drop=True)
+        mapping = {"time": "index", "value": "c"}
+        df.index = pd.date_range("2024-01-01", periods=len(df), freq="min")
+
+        LineSeries(data=df, column_mapping=dict(mapping))
+        series = LineSeries(data=df, column_mapping=dict(mapping))
+
+        assert conversion_cache.hits == 1
+        assert series._column_mapping == {"time": "index", "value": "c"}
+
+    def test_different_class_or_mapping_misses(self):
+        """Test the data class and the mapping are part of the key."""
+        df = _frame()
+
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        LineSeries(data=df, column_mapping={"time": "time", "value": "c"})
+        LineSeries(data=df, column_mapping={"time": "time", "value": "o"})
+
+        assert conversion_cache.misses == 3
+
+    @pytest.mark.parametrize("row", [0, -1])
+    def test_edited_frame_is_converted_again(self, row):
+        """Test in-place edits of the first and last bars are noticed."""
+        df = _frame()
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+
+        df.iloc[row, df.columns.get_loc("c")] = 1.0
+        series = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+
+        assert conversion_cache.hits == 0
+        assert series.data[row].close == 1.0
+
+    def test_edited_middle_row_is_converted_again(self, monkeypatch):
+        """Test an in-place edit of a bar in the middle is noticed by default."""
+        monkeypatch.setattr(base, "xxhash", None)
+        times = np.datetime64("2024-01-01", "ns") + np.arange(5000).astype("timedelta64[m]")
+        df = pd.DataFrame({"t": times, "v": np.ones(5000)}, copy=False)
+        LineSeries(data=df, column_mapping={"time": "t", "value": "v"})
+
+        # Write to the array behind the column, keeping the frame and its buffers
+        times[2346] += np.timedelta64(30, "s")
+        series = LineSeries(data=df, column_mapping={"time": "t", "value": "v"})
+
+        assert conversion_cache.hits == 0
+        assert series.data[2346].time == int(df["t"].iloc[2346].timestamp())
+
+    def test_appended_frame_is_converted_again(self):
+        """Test new rows change the fingerprint."""
+        CandlestickSeries(data=_frame(100), column_mapping=dict(MAPPING))
+        series = CandlestickSeries(data=_frame(101), column_mapping=dict(MAPPING))
+
+        assert conversion_cache.hits == 0
+        assert len(series.data) == 101
+
+    def test_streaming_does_not_change_cached_data(self):
+        """Test updating a series built from the cache leaves the cache intact."""
+        df = _frame(10)
+        series = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        last = series.data[-1]
+
+        series.update_last(CandlestickData(time=last.time, open=1, high=3, low=1, close=2))
+        again = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+
+        assert conversion_cache.hits == 1
+        assert series.data[-1].close == 2
+        assert again.data[-1].close == last.close
+
+    def test_content_fingerprint(self, monkeypatch):
+        """Test equal copies share a conversion by default."""
+        monkeypatch.setattr(
+            base,
+            "xxhash",
+            SimpleNamespace(xxh3_128=lambda: hashlib.blake2b(digest_size=16)),
+        )
+        df = _frame()
+
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        CandlestickSeries(data=df.copy(), column_mapping=dict(MAPPING))
+        edited = df.copy()
+        edited.iloc[2500, 0] = 1.0
+        CandlestickSeries(data=edited, column_mapping=dict(MAPPING))
+
+        assert (conversion_cache.hits, conversion_cache.misses) == (1, 2)
+
+    def test_content_fingerprint_skips_unmapped_columns(self, monkeypatch):
+        """Test content fingerprints only hash the index and the mapped columns."""
+        df = _frame()
+        df["note"] = "bar"
+        mapping = {"time": "time", "value": "c"}
+        hashed = []
+        content_digest = base._content_digest
+        monkeypatch.setattr(
+            base,
+            "_content_digest",
+            lambda frame, columns: hashed.append(columns) or content_digest(frame, columns),
+        )
+
+        LineSeries(data=df, column_mapping=dict(mapping))
+        edited = df.copy()
+        edited.iloc[2500, df.columns.get_loc("o")] = 1.0
+        LineSeries(data=edited, column_mapping=dict(mapping))
+
+        assert hashed == [["c"], ["c"]]
+        assert conversion_cache.hits == 1
+
+    def test_sampled_fingerprint(self, monkeypatch):
+        """Test sampled fingerprints key by identity and notice edits of the latest bars."""
+        monkeypatch.setattr(conversion_cache, "sampled_fingerprints", True)
+        df = _frame()
+
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        CandlestickSeries(data=df.copy(), column_mapping=dict(MAPPING))
+        df.iloc[-1, 0] = 1.0
+        series = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+
+        assert (conversion_cache.hits, conversion_cache.misses) == (1, 3)
+        assert series.data[-1].open == 1.0
+
+    def test_sampled_fingerprint_cost_does_not_grow_with_rows(self, monkeypatch):
+        """Test sampled fingerprints never hash every value."""
+        monkeypatch.setattr(conversion_cache, "sampled_fingerprints", True)
+        monkeypatch.setattr(base, "_content_digest", None)
+        df = _frame(200_000)
+
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+
+        assert conversion_cache.hits == 1
+
+
+class TestConversionCache:
+    """The cache is bounded and counts lookups."""
+
+    @staticmethod
+    def _columns(count):
+        """Read-only float columns holding count points."""
+        column = np.zeros(count)
+        column.flags.writeable = False
+        return {"time": column}
+
+    def test_entry_bound(self):
+        """Test the least recently used conversion is evicted first."""
+        cache = ConversionCache(max_entries=2)
+        cache.put("a", self._columns(1), {})
+        cache.put("b", self._columns(1), {})
+        cache.get("a", None)
+        cache.put("c", self._columns(1), {})
+
+        assert cache.get("b", None) is None
+        assert cache.get("a", None) is not None
+        assert len(cache) == 2
+
+    def test_memory_bound(self):
+        """Test conversions are evicted to stay under max_bytes."""
+        cache = ConversionCache(max_bytes=8 * 150)
+        cache.put("a", self._columns(100), {})
+        cache.put("b", self._columns(100), {})
+        cache.put("huge", self._columns(1000), {})
+
+        assert cache.get("a", None) is None
+        assert cache.get("huge", None) is None
+        assert cache.nbytes == 800
+
+    def test_disabled(self):
+        """Test max_entries=0 turns the cache off."""
+        conversion_cache.max_entries = 0
+        try:
+            df = _frame()
+            CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+            CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+        finally:
+            conversion_cache.max_entries = base.DEFAULT_CONVERSION_CACHE_ENTRIES
+
+        assert len(conversion_cache) == 0
+        assert conversion_cache.hits == 0
+
+    def test_concurrent_runs(self):
+        """Test series built from several threads all get correct data."""
+        frames = [_frame(2000, level=100.0 * (i + 1)) for i in range(4)]
+        errors = []
+
+        def run(df):
+            for _ in range(20):
+                series = CandlestickSeries(data=df, column_mapping=dict(MAPPING))
+                if series.data[0].close != df["c"].iloc[0]:
+                    errors.append(series.data[0].close)
+
+        threads = [threading.Thread(target=run, args=(df,)) for df in frames]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert conversion_cache.hits + conversion_cache.misses == 80
+        assert len(conversion_cache) == 4
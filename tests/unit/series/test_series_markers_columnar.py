@@ -0,0 +1,167 @@
+"""
+Tests for markers stored as columns.
+
+This module tests that Series.add_markers() accepts markers as a DataFrame or
+a SeriesData, validates them in bulk, keeps them as columns, and serializes
+them exactly like the equivalent list of marker objects.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts.series import LineSeries
+from streamlit_lightweight_charts_pro.data import LineData
+from streamlit_lightweight_charts_pro.data.marker import BarMarker, PriceMarker
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions.enums import MarkerPosition, MarkerShape
+from streamlit_lightweight_charts_pro.utils.serialization import EncodedRows, dumps
+
+T = 1_700_000_000
+MAPPING = {"time": "time", "position": "pos", "shape": "shape", "text": "label"}
+
+
+def _series():
+    """Line series to put markers on."""
+    return LineSeries(data=[LineData(T, 1.0)])
+
+
+def _signals(count=6):
+    """Alternating buy and sell signals, one minute apart, indexed by time."""
+    buy = np.arange(count) % 2 == 0
+    return pd.DataFrame(
+        {
+            "pos": np.where(buy, "belowBar", "aboveBar"),
+            "shape": np.where(buy, "arrowUp", "arrowDown"),
+            "label": np.where(buy, "Buy", None),
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(T + 60 * np.arange(count), unit="s"), name="time"),
+    )
+
+
+def _objects(count=6):
+    """The markers of _signals() as objects."""
+    return [
+        BarMarker(
+            time=T + 60 * i,
+            position=MarkerPosition.BELOW_BAR if i % 2 == 0 else MarkerPosition.ABOVE_BAR,
+            shape=MarkerShape.ARROW_UP if i % 2 == 0 else MarkerShape.ARROW_DOWN,
+            text="Buy" if i % 2 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+class TestColumnarMarkers:
+    """Markers given as columns stay columns and serialize like objects."""
+
+    def test_dataframe_markers_match_objects(self):
+        """Test DataFrame markers serialize like the same BarMarker objects."""
+        series = _series().add_markers(_signals(), column_mapping=MAPPING)
+
+        assert isinstance(series.markers, SeriesData)
+        assert series.asdict()["markers"] == [marker.asdict() for marker in _objects()]
+        encoded = series.asdict_encoded()["markers"]
+        assert isinstance(encoded, EncodedRows)
+        assert json.loads(dumps(encoded)) == series.asdict()["markers"]
+
+    def test_repeated_values_are_interned(self):
+        """Test each distinct position and text is stored once."""
+        markers = _series().add_markers(_signals(), column_mapping=MAPPING).markers
+
+        positions = markers.columns["position"]
+        texts = markers.columns["text"]
+        assert positions[0] is MarkerPosition.BELOW_BAR
+        assert len({id(text) for text in texts[::2]}) == 1
+        assert texts[1] is None
+
+    def test_invalid_position_is_rejected_in_bulk(self):
+        """Test the position rules of the marker class apply to every row."""
+        signals = _signals()
+        signals.loc[signals.index[3], "pos"] = "atPriceTop"
+
+        with pytest.raises(ValueError, match="AT_PRICE_TOP' for marker type BarMarker"):
+            _series().add_markers(signals, column_mapping=MAPPING)
+        with pytest.raises(ValueError, match="column_mapping is required"):
+            _series().add_markers(signals)
+        with pytest.raises(ValueError):
+            _series().add_markers(signals.assign(shape="star"), column_mapping=MAPPING)
+
+    def test_price_markers(self):
+        """Test price markers need a non-zero price for every row."""
+        frame = pd.DataFrame(
+            {"time": [T, T + 60], "pos": ["atPriceTop"] * 2, "shape": ["circle"] * 2},
+        )
+        mapping = {"time": "time", "position": "pos", "shape": "shape", "price": "price"}
+
+        series = _series().add_markers(
+            frame.assign(price=[1.0, 2.0]), column_mapping=mapping, marker_class=PriceMarker
+        )
+
+        assert [marker["price"] for marker in series.asdict()["markers"]] == [1.0, 2.0]
+        with pytest.raises(ValueError, match="Price is required"):
+            _series().add_markers(
+                frame.assign(price=[1.0, 0.0]), column_mapping=mapping, marker_class=PriceMarker
+            )
+        with pytest.raises(ValueError, match="for marker type PriceMarker"):
+            _series().add_markers(
+                frame.assign(price=[1.0, 2.0], pos="aboveBar"),
+                column_mapping=mapping,
+                marker_class=PriceMarker,
+            )
+
+
+class TestMixedMarkers:
+    """Columns and objects can be added to the same series."""
+
+    def test_same_class_stays_columnar(self):
+        """Test objects of the stored class are appended to the columns."""
+        series = _series().add_markers(_signals(), column_mapping=MAPPING)
+        extra = BarMarker(time=T + 3600, position="inBar", shape="circle")
+
+        series.add_marker(extra)
+
+        assert isinstance(series.markers, SeriesData)
+        assert series.asdict()["markers"] == [m.asdict() for m in _objects() + [extra]]
+
+    def test_other_class_falls_back_to_a_list(self):
+        """Test markers of different classes end up as one list, in order."""
+        price = PriceMarker(time=T, position="atPriceTop", shape="circle", price=2.0)
+        series = _series().add_marker(price)
+
+        series.add_markers(_signals(), column_mapping=MAPPING)
+
+        assert isinstance(series.markers, list)
+        assert series.asdict()["markers"] == [m.asdict() for m in [price] + _objects()]
+
+    def test_series_data_is_not_shared(self):
+        """Test markers added to one series leave the given SeriesData and other series alone."""
+        markers = SeriesData.from_data(BarMarker, _objects())
+        first = _series().add_markers(markers)
+        second = _series().add_markers(markers)
+        extra = BarMarker(time=T + 3600, position="inBar", shape="circle")
+
+        first.add_marker(extra)
+        first.add_markers(SeriesData.from_data(BarMarker, [extra]))
+
+        assert len(first.markers) == 8
+        assert len(markers) == 6
+        assert len(second.markers) == 6
+        assert first.markers is not markers
+
+    def test_clear_and_assign(self):
+        """Test clearing and assigning columnar markers."""
+        series = _series().add_markers(_signals(), column_mapping=MAPPING)
+        series.clear_markers()
+
+        assert len(series.markers) == 0
+        assert "markers" not in series.asdict()
+
+        series.markers = SeriesData.from_data(BarMarker, _objects())
+        assert len(series.markers) == 6
+        with pytest.raises(TypeError):
+            series.markers = SeriesData.from_data(LineData, [LineData(T, 1.0)])
+        with pytest.raises(TypeError, match="must hold MarkerBase"):
+            series.add_markers(SeriesData.from_data(LineData, [LineData(T, 1.0)]))
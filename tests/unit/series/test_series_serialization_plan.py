@@ -0,0 +1,169 @@
+"""
+Tests for the serialization plan of series.
+
+This module checks that Series.asdict(), which follows the per-class plan of
+chainable properties, produces exactly the configuration of the previous
+implementation reflecting over dir(self), for every series type.
+"""
+
+import pytest
+
+from streamlit_lightweight_charts_pro.charts.options import LineOptions
+from streamlit_lightweight_charts_pro.charts.options.price_format_options import PriceFormatOptions
+from streamlit_lightweight_charts_pro.charts.options.price_line_options import PriceLineOptions
+from streamlit_lightweight_charts_pro.charts.series import (
+    AreaSeries,
+    BandSeries,
+    BarSeries,
+    BaselineSeries,
+    CandlestickSeries,
+    GradientBandSeries,
+    GradientRibbonSeries,
+    HistogramSeries,
+    LineSeries,
+    RibbonSeries,
+    SignalSeries,
+    TrendFillSeries,
+)
+from streamlit_lightweight_charts_pro.data import (
+    AreaData,
+    BandData,
+    BarData,
+    BaselineData,
+    CandlestickData,
+    HistogramData,
+    LineData,
+    RibbonData,
+    SignalData,
+)
+from streamlit_lightweight_charts_pro.data.gradient_band import GradientBandData
+from streamlit_lightweight_charts_pro.data.gradient_ribbon import GradientRibbonData
+from streamlit_lightweight_charts_pro.data.marker import BarMarker
+from streamlit_lightweight_charts_pro.data.trend_fill import TrendFillData
+from streamlit_lightweight_charts_pro.type_definitions.enums import MarkerPosition, MarkerShape
+from streamlit_lightweight_charts_pro.utils import chainable_property
+from streamlit_lightweight_charts_pro.utils.chainable import serialization_plan
+from streamlit_lightweight_charts_pro.utils.data_utils import snake_to_camel
+
+T = 1_700_000_000
+
+
+def _reflected_config(series, data):
+    """Configuration built by reflecting over dir(series), as asdict() used to."""
+    config = {"type": series.chart_type.value, "data": data}
+    options = {}
+    metadata = type(series)._chainable_properties
+    for attr_name in dir(series):
+        if attr_name.startswith("_") or attr_name in ("data", "data_class"):
+            continue
+        if attr_name.isupper() or attr_name not in metadata:
+            continue
+        attr_value = getattr(series, attr_name)
+        if attr_value is None and metadata[attr_name]["allow_none"]:
+            continue
+        target = config if metadata[attr_name]["top_level"] else options
+        key = snake_to_camel(attr_name)
+        if (
+            hasattr(attr_value, "asdict")
+            and callable(getattr(attr_value, "asdict"))
+            and not isinstance(attr_value, type)
+        ):
+            if attr_name.endswith("_options"):
+                options.update(attr_value.asdict())
+            else:
+                target[key] = attr_value.asdict()
+        elif (
+            isinstance(attr_value, list)
+            and attr_value
+            and hasattr(attr_value[0], "asdict")
+            and callable(getattr(attr_value[0], "asdict"))
+        ):
+            target[key] = [item.asdict() for item in attr_value]
+        elif (
+            not callable(attr_value) and not isinstance(attr_value, type) and attr_value is not None
+        ):
+            if isinstance(attr_value, list) and not attr_value:
+                continue
+            if target is config or attr_value != "":
+                target[key] = attr_value
+    if options:
+        config["options"] = options
+    return config
+
+
+SERIES = [
+    (AreaSeries, AreaData(time=T, value=1.0)),
+    (BandSeries, BandData(time=T, upper=3.0, middle=2.0, lower=1.0)),
+    (BarSeries, BarData(time=T, open=1.0, high=2.0, low=0.5, close=1.5)),
+    (BaselineSeries, BaselineData(time=T, value=1.0)),
+    (CandlestickSeries, CandlestickData(time=T, open=1.0, high=2.0, low=0.5, close=1.5)),
+    (GradientBandSeries, GradientBandData(time=T, upper=3.0, middle=2.0, lower=1.0)),
+    (GradientRibbonSeries, GradientRibbonData(time=T, upper=3.0, lower=1.0)),
+    (HistogramSeries, HistogramData(time=T, value=1.0)),
+    (LineSeries, LineData(time=T, value=1.0)),
+    (RibbonSeries, RibbonData(time=T, upper=3.0, lower=1.0)),
+    (SignalSeries, SignalData(time=T, value=1)),
+    (TrendFillSeries, TrendFillData(time=T, base_line=1.0, upper_trend=2.0, trend_direction=1)),
+]
+
+
+@pytest.mark.parametrize(
+    "series_class,point", SERIES, ids=[series_class.__name__ for series_class, _ in SERIES]
+)
+class TestSerializationPlan:
+    """asdict() matches the reflected configuration on every series type."""
+
+    def test_defaults(self, series_class, point):
+        """Test a series with default options."""
+        series = series_class(data=[point])
+
+        assert series.asdict() == _reflected_config(series, series.data_dict)
+
+    def test_customized(self, series_class, point):
+        """Test a series with top-level, nested and list options set."""
+        series = series_class(data=[point], pane_id=1)
+        series.title = "Series"
+        series.price_scale_id = ""
+        series.z_index = None
+        series.price_format = PriceFormatOptions(type="price", precision=4)
+        series.add_price_line(PriceLineOptions(price=1.5, color="#ff0000"))
+        series.add_marker(
+            BarMarker(
+                time=T, position=MarkerPosition.ABOVE_BAR, color="#00ff00", shape=MarkerShape.CIRCLE
+            )
+        )
+        if hasattr(series, "line_options"):
+            series.line_options = LineOptions(color="#123456", line_width=3)
+
+        assert series.asdict() == _reflected_config(series, series.data_dict)
+
+
+class TestPlanCache:
+    """Plans are computed once per class and follow later decorators."""
+
+    def test_plan_is_reused(self):
+        """Test the plan of a class is built once."""
+        assert serialization_plan(LineSeries) is serialization_plan(LineSeries)
+        names = [prop.name for prop in serialization_plan(LineSeries)]
+        assert names == sorted(names)
+        assert "line_options" in names and "data" not in names
+
+    def test_subclass_properties(self):
+        """Test a subclass decorated later gets its own properties serialized."""
+
+        @chainable_property("label_text", str, top_level=True)
+        @chainable_property("label_color", str, validator="color")
+        class LabeledLineSeries(LineSeries):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._label_text = "last"
+                self._label_color = "#ff0000"
+
+        series = LabeledLineSeries(data=[LineData(time=T, value=1.0)])
+
+        config = series.asdict()
+
+        assert config == _reflected_config(series, series.data_dict)
+        assert config["labelText"] == "last"
+        assert config["options"]["labelColor"] == "#ff0000"
+        assert "labelText" not in LineSeries(data=[LineData(time=T, value=1.0)]).asdict()
@@ -0,0 +1,210 @@
+"""
+Tests for streaming updates of series.
+
+This module tests Series.append(), Series.update_last() and max_points on the
+series types used for live charts, and the incremental serialization of the
+underlying SeriesData.
+"""
+
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts.config_delta import diff_series_data
+from streamlit_lightweight_charts_pro.charts.series import (
+    BandSeries,
+    CandlestickSeries,
+    HistogramSeries,
+    LineSeries,
+    RibbonSeries,
+)
+from streamlit_lightweight_charts_pro.charts.series.trend_fill import TrendFillSeries
+from streamlit_lightweight_charts_pro.data import (
+    BandData,
+    CandlestickData,
+    HistogramData,
+    LineData,
+    RibbonData,
+)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.data.trend_fill import TrendFillData
+
+START = 1_700_000_000
+
+
+def _point(data_class, i, level=100.0):
+    """Build point i of the given data class around a price level."""
+    time = START + i * 60
+    if data_class is CandlestickData:
+        return CandlestickData(
+            time=time, open=level, high=level + 2, low=level - 2, close=level + 1
+        )
+    if data_class is BandData:
+        return BandData(time=time, upper=level + 1, middle=level, lower=level - 1)
+    if data_class is RibbonData:
+        return RibbonData(time=time, upper=level + 1, lower=level - 1)
+    if data_class is TrendFillData:
+        return TrendFillData(time=time, base_line=level, upper_trend=level + 1, trend_direction=1)
+    return data_class(time=time, value=level)
+
+
+SERIES_CLASSES = [
+    (CandlestickSeries, CandlestickData),
+    (LineSeries, LineData),
+    (HistogramSeries, HistogramData),
+    (BandSeries, BandData),
+    (RibbonSeries, RibbonData),
+    (TrendFillSeries, TrendFillData),
+]
+
+
+@pytest.mark.parametrize("series_class,data_class", SERIES_CLASSES)
+class TestSeriesStreaming:
+    """append() and update_last() on every streaming series type."""
+
+    def test_append_and_update_last(self, series_class, data_class):
+        """Test the payload matches a series built from all points at once."""
+        points = [_point(data_class, i) for i in range(5)]
+        series = series_class(data=points[:3])
+
+        series.append(points[3])
+        series.append(points[4:])
+        series.update_last(_point(data_class, 4, level=90.0))
+
+        expected = points[:4] + [_point(data_class, 4, level=90.0)]
+        assert series.data_dict == series_class(data=expected).data_dict
+
+    def test_max_points_keeps_latest(self, series_class, data_class):
+        """Test bounded series drop their oldest points."""
+        series = series_class(data=[_point(data_class, i) for i in range(3)])
+        series.max_points = 4
+
+        for i in range(3, 10):
+            series.append(_point(data_class, i))
+
+        assert len(series.data) == 4
+        assert [point["time"] for point in series.data_dict] == [
+            START + i * 60 for i in range(6, 10)
+        ]
+
+    def test_append_rejects_older_points(self, series_class, data_class):
+        """Test appended points must start after the last point."""
+        series = series_class(data=[_point(data_class, i) for i in range(3)])
+
+        with pytest.raises(ValueError, match="must start after the last point"):
+            series.append(_point(data_class, 2))
+
+    def test_update_last_requires_same_time(self, series_class, data_class):
+        """Test update_last() only replaces the bar with the last time."""
+        series = series_class(data=[_point(data_class, i) for i in range(3)])
+
+        with pytest.raises(ValueError, match="expects the time of the last point"):
+            series.update_last(_point(data_class, 3))
+
+
+class TestSeriesAppendInputs:
+    """append() accepts the same inputs as the constructor."""
+
+    def test_append_dataframe_reuses_column_mapping(self):
+        """Test DataFrames are appended with the mapping given at construction."""
+        mapping = {"time": "ts", "value": "price"}
+        df = pd.DataFrame({"ts": [START + i * 60 for i in range(4)], "price": [1.0, 2.0, 3.0, 4.0]})
+        series = LineSeries(data=df.iloc[:2], column_mapping=mapping)
+
+        series.append(df.iloc[2:])
+
+        assert series.data_dict == LineSeries(data=df, column_mapping=mapping).data_dict
+
+    def test_append_dataframe_to_series_from_dataframe(self):
+        """Test from_dataframe() keeps the mapping for appended DataFrames."""
+        mapping = {"time": "ts", "value": "price"}
+        df = pd.DataFrame({"ts": [START + i * 60 for i in range(4)], "price": [1.0, 2.0, 3.0, 4.0]})
+        series = LineSeries.from_dataframe(df.iloc[:2], column_mapping=mapping)
+
+        series.append(df.iloc[2:])
+
+        assert series.data_dict == LineSeries(data=df, column_mapping=mapping).data_dict
+
+    def test_append_promotes_int_values(self):
+        """Test appending floats to integer values keeps the appended precision."""
+        series = LineSeries(
+            data=pd.DataFrame({"time": [START], "value": [1]}),
+            column_mapping={"time": "time", "value": "value"},
+        )
+        series.data_dict  # Serialize once, as a render would
+
+        series.append(LineData(time=START + 60, value=1.5))
+
+        assert series.data_dict == [
+            {"time": START, "value": 1.0},
+            {"time": START + 60, "value": 1.5},
+        ]
+
+    def test_append_invalid_type(self):
+        """Test unsupported inputs are rejected."""
+        series = LineSeries(data=[])
+
+        with pytest.raises(ValueError, match="data must be a data object"):
+            series.append({"time": START, "value": 1.0})
+
+    def test_append_to_empty_series(self):
+        """Test streaming into a series created without data."""
+        series = LineSeries(data=[])
+
+        series.append(LineData(time=START, value=1.0))
+
+        assert series.data_dict == [{"time": START, "value": 1.0}]
+
+    def test_invalid_max_points(self):
+        """Test max_points must be a positive integer."""
+        series = LineSeries(data=[])
+
+        with pytest.raises(ValueError, match="max_points must be a positive integer"):
+            series.max_points = 0
+
+
+class TestIncrementalSerialization:
+    """Modified SeriesData only serializes the points that changed."""
+
+    def test_dirty_range_tracks_tail(self):
+        """Test only appended and updated points are dirty after a serialization."""
+        data = SeriesData.from_data(LineData, [_point(LineData, i) for i in range(5)])
+        data.append(_point(LineData, 5))
+        first = data.asdicts()
+
+        assert data.dirty_range is None
+
+        data.append(_point(LineData, 6))
+        data.update_last(_point(LineData, 6, level=50.0))
+        assert data.dirty_range == (6, 7)
+
+        second = data.asdicts()
+        assert second[:6] == first
+        assert all(old is new for old, new in zip(first, second[:6]))
+        assert second[6] == {"time": START + 360, "value": 50.0}
+
+    def test_bounded_payload_reuse(self):
+        """Test the payload stays correct while old points are dropped."""
+        data = SeriesData.from_data(LineData, [_point(LineData, i) for i in range(3)])
+        data.max_points = 3
+        for i in range(3, 50):
+            data.append(_point(LineData, i, level=float(i)))
+            payload = data.asdicts()
+
+        assert payload == [_point(LineData, i, level=float(i)).asdict() for i in range(47, 50)]
+        # The buffers stay bounded at twice max_points
+        assert len(data._buffers["time"]) <= 6
+
+    def test_delta_of_bounded_series_is_append_with_trim(self):
+        """Test the delta protocol ships only the tail of a bounded series."""
+        series = LineSeries(data=[_point(LineData, i) for i in range(5)])
+        series.max_points = 5
+        before = series.data_dict
+
+        series.append(_point(LineData, 5))
+        after = series.data_dict
+
+        assert diff_series_data(before, after) == {
+            "op": "append",
+            "data": [after[-1]],
+            "trim": 1,
+        }
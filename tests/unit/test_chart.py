@@ -645,6 +645,58 @@ class TestChartRendering:
         # When no key is provided, a unique key should be generated
         assert call_args.kwargs["key"].startswith("chart_")
 
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_keys_stable_across_reruns(self, mock_get_component_func):
+        """Test two reruns that build the same chart render with identical keys."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+
+        def build_chart(last_close):
+            """Build the chart the way a Streamlit script would on every rerun."""
+            candles = [
+                OhlcvData(1640995200, 100.0, 105.0, 98.0, 102.0, 1000.0),
+                OhlcvData(1641081600, 102.0, 108.0, 101.0, last_close, 1200.0),
+            ]
+            chart = Chart(series=CandlestickSeries(data=candles))
+            chart.add_series(LineSeries(data=[LineData(1640995200, 101.0)], pane_id=1))
+            return chart.update_options(height=500)
+
+        build_chart(106.0).render()
+        build_chart(107.5).render()  # New data, same structure
+
+        first, second = mock_component.call_args_list
+        assert first.kwargs["key"] == second.kwargs["key"]
+        first_chart_id = first.kwargs["config"]["charts"][0]["chartId"]
+        assert first_chart_id == second.kwargs["config"]["charts"][0]["chartId"]
+
+    def test_structure_key_changes_with_structure(self):
+        """Test series layout and user keys change the structure key, options do not."""
+        data = [LineData(1640995200, 100.0)]
+        base = Chart(series=LineSeries(data=data)).structure_key()
+
+        assert Chart(series=LineSeries(data=data, pane_id=1)).structure_key() != base
+        assert Chart(series=HistogramSeries(data=data)).structure_key() != base
+        assert (
+            Chart(series=LineSeries(data=data)).update_options(height=600).structure_key() == base
+        )
+        assert Chart(series=LineSeries(data=data)).structure_key(key="other") != base
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart._component_keys_this_run")
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_identical_charts_in_one_run(self, mock_get_component_func, mock_keys):
+        """Test identical charts rendered in the same run get distinct, stable keys."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        used_keys = set()
+        mock_keys.return_value = used_keys
+        mock_component.side_effect = lambda **kwargs: used_keys.add(kwargs["key"])
+
+        Chart().render()
+        Chart().render()
+
+        first, second = mock_component.call_args_list
+        assert second.kwargs["key"] == f"{first.kwargs['key']}_1"
+
 
 class TestChartMethodChaining:
     """Test cases for method chaining functionality."""
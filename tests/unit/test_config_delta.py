@@ -0,0 +1,290 @@
+"""
+Tests for the incremental config protocol.
+
+This module tests the diffing of frontend configurations and the versioned
+payloads produced by ConfigDeltaTracker, including the Chart.render() wiring.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.config_delta import (
+    ConfigDeltaTracker,
+    diff_config,
+    diff_series_data,
+)
+from streamlit_lightweight_charts_pro.charts.series import LineSeries
+from streamlit_lightweight_charts_pro.data import LineData
+
+
+def _bars(count, last_value=None):
+    """Line data points one minute apart, optionally overriding the last value."""
+    bars = [{"time": 1_700_000_000 + i * 60, "value": float(i)} for i in range(count)]
+    if last_value is not None:
+        bars[-1] = {**bars[-1], "value": last_value}
+    return bars
+
+
+def _chart(values, color="#2196f3", height=400):
+    """Chart with one line series over the given values."""
+    data = [LineData(time=1_700_000_000 + i * 60, value=value) for i, value in enumerate(values)]
+    series = LineSeries(data=data)
+    series.line_options.color = color
+    chart = Chart(series=series).incremental_updates()
+    chart.update_options(height=height)
+    return chart
+
+
+class TestDiffSeriesData:
+    """Data changes map to append or setData operations."""
+
+    def test_unchanged(self):
+        """Test identical data produces no operation."""
+        assert diff_series_data(_bars(5), _bars(5)) is None
+
+    def test_appended_bars(self):
+        """Test new bars at the end produce an append of the new bars only."""
+        operation = diff_series_data(_bars(5), _bars(7))
+
+        assert operation == {"op": "append", "data": _bars(7)[5:]}
+
+    def test_updated_last_bar(self):
+        """Test a changed last bar is sent alone."""
+        operation = diff_series_data(_bars(5), _bars(5, last_value=42.0))
+
+        assert operation == {"op": "append", "data": [_bars(5, last_value=42.0)[-1]]}
+
+    def test_updated_last_bar_and_appended(self):
+        """Test the updated last bar comes first, followed by the new bars."""
+        new_data = _bars(7)
+        old_data = _bars(5, last_value=-1.0)
+
+        operation = diff_series_data(old_data, new_data)
+
+        assert operation == {"op": "append", "data": new_data[4:]}
+
+    @pytest.mark.parametrize(
+        "new_data",
+        [
+            _bars(3),  # Truncated
+            [{**bar, "value": 0.5} if i == 1 else bar for i, bar in enumerate(_bars(6))],
+            [{**bar, "time": bar["time"] + 1} if i == 4 else bar for i, bar in enumerate(_bars(6))],
+        ],
+        ids=["truncated", "history_changed", "last_time_changed"],
+    )
+    def test_other_changes_replace_data(self, new_data):
+        """Test any other change sends the whole data."""
+        assert diff_series_data(_bars(5), new_data) == {"op": "setData", "data": new_data}
+
+    def test_trimmed_front(self):
+        """Test points dropped from the front are sent as a trim count."""
+        operation = diff_series_data(_bars(5), _bars(7)[2:])
+
+        assert operation == {"op": "append", "data": _bars(7)[5:], "trim": 2}
+
+    def test_trimmed_past_old_data(self):
+        """Test new data starting after all old points is set."""
+        new_data = [{**bar, "time": bar["time"] + 3600} for bar in _bars(3)]
+
+        assert diff_series_data(_bars(5), new_data) == {"op": "setData", "data": new_data}
+
+    def test_from_empty(self):
+        """Test data for a previously empty series is set."""
+        assert diff_series_data([], _bars(2)) == {"op": "setData", "data": _bars(2)}
+
+
+class TestDiffConfig:
+    """Config changes map to chart deltas, or require a full config."""
+
+    def test_append_and_options(self):
+        """Test appended data and changed options on the same chart."""
+        old = _chart([1.0, 2.0]).to_frontend_config()
+        new = _chart([1.0, 2.0, 3.0], height=500).to_frontend_config()
+
+        delta = diff_config(old, new)
+
+        chart_delta = delta["charts"][0]
+        assert chart_delta["chartId"] == new["charts"][0]["chartId"]
+        assert chart_delta["options"] == new["charts"][0]["chart"]
+        assert chart_delta["series"] == [
+            {"op": "append", "index": 0, "data": [new["charts"][0]["series"][0]["data"][-1]]}
+        ]
+
+    def test_series_options(self):
+        """Test changed series options produce an options operation."""
+        old = _chart([1.0, 2.0]).to_frontend_config()
+        new = _chart([1.0, 2.0], color="#ff0000").to_frontend_config()
+
+        operations = diff_config(old, new)["charts"][0]["series"]
+
+        assert operations == [
+            {"op": "options", "index": 0, "options": new["charts"][0]["series"][0]["options"]}
+        ]
+
+    def test_added_and_removed_series(self):
+        """Test series are added at and removed from the end of the list."""
+        first = {"type": "line", "data": _bars(2), "options": {}}
+        second = {"type": "histogram", "data": _bars(2), "options": {}}
+        third = {"type": "area", "data": _bars(2), "options": {}}
+        base = {"charts": [{"chartId": "c", "chart": {}, "series": [first, second]}]}
+
+        added = diff_config(
+            base, {"charts": [{"chartId": "c", "chart": {}, "series": [first, second, third]}]}
+        )
+        removed = diff_config(base, {"charts": [{"chartId": "c", "chart": {}, "series": [first]}]})
+        replaced = diff_config(
+            base, {"charts": [{"chartId": "c", "chart": {}, "series": [first, third]}]}
+        )
+
+        assert added["charts"][0]["series"] == [{"op": "add", "index": 2, "series": third}]
+        assert removed["charts"][0]["series"] == [{"op": "remove", "index": 1}]
+        assert replaced["charts"][0]["series"] == [{"op": "replace", "index": 1, "series": third}]
+
+    def test_unpatchable_changes_require_full_config(self):
+        """Test annotation, chart id and chart count changes are not diffed."""
+        base = {"charts": [{"chartId": "c", "chart": {}, "series": [], "annotations": {}}]}
+
+        assert (
+            diff_config(
+                base,
+                {"charts": [{"chartId": "c", "chart": {}, "series": [], "annotations": {"x": 1}}]},
+            )
+            is None
+        )
+        assert diff_config(base, {"charts": [{"chartId": "d", "chart": {}, "series": []}]}) is None
+        assert diff_config(base, {"charts": []}) is None
+
+
+class TestConfigDeltaTracker:
+    """The tracker versions payloads and falls back to full configs."""
+
+    def test_first_payload_is_full(self):
+        """Test the first payload is the full config with a version."""
+        config = _chart([1.0]).to_frontend_config()
+
+        payload = ConfigDeltaTracker().prepare(config)
+
+        assert payload == {**config, "version": 1}
+
+    def test_next_payloads_are_deltas(self):
+        """Test later payloads are deltas against the previous version."""
+        tracker = ConfigDeltaTracker()
+        tracker.prepare(_chart([1.0, 2.0]).to_frontend_config())
+
+        payload = tracker.prepare(_chart([1.0, 2.0, 3.0]).to_frontend_config())
+        unchanged = tracker.prepare(_chart([1.0, 2.0, 3.0]).to_frontend_config())
+
+        assert payload["version"] == 2
+        assert payload["baseVersion"] == 1
+        assert "charts" not in payload
+        assert payload["delta"]["charts"][0]["series"][0]["op"] == "append"
+        assert unchanged == {
+            "version": 3,
+            "baseVersion": 2,
+            "delta": {
+                "charts": [{"chartId": payload["delta"]["charts"][0]["chartId"], "series": []}]
+            },
+        }
+
+    def test_resync_request(self):
+        """Test a new resync request from the frontend produces a full config once."""
+        tracker = ConfigDeltaTracker()
+        config = _chart([1.0]).to_frontend_config()
+        tracker.prepare(config)
+
+        resynced = tracker.prepare(config, {"resyncRequest": "a"})
+        same_request = tracker.prepare(config, {"resyncRequest": "a"})
+
+        assert resynced == {**config, "version": 2}
+        assert "delta" in same_request
+
+
+class TestRenderPayload:
+    """Chart.render() sends deltas inside a Streamlit session."""
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_outside_session_sends_config(self, mock_get_component_func):
+        """Test rendering without a script run sends the plain config."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        chart = _chart([1.0, 2.0])
+
+        chart.render(key="live")
+
+        payload = mock_component.call_args.kwargs["config"]
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == chart.to_frontend_config()
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart._session_state")
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_without_opt_in_sends_full_configs(
+        self, mock_get_component_func, mock_session_state
+    ):
+        """Test charts that did not opt in send the full config dict on every rerun."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        session_state = {}
+        mock_session_state.return_value = session_state
+
+        for count in (2, 3):
+            chart = _chart([1.0] * count).incremental_updates(False)
+            chart.render(key="live")
+            assert mock_component.call_args.kwargs["config"] == chart.to_frontend_config()
+        assert session_state == {}
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart._session_state")
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_reruns_send_deltas(self, mock_get_component_func, mock_session_state):
+        """Test a rerun that appends a bar only sends that bar."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        session_state = {}
+        mock_session_state.return_value = session_state
+
+        _chart([1.0, 2.0]).render(key="live")
+        first = json.loads(mock_component.call_args.kwargs["config"])
+        _chart([1.0, 2.0, 3.0]).render(key="live")
+        second = json.loads(mock_component.call_args.kwargs["config"])
+
+        assert first["version"] == 1
+        assert len(first["charts"][0]["series"][0]["data"]) == 2
+        assert second["baseVersion"] == 1
+        assert second["delta"]["charts"][0]["series"][0]["data"] == [
+            {"time": 1_700_000_120, "value": 3.0}
+        ]
+
+        # The frontend lost its state and asked for a resync
+        session_state["live"] = {"resyncRequest": 1}
+        _chart([1.0, 2.0, 3.0]).render(key="live")
+        third = json.loads(mock_component.call_args.kwargs["config"])
+
+        assert third["version"] == 3
+        assert len(third["charts"][0]["series"][0]["data"]) == 3
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart._session_state")
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_columnar_data_deltas(self, mock_get_component_func, mock_session_state):
+        """Test DataFrame data, sent as pre-encoded JSON, is diffed like point lists."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        mock_session_state.return_value = {}
+
+        def render(count):
+            frame = pd.DataFrame(
+                {"time": [1_700_000_000 + i * 60 for i in range(count)], "value": range(count)}
+            )
+            series = LineSeries(data=frame, column_mapping={"time": "time", "value": "value"})
+            Chart(series=series).incremental_updates().render(key="live")
+            return json.loads(mock_component.call_args.kwargs["config"])
+
+        first = render(2)
+        second = render(3)
+
+        assert first["charts"][0]["series"][0]["data"][1] == {"time": 1_700_000_060, "value": 1}
+        assert second["delta"]["charts"][0]["series"] == [
+            {"op": "append", "index": 0, "data": [{"time": 1_700_000_120, "value": 2}]}
+        ]
@@ -0,0 +1,167 @@
+"""
+Tests for the content-addressed series data cache.
+
+This module tests the content hashes of encoded series data and the payloads
+produced by DataCacheTracker, including the Chart.render() wiring.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.data_cache import (
+    CACHED_KEY,
+    DataCacheTracker,
+    content_hash,
+)
+from streamlit_lightweight_charts_pro.charts.series import LineSeries
+from streamlit_lightweight_charts_pro.utils.serialization import ColumnarData, EncodedRows
+
+
+def _rows(count, offset=0):
+    """Encoded line rows one minute apart."""
+    times = [1_700_000_000 + i * 60 for i in range(count)]
+    rows = [f'{{"time":{t},"value":{i + offset}}}'.encode() for i, t in enumerate(times)]
+    return EncodedRows(rows, times)
+
+
+def _config(*data):
+    """Full versioned config with one line series per data set."""
+    series = [{"type": "line", "data": item} for item in data]
+    return {"charts": [{"chartId": "chart-a", "series": series}], "version": 1}
+
+
+class TestContentHash:
+    """Encoded data is hashed by content."""
+
+    def test_encoded_rows(self):
+        """Test equal rows share a hash and different rows do not."""
+        assert _rows(3).content_hash == _rows(3).content_hash
+        assert _rows(3).content_hash != _rows(3, offset=1).content_hash
+        assert _rows(3).content_hash != _rows(4).content_hash
+
+    def test_columnar_data(self):
+        """Test columns are hashed by value, including their numeric data."""
+
+        def columns(values):
+            return ColumnarData(
+                ["time", "value"], {"time": np.arange(3) * 60.0, "value": np.array(values)}
+            )
+
+        assert columns([1.0, 2.0, 3.0]).content_hash == columns([1.0, 2.0, 3.0]).content_hash
+        assert columns([1.0, 2.0, 3.0]).content_hash != columns([1.0, 2.0, 4.0]).content_hash
+
+    def test_other_data_has_no_hash(self):
+        """Test point dictionaries and empty data are never cached."""
+        assert content_hash([{"time": 1, "value": 1}]) is None
+        assert content_hash(EncodedRows([], [])) is None
+
+
+class TestDataCacheTracker:
+    """The tracker replaces data the frontend holds by references."""
+
+    def test_first_payload_tags_data(self):
+        """Test data sent in full carries its hash."""
+        rows = _rows(3)
+
+        payload = DataCacheTracker().prepare(_config(rows))
+
+        series = payload["charts"][0]["series"][0]
+        assert series["data"] is rows
+        assert series["dataHash"] == rows.content_hash
+
+    def test_held_data_is_referenced(self):
+        """Test data sent before is replaced by a reference, without touching the input."""
+        tracker = DataCacheTracker()
+        tracker.prepare(_config(_rows(3)))
+        config = _config(_rows(3), _rows(3, offset=1))
+
+        payload = tracker.prepare(config)
+
+        cached, sent = payload["charts"][0]["series"]
+        assert cached["data"] == {CACHED_KEY: _rows(3).content_hash}
+        assert isinstance(sent["data"], EncodedRows)
+        assert isinstance(config["charts"][0]["series"][0]["data"], EncodedRows)
+        assert "dataHash" not in config["charts"][0]["series"][0]
+
+    def test_delta_operations(self):
+        """Test setData operations and added series are covered, appends are not."""
+        tracker = DataCacheTracker()
+        tracker.prepare(_config(_rows(3)))
+        delta = {
+            "charts": [
+                {
+                    "chartId": "chart-a",
+                    "series": [
+                        {"op": "setData", "index": 0, "data": _rows(3)},
+                        {"op": "append", "index": 0, "data": _rows(1)},
+                        {"op": "add", "index": 1, "series": {"type": "line", "data": _rows(3)}},
+                    ],
+                }
+            ]
+        }
+
+        payload = tracker.prepare({"version": 2, "baseVersion": 1, "delta": delta})
+
+        set_data, append, add = payload["delta"]["charts"][0]["series"]
+        assert set_data["data"] == {CACHED_KEY: _rows(3).content_hash}
+        assert "dataHash" not in append
+        assert add["series"]["data"] == {CACHED_KEY: _rows(3).content_hash}
+
+    def test_least_recently_used_data_is_evicted(self):
+        """Test the mirror evicts the same data as the frontend cache."""
+        tracker = DataCacheTracker(size=2)
+        tracker.prepare(_config(_rows(1), _rows(2)))
+        tracker.prepare(_config(_rows(1)))
+        tracker.prepare(_config(_rows(3)))
+
+        assert tracker.held == [_rows(1).content_hash, _rows(3).content_hash]
+
+    def test_resync_request_resets_held_data(self):
+        """Test the hashes reported with a resync request replace the mirror once."""
+        tracker = DataCacheTracker()
+        tracker.prepare(_config(_rows(1), _rows(2)))
+        frontend_value = {"resyncRequest": 1, "dataCache": [_rows(2).content_hash]}
+
+        payload = tracker.prepare(_config(_rows(1), _rows(2)), frontend_value)
+
+        first, second = payload["charts"][0]["series"]
+        assert isinstance(first["data"], EncodedRows)
+        assert second["data"] == {CACHED_KEY: _rows(2).content_hash}
+        assert tracker.held == [_rows(1).content_hash, _rows(2).content_hash]
+
+        tracker.prepare(_config(_rows(1)), frontend_value)
+        assert len(tracker.held) == 2
+
+
+class TestRenderDataCache:
+    """Chart.render() leaves out data the frontend holds."""
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart._session_state")
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_resync_sends_references(self, mock_get_component_func, mock_session_state):
+        """Test a full config after a resync only references the data already sent."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        session_state = {}
+        mock_session_state.return_value = session_state
+
+        def render():
+            frame = pd.DataFrame(
+                {"time": [1_700_000_000 + i * 60 for i in range(3)], "value": range(3)}
+            )
+            series = LineSeries(data=frame, column_mapping={"time": "time", "value": "value"})
+            Chart(series=series).incremental_updates().render(key="live")
+            return json.loads(mock_component.call_args.kwargs["config"])
+
+        first = render()
+        data_hash = first["charts"][0]["series"][0]["dataHash"]
+        session_state["live"] = {"resyncRequest": 1, "dataCache": [data_hash]}
+        second = render()
+
+        assert len(first["charts"][0]["series"][0]["data"]) == 3
+        assert second["charts"][0]["series"][0]["data"] == {CACHED_KEY: data_hash}
+        assert second["charts"][0]["series"][0]["dataHash"] == data_hash
@@ -0,0 +1,164 @@
+"""
+Tests for viewport reporting.
+
+This module tests reading viewports reported by the frontend, the data
+providers of series and the Chart.render() wiring that loads the window around
+the reported viewport before the config is built.
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart, Viewport
+from streamlit_lightweight_charts_pro.charts.series import CandlestickSeries, LineSeries
+
+START = 1_704_067_200
+MAPPING = {"time": "time", "value": "value"}
+OHLC_MAPPING = {name: name for name in ["time", "open", "high", "low", "close"]}
+
+
+class MinuteLineProvider:
+    """Data provider serving one-minute line points, recording its calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, start, end, max_bars):
+        self.calls.append((start, end, max_bars))
+        if start is None or end is None:
+            # Initial window: the first hour
+            start, end = START, START + 3_600
+        times = np.arange(start - start % 60, end + 1, 60, dtype=np.int64)
+        return pd.DataFrame({"time": times, "value": (times - START) / 60.0})
+
+
+def _report(chart, start, end, width=500):
+    """Component value reporting a viewport of the chart."""
+    return {
+        "viewport": {
+            "chartId": f"chart-{chart.structure_key()}",
+            "from": start,
+            "to": end,
+            "logicalFrom": 1.5,
+            "logicalTo": 60.5,
+            "width": width,
+        }
+    }
+
+
+class TestViewport:
+    """Test Viewport parsing and bar budgets."""
+
+    def test_from_component_value(self):
+        """Test that a report for the chart is read."""
+        value = {
+            "resyncRequest": 1,
+            "viewport": {"chartId": "chart-a", "from": 10, "to": 20.7, "width": 300},
+        }
+
+        viewport = Viewport.from_component_value(value, "chart-a")
+
+        assert viewport == Viewport("chart-a", 10, 20, width=300)
+        assert viewport.bar_budget(2_000) == 600
+        assert viewport.bar_budget(100) == 100
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            {"resyncRequest": 1},
+            {"viewport": {"chartId": "chart-b", "from": 10, "to": 20}},
+            {"viewport": {"chartId": "chart-a", "from": "x", "to": 20}},
+            {"viewport": {"chartId": "chart-a", "from": 30, "to": 20}},
+        ],
+    )
+    def test_invalid_values(self, value):
+        """Test that missing, foreign and malformed reports are ignored."""
+        assert Viewport.from_component_value(value, "chart-a") is None
+
+
+class TestSeriesDataProvider:
+    """Test loading series data through a data provider."""
+
+    def test_set_viewport_loads_padded_window(self):
+        """Test that the range widened by its length is requested."""
+        provider = MinuteLineProvider()
+        series = LineSeries(data=[], column_mapping=MAPPING)
+        series.data_provider = provider
+
+        series.set_viewport(START + 6_000, START + 12_000, max_bars=400)
+
+        assert provider.calls == [(START, START + 18_000, 1_200)]
+        assert len(series.data) == 301
+        assert series.asdict()["data"][0] == {"time": START, "value": 0.0}
+
+    def test_invalid_provider(self):
+        """Test that providers must be callable."""
+        with pytest.raises(TypeError):
+            LineSeries(data=[]).data_provider = "not callable"
+
+
+class TestChartViewport:
+    """Test Chart.render() with viewport reports."""
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart._session_state")
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_applies_reported_viewport(self, mock_get_component_func, mock_session_state):
+        """Test that the reported range is loaded and returned."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        session_state = {}
+        mock_session_state.return_value = session_state
+        provider = MinuteLineProvider()
+
+        def render():
+            series = LineSeries(data=[], column_mapping=MAPPING)
+            series.data_provider = provider
+            chart = Chart(series=series)
+            return chart, chart.render(key="live")
+
+        chart, viewport = render()
+        first = mock_component.call_args.kwargs["config"]
+
+        assert viewport is None
+        assert provider.calls == [(None, None, 2_000)]
+        assert first["charts"][0]["viewport"] == {"debounceMs": 300}
+        assert len(first["charts"][0]["series"][0]["data"]) == 61
+
+        session_state["live"] = _report(chart, START + 36_000, START + 39_600, width=400)
+        _, viewport = render()
+
+        assert viewport == Viewport.from_component_value(session_state["live"], viewport.chart_id)
+        assert provider.calls[-1] == (START + 32_400, START + 43_200, 2_400)
+
+    def test_pyramid_resolution_follows_width(self):
+        """Test that aggregated series fit the bars to the chart width."""
+        times = START + np.arange(20_000, dtype=np.int64) * 60
+        close = np.linspace(100.0, 200.0, len(times))
+        frame = pd.DataFrame(
+            {"time": times, "open": close, "high": close + 1, "low": close - 1, "close": close}
+        )
+        series = CandlestickSeries(
+            data=frame, column_mapping=OHLC_MAPPING, timeframes=["5m", "1h"], max_bars=5_000
+        )
+        chart = Chart(series=series)
+
+        chart.apply_viewport(Viewport(chart_id="chart", start=START, end=START + 3_000 * 60))
+        assert series.resolution is None
+
+        narrow = Viewport(chart_id="chart", start=START, end=START + 3_000 * 60, width=200)
+        chart.apply_viewport(narrow)
+        assert series.resolution == 3_600
+
+    def test_report_viewport(self):
+        """Test that plain charts only report their viewport on request."""
+        chart = Chart(series=LineSeries(data=[]))
+        assert "viewport" not in chart.to_frontend_config()["charts"][0]
+
+        chart.report_viewport(debounce_ms=150)
+        assert chart.to_frontend_config()["charts"][0]["viewport"] == {"debounceMs": 150}
+        with pytest.raises(ValueError):
+            chart.report_viewport(debounce_ms=-1)
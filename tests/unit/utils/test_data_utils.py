@@ -0,0 +1,165 @@
+"""
+Tests for data utility functions.
+
+This module tests the vectorized time normalization in data_utils:
+- datetime64 arrays, DatetimeIndex and timezone-aware Series
+- Epoch integers and floats with unit auto-detection
+- String and datetime object columns
+- Error handling for missing and unparseable values
+- Agreement with the scalar normalize_time(), including in other time zones
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.data import LineData
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.utils.data_utils import normalize_time, normalize_time_array
+
+JAN_1 = 1704067200  # 2024-01-01T00:00:00Z
+JAN_2 = 1704153600  # 2024-01-02T00:00:00Z
+
+
+class TestNormalizeTimeArray:
+    """Test normalize_time_array()."""
+
+    def test_datetime64_array(self):
+        """Test NumPy datetime64 arrays of any resolution."""
+        values = np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[ms]")
+
+        result = normalize_time_array(values)
+
+        assert result.dtype == np.int64
+        assert result.tolist() == [JAN_1, JAN_2]
+
+    def test_datetime_index(self):
+        """Test a naive DatetimeIndex."""
+        index = pd.date_range("2024-01-01", periods=2, freq="D")
+
+        assert normalize_time_array(index).tolist() == [JAN_1, JAN_2]
+
+    def test_tz_aware_series(self):
+        """Test timezone-aware values are converted to UTC."""
+        series = pd.Series(pd.date_range("2024-01-01 09:30", periods=2, tz="America/New_York"))
+
+        expected = [int(ts.timestamp()) for ts in series]
+        assert normalize_time_array(series).tolist() == expected
+        assert normalize_time_array(pd.DatetimeIndex(series)).tolist() == expected
+
+    @pytest.mark.parametrize(
+        "scale",
+        [1, 10**3, 10**6, 10**9],
+        ids=["seconds", "milliseconds", "microseconds", "nanoseconds"],
+    )
+    def test_epoch_unit_detection(self, scale):
+        """Test epoch integers are converted from their detected unit."""
+        values = np.array([JAN_1, JAN_2], dtype=np.int64) * scale
+
+        assert normalize_time_array(values).tolist() == [JAN_1, JAN_2]
+
+    def test_explicit_unit(self):
+        """Test an explicit unit overrides detection."""
+        assert normalize_time_array([5000, 10000], unit="ms").tolist() == [5, 10]
+
+    def test_invalid_unit(self):
+        """Test unknown units are rejected."""
+        with pytest.raises(ValueError, match="Invalid epoch unit"):
+            normalize_time_array([1], unit="minutes")
+
+    def test_float_epochs(self):
+        """Test float epochs are truncated to whole seconds."""
+        assert normalize_time_array([JAN_1 + 0.9, JAN_2 + 0.1]).tolist() == [JAN_1, JAN_2]
+        assert normalize_time_array([JAN_1 * 1000.0, JAN_2 * 1000.0]).tolist() == [JAN_1, JAN_2]
+
+    def test_string_column(self):
+        """Test string columns are parsed in one pass, honoring offsets."""
+        values = pd.Series(["2024-01-01 00:00:00", "2024-01-02T01:00:00+01:00"])
+
+        assert normalize_time_array(values).tolist() == [JAN_1, JAN_2]
+
+    def test_mixed_objects(self):
+        """Test object columns mixing strings, Timestamps and datetimes."""
+        values = np.array(
+            [pd.Timestamp("2024-01-01"), "2024-01-02", datetime(2024, 1, 3)], dtype=object
+        )
+
+        expected = [JAN_1, JAN_2, int(datetime(2024, 1, 3).timestamp())]
+        assert normalize_time_array(values).tolist() == expected
+
+    def test_mixed_objects_with_epochs(self):
+        """Test epoch numbers mixed with strings are read as epochs, not nanoseconds."""
+        values = np.array(["2024-01-01", JAN_2, pd.Timestamp("2024-01-03")], dtype=object)
+
+        assert normalize_time_array(values).tolist() == [JAN_1, JAN_2, JAN_2 + 86400]
+
+    def test_matches_normalize_time(self):
+        """Test results agree with the scalar normalize_time()."""
+        values = ["2024-03-10 14:30:00", "2024-06-01T08:00:00Z", "2024-12-31"]
+
+        assert normalize_time_array(values).tolist() == [normalize_time(v) for v in values]
+
+    def test_empty(self):
+        """Test empty input returns an empty int64 array."""
+        result = normalize_time_array([])
+
+        assert result.dtype == np.int64
+        assert len(result) == 0
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.array(["2024-01-01", "NaT"], dtype="datetime64[s]"),
+            np.array([JAN_1, np.nan]),
+            pd.Series(["2024-01-01", None]),
+        ],
+        ids=["datetime64", "float", "string"],
+    )
+    def test_missing_values(self, values):
+        """Test missing times are rejected."""
+        with pytest.raises(ValueError, match="must not contain missing values"):
+            normalize_time_array(values)
+
+    def test_invalid_string(self):
+        """Test unparseable strings report the offending value."""
+        with pytest.raises(ValueError, match="Invalid time string: 'not a date'"):
+            normalize_time_array(["2024-01-01", "not a date"])
+
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    """Run a test with the local time zone of New York."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset() is not available on this platform")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestScalarAgreement:
+    """List input and DataFrame input of the same values give the same times."""
+
+    def test_naive_datetimes_are_local_time(self, new_york_time):
+        """Test naive datetime objects are read as local time by both paths."""
+        opening = datetime(2024, 1, 1, 9, 30)
+        values = np.array([opening, pd.Timestamp("2024-01-01 09:30"), "2024-01-01 09:30"])
+        frame = pd.DataFrame({"time": pd.Series([opening], dtype=object), "value": [1.0]})
+
+        series = SeriesData.from_columns(LineData, frame.to_dict("series"))
+
+        assert normalize_time(opening) == 1704119400
+        assert normalize_time_array(values).tolist() == [normalize_time(v) for v in values]
+        assert series.columns["time"].tolist() == [LineData(opening, 1.0).time]
+
+    @pytest.mark.parametrize("scale", [10**3, 10**6, 10**9])
+    def test_epoch_units(self, scale):
+        """Test scalar epochs have their unit detected like columns."""
+        assert normalize_time(JAN_1 * scale) == JAN_1
+        assert normalize_time(float(JAN_1 * scale)) == JAN_1
+        assert LineData(time=JAN_1 * scale, value=1.0).time == JAN_1
+        assert normalize_time(np.int64(JAN_1 * scale)) == JAN_1
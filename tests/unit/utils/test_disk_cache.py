@@ -0,0 +1,243 @@
+"""
+Tests for the persistent on-disk cache of series data.
+
+This module tests that DiskCache stores entries atomically and reads them back
+memory-mapped, evicts the least recently used entries beyond its size budget,
+and that a warm restart builds series and renders charts from the disk without
+converting or encoding the data again.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.series import (
+    CandlestickSeries,
+    LineSeries,
+    Series,
+    base,
+    conversion_cache,
+)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions.enums import DataTransport
+from streamlit_lightweight_charts_pro.utils.disk_cache import (
+    DiskCache,
+    disable_disk_cache,
+    disk_key,
+    enable_disk_cache,
+    get_disk_cache,
+)
+from streamlit_lightweight_charts_pro.utils.payload_cache import MIN_SHARED_POINTS, payload_cache
+from streamlit_lightweight_charts_pro.utils.serialization import EncodedRows, dumps
+
+MAPPING = {"time": "time", "open": "o", "high": "h", "low": "l", "close": "c"}
+
+
+@pytest.fixture(autouse=True)
+def _no_cached_state():
+    """Start and end every test without disk cache and with empty memory caches."""
+    disable_disk_cache()
+    conversion_cache.clear()
+    payload_cache.clear()
+    yield
+    disable_disk_cache()
+    conversion_cache.clear()
+    payload_cache.clear()
+
+
+def _frame(count=MIN_SHARED_POINTS):
+    """OHLC bars one minute apart, indexed by time."""
+    close = 100.0 + np.arange(count, dtype=float)
+    index = pd.date_range("2024-01-01", periods=count, freq="min")
+    return pd.DataFrame({"o": close, "h": close + 1, "l": close - 1, "c": close}, index=index)
+
+
+def _restart():
+    """Forget everything held in memory, as a new process would."""
+    conversion_cache.clear()
+    payload_cache.clear()
+
+
+def _series_data(series):
+    """Serialized data of the only series of a chart config."""
+    return Chart(series=series).to_frontend_config(encode_data=True)["charts"][0]["series"][0][
+        "data"
+    ]
+
+
+class TestDiskCache:
+    """Entries are stored atomically, memory-mapped back and bounded in size."""
+
+    def test_round_trip(self, tmp_path):
+        """Test arrays, strings, blobs and the description are read back read-only."""
+        cache = DiskCache(tmp_path)
+        values = np.arange(5, dtype=np.float64)
+        labels = np.array(["a", None, "c"], dtype=object)
+
+        assert cache.put("k" * 40, {"n": 5}, {"v": values, "s": labels}, {"b": b"[1,2]"})
+        entry = cache.get("k" * 40)
+
+        assert entry.meta == {"n": 5}
+        np.testing.assert_array_equal(entry.arrays["v"], values)
+        assert isinstance(entry.arrays["v"].base, np.memmap)
+        assert not entry.arrays["v"].flags.writeable
+        assert entry.arrays["s"].tolist() == ["a", None, "c"]
+        assert bytes(entry.blobs["b"]) == b"[1,2]"
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_missing_and_unstorable_entries(self, tmp_path):
+        """Test misses are counted, and object arrays of other values are not stored."""
+        cache = DiskCache(tmp_path)
+
+        assert cache.get(disk_key("missing")) is None
+        assert not cache.put(disk_key("objects"), {}, {"v": np.array([{}], dtype=object)})
+        assert cache.misses == 1
+        assert len(cache) == 0
+        # No partial entry is left behind
+        assert os.listdir(tmp_path) == []
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Test entries beyond max_bytes are deleted, oldest use first."""
+        cache = DiskCache(tmp_path)
+        blob = b"x" * 1000
+        keys = [disk_key(name) for name in "abc"]
+        for age, key in enumerate(keys):
+            cache.put(key, {}, blobs={"b": blob})
+            os.utime(cache._path(key), (1000 + age, 1000 + age))
+        cache.get(keys[0])
+
+        size = cache.nbytes // 3
+        cache.max_bytes = 2 * size
+        cache.evict()
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.nbytes == 2 * size
+
+    def test_puts_only_scan_the_directory_beyond_max_bytes(self, tmp_path, monkeypatch):
+        """Test put() tracks the total size and evicts once it exceeds max_bytes."""
+        cache = DiskCache(tmp_path)
+        scans = []
+        evict = cache.evict
+        monkeypatch.setattr(cache, "evict", lambda: scans.append(1) or evict())
+        blob = b"x" * 1000
+        cache.put(disk_key("first"), {}, blobs={"b": blob})
+        size = cache.nbytes
+        cache.max_bytes = 3 * size
+
+        for name in "abc":
+            cache.put(disk_key(name), {}, blobs={"b": blob})
+
+        # One scan to measure the directory, one when the fourth entry overflows
+        assert len(scans) == 2
+        assert len(cache) == 3
+        assert cache.nbytes == 3 * size
+
+    def test_enable_keeps_the_cache_of_a_directory(self, tmp_path):
+        """Test enabling the same directory again reuses the cache."""
+        cache = enable_disk_cache(tmp_path / "charts", max_bytes=1000)
+
+        assert enable_disk_cache(str(tmp_path / "charts")) is cache
+        assert cache.max_bytes > 1000
+        assert enable_disk_cache(tmp_path / "other") is not cache
+        disable_disk_cache()
+        assert get_disk_cache() is None
+
+
+class TestEncodedRowsFromJson:
+    """EncodedRows read back from a JSON array behave like the original."""
+
+    def test_rows_are_split_on_use(self):
+        """Test from_json() with row_bounds() restores the points."""
+        rows = EncodedRows([b'{"time":1}', b'{"time":22,"v":"a,b"}', b"{}"], [1, 22, 3])
+        restored = EncodedRows.from_json(rows.to_json(), rows.row_bounds(), rows.times)
+
+        assert restored._rows is None
+        assert restored == rows
+        assert restored.rows == rows.rows
+        assert restored[1:] == rows[1:]
+        assert dumps({"data": restored}) == dumps({"data": rows})
+
+    def test_empty_rows(self):
+        """Test an empty array round-trips."""
+        rows = EncodedRows([], [])
+        restored = EncodedRows.from_json(rows.to_json(), rows.row_bounds(), rows.times)
+
+        assert restored.rows == []
+        assert restored.to_json() == b"[]"
+
+
+class TestWarmRestart:
+    """A new process finds converted and serialized data on the disk."""
+
+    def test_series_skip_the_conversion(self, tmp_path, monkeypatch):
+        """Test series built from equal data after a restart are not converted again."""
+        cache = enable_disk_cache(tmp_path)
+        first = CandlestickSeries(data=_frame(), column_mapping=dict(MAPPING))
+        _restart()
+
+        def no_conversion(*args, **kwargs):
+            raise AssertionError("converted again")
+
+        monkeypatch.setattr(Series, "_process_dataframe_input", no_conversion)
+        second = CandlestickSeries(data=_frame(), column_mapping=dict(MAPPING))
+        _restart()
+        third = CandlestickSeries.from_dataframe(_frame(), column_mapping=dict(MAPPING))
+
+        assert cache.hits == 2
+        assert second.data == first.data
+        assert third.data == first.data
+        assert not second.data.columns["close"].flags.writeable
+
+    def test_content_fingerprint_is_the_disk_key(self, tmp_path, monkeypatch):
+        """Test the data is hashed once for the conversion cache and the disk cache."""
+        cache = enable_disk_cache(tmp_path)
+        hashed = []
+        content_digest = base._content_digest
+        monkeypatch.setattr(
+            base,
+            "_content_digest",
+            lambda frame, columns: hashed.append(columns) or content_digest(frame, columns),
+        )
+
+        CandlestickSeries(data=_frame(), column_mapping=dict(MAPPING))
+
+        assert len(hashed) == 1
+        assert len(cache) == 1
+
+    def test_edited_data_is_converted_again(self, tmp_path):
+        """Test the key covers every value of the DataFrame."""
+        cache = enable_disk_cache(tmp_path)
+        CandlestickSeries(data=_frame(), column_mapping=dict(MAPPING))
+        edited = _frame()
+        edited.iloc[500, 0] = 1.0
+        series = CandlestickSeries(data=edited, column_mapping=dict(MAPPING))
+
+        assert cache.hits == 0
+        assert series.data[500].open == 1.0
+
+    @pytest.mark.parametrize("transport", [DataTransport.JSON, DataTransport.COLUMNAR])
+    def test_render_skips_the_encoding(self, tmp_path, monkeypatch, transport):
+        """Test rendering equal data after a restart reads its payload back."""
+        enable_disk_cache(tmp_path)
+        series = LineSeries(data=_frame()[["c"]], column_mapping={"time": "time", "value": "c"})
+        series.transport = transport
+        first = _series_data(series)
+        _restart()
+
+        def no_encoding(self):
+            raise AssertionError("encoded again")
+
+        monkeypatch.setattr(SeriesData, "encoded", no_encoding)
+        monkeypatch.setattr(SeriesData, "columnar", no_encoding)
+        second = _series_data(series)
+
+        assert second is not first
+        assert second == first
+        assert dumps(second) == dumps(first)
+        if transport == DataTransport.JSON:
+            assert second.content_hash == first.content_hash
@@ -0,0 +1,178 @@
+"""
+Tests for downsampling of line-like series.
+
+This module checks the point selection of utils.downsampling (LTTB, min-max and
+M4) and the downsample option of line, area, baseline and histogram series,
+which must only change the data sent to the frontend.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts.series import (
+    AreaSeries,
+    BaselineSeries,
+    CandlestickSeries,
+    HistogramSeries,
+    LineSeries,
+)
+from streamlit_lightweight_charts_pro.data import CandlestickData, LineData
+from streamlit_lightweight_charts_pro.type_definitions.enums import (
+    DataTransport,
+    DownsampleMethod,
+)
+from streamlit_lightweight_charts_pro.utils.downsampling import (
+    downsample_indices,
+    lttb_indices,
+)
+
+START = 1_700_000_000
+METHODS = ["lttb", "minmax", "m4"]
+
+
+def _walk(length, seed=0):
+    """Build a random walk of the given length."""
+    return np.cumsum(np.random.default_rng(seed).standard_normal(length))
+
+
+def _frame(length):
+    """Build a DataFrame of one-minute points following a random walk."""
+    return pd.DataFrame(
+        {"time": START + np.arange(length, dtype=np.int64) * 60, "value": _walk(length)}
+    )
+
+
+MAPPING = {"time": "time", "value": "value"}
+
+
+class TestDownsampleIndices:
+    """Test point selection."""
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_keeps_bounds_and_extrema(self, method):
+        """Test that first, last, lowest and highest points are kept, in order."""
+        values = _walk(100_000)
+        kept = downsample_indices(values, method, 500)
+
+        assert len(kept) <= 500
+        assert np.all(np.diff(kept) > 0)
+        assert kept[0] == 0
+        assert kept[-1] == len(values) - 1
+        assert np.argmin(values) in kept
+        assert np.argmax(values) in kept
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_short_series_not_downsampled(self, method):
+        """Test that series with no more points than the target are left alone."""
+        assert downsample_indices(np.arange(10.0), method, 10) is None
+
+    def test_nan_values(self):
+        """Test that NaN values do not break the selection."""
+        values = _walk(10_000)
+        values[::7] = np.nan
+        kept = downsample_indices(values, "m4", 100)
+
+        assert kept[0] == 0
+        assert kept[-1] == len(values) - 1
+
+    def test_lttb_matches_reference(self):
+        """Test LTTB against a direct implementation of the algorithm."""
+        values = _walk(1_000, seed=3)
+        points = 50
+
+        length = len(values)
+        bucket = (length - 2) / (points - 2)
+        expected = [0]
+        previous = 0
+        for b in range(points - 2):
+            start = int(b * bucket) + 1
+            stop = int((b + 1) * bucket) + 1
+            next_start = stop
+            next_stop = min(int((b + 2) * bucket) + 1, length)
+            cx = (next_start + next_stop - 1) / 2.0
+            cy = values[next_start:next_stop].mean()
+            best, best_area = start, -1.0
+            for i in range(start, stop):
+                area = abs(
+                    (previous - cx) * (values[i] - values[previous])
+                    - (previous - i) * (cy - values[previous])
+                )
+                if area > best_area:
+                    best, best_area = i, area
+            expected.append(best)
+            previous = best
+        expected.append(length - 1)
+
+        np.testing.assert_array_equal(lttb_indices(values, points), expected)
+
+    def test_invalid_arguments(self):
+        """Test that unknown methods and too small targets are rejected."""
+        with pytest.raises(ValueError):
+            downsample_indices(np.arange(10.0), "average", 5)
+        with pytest.raises(ValueError):
+            downsample_indices(np.arange(10.0), DownsampleMethod.LTTB, 3)
+
+
+class TestSeriesDownsample:
+    """Test the downsample option of series."""
+
+    @pytest.mark.parametrize(
+        "series_class", [LineSeries, AreaSeries, BaselineSeries, HistogramSeries]
+    )
+    def test_asdict_is_downsampled(self, series_class):
+        """Test that only the kept points are serialized and the data is unchanged."""
+        df = _frame(20_000)
+        series = series_class(
+            data=df, column_mapping=MAPPING, downsample="lttb", downsample_points=300
+        )
+
+        data = series.asdict()["data"]
+
+        assert len(series.data) == 20_000
+        assert len(data) <= 300
+        assert data[0]["time"] == START
+        assert data[-1]["time"] == START + 19_999 * 60
+        assert min(point["value"] for point in data) == df["value"].min()
+        assert max(point["value"] for point in data) == df["value"].max()
+
+    def test_disabled_by_default(self):
+        """Test that every point is sent without the option."""
+        series = LineSeries(data=_frame(5_000), column_mapping=MAPPING)
+
+        assert series.downsample is None
+        assert len(series.asdict()["data"]) == 5_000
+
+    def test_list_data(self):
+        """Test downsampling of series built from data objects."""
+        data = [LineData(time=START + i * 60, value=float(i % 37)) for i in range(5_000)]
+        series = LineSeries(data=data, downsample=DownsampleMethod.M4, downsample_points=100)
+
+        assert len(series.asdict()["data"]) <= 100
+        assert len(series.data) == 5_000
+
+    @pytest.mark.parametrize("transport", [DataTransport.JSON, DataTransport.COLUMNAR])
+    def test_asdict_encoded(self, transport):
+        """Test that encoded payloads hold the same points as asdict()."""
+        series = LineSeries(
+            data=_frame(10_000), column_mapping=MAPPING, downsample="minmax", downsample_points=200
+        )
+        series.transport = transport
+
+        encoded = series.asdict_encoded()["data"]
+
+        assert len(encoded) == len(series.asdict()["data"])
+
+    def test_invalid_options(self):
+        """Test validation of downsample and downsample_points."""
+        series = LineSeries(data=_frame(10), column_mapping=MAPPING)
+        with pytest.raises(ValueError):
+            series.downsample = "average"
+        with pytest.raises(ValueError):
+            series.downsample_points = 3
+
+        candles = CandlestickSeries(
+            data=[CandlestickData(time=START, open=1.0, high=2.0, low=0.5, close=1.5)]
+        )
+        with pytest.raises(ValueError):
+            candles.downsample = "lttb"
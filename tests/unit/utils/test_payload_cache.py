@@ -0,0 +1,201 @@
+"""
+Tests for the process-wide cache of serialized series data.
+
+This module tests that series holding the same points share one frozen
+payload, that the payload encodes like an uncached one, and the bounds,
+statistics and concurrency of PayloadCache.
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.series import CandlestickSeries, LineSeries
+from streamlit_lightweight_charts_pro.data import LineData
+from streamlit_lightweight_charts_pro.type_definitions.enums import DataTransport
+from streamlit_lightweight_charts_pro.utils.payload_cache import (
+    MIN_SHARED_POINTS,
+    PayloadCache,
+    payload_cache,
+)
+from streamlit_lightweight_charts_pro.utils.serialization import EncodedRows, dumps
+
+MAPPING = {"time": "time", "value": "v"}
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    """Start and end every test with an empty shared cache."""
+    payload_cache.clear()
+    yield
+    payload_cache.clear()
+
+
+def _frame(count=MIN_SHARED_POINTS, offset=0.0):
+    """Line values one minute apart, indexed by time."""
+    index = pd.date_range("2024-01-01", periods=count, freq="min")
+    return pd.DataFrame({"v": np.arange(count, dtype=float) + offset}, index=index)
+
+
+def _series_data(series):
+    """Serialized data of the only series of a chart config."""
+    return Chart(series=series).to_frontend_config(encode_data=True)["charts"][0]["series"][0][
+        "data"
+    ]
+
+
+class TestSharedPayloads:
+    """Series holding the same points share their payload."""
+
+    def test_equal_series_share_rows(self):
+        """Test two sessions building the same series get one frozen EncodedRows."""
+        first = _series_data(LineSeries(data=_frame(), column_mapping=dict(MAPPING)))
+        second = _series_data(LineSeries(data=_frame(), column_mapping=dict(MAPPING)))
+
+        assert isinstance(first, EncodedRows)
+        assert second is first
+        assert dumps({"data": first}) == b'{"data":[' + b",".join(first.rows) + b"]}"
+        stats = payload_cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+        assert stats.resident_bytes == first.nbytes
+
+    def test_shared_rows_are_kept_as_json_only(self):
+        """Test a frozen EncodedRows holds its JSON array and not the rows as well."""
+        series = LineSeries(data=_frame(), column_mapping=dict(MAPPING))
+        rows = series.data.encoded()
+        json_size = len(dumps(rows))
+        content_hash = rows.content_hash
+
+        shared = _series_data(series)
+
+        assert shared._rows is None
+        assert shared.nbytes < json_size + 2 * shared.times.nbytes + 16 * len(shared)
+        assert shared == rows
+        assert shared[-2:] == rows[-2:]
+        assert shared[5] == rows[5]
+        assert shared.content_hash == content_hash
+        assert shared._rows is None
+
+    def test_payload_matches_uncached_encoding(self):
+        """Test a cached payload encodes exactly like the data itself."""
+        series = LineSeries(data=_frame(), column_mapping=dict(MAPPING))
+
+        shared = _series_data(series)
+
+        assert dumps(shared) == dumps(EncodedRows(shared.rows, shared.times))
+        assert json.loads(dumps(shared)) == series.data.asdicts()
+
+    def test_different_points_or_format_do_not_share(self):
+        """Test the content and the transport are part of the key."""
+        _series_data(LineSeries(data=_frame(), column_mapping=dict(MAPPING)))
+        _series_data(LineSeries(data=_frame(offset=1.0), column_mapping=dict(MAPPING)))
+        columnar = LineSeries(data=_frame(), column_mapping=dict(MAPPING))
+        columnar.transport = DataTransport.COLUMNAR
+        payload = _series_data(columnar)
+
+        assert payload_cache.stats().misses == 3
+        assert not payload.numeric["value"].flags.writeable
+
+    def test_small_and_streaming_data_are_not_cached(self):
+        """Test small series and series modified in place bypass the cache."""
+        _series_data(LineSeries(data=_frame(MIN_SHARED_POINTS - 1), column_mapping=dict(MAPPING)))
+        streaming = LineSeries(data=_frame(), column_mapping=dict(MAPPING))
+        streaming.append(LineData(time=1_900_000_000, value=1.0))
+        _series_data(streaming)
+
+        assert streaming.data.content_hash is None
+        assert payload_cache.stats().misses == 0
+        assert len(payload_cache) == 0
+
+    def test_content_hash_follows_points(self):
+        """Test the content hash covers the data class and every column."""
+        line = LineSeries(data=_frame(), column_mapping=dict(MAPPING)).data
+        same = LineSeries(data=_frame(), column_mapping=dict(MAPPING)).data
+        candles = CandlestickSeries(
+            data=_frame().assign(o=1.0, h=2.0, l=0.5, c=1.5),
+            column_mapping={"time": "time", "open": "o", "high": "h", "low": "l", "close": "c"},
+        ).data
+        trimmed = LineSeries(data=_frame(), column_mapping=dict(MAPPING)).data
+        trimmed.max_points = 10
+
+        assert line.content_hash == same.content_hash
+        assert candles.content_hash != line.content_hash
+        assert (
+            trimmed.content_hash
+            == LineSeries(data=_frame().iloc[-10:], column_mapping=dict(MAPPING)).data.content_hash
+        )
+
+
+class TestPayloadCache:
+    """The cache is bounded, counts lookups and encodes once under contention."""
+
+    @staticmethod
+    def _rows(count):
+        """EncodedRows of count small points."""
+        return EncodedRows([b'{"time":%d}' % i for i in range(count)], np.arange(count))
+
+    def test_entry_bound(self):
+        """Test the least recently used payload is evicted first."""
+        cache = PayloadCache(max_entries=2)
+        cache.get("a", lambda: self._rows(1))
+        cache.get("b", lambda: self._rows(1))
+        cache.get("a", lambda: self._rows(1))
+        cache.get("c", lambda: self._rows(1))
+        cache.get("b", lambda: self._rows(1))
+
+        assert cache.stats().misses == 4
+        assert len(cache) == 2
+
+    def test_memory_bound(self):
+        """Test payloads are evicted to stay under max_bytes, and larger ones are not kept."""
+        size = self._rows(10).freeze().nbytes
+        cache = PayloadCache(max_bytes=size * 2)
+        cache.get("a", lambda: self._rows(10))
+        cache.get("b", lambda: self._rows(10))
+        cache.get("c", lambda: self._rows(10))
+        cache.get("huge", lambda: self._rows(1000))
+
+        assert len(cache) == 2
+        assert cache.stats().resident_bytes == size * 2
+
+    def test_concurrent_misses_encode_once(self):
+        """Test script runs missing the same payload at once wait for one encoding."""
+        cache = PayloadCache()
+        calls = []
+        results = []
+
+        def encode():
+            calls.append(1)
+            time.sleep(0.05)
+            return self._rows(10)
+
+        def run():
+            results.append(cache.get("key", encode))
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert cache.stats().hits == 7
+
+    def test_failed_encoding_is_not_cached(self):
+        """Test an error reaches the caller and the next lookup encodes again."""
+        cache = PayloadCache()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get("key", fail)
+
+        assert len(cache.get("key", lambda: self._rows(3))) == 3
@@ -0,0 +1,403 @@
+"""
+Tests for the fast JSON serializer.
+
+This module checks that payloads written straight from NumPy columns decode to
+exactly the dictionaries produced by Data.asdict() and Chart.to_frontend_config(),
+with orjson and with the standard library fallback, including series data sent
+as binary columns.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.config_delta import diff_series_data
+from streamlit_lightweight_charts_pro.charts.series import (
+    BaselineSeries,
+    CandlestickSeries,
+    HistogramSeries,
+    LineSeries,
+)
+from streamlit_lightweight_charts_pro.data import (
+    BaselineData,
+    CandlestickData,
+    HistogramData,
+    LineData,
+    Marker,
+    OhlcvData,
+)
+from streamlit_lightweight_charts_pro.data.series_data import SeriesData
+from streamlit_lightweight_charts_pro.type_definitions.enums import (
+    DataTransport,
+    MarkerPosition,
+    MarkerShape,
+)
+from streamlit_lightweight_charts_pro.utils import serialization
+from streamlit_lightweight_charts_pro.utils.serialization import (
+    COLUMNAR_KEY,
+    ColumnarData,
+    EncodedRows,
+    dumps,
+    encode_column,
+    encode_payload,
+    encode_rows,
+)
+
+N = 50
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson, and with the standard library fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.fixture
+def ohlc_frame():
+    """OHLC columns with NaN values, integer volumes and sparse colors."""
+    rng = np.random.default_rng(7)
+    close = 100.0 + rng.standard_normal(N).cumsum()
+    close[3] = np.nan
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=N, freq="h"),
+            "open": close + 0.25,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.integers(100, 1_000, N),
+            "color": ["#26a69a" if i % 3 else "" for i in range(N)],
+        }
+    )
+
+
+def _decode_payload(payload, buffer):
+    """Decode a payload of encode_payload() the way the frontend does."""
+
+    def decode(value):
+        if isinstance(value, dict) and COLUMNAR_KEY in value:
+            descriptor = value[COLUMNAR_KEY]
+            length = descriptor["length"]
+            columns = {
+                key: np.frombuffer(buffer, dtype="<f8", count=length, offset=offset).tolist()
+                for key, offset in descriptor["numeric"].items()
+            }
+            points = []
+            for index in range(length):
+                point = {}
+                for key in descriptor["keys"]:
+                    if key in columns:
+                        point[key] = columns[key][index]
+                    elif key in descriptor["values"]:
+                        if descriptor["values"][key][index] is not None:
+                            point[key] = descriptor["values"][key][index]
+                    else:
+                        point[key] = descriptor["constants"][key]
+                points.append(point)
+            return points
+        if isinstance(value, dict):
+            return {key: decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        return value
+
+    return decode(json.loads(payload))
+
+
+class TestSeriesDataConformance:
+    """SeriesData.to_json() decodes to SeriesData.asdicts()."""
+
+    @pytest.mark.parametrize(
+        "data_class,mapping",
+        [
+            (CandlestickData, {"open": "open", "high": "high", "low": "low", "close": "close"}),
+            (OhlcvData, {"open": "open", "high": "high", "low": "low", "close": "close"}),
+            (LineData, {"value": "close", "color": "color"}),
+            (HistogramData, {"value": "volume", "color": "color"}),
+            (BaselineData, {"value": "close"}),
+        ],
+        ids=["candlestick", "ohlcv", "line", "histogram", "baseline"],
+    )
+    def test_matches_asdicts(self, backend, ohlc_frame, data_class, mapping):
+        """Test the encoded payload equals the dictionary payload."""
+        if data_class is OhlcvData:
+            mapping = {**mapping, "volume": "volume"}
+        columns = {"time": ohlc_frame["time"]}
+        columns.update({field: ohlc_frame[column] for field, column in mapping.items()})
+        data = SeriesData.from_columns(data_class, columns)
+
+        assert json.loads(data.to_json()) == data.asdicts()
+
+    def test_value_rules(self, backend):
+        """Test NaN, camelCase keys, empty strings and numeric types follow Data.asdict()."""
+        data = SeriesData.from_data(
+            BaselineData,
+            [
+                BaselineData(time=1, value=float("nan"), top_line_color="#fff"),
+                BaselineData(time=2, value=2.5, top_line_color=""),
+            ],
+        )
+
+        payload = json.loads(data.to_json())
+
+        assert payload == data.asdicts()
+        assert payload == [
+            {"time": 1, "value": 0.0, "topLineColor": "#fff"},
+            {"time": 2, "value": 2.5},
+        ]
+        assert isinstance(payload[0]["value"], float)
+
+    def test_data_class_with_custom_asdict(self, backend):
+        """Test data classes that override asdict() are encoded through it."""
+        markers = [
+            Marker(time=i, position=MarkerPosition.ABOVE_BAR, color="red", shape=MarkerShape.CIRCLE)
+            for i in range(3)
+        ]
+        data = SeriesData.from_data(Marker, markers)
+
+        assert json.loads(data.to_json()) == [marker.asdict() for marker in markers]
+
+    def test_incremental_encoding(self, backend):
+        """Test a streaming container only re-encodes changed points."""
+        data = SeriesData.from_data(LineData, [LineData(time=i, value=float(i)) for i in range(5)])
+        data.append(LineData(time=5, value=5.0))
+        first = data.encoded()
+
+        data.update_last(LineData(time=5, value=-1.0))
+        data.append(LineData(time=6, value=6.0))
+        second = data.encoded()
+
+        assert all(old is new for old, new in zip(first.rows[:5], second.rows[:5]))
+        assert json.loads(second.to_json()) == data.asdicts()
+        assert second.times.tolist() == list(range(7))
+
+
+class TestChartConformance:
+    """Chart.to_frontend_json() decodes to Chart.to_frontend_config()."""
+
+    def test_chart_payload(self, backend, ohlc_frame):
+        """Test a chart mixing columnar and list data."""
+        chart = Chart(
+            series=CandlestickSeries.from_dataframe(
+                ohlc_frame,
+                column_mapping={
+                    "time": "time",
+                    "open": "open",
+                    "high": "high",
+                    "low": "low",
+                    "close": "close",
+                },
+            )
+        )
+        chart.add_series(
+            HistogramSeries(
+                data=ohlc_frame,
+                column_mapping={"time": "time", "value": "volume", "color": "color"},
+                pane_id=1,
+            )
+        )
+        chart.add_series(LineSeries(data=[LineData(time=1_704_067_200, value=1.0)]))
+
+        payload = chart.to_frontend_json()
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == chart.to_frontend_config()
+
+    def test_encoded_series_config(self, backend, ohlc_frame):
+        """Test asdict_encoded() keeps every option of asdict()."""
+        series = BaselineSeries(data=ohlc_frame, column_mapping={"time": "time", "value": "close"})
+
+        encoded = series.asdict_encoded()
+
+        assert isinstance(encoded["data"], EncodedRows)
+        assert json.loads(dumps(encoded)) == series.asdict()
+
+
+class TestColumnarTransport:
+    """Series data sent as binary columns decodes to the JSON payload."""
+
+    @pytest.mark.parametrize(
+        "data_class,mapping",
+        [
+            (OhlcvData, {"open": "open", "high": "high", "low": "low", "close": "close"}),
+            (LineData, {"value": "close", "color": "color"}),
+            (HistogramData, {"value": "volume", "color": "color"}),
+        ],
+        ids=["ohlcv", "line", "histogram"],
+    )
+    def test_matches_asdicts(self, backend, ohlc_frame, data_class, mapping):
+        """Test decoded columns equal the dictionary payload."""
+        if data_class is OhlcvData:
+            mapping = {**mapping, "volume": "volume"}
+        columns = {"time": ohlc_frame["time"]}
+        columns.update({field: ohlc_frame[column] for field, column in mapping.items()})
+        data = SeriesData.from_columns(data_class, columns)
+
+        columnar = data.columnar()
+        payload, buffer = encode_payload({"data": columnar})
+
+        assert _decode_payload(payload, buffer) == {"data": data.asdicts()}
+        assert columnar.to_list() == data.asdicts()
+        assert json.loads(dumps(columnar)) == data.asdicts()
+
+    def test_constants_and_layout(self, backend):
+        """Test defaults are sent once and columns are 8-byte aligned float64 values."""
+        data = SeriesData.from_columns(
+            BaselineData, {"time": [1, 2], "value": [1.5, np.nan], "top_line_color": ["#fff", ""]}
+        )
+
+        payload, buffer = encode_payload([data.columnar(), data.columnar()[1:]])
+        descriptors = [item[COLUMNAR_KEY] for item in json.loads(payload)]
+
+        assert descriptors[0]["keys"] == ["time", "value", "topLineColor"]
+        assert descriptors[0]["values"] == {"topLineColor": ["#fff", None]}
+        assert descriptors[0]["numeric"] == {"time": 0, "value": 16}
+        assert descriptors[1]["numeric"] == {"time": 32, "value": 40}
+        assert len(buffer) == 48
+        assert np.frombuffer(buffer, dtype="<f8").tolist() == [1, 2, 1.5, 0.0, 2, 0.0]
+
+    def test_custom_asdict_is_rejected(self):
+        """Test data classes that override asdict() cannot be sent as columns."""
+
+        class LabeledData(LineData):
+            def asdict(self):
+                return {**super().asdict(), "label": str(self.value)}
+
+        data = SeriesData.from_data(LabeledData, [LabeledData(time=1, value=1.0)])
+
+        with pytest.raises(TypeError, match="cannot be sent as columns"):
+            data.columnar()
+
+    def test_series_transport(self, ohlc_frame):
+        """Test the opt-in transport of a series and its validation."""
+        series = LineSeries(data=[LineData(time=i, value=float(i)) for i in range(3)])
+
+        assert series.transport == DataTransport.JSON
+        assert isinstance(series.asdict_encoded()["data"], list)
+
+        series.transport = "columnar"
+        encoded = series.asdict_encoded()
+
+        assert series.transport == DataTransport.COLUMNAR
+        assert isinstance(encoded["data"], ColumnarData)
+        assert json.loads(dumps(encoded)) == series.asdict()
+        with pytest.raises(ValueError, match="transport must be one of"):
+            series.transport = "arrow"
+
+    def test_diff_of_columns(self):
+        """Test the delta protocol appends columns like dictionaries."""
+        data = SeriesData.from_data(LineData, [LineData(time=i, value=float(i)) for i in range(5)])
+        before = data.columnar()
+        data.append(LineData(time=5, value=5.0))
+
+        operation = diff_series_data(before, data.columnar())
+
+        assert operation["op"] == "append"
+        assert isinstance(operation["data"], ColumnarData)
+        assert operation["data"].to_list() == [{"time": 5, "value": 5.0}]
+        assert diff_series_data(before, data.encoded())["op"] == "setData"
+
+    @patch("streamlit_lightweight_charts_pro.charts.chart.get_component_func")
+    def test_render_sends_buffers(self, mock_get_component_func, ohlc_frame):
+        """Test render() sends the columns as a separate binary argument."""
+        mock_component = Mock()
+        mock_get_component_func.return_value = mock_component
+        series = CandlestickSeries(
+            data=ohlc_frame,
+            column_mapping={
+                "time": "time",
+                "open": "open",
+                "high": "high",
+                "low": "low",
+                "close": "close",
+            },
+        )
+        series.transport = DataTransport.COLUMNAR
+        chart = Chart(series=series)
+
+        chart.render(key="columnar")
+
+        kwargs = mock_component.call_args.kwargs
+        assert len(kwargs["buffers"]) == 5 * 8 * N
+        assert _decode_payload(kwargs["config"], kwargs["buffers"]) == chart.to_frontend_config()
+
+
+class TestEncoders:
+    """Low-level encoding helpers."""
+
+    def test_encode_column(self, backend):
+        """Test NaN becomes 0.0, infinities null and floats keep their precision."""
+        tokens = encode_column(np.array([0.1, np.nan, np.inf, 1e16, -2.0], dtype=np.float64))
+
+        assert [json.loads(token) for token in tokens] == [0.1, 0.0, None, 1e16, -2.0]
+
+    def test_encode_column_types(self, backend):
+        """Test integer, boolean and float32 columns."""
+        assert [json.loads(t) for t in encode_column(np.array([1, 2], dtype=np.uint8))] == [1, 2]
+        assert [json.loads(t) for t in encode_column(np.array([True, False]))] == [True, False]
+        float32 = encode_column(np.array([1.1], dtype=np.float32))
+        assert json.loads(float32[0]) == float(np.float32(1.1))
+        with pytest.raises(TypeError):
+            encode_column(np.array(["a"], dtype=object))
+
+    def test_encode_rows_leaves_out_missing_tokens(self, backend):
+        """Test None tokens leave their key out of the row."""
+        rows = encode_rows(
+            ["time", "color"],
+            [encode_column(np.array([1, 2])), [serialization.encode_value("red"), None]],
+        )
+
+        assert [json.loads(row) for row in rows] == [{"time": 1, "color": "red"}, {"time": 2}]
+
+    def test_dumps_splices_encoded_rows(self, backend):
+        """Test EncodedRows are written as JSON arrays inside a payload."""
+        rows = EncodedRows([b'{"time":1}', b'{"time":2}'], [1, 2])
+
+        payload = dumps({"data": rows, "tail": rows[1:], "shape": MarkerShape.CIRCLE})
+
+        assert json.loads(payload) == {
+            "data": [{"time": 1}, {"time": 2}],
+            "tail": [{"time": 2}],
+            "shape": "circle",
+        }
+
+    def test_dumps_splices_frozen_rows(self, backend):
+        """Test frozen EncodedRows are written from their joined JSON array."""
+        rows = EncodedRows([b'{"time":1}', b'{"time":2}'], [1, 2])
+        assert rows.frozen_json is None
+
+        rows.freeze()
+
+        assert rows.frozen_json == b'[{"time":1},{"time":2}]'
+        assert json.loads(dumps({"data": rows})) == {"data": [{"time": 1}, {"time": 2}]}
+
+    def test_json_backend(self, backend):
+        """Test the active JSON backend is reported by name."""
+        assert serialization.json_backend() == backend
+
+    def test_dumps_unsupported_type(self, backend):
+        """Test values that cannot be encoded raise TypeError."""
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+    def test_diff_of_encoded_rows(self):
+        """Test the delta protocol appends encoded points like dictionaries."""
+        data = SeriesData.from_data(LineData, [LineData(time=i, value=float(i)) for i in range(5)])
+        data.max_points = 5
+        before = data.encoded()
+        data.append(LineData(time=5, value=5.0))
+        after = data.encoded()
+
+        operation = diff_series_data(before, after)
+
+        assert operation["op"] == "append"
+        assert operation["trim"] == 1
+        assert json.loads(dumps(operation["data"])) == [{"time": 5, "value": 5.0}]
@@ -0,0 +1,173 @@
+"""
+Tests for the alignment of times onto bar times.
+
+This module tests that TimeIndex aligns times with each TimeAlignment policy,
+and that Chart.align_times() sends markers, trades and annotations with times
+already aligned onto the bars of their series.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_lightweight_charts_pro.charts import Chart
+from streamlit_lightweight_charts_pro.charts.options import ChartOptions
+from streamlit_lightweight_charts_pro.charts.options.trade_visualization_options import (
+    TradeVisualizationOptions,
+)
+from streamlit_lightweight_charts_pro.charts.series import LineSeries
+from streamlit_lightweight_charts_pro.data import LineData, TradeBatch, TradeData
+from streamlit_lightweight_charts_pro.data.annotation import create_text_annotation
+from streamlit_lightweight_charts_pro.data.marker import BarMarker
+from streamlit_lightweight_charts_pro.type_definitions.enums import (
+    TimeAlignment,
+    TradeVisualization,
+)
+from streamlit_lightweight_charts_pro.utils.serialization import EncodedRows, dumps
+from streamlit_lightweight_charts_pro.utils.time_index import TimeIndex
+
+T = 1_700_000_040
+BARS = [T, T + 60, T + 120]
+
+
+def _line(times=BARS):
+    """Line series with one point per bar time."""
+    return LineSeries(data=[LineData(time, 1.0) for time in times])
+
+
+class TestTimeIndex:
+    """Times are aligned onto the bars following the policy."""
+
+    @pytest.mark.parametrize(
+        "policy, aligned, kept",
+        [
+            (TimeAlignment.NEAREST, [T, T, T, T + 60, T + 120], [1, 1, 1, 1, 1]),
+            (TimeAlignment.PREVIOUS, [T - 1, T, T, T + 60, T + 120], [0, 1, 1, 1, 1]),
+            (TimeAlignment.NEXT, [T, T, T + 60, T + 60, T + 500], [1, 1, 1, 1, 0]),
+            (TimeAlignment.DROP, [T - 1, T, T + 30, T + 60, T + 500], [0, 1, 0, 1, 0]),
+        ],
+    )
+    def test_policies(self, policy, aligned, kept):
+        """Test each policy, with ties going to the earlier bar."""
+        index = TimeIndex(BARS[::-1] + [T])
+
+        times, keep = index.align([T - 1, T, T + 30, T + 60, T + 500], policy.value)
+
+        assert index.times.tolist() == BARS
+        assert keep.tolist() == [bool(flag) for flag in kept]
+        assert times.tolist() == aligned
+
+    def test_empty_index_keeps_times(self):
+        """Test there is nothing to align onto without bars."""
+        times, keep = TimeIndex([]).align([T, T + 1], TimeAlignment.DROP)
+
+        assert times.tolist() == [T, T + 1]
+        assert keep.all()
+
+    def test_from_payload(self):
+        """Test the times of any serialized series data are indexed."""
+        series = _line()
+
+        assert TimeIndex.from_payload(series.asdict()["data"]).times.tolist() == BARS
+        encoded = series.asdict_encoded()["data"]
+        assert TimeIndex.from_payload(encoded).times.tolist() == BARS
+        assert len(TimeIndex.from_payload(None)) == 0
+
+    def test_trade_batch(self):
+        """Test trades are dropped when their entry or exit is left out."""
+        batch = TradeBatch([T + 10, T + 70], [1.0, 1.0], [T + 50, T + 130], [2.0, 2.0], [1, 1])
+
+        nearest = batch.aligned(TimeIndex(BARS))
+        following = batch.aligned(TimeIndex(BARS), TimeAlignment.NEXT)
+
+        assert nearest.entry_time.tolist() == [T, T + 60]
+        assert nearest.exit_time.tolist() == [T + 60, T + 120]
+        assert following.entry_time.tolist() == [T + 60]
+        assert following.exit_time.tolist() == [T + 60]
+        assert following.pnl.tolist() == [1.0]
+        assert batch.entry_time.tolist() == [T + 10, T + 70]
+
+
+class TestChartAlignment:
+    """Chart.align_times() sends times aligned onto the bars."""
+
+    @staticmethod
+    def _chart():
+        """Chart of a line series with off-bar markers, trades and annotations."""
+        options = ChartOptions(
+            trade_visualization=TradeVisualizationOptions(style=TradeVisualization.RECTANGLES)
+        )
+        chart = Chart(series=_line(), options=options)
+        chart.series[0].add_markers(
+            [
+                BarMarker(time=T - 100, position="aboveBar", shape="circle"),
+                BarMarker(time=T + 35, position="aboveBar", shape="circle"),
+            ]
+        )
+        chart.add_trades([TradeData(T + 10, 1.0, T + 100, 2.0, 1)])
+        chart.add_annotation(create_text_annotation(T + 80, 1.0, "note"))
+        return chart
+
+    def test_unaligned_by_default(self):
+        """Test times are left to the frontend unless an alignment is set."""
+        chart = self._chart().to_frontend_config()["charts"][0]
+
+        assert "timesAligned" not in chart["series"][0]
+        assert chart["trades"][0]["entryTime"] == T + 10
+
+    def test_nearest(self):
+        """Test markers, trades and annotations land on the nearest bars."""
+        chart = self._chart().align_times().to_frontend_config()["charts"][0]
+        series = chart["series"][0]
+
+        assert series["timesAligned"] is True
+        assert [marker["time"] for marker in series["markers"]] == [T, T + 60]
+        assert (chart["trades"][0]["entryTime"], chart["trades"][0]["exitTime"]) == (T, T + 120)
+        annotation = chart["annotations"]["layers"]["default"]["annotations"][0]
+        assert annotation["time"] == T + 60
+
+    def test_left_out_items_are_not_sent(self):
+        """Test items without a bar for the policy are dropped."""
+        chart = self._chart().align_times("previous").to_frontend_config()["charts"][0]
+
+        assert [marker["time"] for marker in chart["series"][0]["markers"]] == [T]
+        assert (chart["trades"][0]["entryTime"], chart["trades"][0]["exitTime"]) == (T, T + 60)
+
+        dropped = self._chart().align_times(TimeAlignment.DROP).to_frontend_config()["charts"][0]
+        assert dropped["series"][0]["markers"] == []
+        assert "trades" not in dropped
+        assert dropped["annotations"]["layers"]["default"]["annotations"] == []
+
+    def test_columnar_markers_and_encoded_config(self):
+        """Test markers given as columns are aligned and encoded."""
+        chart = Chart(series=_line()).align_times()
+        signals = pd.DataFrame(
+            {"time": np.array([T + 20, T + 100]), "pos": "belowBar", "shape": "arrowUp"}
+        )
+        chart.series[0].add_markers(
+            signals, column_mapping={"time": "time", "position": "pos", "shape": "shape"}
+        )
+
+        markers = chart.to_frontend_config(encode_data=True)["charts"][0]["series"][0]["markers"]
+
+        assert isinstance(markers, EncodedRows)
+        assert [marker["time"] for marker in json.loads(dumps(markers))] == [T, T + 120]
+        assert chart.series[0].markers.columns["time"].tolist() == [T + 20, T + 100]
+
+    def test_markers_of_other_series_use_their_bars(self):
+        """Test markers of a second series are aligned onto its own bars."""
+        chart = Chart(series=[_line(), _line([T + 5, T + 65])]).align_times()
+        chart.series[1].add_marker(BarMarker(time=T + 50, position="aboveBar", shape="circle"))
+
+        series = chart.to_frontend_config()["charts"][0]["series"]
+
+        assert series[1]["markers"][0]["time"] == T + 65
+
+    def test_invalid_policy(self):
+        """Test unknown policies are rejected and None turns alignment off."""
+        with pytest.raises(ValueError):
+            Chart().align_times("closest")
+        chart = self._chart().align_times().align_times(None)
+        assert "timesAligned" not in chart.to_frontend_config()["charts"][0]["series"][0]